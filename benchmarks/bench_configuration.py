@@ -0,0 +1,244 @@
+"""
+Benchmarks of the configuration package.
+
+Run them from the root of the repository with, e.g.::
+
+    python benchmarks/bench_configuration.py --output results.json --baseline benchmarks/baseline.json
+"""
+
+# Copyright  2025  Institute of Light and Matter, CNRS UMR 5306, University Claude Bernard Lyon 1
+# Contributors: Oscar DUFOUR, Maxime STAPELLE, Alexandre NICOLAS
+
+# This software is a computer program designed to generate a realistic crowd from anthropometric data and
+# simulate the mechanical interactions that occur within it and with obstacles.
+
+# This software is governed by the CeCILL  license under French law and abiding by the rules of distribution
+# of free software.  You can  use, modify and/ or redistribute the software under the terms of the CeCILL
+# license as circulated by CEA, CNRS and INRIA at the following URL "http://www.cecill.info".
+
+# As a counterpart to the access to the source code and  rights to copy, modify and redistribute granted by
+# the license, users are provided only with a limited warranty  and the software's author,  the holder of the
+# economic rights,  and the successive licensors  have only  limited liability.
+
+# In this respect, the user's attention is drawn to the risks associated with loading,  using,  modifying
+# and/or developing or reproducing the software by the user in light of its specific status of free software,
+# that may mean  that it is complicated to manipulate,  and  that  also therefore means  that it is reserved
+# for developers  and  experienced professionals having in-depth computer knowledge. Users are therefore
+# encouraged to load and test the software's suitability as regards their requirements in conditions enabling
+# the security of their systems and/or data to be ensured and,  more generally, to use and operate it in the
+# same conditions as regards security.
+
+# The fact that you are presently reading this means that you have had knowledge of the CeCILL license and that
+# you accept its terms.
+
+import io
+import zipfile
+from functools import lru_cache
+
+import numpy as np
+from runner import Benchmark, main
+from shapely.geometry import Polygon
+
+import configuration.backup.crowd_to_dict as fun_dict
+import configuration.backup.crowd_to_zip_and_reverse as fun_zip
+import configuration.backup.dict_to_xml_and_reverse as fun_xml
+import configuration.utils.constants as cst
+from configuration.models.agents import Agent
+from configuration.models.crowd import Crowd, create_agents_from_dynamic_static_geometry_parameters
+from configuration.models.measures import AgentMeasures, CrowdMeasures, draw_agent_measures
+from configuration.models.packing_sweep import copy_crowd_for_packing
+from configuration.utils.typing_custom import Sex
+
+SEED: int = 0  # Seed of the global NumPy random generator before generating the benchmarked crowds
+CROWD_SIZE: int = 100  # Number of agents of the crowd used by the benchmarks of the exports and the statistics
+FORCES_CROWD_SIZE: int = 20  # Number of agents of the crowd packed with forces
+FORCES_NB_ITERATIONS: int = 10  # Number of iterations of the benchmarked packing with forces
+
+PEDESTRIAN_MEASURES: dict[str, float | Sex] = {
+    "sex": "male",
+    "bideltoid_breadth": 51.0,
+    "chest_depth": 26.0,
+    "height": 178.0,
+    "weight": 85.0,
+}
+
+
+@lru_cache(maxsize=4)
+def get_crowd(number_agents: int) -> Crowd:
+    """
+    Generate a crowd of pedestrians from the ANSUR II database, packed on a grid, once per size.
+
+    Parameters
+    ----------
+    number_agents : int
+        The number of agents of the crowd.
+
+    Returns
+    -------
+    Crowd
+        The packed crowd, in a room enclosing it.
+    """
+    np.random.seed(SEED)
+    crowd = Crowd()
+    crowd.create_agents(number_agents)
+    crowd.pack_agents_on_grid()
+    min_x, min_y, max_x, max_y = _get_bounds(crowd)
+    crowd.boundaries = Polygon(
+        [(min_x - 10.0, min_y - 10.0), (max_x + 10.0, min_y - 10.0), (max_x + 10.0, max_y + 10.0), (min_x - 10.0, max_y + 10.0)]
+    )
+    return crowd
+
+
+def _get_bounds(crowd: Crowd) -> tuple[float, float, float, float]:
+    """
+    Get the bounds of the 2D shapes of all the agents of a crowd.
+
+    Parameters
+    ----------
+    crowd : Crowd
+        The crowd.
+
+    Returns
+    -------
+    tuple[float, float, float, float]
+        The minimum x, minimum y, maximum x and maximum y (cm).
+    """
+    bounds = np.array([agent.shapes2D.get_geometric_shape().bounds for agent in crowd.agents])
+    return float(bounds[:, 0].min()), float(bounds[:, 1].min()), float(bounds[:, 2].max()), float(bounds[:, 3].max())
+
+
+@lru_cache(maxsize=1)
+def get_crowd_dicts() -> dict[str, dict]:
+    """
+    Export the benchmarked crowd to dictionaries, once.
+
+    Returns
+    -------
+    dict[str, dict]
+        The static, dynamic, geometry, materials and interactions dictionaries of the crowd.
+    """
+    crowd = get_crowd(CROWD_SIZE)
+    return {
+        "static": fun_dict.get_static_params(crowd),
+        "dynamic": fun_dict.get_dynamic_params(crowd),
+        "geometry": fun_dict.get_geometry_params(crowd),
+        "materials": fun_dict.get_materials_params(),
+        "interactions": fun_dict.get_interactions_params(crowd),
+    }
+
+
+@lru_cache(maxsize=1)
+def get_crowd_xml() -> dict[str, bytes]:
+    """
+    Export the benchmarked crowd to XML, once.
+
+    Returns
+    -------
+    dict[str, bytes]
+        The static, dynamic, geometry, materials and interactions XML documents of the crowd.
+    """
+    crowd_dicts = get_crowd_dicts()
+    return {
+        "static": fun_xml.static_dict_to_xml(crowd_dicts["static"]),
+        "dynamic": fun_xml.dynamic_dict_to_xml(crowd_dicts["dynamic"]),
+        "geometry": fun_xml.geometry_dict_to_xml(crowd_dicts["geometry"]),
+        "materials": fun_xml.materials_dict_to_xml(crowd_dicts["materials"]),
+        "interactions": fun_xml.interactions_dict_to_xml(crowd_dicts["interactions"]),
+    }
+
+
+def zip_round_trip(crowd: Crowd) -> Crowd:
+    """
+    Write a crowd to an in-memory ZIP archive of XML files, and create a crowd back from it.
+
+    Parameters
+    ----------
+    crowd : Crowd
+        The crowd to write.
+
+    Returns
+    -------
+    Crowd
+        The crowd read back from the archive.
+    """
+    zip_buffer: io.BytesIO = fun_zip.write_crowd_data_to_zip(crowd)
+    static_file_name, dynamic_file_name, geometry_file_name, _ = cst.CROWD_XML_FILE_NAMES
+    with zipfile.ZipFile(zip_buffer) as zip_file:
+        static_dict = fun_xml.static_xml_to_dict(zip_file.read(static_file_name))
+        dynamic_dict = fun_xml.dynamic_xml_to_dict(zip_file.read(dynamic_file_name))
+        geometry_dict = fun_xml.geometry_xml_to_dict(zip_file.read(geometry_file_name))
+    return create_agents_from_dynamic_static_geometry_parameters(static_dict, dynamic_dict, geometry_dict)
+
+
+def create_crowd(number_agents: int) -> Crowd:
+    """
+    Create a crowd of pedestrians from the ANSUR II database.
+
+    Parameters
+    ----------
+    number_agents : int
+        The number of agents of the crowd.
+
+    Returns
+    -------
+    Crowd
+        The created crowd, not packed.
+    """
+    crowd = Crowd()
+    crowd.create_agents(number_agents)
+    return crowd
+
+
+BENCHMARKS: list[Benchmark] = [
+    # Agents
+    Benchmark(
+        "agent_creation_pedestrian",
+        lambda measures: Agent(cst.AgentTypes.pedestrian, measures),
+        lambda: AgentMeasures(cst.AgentTypes.pedestrian, dict(PEDESTRIAN_MEASURES)),
+    ),
+    Benchmark(
+        "agent_creation_bike",
+        lambda measures: Agent(cst.AgentTypes.bike, measures),
+        lambda: draw_agent_measures(cst.AgentTypes.bike, CrowdMeasures(agent_statistics=dict(cst.CrowdStat))),
+    ),
+    # Crowd creation
+    Benchmark("crowd_create_agents_10", lambda _: create_crowd(10), repeat=3),
+    Benchmark("crowd_create_agents_100", lambda _: create_crowd(100), repeat=1, slow=True),
+    Benchmark("crowd_create_agents_1000", lambda _: create_crowd(1000), repeat=1, slow=True),
+    # Packing
+    Benchmark(
+        "pack_agents_with_forces",
+        lambda crowd: crowd.pack_agents_with_forces(nb_iterations=FORCES_NB_ITERATIONS),
+        lambda: copy_crowd_for_packing(get_crowd(FORCES_CROWD_SIZE)),
+        repeat=3,
+    ),
+    Benchmark("pack_agents_on_grid", lambda crowd: crowd.pack_agents_on_grid(), lambda: copy_crowd_for_packing(get_crowd(CROWD_SIZE))),
+    # Crowd measures
+    Benchmark("calculate_interpenetration", lambda crowd: crowd.calculate_interpenetration(), lambda: get_crowd(CROWD_SIZE), repeat=3),
+    Benchmark("get_crowd_statistics", lambda crowd: crowd.get_crowd_statistics(), lambda: get_crowd(CROWD_SIZE)),
+    # Exports to dictionaries
+    Benchmark("crowd_to_dict_light_agents", fun_dict.get_light_agents_params, lambda: get_crowd(CROWD_SIZE)),
+    Benchmark("crowd_to_dict_static", fun_dict.get_static_params, lambda: get_crowd(CROWD_SIZE)),
+    Benchmark("crowd_to_dict_dynamic", fun_dict.get_dynamic_params, lambda: get_crowd(CROWD_SIZE)),
+    Benchmark("crowd_to_dict_arrays", fun_dict.get_crowd_arrays, lambda: get_crowd(CROWD_SIZE)),
+    Benchmark("crowd_to_dict_geometry", fun_dict.get_geometry_params, lambda: get_crowd(CROWD_SIZE)),
+    Benchmark("crowd_to_dict_interactions", fun_dict.get_interactions_params, lambda: get_crowd(CROWD_SIZE)),
+    Benchmark("crowd_to_dict_materials", lambda _: fun_dict.get_materials_params()),
+    # XML
+    Benchmark("xml_write_static", fun_xml.static_dict_to_xml, lambda: get_crowd_dicts()["static"]),
+    Benchmark("xml_write_dynamic", fun_xml.dynamic_dict_to_xml, lambda: get_crowd_dicts()["dynamic"]),
+    Benchmark("xml_write_geometry", fun_xml.geometry_dict_to_xml, lambda: get_crowd_dicts()["geometry"]),
+    Benchmark("xml_write_materials", fun_xml.materials_dict_to_xml, lambda: get_crowd_dicts()["materials"]),
+    Benchmark("xml_write_interactions", fun_xml.interactions_dict_to_xml, lambda: get_crowd_dicts()["interactions"]),
+    Benchmark("xml_read_static", fun_xml.static_xml_to_dict, lambda: get_crowd_xml()["static"]),
+    Benchmark("xml_read_dynamic", fun_xml.dynamic_xml_to_dict, lambda: get_crowd_xml()["dynamic"]),
+    Benchmark("xml_read_geometry", fun_xml.geometry_xml_to_dict, lambda: get_crowd_xml()["geometry"]),
+    Benchmark("xml_read_materials", fun_xml.materials_xml_to_dict, lambda: get_crowd_xml()["materials"]),
+    Benchmark("xml_read_interactions", fun_xml.interactions_xml_to_dict, lambda: get_crowd_xml()["interactions"]),
+    # ZIP
+    Benchmark("zip_round_trip", zip_round_trip, lambda: get_crowd(CROWD_SIZE), repeat=3),
+]
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(BENCHMARKS))
@@ -0,0 +1,197 @@
+"""Self-contained timing runner of the benchmarks, writing JSON results and comparing them with a stored baseline."""
+
+# Copyright  2025  Institute of Light and Matter, CNRS UMR 5306, University Claude Bernard Lyon 1
+# Contributors: Oscar DUFOUR, Maxime STAPELLE, Alexandre NICOLAS
+
+# This software is a computer program designed to generate a realistic crowd from anthropometric data and
+# simulate the mechanical interactions that occur within it and with obstacles.
+
+# This software is governed by the CeCILL  license under French law and abiding by the rules of distribution
+# of free software.  You can  use, modify and/ or redistribute the software under the terms of the CeCILL
+# license as circulated by CEA, CNRS and INRIA at the following URL "http://www.cecill.info".
+
+# As a counterpart to the access to the source code and  rights to copy, modify and redistribute granted by
+# the license, users are provided only with a limited warranty  and the software's author,  the holder of the
+# economic rights,  and the successive licensors  have only  limited liability.
+
+# In this respect, the user's attention is drawn to the risks associated with loading,  using,  modifying
+# and/or developing or reproducing the software by the user in light of its specific status of free software,
+# that may mean  that it is complicated to manipulate,  and  that  also therefore means  that it is reserved
+# for developers  and  experienced professionals having in-depth computer knowledge. Users are therefore
+# encouraged to load and test the software's suitability as regards their requirements in conditions enabling
+# the security of their systems and/or data to be ensured and,  more generally, to use and operate it in the
+# same conditions as regards security.
+
+# The fact that you are presently reading this means that you have had knowledge of the CeCILL license and that
+# you accept its terms.
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+
+@dataclass
+class Benchmark:
+    """
+    A timed operation and the preparation of its input.
+
+    Attributes
+    ----------
+    name : str
+        The unique name of the benchmark, used as its key in the results and the baseline.
+    run : Callable[[Any], Any]
+        The timed operation, called with the value returned by `setup`.
+    setup : Callable[[], Any]
+        The untimed preparation of the input of `run`, called before each repetition.
+    repeat : int
+        The number of timed repetitions.
+    slow : bool
+        Whether the benchmark is skipped by `--quick` runs.
+    """
+
+    name: str
+    run: Callable[[Any], Any]
+    setup: Callable[[], Any] = lambda: None
+    repeat: int = 5
+    slow: bool = False
+
+
+def time_benchmark(benchmark: Benchmark, repeat: int | None = None) -> dict[str, Any]:
+    """
+    Time the repetitions of a benchmark.
+
+    Parameters
+    ----------
+    benchmark : Benchmark
+        The benchmark to time.
+    repeat : int | None
+        The number of repetitions, overriding the one of the benchmark.
+
+    Returns
+    -------
+    dict[str, Any]
+        The number of repetitions and the minimum, median and mean wall times (s) of the repetitions.
+    """
+    times = []
+    for _ in range(repeat or benchmark.repeat):
+        value = benchmark.setup()
+        start_time = time.perf_counter()
+        benchmark.run(value)
+        times.append(time.perf_counter() - start_time)
+    return {"repeat": len(times), "min": min(times), "median": statistics.median(times), "mean": statistics.fmean(times)}
+
+
+def run_benchmarks(
+    benchmarks: list[Benchmark], name_filter: str | None = None, quick: bool = False, repeat: int | None = None
+) -> dict[str, Any]:
+    """
+    Run benchmarks and collect their timings with the description of the environment.
+
+    Parameters
+    ----------
+    benchmarks : list[Benchmark]
+        The benchmarks to run.
+    name_filter : str | None
+        Only the benchmarks whose name contains this string are run. If None, all of them are run.
+    quick : bool
+        Whether to skip the slow benchmarks.
+    repeat : int | None
+        The number of repetitions of every benchmark, overriding the ones of the benchmarks.
+
+    Returns
+    -------
+    dict[str, Any]
+        The description of the environment ("environment") and the timings of each benchmark ("results").
+    """
+    results = {}
+    for benchmark in benchmarks:
+        if (name_filter is not None and name_filter not in benchmark.name) or (quick and benchmark.slow):
+            continue
+        results[benchmark.name] = time_benchmark(benchmark, repeat)
+        print(f"{benchmark.name:<45} median {results[benchmark.name]['median'] * 1e3:10.2f} ms", flush=True)
+    environment = {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+    }
+    return {"environment": environment, "results": results}
+
+
+def compare_with_baseline(results: dict[str, Any], baseline: dict[str, Any], tolerance: float) -> list[str]:
+    """
+    Compare the median timings of benchmarks with the ones of a baseline.
+
+    Parameters
+    ----------
+    results : dict[str, Any]
+        The results of `run_benchmarks`.
+    baseline : dict[str, Any]
+        The results of a previous run of `run_benchmarks`.
+    tolerance : float
+        The allowed relative slowdown, e.g. 0.25 for 25 %.
+
+    Returns
+    -------
+    list[str]
+        The names of the benchmarks slower than the baseline by more than the tolerance.
+    """
+    regressions = []
+    for name, timing in results["results"].items():
+        baseline_timing = baseline["results"].get(name)
+        if baseline_timing is None:
+            print(f"{name:<45} new benchmark")
+            continue
+        ratio = timing["median"] / baseline_timing["median"]
+        status = "REGRESSION" if ratio > 1.0 + tolerance else "ok"
+        print(f"{name:<45} {ratio:6.2f}x baseline  {status}")
+        if ratio > 1.0 + tolerance:
+            regressions.append(name)
+    return regressions
+
+
+def main(benchmarks: list[Benchmark], argv: list[str] | None = None) -> int:
+    """
+    Run benchmarks from the command line.
+
+    Parameters
+    ----------
+    benchmarks : list[Benchmark]
+        The benchmarks of the suite.
+    argv : list[str] | None
+        The arguments of the command. If None, the ones of the command line.
+
+    Returns
+    -------
+    int
+        The exit status: 1 if a benchmark regressed compared with the baseline, 0 otherwise.
+    """
+    parser = argparse.ArgumentParser(description="Time the benchmarks and compare them with a baseline.")
+    parser.add_argument("-o", "--output", type=Path, default=None, help="path of the JSON results")
+    parser.add_argument("-b", "--baseline", type=Path, default=None, help="path of the JSON baseline to compare with")
+    parser.add_argument("-t", "--tolerance", type=float, default=0.25, help="allowed relative slowdown (default: 0.25)")
+    parser.add_argument("-k", "--filter", default=None, help="only run the benchmarks whose name contains this string")
+    parser.add_argument("-r", "--repeat", type=int, default=None, help="number of repetitions of every benchmark")
+    parser.add_argument("--quick", action="store_true", help="skip the slow benchmarks")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(benchmarks, args.filter, args.quick, args.repeat)
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    if args.baseline is None:
+        return 0
+    regressions = compare_with_baseline(results, json.loads(args.baseline.read_text(encoding="utf-8")), args.tolerance)
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) regressed: {', '.join(regressions)}", file=sys.stderr)
+        return 1
+    return 0
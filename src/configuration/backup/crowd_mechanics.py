@@ -0,0 +1,201 @@
+"""In-memory interface to the CrowdMechanics library, exchanging NumPy arrays instead of XML files at each time step."""
+
+# Copyright  2025  Institute of Light and Matter, CNRS UMR 5306, University Claude Bernard Lyon 1
+# Contributors: Oscar DUFOUR, Maxime STAPELLE, Alexandre NICOLAS
+
+# This software is a computer program designed to generate a realistic crowd from anthropometric data and
+# simulate the mechanical interactions that occur within it and with obstacles.
+
+# This software is governed by the CeCILL  license under French law and abiding by the rules of distribution
+# of free software.  You can  use, modify and/ or redistribute the software under the terms of the CeCILL
+# license as circulated by CEA, CNRS and INRIA at the following URL "http://www.cecill.info".
+
+# As a counterpart to the access to the source code and  rights to copy, modify and redistribute granted by
+# the license, users are provided only with a limited warranty  and the software's author,  the holder of the
+# economic rights,  and the successive licensors  have only  limited liability.
+
+# In this respect, the user's attention is drawn to the risks associated with loading,  using,  modifying
+# and/or developing or reproducing the software by the user in light of its specific status of free software,
+# that may mean  that it is complicated to manipulate,  and  that  also therefore means  that it is reserved
+# for developers  and  experienced professionals having in-depth computer knowledge. Users are therefore
+# encouraged to load and test the software's suitability as regards their requirements in conditions enabling
+# the security of their systems and/or data to be ensured and,  more generally, to use and operate it in the
+# same conditions as regards security.
+
+# The fact that you are presently reading this means that you have had knowledge of the CeCILL license and that
+# you accept its terms.
+
+import ctypes
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+import configuration.utils.constants as cst
+from configuration.utils.typing_custom import CrowdArraysDataType
+
+#: Argument type of the buffers read by the library, as contiguous arrays of float64.
+_INPUT_BUFFER = np.ctypeslib.ndpointer(dtype=np.float64, flags=("C_CONTIGUOUS", "ALIGNED"))
+#: Argument type of the buffers read and overwritten by the library.
+_OUTPUT_BUFFER = np.ctypeslib.ndpointer(dtype=np.float64, flags=("C_CONTIGUOUS", "ALIGNED", "WRITEABLE"))
+#: Buffers of a time step, in the order of the arguments of `CrowdMechanicsStep`, with their number of columns and
+#: whether the library overwrites them.
+_STEP_BUFFERS: dict[str, tuple[int, bool]] = {
+    "position": (2, True),
+    "velocity": (2, True),
+    "theta": (1, True),
+    "omega": (1, True),
+    "fp": (2, False),
+    "mp": (1, False),
+}
+
+
+def load_crowd_mechanics_library(library_path: Path) -> ctypes.CDLL:
+    """
+    Load the CrowdMechanics shared library and declare the signatures of its functions.
+
+    Parameters
+    ----------
+    library_path : Path
+        The path of the shared library (libCrowdMechanics.so, .dylib or .dll).
+
+    Returns
+    -------
+    ctypes.CDLL
+        The loaded library.
+
+    Raises
+    ------
+    TypeError
+        If `library_path` is not a Path object.
+    FileNotFoundError
+        If the library does not exist.
+    """
+    if not isinstance(library_path, Path):
+        raise TypeError("`library_path` should be a Path object.")
+    if not library_path.is_file():
+        raise FileNotFoundError(f"The CrowdMechanics library {library_path} does not exist.")
+    library = ctypes.CDLL(str(library_path))
+    library.CrowdMechanics.argtypes = [ctypes.POINTER(ctypes.c_char_p)]
+    library.CrowdMechanics.restype = ctypes.c_int
+    library.CrowdMechanicsInitialise.argtypes = [ctypes.POINTER(ctypes.c_char_p)]
+    library.CrowdMechanicsInitialise.restype = ctypes.c_int
+    library.CrowdMechanicsGetNumberAgents.argtypes = []
+    library.CrowdMechanicsGetNumberAgents.restype = ctypes.c_uint32
+    library.CrowdMechanicsGetAgentId.argtypes = [ctypes.c_uint32]
+    library.CrowdMechanicsGetAgentId.restype = ctypes.c_char_p
+    library.CrowdMechanicsStep.argtypes = [_OUTPUT_BUFFER] * 4 + [_INPUT_BUFFER] * 2
+    library.CrowdMechanicsStep.restype = ctypes.c_int
+    return library
+
+
+class CrowdMechanics:
+    """
+    Simulate the mechanical interactions of a crowd with the CrowdMechanics library, without any file at each time step.
+
+    The parameters and the static files (materials, geometry and agents) are read once. Each call to `step` then passes
+    the kinematics and the driving forces and torques of the agents to the library as NumPy arrays, which are updated in
+    place: there is neither file I/O nor XML parsing, and the contacts between agents are kept in memory by the library.
+
+    The library holds a single crowd: another instance created from the same library replaces the crowd of this one.
+
+    Parameters
+    ----------
+    library_path : Path
+        The path of the shared library.
+    parameters_path : Path
+        The path of the Parameters XML file, whose "Static" directory contains the static files.
+    materials_file_name : str, optional
+        The name of the Materials XML file in the static directory, by default the one of a crowd ZIP.
+    geometry_file_name : str, optional
+        The name of the Geometry XML file in the static directory, by default the one of a crowd ZIP.
+    agents_file_name : str, optional
+        The name of the Agents XML file in the static directory, by default the one of a crowd ZIP.
+
+    Raises
+    ------
+    ValueError
+        If the library cannot read the parameters or the static files.
+    """
+
+    def __init__(
+        self,
+        library_path: Path,
+        parameters_path: Path,
+        materials_file_name: str = cst.CROWD_XML_FILE_NAMES[3],
+        geometry_file_name: str = cst.CROWD_XML_FILE_NAMES[2],
+        agents_file_name: str = cst.CROWD_XML_FILE_NAMES[0],
+    ) -> None:
+        self.library = load_crowd_mechanics_library(library_path)
+        files = (ctypes.c_char_p * 4)(
+            str(parameters_path).encode(), materials_file_name.encode(), geometry_file_name.encode(), agents_file_name.encode()
+        )
+        if self.library.CrowdMechanicsInitialise(files) != 0:
+            raise ValueError(f"The CrowdMechanics library could not read the parameters {parameters_path} or the static files.")
+        self.number_agents: int = int(self.library.CrowdMechanicsGetNumberAgents())
+        self.agent_ids: list[str] = [self.library.CrowdMechanicsGetAgentId(agent).decode() for agent in range(self.number_agents)]
+
+    def step(self, dynamic_arrays: CrowdArraysDataType) -> None:
+        """
+        Simulate one time step of the crowd, updating its kinematics in place.
+
+        Parameters
+        ----------
+        dynamic_arrays : CrowdArraysDataType
+            The dynamic arrays of the crowd, in the layout of `dynamic_xml_to_arrays` and with the agents in the order of
+            `agent_ids`. The arrays "position", "velocity", "theta" and "omega" are overwritten with the new kinematics,
+            and the driving forces "fp" and torques "mp" are left unchanged. All of them should be C-contiguous arrays of
+            float64, so that the library uses them without copy.
+
+        Raises
+        ------
+        ValueError
+            If an array is missing, has another shape than the crowd or cannot be used without copy, or if the library fails.
+        """
+        buffers = [
+            _check_buffer(dynamic_arrays, key, self.number_agents, columns, overwritten)
+            for key, (columns, overwritten) in _STEP_BUFFERS.items()
+        ]
+        if self.library.CrowdMechanicsStep(*buffers) != 0:
+            raise ValueError("The CrowdMechanics library failed to simulate the time step.")
+
+
+def _check_buffer(dynamic_arrays: CrowdArraysDataType, key: str, number_agents: int, columns: int, overwritten: bool) -> Any:
+    """
+    Check that an array of the dynamic arrays can be passed to the library without copy.
+
+    Parameters
+    ----------
+    dynamic_arrays : CrowdArraysDataType
+        The dynamic arrays of the crowd.
+    key : str
+        The name of the array.
+    number_agents : int
+        The number of agents of the crowd.
+    columns : int
+        The number of columns of the array, 1 for a one-dimensional array.
+    overwritten : bool
+        Whether the library overwrites the array, which should then be writeable.
+
+    Returns
+    -------
+    Any
+        The array.
+
+    Raises
+    ------
+    ValueError
+        If the array is missing, has another shape, is not a C-contiguous array of float64, or is read-only while
+        overwritten.
+    """
+    if key not in dynamic_arrays:
+        raise ValueError(f"The dynamic arrays have no '{key}' array.")
+    array = dynamic_arrays[key]
+    expected_shape = (number_agents,) if columns == 1 else (number_agents, columns)
+    if array.shape != expected_shape:
+        raise ValueError(f"The '{key}' array should have a shape {expected_shape}, not {array.shape}.")
+    if array.dtype != np.float64 or not array.flags.c_contiguous:
+        raise ValueError(f"The '{key}' array should be a C-contiguous array of float64.")
+    if overwritten and not array.flags.writeable:
+        raise ValueError(f"The '{key}' array should be writeable.")
+    return array
@@ -27,15 +27,20 @@
 
 import itertools
 from collections import defaultdict
-from typing import Any
+from typing import Any, cast
 
 import numpy as np
+import shapely
+from numpy.typing import NDArray
+from scipy.spatial import cKDTree
+from shapely import STRtree
 from shapely.geometry import Point, Polygon
 
 import configuration.utils.constants as cst
 import configuration.utils.functions as fun
 from configuration.models.crowd import Crowd
 from configuration.utils.typing_custom import (
+    CrowdArraysDataType,
     DynamicCrowdDataType,
     GeometryDataType,
     InteractionsDataType,
@@ -187,6 +192,103 @@ def get_dynamic_params(current_crowd: Crowd) -> DynamicCrowdDataType:
     return dynamical_parameters_crowd
 
 
+def get_crowd_arrays(current_crowd: Crowd) -> tuple[CrowdArraysDataType, CrowdArraysDataType]:
+    """
+    Retrieve the static and dynamic parameters of all agents as columnar arrays, computed for the whole crowd at once.
+
+    The values are the ones of `get_static_params` and `get_dynamic_params`, with the same units and rounding, but the
+    positions, orientations and shape offsets of all agents are computed in a few vectorised operations instead of
+    agent by agent, and no nested dictionary is built.
+
+    Parameters
+    ----------
+    current_crowd : Crowd
+        The current crowd object containing agent data.
+
+    Returns
+    -------
+    CrowdArraysDataType
+        The static arrays of the crowd, in the layout of `static_xml_to_arrays`: the shapes of the i-th agent are the
+        rows `shape_offsets[i]` to `shape_offsets[i + 1]` of the shape arrays.
+    CrowdArraysDataType
+        The dynamic arrays of the crowd, in the layout of `dynamic_xml_to_arrays`, with one row per agent.
+
+    Raises
+    ------
+    ValueError
+        If the agents are not all pedestrians.
+    """
+    agents = current_crowd.agents
+    if not all(agent.agent_type.name == cst.AgentTypes.pedestrian.name for agent in agents):
+        raise ValueError("All agents must be pedestrians to retrieve static parameters.")
+    number_agents = len(agents)
+
+    # Gather the shapes of all agents
+    shape_names = [list(agent.shapes2D.shapes) for agent in agents]
+    shapes = [shape for agent in agents for shape in agent.shapes2D.shapes.values()]
+    shape_counts = np.array([len(agent.shapes2D.shapes) for agent in agents], dtype=np.int64)
+    shape_offsets = np.concatenate(([0], np.cumsum(shape_counts))).astype(np.int64)
+    agent_index = np.repeat(np.arange(number_agents), shape_counts)
+    shape_objects = np.array([shape["object"] for shape in shapes], dtype=object)
+    shape_centroids = shapely.centroid(shape_objects)
+    shape_radii = shapely.distance(shapely.get_exterior_ring(shape_objects), shape_centroids)
+    shape_centers = shapely.get_coordinates(shape_centroids).reshape(-1, 2)  # cm
+
+    # Position of each agent as the mean of the centroids of its shapes, and offsets of the shapes from it
+    positions = np.zeros((number_agents, 2))
+    np.add.at(positions, agent_index, shape_centers)
+    positions /= np.maximum(shape_counts, 1)[:, None]
+    delta_g_to_gi = shape_centers - positions[agent_index]
+
+    # Orientation of each agent, orthogonal to the direction from its last disk to its first disk
+    disk0_rows = shape_offsets[:-1] + np.array([names.index("disk0") for names in shape_names], dtype=np.int64)
+    disk4_rows = shape_offsets[:-1] + np.array([names.index("disk4") for names in shape_names], dtype=np.int64)
+    shoulders_direction = delta_g_to_gi[disk0_rows] - delta_g_to_gi[disk4_rows]
+    shoulders_direction /= np.linalg.norm(shoulders_direction, axis=1, keepdims=True)
+    orientations = fun.wrap_angle(np.degrees(np.arctan2(shoulders_direction[:, 1], shoulders_direction[:, 0]) - np.pi / 2))
+
+    # Offsets of the shapes in the frame of their agent
+    theta_rad = np.radians(-orientations)[agent_index]
+    shape_positions = np.column_stack(
+        (
+            delta_g_to_gi[:, 0] * np.cos(theta_rad) - delta_g_to_gi[:, 1] * np.sin(theta_rad),
+            delta_g_to_gi[:, 0] * np.sin(theta_rad) + delta_g_to_gi[:, 1] * np.cos(theta_rad),
+        )
+    )
+
+    measures = [agent.measures.measures for agent in agents]
+    static_arrays: CrowdArraysDataType = {
+        "agent_id": np.arange(number_agents, dtype=np.int64),
+        "agent_type": np.array([agent.agent_type.name for agent in agents], dtype=np.str_),
+        "mass": np.round(np.array([measure[cst.CommonMeasures.weight.name] for measure in measures], dtype=np.float64), 2),
+        "height": np.round(
+            np.array([measure[cst.PedestrianParts.height.name] for measure in measures], dtype=np.float64) * cst.CM_TO_M, 2
+        ),
+        "moment_of_inertia": np.round(
+            np.array([measure[cst.CommonMeasures.moment_of_inertia.name] for measure in measures], dtype=np.float64), 2
+        ),
+        "floor_damping": np.full(number_agents, np.round(cst.DEFAULT_FLOOR_DAMPING, 2)),
+        "angular_damping": np.full(number_agents, np.round(cst.DEFAULT_ANGULAR_DAMPING, 2)),
+        "shape_offsets": shape_offsets,
+        "shape_type": np.array([shape["type"] for shape in shapes], dtype=np.str_),
+        "shape_radius": np.round(np.round(shape_radii * cst.CM_TO_M, 3), 3),
+        "shape_material": np.array([getattr(cst.MaterialNames, str(shape["material"])).name for shape in shapes], dtype=np.str_),
+        "shape_position": np.round(shape_positions * cst.CM_TO_M, 3).reshape(-1, 2),
+    }
+    dynamic_arrays: CrowdArraysDataType = {
+        "agent_id": np.arange(number_agents, dtype=np.int64),
+        "position": np.round(positions * cst.CM_TO_M, 3),
+        "velocity": np.tile(
+            np.round([cst.INITIAL_TRANSLATIONAL_VELOCITY_X, cst.INITIAL_TRANSLATIONAL_VELOCITY_Y], 2), (number_agents, 1)
+        ),
+        "theta": np.round(np.radians(orientations), 2),
+        "omega": np.full(number_agents, np.round(cst.INITIAL_ROTATIONAL_VELOCITY, 2)),
+        "fp": np.tile(np.round([cst.DECISIONAL_TRANSLATIONAL_FORCE_X, cst.DECISIONAL_TRANSLATIONAL_FORCE_Y], 2), (number_agents, 1)),
+        "mp": np.full(number_agents, np.round(cst.DECISIONAL_TORQUE, 2)),
+    }
+    return static_arrays, dynamic_arrays
+
+
 def get_geometry_params(current_crowd: Crowd) -> GeometryDataType:
     """
     Retrieve the parameters of the boundaries.
@@ -252,10 +354,77 @@ def get_geometry_params(current_crowd: Crowd) -> GeometryDataType:
     return boundaries_dict
 
 
+def _get_intersecting_shape_pairs(current_crowd: Crowd) -> NDArray[np.int64]:
+    """
+    Find all the pairs of intersecting shapes that belong to two different agents of the crowd.
+
+    The candidate pairs are found in bulk with a spatial index over the shapes of all agents, instead of testing every
+    pair of agents. If all shapes are disks, the pairs are found with a k-d tree over their centers and decided by
+    vectorised circle tests: two polygonal disks surely intersect if their inscribed circles do, and surely do not if
+    their circumscribed circles do not. Only the pairs in between are tested with shapely. Otherwise, an STRtree over
+    all shapes is queried with the `intersects` predicate. Both methods give the same pairs as testing every pair of
+    shapes with shapely.
+
+    Parameters
+    ----------
+    current_crowd : Crowd
+        The current crowd object containing agent data.
+
+    Returns
+    -------
+    NDArray[np.int64]
+        An array of shape (number of pairs, 4) whose rows are (agent1 id, shape1 id, agent2 id, shape2 id), with
+        both orders of each pair, sorted lexicographically.
+    """
+    shapes, agent_ids, shape_ids, disk_only = [], [], [], True
+    for id_agent, agent in enumerate(current_crowd.agents):
+        for id_shape, shape in enumerate(agent.shapes2D.shapes.values()):
+            shapes.append(shape["object"])
+            agent_ids.append(id_agent)
+            shape_ids.append(id_shape)
+            disk_only = disk_only and shape["type"] == cst.ShapeTypes.disk.name
+    geometries = np.array(shapes, dtype=object)
+    agent_index = np.array(agent_ids, dtype=np.int64)
+    shape_index = np.array(shape_ids, dtype=np.int64)
+    if len(geometries) == 0:
+        return np.empty((0, 4), dtype=np.int64)
+
+    if disk_only:
+        # The vertices of the polygonal disks lie on their circumscribed circle
+        centers = shapely.get_coordinates(shapely.centroid(geometries))
+        coordinates, coordinates_index = shapely.get_coordinates(shapely.get_exterior_ring(geometries), return_index=True)
+        circumradii = np.zeros(len(geometries))
+        np.maximum.at(circumradii, coordinates_index, np.linalg.norm(coordinates - centers[coordinates_index], axis=1))
+        inradii = circumradii * np.cos(np.pi / (np.bincount(coordinates_index, minlength=len(geometries)) - 1))
+
+        # The circle tests are relaxed by a relative tolerance, the pairs within it being left to shapely
+        search_radius = 2.0 * float(np.max(circumradii)) * (1.0 + cst.CIRCLE_TEST_TOLERANCE)
+        first, second = cKDTree(centers).query_pairs(r=search_radius, output_type="ndarray").T
+        distances = np.linalg.norm(centers[first] - centers[second], axis=1)
+        surely_intersecting = distances < (inradii[first] + inradii[second]) * (1.0 - cst.CIRCLE_TEST_TOLERANCE)
+        undecided = ~surely_intersecting & (
+            distances <= (circumradii[first] + circumradii[second]) * (1.0 + cst.CIRCLE_TEST_TOLERANCE)
+        )
+        undecided[undecided] = shapely.intersects(geometries[first[undecided]], geometries[second[undecided]])
+        intersecting = surely_intersecting | undecided
+        first, second = first[intersecting], second[intersecting]
+        first, second = np.concatenate((first, second)), np.concatenate((second, first))
+    else:
+        first, second = STRtree(geometries).query(geometries, predicate="intersects")
+
+    pairs = np.column_stack((agent_index[first], shape_index[first], agent_index[second], shape_index[second]))
+    pairs = pairs[pairs[:, 0] != pairs[:, 2]]
+    sorted_pairs: NDArray[np.int64] = pairs[np.lexsort((pairs[:, 3], pairs[:, 1], pairs[:, 2], pairs[:, 0]))]
+    return sorted_pairs
+
+
 def get_interactions_params(current_crowd: Crowd) -> InteractionsDataType:
     """
     Retrieve the parameters for agent interactions.
 
+    Two agents interact through each pair of their shapes that intersect. The shapes of all agents are indexed
+    spatially, so that the intersecting pairs are found in near-linear time (see `_get_intersecting_shape_pairs`).
+
     Parameters
     ----------
     current_crowd : Crowd
@@ -268,42 +437,30 @@ def get_interactions_params(current_crowd: Crowd) -> InteractionsDataType:
     """
     interactions_dict: InteractionsDataType = {"Interactions": defaultdict(dict)}
 
-    # Loop through all agents
-    for id_agent1, agent1 in enumerate(current_crowd.agents):
-        agent1_data: dict[str, Any] = {
-            "Id": id_agent1,
+    # Initialize the data of all agents, even those without any interaction
+    for id_agent in range(len(current_crowd.agents)):
+        interactions_dict["Interactions"][f"Agent{id_agent}"] = {
+            "Id": id_agent,
             "NeighbouringAgents": defaultdict(dict),  # Initialize as an empty dictionary
         }
-        shapes_agent1 = agent1.shapes2D.get_geometric_shapes()
-
-        for id_agent2, agent2 in enumerate(current_crowd.agents):
-            if id_agent1 == id_agent2:
-                continue  # Skip self-interactions
-
-            shapes_agent2 = agent2.shapes2D.get_geometric_shapes()
-            interactions: dict[str, dict[str, int | tuple[float, float]]] = {
-                f"Interaction_{p_id}_{c_id}": {
-                    "ParentShape": p_id,
-                    "ChildShape": c_id,
-                    "TangentialRelativeDisplacement": (
-                        cst.INITIAL_TANGENTIAL_RELATIVE_DISPLACEMENT_X,
-                        cst.INITIAL_TANGENTIAL_RELATIVE_DISPLACEMENT_Y,
-                    ),
-                    "Fn": (cst.INITIAL_NORMAL_FORCE_X, cst.INITIAL_NORMAL_FORCE_Y),
-                    "Ft": (cst.INITIAL_TANGENTIAL_FORCE_X, cst.INITIAL_TANGENTIAL_FORCE_Y),
-                }
-                for p_id, shape1 in enumerate(shapes_agent1)
-                for c_id, shape2 in enumerate(shapes_agent2)
-                if p_id <= c_id and shape1.intersects(shape2)
-            }
-
-            if interactions:  # Only add if there are interactions
-                agent1_data["NeighbouringAgents"][f"Agent{id_agent2}"] = {
-                    "Id": id_agent2,
-                    "Interactions": interactions,
-                }
 
-        interactions_dict["Interactions"][f"Agent{id_agent1}"] = agent1_data
+    # Group the intersecting shape pairs by agent pair, keeping only the parent shapes with an id lower than the child's
+    for id_agent1, p_id, id_agent2, c_id in _get_intersecting_shape_pairs(current_crowd).tolist():
+        if p_id > c_id:
+            continue
+        neighbouring_agents = cast(dict[str, Any], interactions_dict["Interactions"][f"Agent{id_agent1}"]["NeighbouringAgents"])
+        if f"Agent{id_agent2}" not in neighbouring_agents:
+            neighbouring_agents[f"Agent{id_agent2}"] = {"Id": id_agent2, "Interactions": {}}
+        neighbouring_agents[f"Agent{id_agent2}"]["Interactions"][f"Interaction_{p_id}_{c_id}"] = {
+            "ParentShape": p_id,
+            "ChildShape": c_id,
+            "TangentialRelativeDisplacement": (
+                cst.INITIAL_TANGENTIAL_RELATIVE_DISPLACEMENT_X,
+                cst.INITIAL_TANGENTIAL_RELATIVE_DISPLACEMENT_Y,
+            ),
+            "Fn": (cst.INITIAL_NORMAL_FORCE_X, cst.INITIAL_NORMAL_FORCE_Y),
+            "Ft": (cst.INITIAL_TANGENTIAL_FORCE_X, cst.INITIAL_TANGENTIAL_FORCE_Y),
+        }
 
     return interactions_dict
 
@@ -0,0 +1,573 @@
+"""Save and load the crowd parameters as a compact binary archive of columnar arrays."""
+
+# Copyright  2025  Institute of Light and Matter, CNRS UMR 5306, University Claude Bernard Lyon 1
+# Contributors: Oscar DUFOUR, Maxime STAPELLE, Alexandre NICOLAS
+
+# This software is a computer program designed to generate a realistic crowd from anthropometric data and
+# simulate the mechanical interactions that occur within it and with obstacles.
+
+# This software is governed by the CeCILL  license under French law and abiding by the rules of distribution
+# of free software.  You can  use, modify and/ or redistribute the software under the terms of the CeCILL
+# license as circulated by CEA, CNRS and INRIA at the following URL "http://www.cecill.info".
+
+# As a counterpart to the access to the source code and  rights to copy, modify and redistribute granted by
+# the license, users are provided only with a limited warranty  and the software's author,  the holder of the
+# economic rights,  and the successive licensors  have only  limited liability.
+
+# In this respect, the user's attention is drawn to the risks associated with loading,  using,  modifying
+# and/or developing or reproducing the software by the user in light of its specific status of free software,
+# that may mean  that it is complicated to manipulate,  and  that  also therefore means  that it is reserved
+# for developers  and  experienced professionals having in-depth computer knowledge. Users are therefore
+# encouraged to load and test the software's suitability as regards their requirements in conditions enabling
+# the security of their systems and/or data to be ensured and,  more generally, to use and operate it in the
+# same conditions as regards security.
+
+# The fact that you are presently reading this means that you have had knowledge of the CeCILL license and that
+# you accept its terms.
+
+import os
+import zipfile
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+import configuration.backup.crowd_to_dict as to_dict
+import configuration.backup.dict_to_xml_and_reverse as dict_to_xml
+import configuration.utils.constants as cst
+from configuration.models.crowd import Crowd, create_agents_from_dynamic_static_geometry_parameters
+from configuration.utils.typing_custom import (
+    CrowdArraysDataType,
+    DynamicCrowdDataType,
+    GeometryDataType,
+    MaterialsDataType,
+    StaticCrowdDataType,
+)
+
+#: Arrays stored in a crowd archive, with the same units as the XML files (m, kg, rad, ...).
+CROWD_ARCHIVE_KEYS: tuple[str, ...] = (
+    # Static parameters, one row per agent, then one row per shape
+    "agent_id",
+    "agent_type",
+    "mass",
+    "height",
+    "moment_of_inertia",
+    "floor_damping",
+    "angular_damping",
+    "shape_offsets",
+    "shape_type",
+    "shape_radius",
+    "shape_material",
+    "shape_position",
+    # Dynamic parameters, one row per agent
+    "dynamic_agent_id",
+    "position",
+    "velocity",
+    "theta",
+    "omega",
+    "fp",
+    "mp",
+    # Geometry, one row per wall, then one row per corner
+    "dimensions",
+    "wall_id",
+    "wall_material",
+    "corner_offsets",
+    "corner_coordinates",
+    # Materials, one row per material, then one row per pair of materials
+    "material_id",
+    "young_modulus",
+    "shear_modulus",
+    "contact_id1",
+    "contact_id2",
+    "gamma_normal",
+    "gamma_tangential",
+    "kinetic_friction",
+)
+
+
+def static_dict_to_arrays(crowd_dict: StaticCrowdDataType) -> CrowdArraysDataType:
+    """
+    Convert a static crowd dictionary to columnar arrays.
+
+    The layout is the one of `static_xml_to_arrays`: the shapes of the i-th agent are the rows `shape_offsets[i]` to
+    `shape_offsets[i + 1]` of the shape arrays.
+
+    Parameters
+    ----------
+    crowd_dict : StaticCrowdDataType
+        Dictionary with agent data.
+
+    Returns
+    -------
+    CrowdArraysDataType
+        The static arrays of the crowd.
+    """
+    agents: list[dict[str, Any]] = list(crowd_dict["Agents"].values())
+    shapes = [shape_data for agent_data in agents for shape_data in agent_data["Shapes"].values()]
+    return {
+        "agent_id": np.array([agent_data["Id"] for agent_data in agents], dtype=np.int64),
+        "agent_type": np.array([agent_data["Type"] for agent_data in agents], dtype=np.str_),
+        "mass": np.array([agent_data["Mass"] for agent_data in agents], dtype=np.float64),
+        "height": np.array([agent_data["Height"] for agent_data in agents], dtype=np.float64),
+        "moment_of_inertia": np.array([agent_data["MomentOfInertia"] for agent_data in agents], dtype=np.float64),
+        "floor_damping": np.array([agent_data["FloorDamping"] for agent_data in agents], dtype=np.float64),
+        "angular_damping": np.array([agent_data["AngularDamping"] for agent_data in agents], dtype=np.float64),
+        "shape_offsets": np.cumsum([0] + [len(agent_data["Shapes"]) for agent_data in agents], dtype=np.int64),
+        "shape_type": np.array([shape_data["Type"] for shape_data in shapes], dtype=np.str_),
+        "shape_radius": np.array([shape_data["Radius"] for shape_data in shapes], dtype=np.float64),
+        "shape_material": np.array([shape_data["MaterialId"] for shape_data in shapes], dtype=np.str_),
+        "shape_position": np.array([shape_data["Position"] for shape_data in shapes], dtype=np.float64).reshape(-1, 2),
+    }
+
+
+def arrays_to_static_dict(arrays: CrowdArraysDataType) -> StaticCrowdDataType:
+    """
+    Convert columnar static arrays back to a static crowd dictionary.
+
+    Parameters
+    ----------
+    arrays : CrowdArraysDataType
+        The static arrays of the crowd, as returned by `static_dict_to_arrays`.
+
+    Returns
+    -------
+    StaticCrowdDataType
+        Dictionary with agent data, as returned by `static_xml_to_dict`.
+    """
+    shape_offsets = arrays["shape_offsets"].tolist()
+    shape_types = arrays["shape_type"].tolist()
+    shape_radii = arrays["shape_radius"].tolist()
+    shape_materials = arrays["shape_material"].tolist()
+    shape_positions = [tuple(position) for position in arrays["shape_position"].tolist()]
+    agents: dict[str, Any] = {}
+    for agent_idx, agent_id in enumerate(arrays["agent_id"].tolist()):
+        first_shape, last_shape = shape_offsets[agent_idx], shape_offsets[agent_idx + 1]
+        agents[f"Agent{agent_idx}"] = {
+            "Type": str(arrays["agent_type"][agent_idx]),
+            "Id": agent_id,
+            "Mass": float(arrays["mass"][agent_idx]),
+            "Height": float(arrays["height"][agent_idx]),
+            "MomentOfInertia": float(arrays["moment_of_inertia"][agent_idx]),
+            "FloorDamping": float(arrays["floor_damping"][agent_idx]),
+            "AngularDamping": float(arrays["angular_damping"][agent_idx]),
+            "Shapes": {
+                f"disk{shape_idx}": {
+                    "Type": shape_types[row],
+                    "Radius": shape_radii[row],
+                    "MaterialId": shape_materials[row],
+                    "Position": shape_positions[row],
+                }
+                for shape_idx, row in enumerate(range(first_shape, last_shape))
+            },
+        }
+    return {"Agents": agents}
+
+
+def dynamic_dict_to_arrays(dynamical_parameters_crowd: DynamicCrowdDataType) -> CrowdArraysDataType:
+    """
+    Convert a dictionary of agents' dynamic parameters to columnar arrays, with one row per agent.
+
+    The agent ids are stored as "dynamic_agent_id", so that the dynamic arrays can be stored along the static ones.
+
+    Parameters
+    ----------
+    dynamical_parameters_crowd : DynamicCrowdDataType
+        Dictionary with agent data.
+
+    Returns
+    -------
+    CrowdArraysDataType
+        The dynamic arrays of the crowd.
+    """
+    agents: list[dict[str, Any]] = list(dynamical_parameters_crowd["Agents"].values())
+    return {
+        "dynamic_agent_id": np.array([agent_data["Id"] for agent_data in agents], dtype=np.int64),
+        "position": np.array([agent_data["Kinematics"]["Position"] for agent_data in agents], dtype=np.float64).reshape(-1, 2),
+        "velocity": np.array([agent_data["Kinematics"]["Velocity"] for agent_data in agents], dtype=np.float64).reshape(-1, 2),
+        "theta": np.array([agent_data["Kinematics"]["Theta"] for agent_data in agents], dtype=np.float64),
+        "omega": np.array([agent_data["Kinematics"]["Omega"] for agent_data in agents], dtype=np.float64),
+        "fp": np.array([agent_data["Dynamics"]["Fp"] for agent_data in agents], dtype=np.float64).reshape(-1, 2),
+        "mp": np.array([agent_data["Dynamics"]["Mp"] for agent_data in agents], dtype=np.float64),
+    }
+
+
+def arrays_to_dynamic_dict(arrays: CrowdArraysDataType) -> DynamicCrowdDataType:
+    """
+    Convert columnar dynamic arrays back to a dictionary of agents' dynamic parameters.
+
+    Parameters
+    ----------
+    arrays : CrowdArraysDataType
+        The dynamic arrays of the crowd, as returned by `dynamic_dict_to_arrays`.
+
+    Returns
+    -------
+    DynamicCrowdDataType
+        Dictionary with agent data, as returned by `dynamic_xml_to_dict`.
+    """
+    positions = arrays["position"].tolist()
+    velocities = arrays["velocity"].tolist()
+    thetas = arrays["theta"].tolist()
+    omegas = arrays["omega"].tolist()
+    fps = arrays["fp"].tolist()
+    mps = arrays["mp"].tolist()
+    agents: dict[str, Any] = {
+        f"Agent{agent_id}": {
+            "Id": agent_id,
+            "Kinematics": {
+                "Position": tuple(positions[row]),
+                "Velocity": tuple(velocities[row]),
+                "Theta": thetas[row],
+                "Omega": omegas[row],
+            },
+            "Dynamics": {"Fp": tuple(fps[row]), "Mp": mps[row]},
+        }
+        for row, agent_id in enumerate(arrays["dynamic_agent_id"].tolist())
+    }
+    return {"Agents": agents}
+
+
+def geometry_dict_to_arrays(boundaries_dict: GeometryDataType) -> CrowdArraysDataType:
+    """
+    Convert a dictionary of geometry data to columnar arrays.
+
+    The corners of the i-th wall are the rows `corner_offsets[i]` to `corner_offsets[i + 1]` of "corner_coordinates".
+
+    Parameters
+    ----------
+    boundaries_dict : GeometryDataType
+        Dictionary with boundary data.
+
+    Returns
+    -------
+    CrowdArraysDataType
+        The geometry arrays of the crowd.
+    """
+    geometry: dict[str, Any] = boundaries_dict["Geometry"]
+    dimensions: dict[str, float] = geometry["Dimensions"]
+    walls: list[dict[str, Any]] = list(geometry["Wall"].values())
+    corners = [corner_data["Coordinates"] for wall_data in walls for corner_data in wall_data["Corners"].values()]
+    return {
+        "dimensions": np.array([dimensions["Lx"], dimensions["Ly"]], dtype=np.float64),
+        "wall_id": np.array([wall_data["Id"] for wall_data in walls], dtype=np.int64),
+        "wall_material": np.array([wall_data["MaterialId"] for wall_data in walls], dtype=np.str_),
+        "corner_offsets": np.cumsum([0] + [len(wall_data["Corners"]) for wall_data in walls], dtype=np.int64),
+        "corner_coordinates": np.array(corners, dtype=np.float64).reshape(-1, 2),
+    }
+
+
+def arrays_to_geometry_dict(arrays: CrowdArraysDataType) -> GeometryDataType:
+    """
+    Convert columnar geometry arrays back to a dictionary of geometry data.
+
+    Parameters
+    ----------
+    arrays : CrowdArraysDataType
+        The geometry arrays of the crowd, as returned by `geometry_dict_to_arrays`.
+
+    Returns
+    -------
+    GeometryDataType
+        Dictionary with boundary data, as returned by `geometry_xml_to_dict`.
+    """
+    corner_offsets = arrays["corner_offsets"].tolist()
+    corner_coordinates = [tuple(coordinates) for coordinates in arrays["corner_coordinates"].tolist()]
+    walls: dict[str, Any] = {
+        f"Wall{wall_id}": {
+            "Id": wall_id,
+            "MaterialId": str(arrays["wall_material"][wall_idx]),
+            "Corners": {
+                f"Corner{corner_idx}": {"Coordinates": corner_coordinates[row]}
+                for corner_idx, row in enumerate(range(corner_offsets[wall_idx], corner_offsets[wall_idx + 1]))
+            },
+        }
+        for wall_idx, wall_id in enumerate(arrays["wall_id"].tolist())
+    }
+    lx, ly = arrays["dimensions"].tolist()
+    return {"Geometry": {"Dimensions": {"Lx": lx, "Ly": ly}, "Wall": walls}}
+
+
+def materials_dict_to_arrays(material_dict: MaterialsDataType) -> CrowdArraysDataType:
+    """
+    Convert a dictionary of material properties to columnar arrays.
+
+    Parameters
+    ----------
+    material_dict : MaterialsDataType
+        Dictionary with material data.
+
+    Returns
+    -------
+    CrowdArraysDataType
+        The material arrays, with one row per material and one row per pair of materials in contact.
+    """
+    materials: list[dict[str, Any]] = list(material_dict["Materials"]["Intrinsic"].values())
+    contacts: list[dict[str, Any]] = list(material_dict["Materials"]["Binary"].values())
+    return {
+        "material_id": np.array([material["Id"] for material in materials], dtype=np.str_),
+        "young_modulus": np.array([material["YoungModulus"] for material in materials], dtype=np.float64),
+        "shear_modulus": np.array([material["ShearModulus"] for material in materials], dtype=np.float64),
+        "contact_id1": np.array([contact["Id1"] for contact in contacts], dtype=np.str_),
+        "contact_id2": np.array([contact["Id2"] for contact in contacts], dtype=np.str_),
+        "gamma_normal": np.array([contact["GammaNormal"] for contact in contacts], dtype=np.float64),
+        "gamma_tangential": np.array([contact["GammaTangential"] for contact in contacts], dtype=np.float64),
+        "kinetic_friction": np.array([contact["KineticFriction"] for contact in contacts], dtype=np.float64),
+    }
+
+
+def arrays_to_materials_dict(arrays: CrowdArraysDataType) -> MaterialsDataType:
+    """
+    Convert columnar material arrays back to a dictionary of material properties.
+
+    Parameters
+    ----------
+    arrays : CrowdArraysDataType
+        The material arrays, as returned by `materials_dict_to_arrays`.
+
+    Returns
+    -------
+    MaterialsDataType
+        Dictionary with material data, as returned by `materials_xml_to_dict`.
+    """
+    intrinsic_columns = zip(
+        arrays["material_id"].tolist(), arrays["young_modulus"].tolist(), arrays["shear_modulus"].tolist(), strict=True
+    )
+    binary_columns = zip(
+        arrays["contact_id1"].tolist(),
+        arrays["contact_id2"].tolist(),
+        arrays["gamma_normal"].tolist(),
+        arrays["gamma_tangential"].tolist(),
+        arrays["kinetic_friction"].tolist(),
+        strict=True,
+    )
+    return {
+        "Materials": {
+            "Intrinsic": {
+                f"Material{row}": {"Id": material_id, "YoungModulus": young_modulus, "ShearModulus": shear_modulus}
+                for row, (material_id, young_modulus, shear_modulus) in enumerate(intrinsic_columns)
+            },
+            "Binary": {
+                f"Contact{row}": {
+                    "Id1": id1,
+                    "Id2": id2,
+                    "GammaNormal": gamma_normal,
+                    "GammaTangential": gamma_tangential,
+                    "KineticFriction": kinetic_friction,
+                }
+                for row, (id1, id2, gamma_normal, gamma_tangential, kinetic_friction) in enumerate(binary_columns)
+            },
+        }
+    }
+
+
+def crowd_to_arrays(current_crowd: Crowd) -> CrowdArraysDataType:
+    """
+    Gather the static, dynamic, geometry and material parameters of a crowd as columnar arrays.
+
+    Parameters
+    ----------
+    current_crowd : Crowd
+        The current crowd object containing the parameters to be saved.
+
+    Returns
+    -------
+    CrowdArraysDataType
+        All the arrays of a crowd archive (see `CROWD_ARCHIVE_KEYS`).
+    """
+    static_arrays, dynamic_arrays = to_dict.get_crowd_arrays(current_crowd)
+    dynamic_arrays["dynamic_agent_id"] = dynamic_arrays.pop("agent_id")
+    return {
+        **static_arrays,
+        **dynamic_arrays,
+        **geometry_dict_to_arrays(to_dict.get_geometry_params(current_crowd)),
+        **materials_dict_to_arrays(to_dict.get_materials_params()),
+    }
+
+
+def save_crowd_arrays_to_npz(arrays: CrowdArraysDataType, output_npz_path: Path) -> None:
+    """
+    Save the arrays of a crowd to a versioned, uncompressed `.npz` archive.
+
+    Each array is stored as a contiguous `.npy` member, so that it can be read on its own. The file is first written
+    next to its destination and then atomically moved in place.
+
+    Parameters
+    ----------
+    arrays : CrowdArraysDataType
+        All the arrays of a crowd archive (see `CROWD_ARCHIVE_KEYS`).
+    output_npz_path : Path
+        The path where the archive will be saved.
+
+    Raises
+    ------
+    TypeError
+        If `output_npz_path` is not a Path object.
+    ValueError
+        If `output_npz_path` does not have a .npz extension, or if some arrays are missing.
+    """
+    if not isinstance(output_npz_path, Path):
+        raise TypeError("`output_npz_path` should be a Path object.")
+    if output_npz_path.suffix != ".npz":
+        raise ValueError("`output_npz_path` should have a .npz extension.")
+    missing_keys = [key for key in CROWD_ARCHIVE_KEYS if key not in arrays]
+    if missing_keys:
+        raise ValueError(f"Missing arrays in the crowd archive: {', '.join(missing_keys)}")
+
+    output_npz_path.parent.mkdir(parents=True, exist_ok=True)
+    temporary_path = output_npz_path.with_name(f"{output_npz_path.name}.tmp")
+    archive_arrays: dict[str, Any] = {key: np.asarray(arrays[key]) for key in CROWD_ARCHIVE_KEYS}
+    with open(temporary_path, "wb") as archive_file:
+        np.savez(archive_file, version=np.array(cst.CROWD_ARCHIVE_VERSION, dtype=np.int64), **archive_arrays)
+    os.replace(temporary_path, output_npz_path)
+
+
+def load_crowd_arrays_from_npz(npz_path: Path) -> CrowdArraysDataType:
+    """
+    Load the arrays of a crowd from a `.npz` archive written by `save_crowd_arrays_to_npz`.
+
+    Parameters
+    ----------
+    npz_path : Path
+        The path of the archive.
+
+    Returns
+    -------
+    CrowdArraysDataType
+        All the arrays of the crowd archive (see `CROWD_ARCHIVE_KEYS`).
+
+    Raises
+    ------
+    TypeError
+        If `npz_path` is not a Path object.
+    FileNotFoundError
+        If the archive does not exist.
+    ValueError
+        If the archive was written with an unsupported layout version or if some arrays are missing.
+    """
+    if not isinstance(npz_path, Path):
+        raise TypeError("`npz_path` should be a Path object.")
+    if not npz_path.exists():
+        raise FileNotFoundError(f"Crowd archive not found: {npz_path}")
+
+    with np.load(npz_path, allow_pickle=False) as data:
+        if "version" not in data.files:
+            raise ValueError(f"{npz_path} is not a crowd archive.")
+        version = int(data["version"])
+        if version != cst.CROWD_ARCHIVE_VERSION:
+            raise ValueError(f"Unsupported crowd archive version {version} (expected {cst.CROWD_ARCHIVE_VERSION}).")
+        missing_keys = [key for key in CROWD_ARCHIVE_KEYS if key not in data.files]
+        if missing_keys:
+            raise ValueError(f"Missing arrays in the crowd archive: {', '.join(missing_keys)}")
+        return {key: data[key] for key in CROWD_ARCHIVE_KEYS}
+
+
+def save_crowd_data_to_npz(current_crowd: Crowd, output_npz_path: Path) -> None:
+    """
+    Save crowd data as a `.npz` archive of columnar arrays.
+
+    Parameters
+    ----------
+    current_crowd : Crowd
+        The current crowd object containing the parameters to be saved.
+    output_npz_path : Path
+        The path where the archive will be saved.
+    """
+    save_crowd_arrays_to_npz(crowd_to_arrays(current_crowd), output_npz_path)
+
+
+def load_crowd_from_npz(npz_path: Path) -> Crowd:
+    """
+    Create a crowd from a `.npz` archive written by `save_crowd_data_to_npz`.
+
+    Parameters
+    ----------
+    npz_path : Path
+        The path of the archive.
+
+    Returns
+    -------
+    Crowd
+        A Crowd object containing the agents and the boundaries stored in the archive.
+    """
+    arrays = load_crowd_arrays_from_npz(npz_path)
+    return create_agents_from_dynamic_static_geometry_parameters(
+        static_dict=arrays_to_static_dict(arrays),
+        dynamic_dict=arrays_to_dynamic_dict(arrays),
+        geometry_dict=arrays_to_geometry_dict(arrays),
+    )
+
+
+def xml_zip_to_npz(zip_path: Path, output_npz_path: Path) -> None:
+    """
+    Convert a ZIP file of XML files, as written by `save_crowd_data_to_zip`, to a `.npz` crowd archive.
+
+    Parameters
+    ----------
+    zip_path : Path
+        The path of the ZIP file containing Agents.xml, AgentDynamics.xml, Geometry.xml and Materials.xml.
+    output_npz_path : Path
+        The path where the archive will be saved.
+
+    Raises
+    ------
+    TypeError
+        If `zip_path` is not a Path object.
+    ValueError
+        If an XML file is missing from the ZIP file or is malformed.
+    """
+    if not isinstance(zip_path, Path):
+        raise TypeError("`zip_path` should be a Path object.")
+
+    with zipfile.ZipFile(zip_path, "r") as zip_file:
+        missing_files = [name for name in cst.CROWD_XML_FILE_NAMES if name not in zip_file.namelist()]
+        if missing_files:
+            raise ValueError(f"Missing files in {zip_path}: {', '.join(missing_files)}")
+        # The XML files are parsed incrementally, straight from the ZIP file
+        with zip_file.open("Agents.xml") as xml_file:
+            static_arrays = dict_to_xml.static_xml_to_arrays(xml_file)
+        with zip_file.open("AgentDynamics.xml") as xml_file:
+            dynamic_arrays = dict_to_xml.dynamic_xml_to_arrays(xml_file)
+        with zip_file.open("Geometry.xml") as xml_file:
+            geometry_arrays = geometry_dict_to_arrays(dict_to_xml.geometry_xml_to_dict(xml_file))
+        with zip_file.open("Materials.xml") as xml_file:
+            materials_arrays = materials_dict_to_arrays(dict_to_xml.materials_xml_to_dict(xml_file))
+
+    dynamic_arrays["dynamic_agent_id"] = dynamic_arrays.pop("agent_id")
+    save_crowd_arrays_to_npz({**static_arrays, **dynamic_arrays, **geometry_arrays, **materials_arrays}, output_npz_path)
+
+
+def npz_to_xml_zip(npz_path: Path, output_zip_path: Path) -> None:
+    """
+    Convert a `.npz` crowd archive to a ZIP file of XML files, as written by `save_crowd_data_to_zip`.
+
+    Parameters
+    ----------
+    npz_path : Path
+        The path of the archive.
+    output_zip_path : Path
+        The path where the ZIP file will be saved.
+
+    Raises
+    ------
+    TypeError
+        If `output_zip_path` is not a Path object.
+    ValueError
+        If `output_zip_path` does not have a .zip extension.
+    """
+    if not isinstance(output_zip_path, Path):
+        raise TypeError("`output_zip_path` should be a Path object.")
+    if output_zip_path.suffix != ".zip":
+        raise ValueError("`output_zip_path` should have a .zip extension.")
+
+    arrays = load_crowd_arrays_from_npz(npz_path)
+    output_zip_path.parent.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(output_zip_path, "w", zipfile.ZIP_DEFLATED) as zip_file:
+        # The XML files are streamed straight into the ZIP file
+        with zip_file.open("Agents.xml", "w") as xml_file:
+            dict_to_xml.write_static_arrays_xml(arrays, xml_file)
+        with zip_file.open("AgentDynamics.xml", "w") as xml_file:
+            dict_to_xml.write_dynamic_arrays_xml({**arrays, "agent_id": arrays["dynamic_agent_id"]}, xml_file)
+        with zip_file.open("Geometry.xml", "w") as xml_file:
+            dict_to_xml.write_geometry_xml(arrays_to_geometry_dict(arrays), xml_file)
+        with zip_file.open("Materials.xml", "w") as xml_file:
+            dict_to_xml.write_materials_xml(arrays_to_materials_dict(arrays), xml_file)
@@ -26,17 +26,24 @@
 # you accept its terms.
 
 import io
+import shutil
+import tempfile
 import zipfile
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
+from typing import IO
 
 import configuration.backup.crowd_to_dict as to_dict
 import configuration.backup.dict_to_xml_and_reverse as dict_to_xml
+import configuration.utils.constants as cst
 from configuration.models.crowd import Crowd
 
 
-def write_crowd_data_to_zip(current_crowd: Crowd) -> io.BytesIO:
+def _get_crowd_xml_writers(current_crowd: Crowd) -> list[tuple[str, Callable[[IO[bytes]], None]]]:
     """
-    Generate an in-memory ZIP file containing XML representations of the nested dictionaries that summarize the crowd parameters.
+    Build, for each member of the crowd ZIP file, a function streaming its XML representation to a binary stream.
 
     Parameters
     ----------
@@ -45,49 +52,115 @@ def write_crowd_data_to_zip(current_crowd: Crowd) -> io.BytesIO:
 
     Returns
     -------
-    io.BytesIO
-        An in-memory ZIP file containing the XML representations of crowd parameters.
+    list[tuple[str, Callable[[IO[bytes]], None]]]
+        The name of each member of the ZIP file, in archive order, and the function writing its content.
+    """
+    static_file_name, dynamic_file_name, geometry_file_name, materials_file_name = cst.CROWD_XML_FILE_NAMES
+    static_arrays, dynamic_arrays = to_dict.get_crowd_arrays(current_crowd)
+    return [
+        (static_file_name, partial(dict_to_xml.write_static_arrays_xml, static_arrays)),
+        (dynamic_file_name, partial(dict_to_xml.write_dynamic_arrays_xml, dynamic_arrays)),
+        (geometry_file_name, partial(dict_to_xml.write_geometry_xml, to_dict.get_geometry_params(current_crowd))),
+        (materials_file_name, partial(dict_to_xml.write_materials_xml, to_dict.get_materials_params())),
+    ]
+
+
+def _write_to_spooled_file(write_xml: Callable[[IO[bytes]], None]) -> IO[bytes]:
     """
-    # Extract static pedestrian parameters and convert to XML
-    static_data_dict = to_dict.get_static_params(current_crowd)
-    static_data_bytes = dict_to_xml.static_dict_to_xml(static_data_dict)
+    Serialise an XML member into a temporary file, kept in memory until it exceeds `ZIP_SPOOL_MAX_SIZE` bytes.
 
-    # Extract dynamic pedestrian parameters and convert to XML
-    dynamic_data_dict = to_dict.get_dynamic_params(current_crowd)
-    dynamic_data_bytes = dict_to_xml.dynamic_dict_to_xml(dynamic_data_dict)
+    Parameters
+    ----------
+    write_xml : Callable[[IO[bytes]], None]
+        The function streaming the XML representation of the member.
 
-    # Extract geometry parameters and convert to XML
-    geometry_data_dict = to_dict.get_geometry_params(current_crowd)
-    geometry_data_bytes = dict_to_xml.geometry_dict_to_xml(geometry_data_dict)
+    Returns
+    -------
+    IO[bytes]
+        The temporary file, rewound to its beginning.
+    """
+    spooled_file = tempfile.SpooledTemporaryFile(max_size=cst.ZIP_SPOOL_MAX_SIZE)
+    write_xml(spooled_file)
+    spooled_file.seek(0)
+    return spooled_file
 
-    # Extract material parameters and convert to XML
-    materials_data_dict = to_dict.get_materials_params()
-    materials_data_bytes = dict_to_xml.materials_dict_to_xml(materials_data_dict)
 
-    # Create an in-memory ZIP file
+def stream_crowd_data_to_zip(current_crowd: Crowd, output: Path | IO[bytes], max_workers: int = 1) -> None:
+    """
+    Stream the XML representations of the crowd parameters into a ZIP file, without materialising any member in memory.
+
+    Each member is opened with `ZipFile.open(name, "w")` and the XML writers of `dict_to_xml_and_reverse` write straight
+    into it, so the members are compressed while they are generated. With several workers, the members are serialised
+    concurrently in threads while the calling thread compresses the ones already available into the archive, in order.
+
+    Parameters
+    ----------
+    current_crowd : Crowd
+        The current crowd object containing the parameters to be saved.
+    output : Path | IO[bytes]
+        The path of the ZIP file, or a binary stream opened for writing.
+    max_workers : int, optional
+        The number of threads serialising the members. With 1 (the default), everything runs in the calling thread.
+
+    Raises
+    ------
+    ValueError
+        If `max_workers` is not a positive integer.
+    """
+    if not isinstance(max_workers, int) or max_workers < 1:
+        raise ValueError("`max_workers` should be a positive integer.")
+
+    xml_writers = _get_crowd_xml_writers(current_crowd)
+    with zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED) as zip_file:
+        if max_workers == 1:
+            for file_name, write_xml in xml_writers:
+                with zip_file.open(file_name, "w") as member_file:
+                    write_xml(member_file)
+            return
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [(file_name, executor.submit(_write_to_spooled_file, write_xml)) for file_name, write_xml in xml_writers]
+            for file_name, future in futures:
+                with future.result() as spooled_file, zip_file.open(file_name, "w") as member_file:
+                    shutil.copyfileobj(spooled_file, member_file, cst.XML_WRITE_BUFFER_SIZE)
+
+
+def write_crowd_data_to_zip(current_crowd: Crowd) -> io.BytesIO:
+    """
+    Generate an in-memory ZIP file containing XML representations of the nested dictionaries that summarize the crowd parameters.
+
+    Parameters
+    ----------
+    current_crowd : Crowd
+        The current crowd object containing the parameters to be saved.
+
+    Returns
+    -------
+    io.BytesIO
+        An in-memory ZIP file containing the XML representations of crowd parameters.
+    """
     zip_buffer = io.BytesIO()
-    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
-        # Write each XML file into the ZIP archive
-        zip_file.writestr("Agents.xml", static_data_bytes)
-        zip_file.writestr("AgentDynamics.xml", dynamic_data_bytes)
-        zip_file.writestr("Geometry.xml", geometry_data_bytes)
-        zip_file.writestr("Materials.xml", materials_data_bytes)
+    stream_crowd_data_to_zip(current_crowd, zip_buffer)
 
     # Move the buffer's pointer to the beginning
     zip_buffer.seek(0)
     return zip_buffer
 
 
-def save_crowd_data_to_zip(current_crowd: Crowd, output_zip_path: Path) -> None:
+def save_crowd_data_to_zip(current_crowd: Crowd, output_zip_path: Path, max_workers: int = 1) -> None:
     """
     Save crowd data as a ZIP file containing multiple XML files.
 
+    The archive is streamed directly to the output file (see `stream_crowd_data_to_zip`).
+
     Parameters
     ----------
     current_crowd : Crowd
         The current crowd object containing the parameters to be saved.
     output_zip_path : Path
         The path where the ZIP file will be saved.
+    max_workers : int, optional
+        The number of threads serialising the members of the archive, by default 1.
 
     Raises
     ------
@@ -104,12 +177,4 @@ def save_crowd_data_to_zip(current_crowd: Crowd, output_zip_path: Path) -> None:
     # Ensure the output directory exists
     output_zip_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Generate the ZIP file in memory
-    zip_buffer = write_crowd_data_to_zip(current_crowd)
-
-    # Write the in-memory ZIP file to the specified output path
-    with open(output_zip_path, "wb") as output_file:
-        output_file.write(zip_buffer.read())
-
-    # Close the in-memory buffer
-    zip_buffer.close()
+    stream_crowd_data_to_zip(current_crowd, output_zip_path, max_workers=max_workers)
@@ -26,9 +26,13 @@
 # you accept its terms.
 
 import xml.etree.ElementTree as ET
-from typing import Any
-from xml.dom import minidom
+from collections.abc import Iterator
+from contextlib import contextmanager
+from io import BytesIO
+from pathlib import Path
+from typing import IO, Any
 from xml.dom.minidom import parseString
+from xml.sax.saxutils import escape
 
 import numpy as np
 from dicttoxml import dicttoxml
@@ -36,6 +40,7 @@ from dicttoxml import dicttoxml
 import configuration.utils.constants as cst
 import configuration.utils.functions as fun
 from configuration.utils.typing_custom import (
+    CrowdArraysDataType,
     DynamicCrowdDataType,
     GeometryDataType,
     InteractionsDataType,
@@ -44,8 +49,44 @@ from configuration.utils.typing_custom import (
     PairMaterialsDataType,
     ShapeDataType,
     StaticCrowdDataType,
+    XMLSourceType,
 )
 
+# Indentation of the XML files, as produced by `minidom.toprettyxml(indent="    ")`
+_XML_INDENT = "    "
+# Characters escaped in the attribute values by minidom, on top of "&", "<" and ">"
+_XML_ATTRIBUTE_ENTITIES = {'"': "&quot;"}
+
+# Columns of the arrays read from the XML files, with the attribute they are read from
+_STATIC_AGENT_COLUMNS = {
+    "agent_id": "Id",
+    "agent_type": "Type",
+    "mass": "Mass",
+    "height": "Height",
+    "moment_of_inertia": "MomentOfInertia",
+    "floor_damping": "FloorDamping",
+    "angular_damping": "AngularDamping",
+}
+_STATIC_SHAPE_COLUMNS = {"shape_type": "Type", "shape_radius": "Radius", "shape_material": "MaterialId", "shape_position": "Position"}
+_DYNAMIC_COLUMNS = {
+    "agent_id": ("", "Id"),
+    "position": ("Kinematics", "Position"),
+    "velocity": ("Kinematics", "Velocity"),
+    "theta": ("Kinematics", "Theta"),
+    "omega": ("Kinematics", "Omega"),
+    "fp": ("Dynamics", "Fp"),
+    "mp": ("Dynamics", "Mp"),
+}
+_INTERACTIONS_COLUMNS = {
+    "parent_agent_id": "",
+    "child_agent_id": "",
+    "parent_shape": "ParentShape",
+    "child_shape": "ChildShape",
+    "tangential_relative_displacement": "TangentialRelativeDisplacement",
+    "fn": "Fn",
+    "ft": "Ft",
+}
+
 
 def save_light_agents_params_dict_to_xml(crowd_data_dict: StaticCrowdDataType) -> str:
     """
@@ -74,150 +115,477 @@ def save_light_agents_params_dict_to_xml(crowd_data_dict: StaticCrowdDataType) -
     return data
 
 
-def static_dict_to_xml(crowd_dict: StaticCrowdDataType) -> bytes:
+class _IndentedXMLWriter:
     """
-    Convert a static crowd dictionary to a prettified XML representation.
+    Write indented XML incrementally to a binary stream.
+
+    The output is identical to the one of `xml.dom.minidom` `toprettyxml(indent="    ", encoding="utf-8")` for documents
+    made of elements with attributes only (no text), which is the case of all the files of the crowd. Elements without
+    children are self-closed. The encoded text is buffered and flushed to the stream by chunks, so the memory used does
+    not depend on the size of the document.
+
+    Parameters
+    ----------
+    stream : IO[bytes]
+        Binary stream to which the XML is written.
+    """
+
+    def __init__(self, stream: IO[bytes]) -> None:
+        self._stream = stream
+        self._open_tags: list[str] = []
+        self._start_tag_pending = False
+        self._buffer: list[str] = ['<?xml version="1.0" encoding="utf-8"?>\n']
+        self._buffer_size = 0
+
+    def _write(self, text: str) -> None:
+        """Append some text to the buffer and flush the buffer when it is large enough."""
+        self._buffer.append(text)
+        self._buffer_size += len(text)
+        if self._buffer_size >= cst.XML_WRITE_BUFFER_SIZE:
+            self.flush()
+
+    def flush(self) -> None:
+        """Encode the buffered text and write it to the stream."""
+        self._stream.write("".join(self._buffer).encode("utf-8"))
+        self._buffer = []
+        self._buffer_size = 0
+
+    def start(self, tag: str, attributes: dict[str, str] | None = None) -> None:
+        """
+        Open an element.
+
+        Parameters
+        ----------
+        tag : str
+            Name of the element.
+        attributes : dict[str, str] | None
+            Attributes of the element, written in the given order.
+        """
+        if self._start_tag_pending:
+            self._write(">\n")
+        attributes_text = "".join(f' {name}="{escape(value, _XML_ATTRIBUTE_ENTITIES)}"' for name, value in (attributes or {}).items())
+        self._write(f"{_XML_INDENT * len(self._open_tags)}<{tag}{attributes_text}")
+        self._open_tags.append(tag)
+        self._start_tag_pending = True
+
+    def end(self) -> None:
+        """Close the last opened element."""
+        tag = self._open_tags.pop()
+        if self._start_tag_pending:
+            self._write("/>\n")
+        else:
+            self._write(f"{_XML_INDENT * len(self._open_tags)}</{tag}>\n")
+        self._start_tag_pending = False
+
+    def element(self, tag: str, attributes: dict[str, str] | None = None) -> None:
+        """
+        Write an element without children.
+
+        Parameters
+        ----------
+        tag : str
+            Name of the element.
+        attributes : dict[str, str] | None
+            Attributes of the element, written in the given order.
+        """
+        self.start(tag, attributes)
+        self.end()
+
+    def close(self) -> None:
+        """Close all the elements still opened and flush the buffer to the stream."""
+        while self._open_tags:
+            self.end()
+        self.flush()
+
+
+@contextmanager
+def _open_binary_stream(output: Path | IO[bytes]) -> Iterator[IO[bytes]]:
+    """
+    Open the output of a writer as a binary stream.
+
+    Parameters
+    ----------
+    output : Path | IO[bytes]
+        Path of the file to write, or binary stream (left open).
+
+    Yields
+    ------
+    IO[bytes]
+        The binary stream to write to.
+    """
+    if isinstance(output, Path):
+        with output.open("wb") as stream:
+            yield stream
+    else:
+        yield output
+
+
+def write_static_xml(crowd_dict: StaticCrowdDataType, output: Path | IO[bytes]) -> None:
+    """
+    Write a static crowd dictionary as pretty-printed XML, incrementally.
 
     Parameters
     ----------
     crowd_dict : StaticCrowdDataType
         Dictionary with agent data.
-
-    Returns
-    -------
-    bytes
-        UTF-8 encoded, pretty-printed XML representation of all agents' static parameters.
+    output : Path | IO[bytes]
+        Path of the file to write, or binary stream to write to.
     """
-    # Create the root element <Agents>
-    root = ET.Element("Agents")
-
-    # Iterate through each agent in the dictionary
-    for agent_data in crowd_dict["Agents"].values():
-        # Create an <Agent> element with attributes
-        agent = ET.SubElement(
-            root,
-            "Agent",
-            {
-                "Type": agent_data["Type"],
-                "Id": f"{agent_data['Id']}",
-                "Mass": f"{agent_data['Mass']:.2f}",
-                "Height": f"{agent_data['Height']:.2f}",
-                "MomentOfInertia": f"{agent_data['MomentOfInertia']:.2f}",
-                "FloorDamping": f"{agent_data['FloorDamping']:.2f}",
-                "AngularDamping": f"{agent_data['AngularDamping']:.2f}",
-            },
-        )
-
-        # Iterate through each shape in the agent's shapes
-        for shape_data in agent_data["Shapes"].values():
-            # Create a <Shape> element with attributes
-            ET.SubElement(
-                agent,
-                "Shape",
+    with _open_binary_stream(output) as stream:
+        writer = _IndentedXMLWriter(stream)
+        writer.start("Agents")
+
+        # Iterate through each agent in the dictionary
+        for agent_data in crowd_dict["Agents"].values():
+            writer.start(
+                "Agent",
                 {
-                    "Type": shape_data["Type"],
-                    "Radius": f"{shape_data['Radius']:.3f}",
-                    "MaterialId": f"{shape_data['MaterialId']}",
-                    "Position": f"{shape_data['Position'][0]:.3f},{shape_data['Position'][1]:.3f}",
+                    "Type": agent_data["Type"],
+                    "Id": f"{agent_data['Id']}",
+                    "Mass": f"{agent_data['Mass']:.2f}",
+                    "Height": f"{agent_data['Height']:.2f}",
+                    "MomentOfInertia": f"{agent_data['MomentOfInertia']:.2f}",
+                    "FloorDamping": f"{agent_data['FloorDamping']:.2f}",
+                    "AngularDamping": f"{agent_data['AngularDamping']:.2f}",
                 },
             )
 
-    rough_string = ET.tostring(root, encoding="utf-8")
-    reparsed = minidom.parseString(rough_string).toprettyxml(indent="    ", encoding="utf-8")
+            # Iterate through each shape in the agent's shapes
+            for shape_data in agent_data["Shapes"].values():
+                writer.element(
+                    "Shape",
+                    {
+                        "Type": shape_data["Type"],
+                        "Radius": f"{shape_data['Radius']:.3f}",
+                        "MaterialId": f"{shape_data['MaterialId']}",
+                        "Position": f"{shape_data['Position'][0]:.3f},{shape_data['Position'][1]:.3f}",
+                    },
+                )
+            writer.end()
 
-    return reparsed
+        writer.close()
 
 
-def dynamic_dict_to_xml(dynamical_parameters_crowd: DynamicCrowdDataType) -> bytes:
+def write_dynamic_xml(dynamical_parameters_crowd: DynamicCrowdDataType, output: Path | IO[bytes]) -> None:
     """
-    Convert a dictionary of agents' dynamic parameters to a prettified XML representation.
+    Write a dictionary of agents' dynamic parameters as pretty-printed XML, incrementally.
 
     Parameters
     ----------
     dynamical_parameters_crowd : DynamicCrowdDataType
         Dictionary with agent data.
-
-    Returns
-    -------
-    bytes
-        UTF-8 encoded, pretty-printed XML representation of all agents' dynamic parameters.
+    output : Path | IO[bytes]
+        Path of the file to write, or binary stream to write to.
     """
-    # Create the root element
-    root = ET.Element("Agents")
+    with _open_binary_stream(output) as stream:
+        writer = _IndentedXMLWriter(stream)
+        writer.start("Agents")
 
-    # Iterate through agents in the dictionary
-    for agent_data in dynamical_parameters_crowd["Agents"].values():
-        # Create an Agent element
-        agent_element = ET.SubElement(root, "Agent", Id=f"{agent_data['Id']}")
+        # Iterate through agents in the dictionary
+        for agent_data in dynamical_parameters_crowd["Agents"].values():
+            writer.start("Agent", {"Id": f"{agent_data['Id']}"})
 
-        # Create Kinematics element
-        kinematics_data = agent_data["Kinematics"]
-        ET.SubElement(
-            agent_element,
-            "Kinematics",
-            Position=f"{kinematics_data['Position'][0]:.3f},{kinematics_data['Position'][1]:.3f}",
-            Velocity=f"{kinematics_data['Velocity'][0]:.2f},{kinematics_data['Velocity'][1]:.2f}",
-            Theta=f"{kinematics_data['Theta']:.2f}",
-            Omega=f"{kinematics_data['Omega']:.2f}",
-        )
+            kinematics_data = agent_data["Kinematics"]
+            writer.element(
+                "Kinematics",
+                {
+                    "Position": f"{kinematics_data['Position'][0]:.3f},{kinematics_data['Position'][1]:.3f}",
+                    "Velocity": f"{kinematics_data['Velocity'][0]:.2f},{kinematics_data['Velocity'][1]:.2f}",
+                    "Theta": f"{kinematics_data['Theta']:.2f}",
+                    "Omega": f"{kinematics_data['Omega']:.2f}",
+                },
+            )
 
-        # Create Dynamics element
-        dynamics_data = agent_data["Dynamics"]
-        ET.SubElement(
-            agent_element,
-            "Dynamics",
-            Fp=f"{dynamics_data['Fp'][0]:.2f},{dynamics_data['Fp'][1]:.2f}",
-            Mp=f"{dynamics_data['Mp']:.2f}",
-        )
+            dynamics_data = agent_data["Dynamics"]
+            writer.element(
+                "Dynamics",
+                {
+                    "Fp": f"{dynamics_data['Fp'][0]:.2f},{dynamics_data['Fp'][1]:.2f}",
+                    "Mp": f"{dynamics_data['Mp']:.2f}",
+                },
+            )
+            writer.end()
 
-    # Convert the tree to a string
-    xml_str = ET.tostring(root, encoding="utf-8")
+        writer.close()
 
-    # Prettify the XML string
-    pretty_xml_str = minidom.parseString(xml_str).toprettyxml(indent="    ", encoding="utf-8")
 
-    return pretty_xml_str
+def write_static_arrays_xml(arrays: CrowdArraysDataType, output: Path | IO[bytes]) -> None:
+    """
+    Write columnar static crowd arrays as pretty-printed XML, incrementally.
 
+    The output is the one of `write_static_xml` for the corresponding dictionary, without building it.
 
-def geometry_dict_to_xml(boundaries_dict: GeometryDataType) -> bytes:
+    Parameters
+    ----------
+    arrays : CrowdArraysDataType
+        The static arrays of the crowd, in the layout of `static_xml_to_arrays`.
+    output : Path | IO[bytes]
+        Path of the file to write, or binary stream to write to.
     """
-    Convert a dictionary of geometry data to a prettified XML representation.
+    shape_offsets = arrays["shape_offsets"].tolist()
+    shape_types = arrays["shape_type"].tolist()
+    shape_radii = arrays["shape_radius"].tolist()
+    shape_materials = arrays["shape_material"].tolist()
+    shape_positions = arrays["shape_position"].tolist()
+    agent_columns = zip(
+        arrays["agent_type"].tolist(),
+        arrays["agent_id"].tolist(),
+        arrays["mass"].tolist(),
+        arrays["height"].tolist(),
+        arrays["moment_of_inertia"].tolist(),
+        arrays["floor_damping"].tolist(),
+        arrays["angular_damping"].tolist(),
+        strict=True,
+    )
+
+    with _open_binary_stream(output) as stream:
+        writer = _IndentedXMLWriter(stream)
+        writer.start("Agents")
+
+        for agent_idx, (agent_type, agent_id, mass, height, moment_of_inertia, floor_damping, angular_damping) in enumerate(
+            agent_columns
+        ):
+            writer.start(
+                "Agent",
+                {
+                    "Type": agent_type,
+                    "Id": f"{agent_id}",
+                    "Mass": f"{mass:.2f}",
+                    "Height": f"{height:.2f}",
+                    "MomentOfInertia": f"{moment_of_inertia:.2f}",
+                    "FloorDamping": f"{floor_damping:.2f}",
+                    "AngularDamping": f"{angular_damping:.2f}",
+                },
+            )
+            for row in range(shape_offsets[agent_idx], shape_offsets[agent_idx + 1]):
+                writer.element(
+                    "Shape",
+                    {
+                        "Type": shape_types[row],
+                        "Radius": f"{shape_radii[row]:.3f}",
+                        "MaterialId": f"{shape_materials[row]}",
+                        "Position": f"{shape_positions[row][0]:.3f},{shape_positions[row][1]:.3f}",
+                    },
+                )
+            writer.end()
+
+        writer.close()
+
+
+def write_dynamic_arrays_xml(arrays: CrowdArraysDataType, output: Path | IO[bytes]) -> None:
+    """
+    Write columnar dynamic crowd arrays as pretty-printed XML, incrementally.
+
+    The output is the one of `write_dynamic_xml` for the corresponding dictionary, without building it.
+
+    Parameters
+    ----------
+    arrays : CrowdArraysDataType
+        The dynamic arrays of the crowd, in the layout of `dynamic_xml_to_arrays`.
+    output : Path | IO[bytes]
+        Path of the file to write, or binary stream to write to.
+    """
+    agent_columns = zip(
+        arrays["agent_id"].tolist(),
+        arrays["position"].tolist(),
+        arrays["velocity"].tolist(),
+        arrays["theta"].tolist(),
+        arrays["omega"].tolist(),
+        arrays["fp"].tolist(),
+        arrays["mp"].tolist(),
+        strict=True,
+    )
+
+    with _open_binary_stream(output) as stream:
+        writer = _IndentedXMLWriter(stream)
+        writer.start("Agents")
+
+        for agent_id, position, velocity, theta, omega, fp, mp in agent_columns:
+            writer.start("Agent", {"Id": f"{agent_id}"})
+            writer.element(
+                "Kinematics",
+                {
+                    "Position": f"{position[0]:.3f},{position[1]:.3f}",
+                    "Velocity": f"{velocity[0]:.2f},{velocity[1]:.2f}",
+                    "Theta": f"{theta:.2f}",
+                    "Omega": f"{omega:.2f}",
+                },
+            )
+            writer.element("Dynamics", {"Fp": f"{fp[0]:.2f},{fp[1]:.2f}", "Mp": f"{mp:.2f}"})
+            writer.end()
+
+        writer.close()
+
+
+def write_geometry_xml(boundaries_dict: GeometryDataType, output: Path | IO[bytes]) -> None:
+    """
+    Write a dictionary of geometry data as pretty-printed XML, incrementally.
 
     Parameters
     ----------
     boundaries_dict : GeometryDataType
         Dictionary with boundary data.
+    output : Path | IO[bytes]
+        Path of the file to write, or binary stream to write to.
+    """
+    with _open_binary_stream(output) as stream:
+        writer = _IndentedXMLWriter(stream)
+        writer.start("Geometry")
+
+        dimensions = boundaries_dict["Geometry"]["Dimensions"]
+        writer.element("Dimensions", {"Lx": f"{dimensions['Lx']:.3f}", "Ly": f"{dimensions['Ly']:.3f}"})
+
+        # Iterate over all walls in the dictionary
+        for wall_data in boundaries_dict["Geometry"]["Wall"].values():
+            writer.start("Wall", {"Id": f"{wall_data['Id']}", "MaterialId": f"{wall_data['MaterialId']}"})
+            for corner_data in wall_data["Corners"].values():
+                writer.element("Corner", {"Coordinates": f"{corner_data['Coordinates'][0]:.3f},{corner_data['Coordinates'][1]:.3f}"})
+            writer.end()
+
+        writer.close()
+
+
+def write_materials_xml(material_dict: MaterialsDataType, output: Path | IO[bytes]) -> None:
+    """
+    Write a dictionary of material properties as pretty-printed XML, incrementally.
+
+    Parameters
+    ----------
+    material_dict : MaterialsDataType
+        Dictionary with material data.
+    output : Path | IO[bytes]
+        Path of the file to write, or binary stream to write to.
+    """
+    with _open_binary_stream(output) as stream:
+        writer = _IndentedXMLWriter(stream)
+        writer.start("Materials")
+
+        # Add Intrinsic materials
+        writer.start("Intrinsic")
+        for material_data in material_dict["Materials"]["Intrinsic"].values():
+            writer.element(
+                "Material",
+                {
+                    "Id": f"{material_data['Id']}",
+                    "YoungModulus": f"{material_data['YoungModulus']:.2e}",
+                    "ShearModulus": f"{material_data['ShearModulus']:.2e}",
+                },
+            )
+        writer.end()
+
+        # Add Binary contacts
+        writer.start("Binary")
+        for contact_data in material_dict["Materials"]["Binary"].values():
+            writer.element(
+                "Contact",
+                {
+                    "Id1": f"{contact_data['Id1']}",
+                    "Id2": f"{contact_data['Id2']}",
+                    "GammaNormal": f"{contact_data['GammaNormal']:.2e}",
+                    "GammaTangential": f"{contact_data['GammaTangential']:.2e}",
+                    "KineticFriction": f"{contact_data['KineticFriction']:.2f}",
+                },
+            )
+        writer.end()
+
+        writer.close()
+
+
+def write_interactions_xml(data: InteractionsDataType, output: Path | IO[bytes]) -> None:
+    """
+    Write a dictionary of interactions data as pretty-printed XML, incrementally.
+
+    Parameters
+    ----------
+    data : InteractionsDataType
+        Dictionary with interactions data.
+    output : Path | IO[bytes]
+        Path of the file to write, or binary stream to write to.
+    """
+    with _open_binary_stream(output) as stream:
+        writer = _IndentedXMLWriter(stream)
+        writer.start("Interactions")
+
+        # Iterate through agents in the dictionary
+        for agent_data in data["Interactions"].values():
+            writer.start("Agent", {"Id": f"{agent_data['Id']}"})
+            # Iterate through neighboring agents
+            for neighbor_data in agent_data.get("NeighbouringAgents", {}).values():
+                writer.start("Agent", {"Id": f"{neighbor_data['Id']}"})
+                # Iterate through interactions
+                for interaction_data in neighbor_data["Interactions"].values():
+                    writer.element(
+                        "Interaction",
+                        {
+                            "ParentShape": f"{interaction_data['ParentShape']}",
+                            "ChildShape": f"{interaction_data['ChildShape']}",
+                            "TangentialRelativeDisplacement": f"{interaction_data['TangentialRelativeDisplacement'][0]:.2f},"
+                            f"{interaction_data['TangentialRelativeDisplacement'][1]:.2f}",
+                            "Fn": f"{interaction_data['Fn'][0]:.2f},{interaction_data['Fn'][1]:.2f}",
+                            "Ft": f"{interaction_data['Ft'][0]:.2f},{interaction_data['Ft'][1]:.2f}",
+                        },
+                    )
+                writer.end()
+            writer.end()
+
+        writer.close()
+
+
+def static_dict_to_xml(crowd_dict: StaticCrowdDataType) -> bytes:
+    """
+    Convert a static crowd dictionary to a prettified XML representation.
+
+    Parameters
+    ----------
+    crowd_dict : StaticCrowdDataType
+        Dictionary with agent data.
 
     Returns
     -------
     bytes
-        UTF-8 encoded, pretty-printed XML representation of the boundaries.
+        UTF-8 encoded, pretty-printed XML representation of all agents' static parameters.
     """
-    # Create the root element
-    root = ET.Element("Geometry")
+    stream = BytesIO()
+    write_static_xml(crowd_dict, stream)
+    return stream.getvalue()
 
-    # Add Dimensions element
-    dimensions = boundaries_dict["Geometry"]["Dimensions"]
-    ET.SubElement(root, "Dimensions", Lx=f"{dimensions['Lx']:.3f}", Ly=f"{dimensions['Ly']:.3f}")
 
-    # Iterate over all walls in the dictionary
-    for wall_data in boundaries_dict["Geometry"]["Wall"].values():
-        # Add Wall element
-        wall_element = ET.SubElement(root, "Wall", Id=f"{wall_data['Id']}", MaterialId=f"{wall_data['MaterialId']}")
+def dynamic_dict_to_xml(dynamical_parameters_crowd: DynamicCrowdDataType) -> bytes:
+    """
+    Convert a dictionary of agents' dynamic parameters to a prettified XML representation.
 
-        # Add Corners element
-        for corner_data in wall_data["Corners"].values():
-            ET.SubElement(
-                wall_element, "Corner", Coordinates=f"{corner_data['Coordinates'][0]:.3f},{corner_data['Coordinates'][1]:.3f}"
-            )
+    Parameters
+    ----------
+    dynamical_parameters_crowd : DynamicCrowdDataType
+        Dictionary with agent data.
 
-    # Convert the tree to a string
-    xml_str = ET.tostring(root, encoding="utf-8")
+    Returns
+    -------
+    bytes
+        UTF-8 encoded, pretty-printed XML representation of all agents' dynamic parameters.
+    """
+    stream = BytesIO()
+    write_dynamic_xml(dynamical_parameters_crowd, stream)
+    return stream.getvalue()
 
-    # Prettify the XML string
-    pretty_xml_str = minidom.parseString(xml_str).toprettyxml(indent="    ", encoding="utf-8")
 
-    return pretty_xml_str
+def geometry_dict_to_xml(boundaries_dict: GeometryDataType) -> bytes:
+    """
+    Convert a dictionary of geometry data to a prettified XML representation.
+
+    Parameters
+    ----------
+    boundaries_dict : GeometryDataType
+        Dictionary with boundary data.
+
+    Returns
+    -------
+    bytes
+        UTF-8 encoded, pretty-printed XML representation of the boundaries.
+    """
+    stream = BytesIO()
+    write_geometry_xml(boundaries_dict, stream)
+    return stream.getvalue()
 
 
 def materials_dict_to_xml(material_dict: MaterialsDataType) -> bytes:
@@ -234,40 +602,9 @@ def materials_dict_to_xml(material_dict: MaterialsDataType) -> bytes:
     bytes
         UTF-8 encoded, pretty-printed XML representation of the materials.
     """
-    # Create the root element
-    root = ET.Element("Materials")
-
-    # Add Intrinsic materials
-    intrinsic_element = ET.SubElement(root, "Intrinsic")
-    for material_data in material_dict["Materials"]["Intrinsic"].values():
-        ET.SubElement(
-            intrinsic_element,
-            "Material",
-            Id=f"{material_data['Id']}",
-            YoungModulus=f"{material_data['YoungModulus']:.2e}",
-            ShearModulus=f"{material_data['ShearModulus']:.2e}",
-        )
-
-    # Add Binary contacts
-    binary_element = ET.SubElement(root, "Binary")
-    for contact_data in material_dict["Materials"]["Binary"].values():
-        ET.SubElement(
-            binary_element,
-            "Contact",
-            Id1=f"{contact_data['Id1']}",
-            Id2=f"{contact_data['Id2']}",
-            GammaNormal=f"{contact_data['GammaNormal']:.2e}",
-            GammaTangential=f"{contact_data['GammaTangential']:.2e}",
-            KineticFriction=f"{contact_data['KineticFriction']:.2f}",
-        )
-
-    # Convert the tree to a string
-    xml_str = ET.tostring(root, encoding="utf-8")
-
-    # Prettify the XML string
-    pretty_xml_str = minidom.parseString(xml_str).toprettyxml(indent="    ", encoding="utf-8")
-
-    return pretty_xml_str
+    stream = BytesIO()
+    write_materials_xml(material_dict, stream)
+    return stream.getvalue()
 
 
 def interactions_dict_to_xml(data: InteractionsDataType) -> bytes:
@@ -284,190 +621,328 @@ def interactions_dict_to_xml(data: InteractionsDataType) -> bytes:
     bytes
         UTF-8 encoded, pretty-printed XML representation of all agents and their interactions.
     """
-    # Create the root element
-    root = ET.Element("Interactions")
+    stream = BytesIO()
+    write_interactions_xml(data, stream)
+    return stream.getvalue()
 
-    # Iterate through agents in the dictionary
-    for agent_data in data["Interactions"].values():
-        agent_element = ET.SubElement(root, "Agent", Id=f"{agent_data['Id']}")
-        # Iterate through neighboring agents
-        if "NeighbouringAgents" in agent_data:
-            for neighbor_data in agent_data["NeighbouringAgents"].values():
-                neighbor_element = ET.SubElement(agent_element, "Agent", Id=f"{neighbor_data['Id']}")
 
-                # Iterate through interactions
-                for interaction_data in neighbor_data["Interactions"].values():
-                    ET.SubElement(
-                        neighbor_element,
-                        "Interaction",
-                        ParentShape=f"{interaction_data['ParentShape']}",
-                        ChildShape=f"{interaction_data['ChildShape']}",
-                        TangentialRelativeDisplacement=f"{interaction_data['TangentialRelativeDisplacement'][0]:.2f},{interaction_data['TangentialRelativeDisplacement'][1]:.2f}",
-                        Fn=f"{interaction_data['Fn'][0]:.2f},{interaction_data['Fn'][1]:.2f}",
-                        Ft=f"{interaction_data['Ft'][0]:.2f},{interaction_data['Ft'][1]:.2f}",
-                    )
-    # Convert the tree to a string
-    xml_str = ET.tostring(root, encoding="utf-8")
+@contextmanager
+def _open_xml_source(xml_source: XMLSourceType) -> Iterator[IO[bytes]]:
+    """
+    Open a source of XML data as a binary stream.
+
+    Parameters
+    ----------
+    xml_source : XMLSourceType
+        XML document (as a string or as bytes), path of an XML file, or binary stream (left open).
+
+    Yields
+    ------
+    IO[bytes]
+        The binary stream to parse.
+    """
+    if isinstance(xml_source, str):
+        yield BytesIO(xml_source.encode("utf-8"))
+    elif isinstance(xml_source, bytes):
+        yield BytesIO(xml_source)
+    elif isinstance(xml_source, Path):
+        with xml_source.open("rb") as stream:
+            yield stream
+    else:
+        yield xml_source
+
+
+def _iterparse_children(xml_source: XMLSourceType, tag: str | None = None) -> Iterator[ET.Element]:
+    """
+    Parse an XML document incrementally and yield the children of its root element once they are complete.
 
-    # Prettify the XML string
-    pretty_xml_str = minidom.parseString(xml_str).toprettyxml(indent="    ", encoding="utf-8")
+    Each child is cleared from the tree as soon as the next one is requested, so only one child of the root (and its
+    descendants) is held in memory at a time.
 
-    return pretty_xml_str
+    Parameters
+    ----------
+    xml_source : XMLSourceType
+        XML document (as a string or as bytes), path of an XML file, or binary stream.
+    tag : str | None
+        If given, only the children with this tag are yielded.
 
+    Yields
+    ------
+    ET.Element
+        The complete children of the root element, in document order.
 
-def static_xml_to_dict(xml_file: str) -> StaticCrowdDataType:
+    Raises
+    ------
+    ValueError
+        If the XML is malformed.
+    """
+    with _open_xml_source(xml_source) as stream:
+        events = ET.iterparse(stream, events=("start", "end"))
+        root: ET.Element | None = None
+        depth = 0
+        while True:
+            try:
+                event, element = next(events)
+            except StopIteration:
+                return
+            except ET.ParseError as e:
+                raise ValueError(f"Malformed XML: {e}") from e
+            if event == "start":
+                root = element if root is None else root
+                depth += 1
+                continue
+            depth -= 1
+            if depth == 1 and root is not None:
+                if tag is None or element.tag == tag:
+                    yield element
+                root.clear()
+
+
+def _parse_static_agent(agent: ET.Element, agent_idx: int) -> dict[str, Any]:
     """
-    Convert an XML string representing agents' static data into a dictionary.
+    Convert an <Agent> element of a static XML file into a dictionary.
 
     Parameters
     ----------
-    xml_file : str
-        XML data as a string.
+    agent : ET.Element
+        The <Agent> element.
+    agent_idx : int
+        Position of the agent in the file, used in the error messages.
 
     Returns
     -------
-    StaticCrowdDataType
-        A dictionary representation of the XML data.
+    dict[str, Any]
+        The static data of the agent, including its shapes.
 
     Raises
     ------
     ValueError
-        If the XML structure or attribute types are incorrect.
+        If an attribute is missing or has an incorrect type.
     """
+    # Validate required agent attributes
     try:
-        root = ET.fromstring(xml_file)
-    except ET.ParseError as e:
-        raise ValueError(f"Malformed XML: {e}") from e
-
-    crowd_dict: StaticCrowdDataType = {"Agents": {}}
+        agent_data: dict[str, Any] = {
+            "Type": agent.attrib["Type"],
+            "Id": int(agent.attrib["Id"]),
+            "Mass": float(agent.attrib["Mass"]),
+            "Height": float(agent.attrib["Height"]),
+            "MomentOfInertia": float(agent.attrib["MomentOfInertia"]),
+            "FloorDamping": float(agent.attrib["FloorDamping"]),
+            "AngularDamping": float(agent.attrib["AngularDamping"]),
+        }
+    except KeyError as e:
+        raise ValueError(f"Missing '{e.args[0]}' attribute in <Agent> at position {agent_idx}.") from e
+    except ValueError as e:
+        raise ValueError(f"Type error in <Agent> at position {agent_idx}: {e}") from e
 
-    for agent_idx, agent in enumerate(root.findall("Agent")):
-        # Validate required agent attributes
+    # Process <Shapes> if present
+    shapes_dict: ShapeDataType = {}
+    for shape_idx, shape in enumerate(agent.findall("Shape")):
+        # Validate required shape attributes
         try:
-            agent_data: dict[str, Any] = {
-                "Type": agent.attrib["Type"],
-                "Id": int(agent.attrib["Id"]),
-                "Mass": float(agent.attrib["Mass"]),
-                "Height": float(agent.attrib["Height"]),
-                "MomentOfInertia": float(agent.attrib["MomentOfInertia"]),
-                "FloorDamping": float(agent.attrib["FloorDamping"]),
-                "AngularDamping": float(agent.attrib["AngularDamping"]),
+            shape_data = {
+                "Type": shape.attrib["Type"],
+                "Radius": float(shape.attrib["Radius"]),
+                "MaterialId": str(shape.attrib["MaterialId"]),
+                "Position": fun.from_string_to_tuple(shape.attrib["Position"]),
             }
         except KeyError as e:
-            raise ValueError(f"Missing '{e.args[0]}' attribute in <Agent> at position {agent_idx}.") from e
+            raise ValueError(
+                f"Missing '{e.args[0]}' attribute in <Shape> at position {shape_idx} under <Agent> with Id={agent_data['Id']}."
+            ) from e
         except ValueError as e:
-            raise ValueError(f"Type error in <Agent> at position {agent_idx}: {e}") from e
+            raise ValueError(f"Type error in <Shape> at position {shape_idx} under <Agent> with Id={agent_data['Id']}: {e}") from e
+        # Assign a unique name to each shape (e.g., disk0, disk1, ...)
+        shape_name = f"disk{shape_idx}"
+        shapes_dict[shape_name] = shape_data
+    agent_data["Shapes"] = shapes_dict
 
-        # Process <Shapes> if present
-        shapes_dict: ShapeDataType = {}
-        for shape_idx, shape in enumerate(agent.findall("Shape")):
-            # Validate required shape attributes
-            try:
-                shape_data = {
-                    "Type": shape.attrib["Type"],
-                    "Radius": float(shape.attrib["Radius"]),
-                    "MaterialId": str(shape.attrib["MaterialId"]),
-                    "Position": fun.from_string_to_tuple(shape.attrib["Position"]),
-                }
-            except KeyError as e:
-                raise ValueError(
-                    f"Missing '{e.args[0]}' attribute in <Shape> at position {shape_idx} under <Agent> with Id={agent_data['Id']}."
-                ) from e
-            except ValueError as e:
-                raise ValueError(f"Type error in <Shape> at position {shape_idx} under <Agent> with Id={agent_data['Id']}: {e}") from e
-            # Assign a unique name to each shape (e.g., disk0, disk1, ...)
-            shape_name = f"disk{shape_idx}"
-            shapes_dict[shape_name] = shape_data
-        agent_data["Shapes"] = shapes_dict
+    return agent_data
+
+
+def static_xml_to_dict(xml_file: XMLSourceType) -> StaticCrowdDataType:
+    """
+    Convert an XML document representing agents' static data into a dictionary.
+
+    Parameters
+    ----------
+    xml_file : XMLSourceType
+        XML data as a string or bytes, path of the XML file, or binary stream.
 
+    Returns
+    -------
+    StaticCrowdDataType
+        A dictionary representation of the XML data.
+
+    Raises
+    ------
+    ValueError
+        If the XML structure or attribute types are incorrect.
+    """
+    crowd_dict: StaticCrowdDataType = {"Agents": {}}
+
+    for agent_idx, agent in enumerate(_iterparse_children(xml_file, "Agent")):
         # Assign a unique name to each agent (e.g., Agent0, Agent1, ...)
         agent_name = f"Agent{agent_idx}"
-        crowd_dict["Agents"][agent_name] = agent_data
+        crowd_dict["Agents"][agent_name] = _parse_static_agent(agent, agent_idx)
 
     return crowd_dict
 
 
-def dynamic_xml_to_dict(xml_data: str) -> DynamicCrowdDataType:
+def static_xml_to_arrays(xml_file: XMLSourceType) -> CrowdArraysDataType:
     """
-    Convert an XML string representing agents' dynamic parameters into a dictionary.
+    Convert an XML document representing agents' static data into columnar arrays.
+
+    The agent arrays have one row per agent. The shape arrays have one row per shape; the shapes of the i-th agent
+    are the rows `shape_offsets[i]` to `shape_offsets[i + 1]`.
 
     Parameters
     ----------
-    xml_data : str
-        A string containing XML data.
+    xml_file : XMLSourceType
+        XML data as a string or bytes, path of the XML file, or binary stream.
 
     Returns
     -------
-    DynamicCrowdDataType
-        A dictionary representation of the XML data.
+    CrowdArraysDataType
+        A dictionary with the arrays "agent_id", "agent_type", "mass", "height", "moment_of_inertia", "floor_damping",
+        "angular_damping", "shape_offsets", "shape_type", "shape_radius", "shape_material" and "shape_position" (of
+        shape (number of shapes, 2)).
 
     Raises
     ------
     ValueError
         If the XML structure or attribute types are incorrect.
     """
-    try:
-        root = ET.fromstring(xml_data)
-    except ET.ParseError as e:
-        raise ValueError(f"Malformed XML: {e}") from e
+    agent_columns: dict[str, list[Any]] = {key: [] for key in _STATIC_AGENT_COLUMNS}
+    shape_columns: dict[str, list[Any]] = {key: [] for key in _STATIC_SHAPE_COLUMNS}
+    shape_offsets = [0]
+
+    for agent_idx, agent in enumerate(_iterparse_children(xml_file, "Agent")):
+        agent_data = _parse_static_agent(agent, agent_idx)
+        for key, attribute in _STATIC_AGENT_COLUMNS.items():
+            agent_columns[key].append(agent_data[attribute])
+        for shape_data in agent_data["Shapes"].values():
+            for key, attribute in _STATIC_SHAPE_COLUMNS.items():
+                shape_columns[key].append(shape_data[attribute])
+        shape_offsets.append(len(shape_columns["shape_type"]))
+
+    return {
+        "agent_id": np.array(agent_columns["agent_id"], dtype=np.int64),
+        "agent_type": np.array(agent_columns["agent_type"], dtype=np.str_),
+        "mass": np.array(agent_columns["mass"], dtype=np.float64),
+        "height": np.array(agent_columns["height"], dtype=np.float64),
+        "moment_of_inertia": np.array(agent_columns["moment_of_inertia"], dtype=np.float64),
+        "floor_damping": np.array(agent_columns["floor_damping"], dtype=np.float64),
+        "angular_damping": np.array(agent_columns["angular_damping"], dtype=np.float64),
+        "shape_offsets": np.array(shape_offsets, dtype=np.int64),
+        "shape_type": np.array(shape_columns["shape_type"], dtype=np.str_),
+        "shape_radius": np.array(shape_columns["shape_radius"], dtype=np.float64),
+        "shape_material": np.array(shape_columns["shape_material"], dtype=np.str_),
+        "shape_position": np.array(shape_columns["shape_position"], dtype=np.float64).reshape(-1, 2),
+    }
 
-    agents: DynamicCrowdDataType = {}
 
-    for agent_idx, agent in enumerate(root.findall("Agent")):
-        # Validate agent Id
-        try:
-            agent_id = int(agent.attrib["Id"])
-        except KeyError as e:
-            raise ValueError(f"Missing 'Id' attribute in <Agent> at position {agent_idx}.") from e
-        except ValueError as e:
-            raise ValueError(f"Invalid 'Id' value in <Agent> at position {agent_idx}: {e}") from e
+def _parse_dynamic_agent(agent: ET.Element, agent_idx: int) -> dict[str, Any]:
+    """
+    Convert an <Agent> element of a dynamic XML file into a dictionary.
 
-        # Extract and validate kinematics
-        kinematics = agent.find("Kinematics")
-        if kinematics is None:
-            raise ValueError(f"Missing <Kinematics> section for <Agent> with Id={agent_id}.")
-        try:
-            position_str = kinematics.attrib["Position"]
-            velocity_str = kinematics.attrib["Velocity"]
-            theta_str = kinematics.attrib["Theta"]
-            omega_str = kinematics.attrib["Omega"]
-        except KeyError as e:
-            raise ValueError(f"Missing '{e.args[0]}' attribute in <Kinematics> for <Agent> with Id={agent_id}.") from e
-        try:
-            kinematics_dict = {
-                "Position": fun.from_string_to_tuple(position_str),
-                "Velocity": fun.from_string_to_tuple(velocity_str),
-                "Theta": float(theta_str),
-                "Omega": float(omega_str),
-            }
-        except ValueError as e:
-            raise ValueError(f"Type error in <Kinematics> for <Agent> with Id={agent_id}: {e}") from e
-
-        # Extract and validate dynamics parameters
-        dynamics = agent.find("Dynamics")
-        fp_str_default = (
-            f"{float(np.round(cst.DECISIONAL_TRANSLATIONAL_FORCE_X, 2))},{float(np.round(cst.DECISIONAL_TRANSLATIONAL_FORCE_Y, 2))}"
-        )
-        mp_str_default = f"{float(np.round(cst.DECISIONAL_TORQUE, 2))}"
-        if dynamics is not None:
-            # Get the 'Fp' and 'Mp' attributes, or use defaults if not present
-            fp_str = dynamics.attrib.get("Fp", fp_str_default)
-            mp_str = dynamics.attrib.get("Mp", mp_str_default)
-        else:
-            # Use default values if 'Dynamics' element is missing
-            fp_str = fp_str_default
-            mp_str = mp_str_default
-        dynamics_dict = {
-            "Fp": fun.from_string_to_tuple(fp_str),
-            "Mp": float(mp_str),
-        }
+    Parameters
+    ----------
+    agent : ET.Element
+        The <Agent> element.
+    agent_idx : int
+        Position of the agent in the file, used in the error messages.
+
+    Returns
+    -------
+    dict[str, Any]
+        The dynamic data of the agent, with its "Id", "Kinematics" and "Dynamics".
 
-        # Combine into agent dictionary
-        agents[f"Agent{agent_id}"] = {
-            "Id": agent_id,
-            "Kinematics": kinematics_dict,
-            "Dynamics": dynamics_dict,
+    Raises
+    ------
+    ValueError
+        If an attribute is missing or has an incorrect type.
+    """
+    # Validate agent Id
+    try:
+        agent_id = int(agent.attrib["Id"])
+    except KeyError as e:
+        raise ValueError(f"Missing 'Id' attribute in <Agent> at position {agent_idx}.") from e
+    except ValueError as e:
+        raise ValueError(f"Invalid 'Id' value in <Agent> at position {agent_idx}: {e}") from e
+
+    # Extract and validate kinematics
+    kinematics = agent.find("Kinematics")
+    if kinematics is None:
+        raise ValueError(f"Missing <Kinematics> section for <Agent> with Id={agent_id}.")
+    try:
+        position_str = kinematics.attrib["Position"]
+        velocity_str = kinematics.attrib["Velocity"]
+        theta_str = kinematics.attrib["Theta"]
+        omega_str = kinematics.attrib["Omega"]
+    except KeyError as e:
+        raise ValueError(f"Missing '{e.args[0]}' attribute in <Kinematics> for <Agent> with Id={agent_id}.") from e
+    try:
+        kinematics_dict = {
+            "Position": fun.from_string_to_tuple(position_str),
+            "Velocity": fun.from_string_to_tuple(velocity_str),
+            "Theta": float(theta_str),
+            "Omega": float(omega_str),
         }
+    except ValueError as e:
+        raise ValueError(f"Type error in <Kinematics> for <Agent> with Id={agent_id}: {e}") from e
+
+    # Extract and validate dynamics parameters
+    dynamics = agent.find("Dynamics")
+    fp_str_default = (
+        f"{float(np.round(cst.DECISIONAL_TRANSLATIONAL_FORCE_X, 2))},{float(np.round(cst.DECISIONAL_TRANSLATIONAL_FORCE_Y, 2))}"
+    )
+    mp_str_default = f"{float(np.round(cst.DECISIONAL_TORQUE, 2))}"
+    if dynamics is not None:
+        # Get the 'Fp' and 'Mp' attributes, or use defaults if not present
+        fp_str = dynamics.attrib.get("Fp", fp_str_default)
+        mp_str = dynamics.attrib.get("Mp", mp_str_default)
+    else:
+        # Use default values if 'Dynamics' element is missing
+        fp_str = fp_str_default
+        mp_str = mp_str_default
+    dynamics_dict = {
+        "Fp": fun.from_string_to_tuple(fp_str),
+        "Mp": float(mp_str),
+    }
+
+    # Combine into agent dictionary
+    return {
+        "Id": agent_id,
+        "Kinematics": kinematics_dict,
+        "Dynamics": dynamics_dict,
+    }
+
+
+def dynamic_xml_to_dict(xml_data: XMLSourceType) -> DynamicCrowdDataType:
+    """
+    Convert an XML document representing agents' dynamic parameters into a dictionary.
+
+    Parameters
+    ----------
+    xml_data : XMLSourceType
+        XML data as a string or bytes, path of the XML file, or binary stream.
+
+    Returns
+    -------
+    DynamicCrowdDataType
+        A dictionary representation of the XML data.
+
+    Raises
+    ------
+    ValueError
+        If the XML structure or attribute types are incorrect.
+    """
+    agents: DynamicCrowdDataType = {}
+
+    for agent_idx, agent in enumerate(_iterparse_children(xml_data, "Agent")):
+        agent_data = _parse_dynamic_agent(agent, agent_idx)
+        agents[f"Agent{agent_data['Id']}"] = agent_data
 
     # Construct the final dictionary
     dynamical_parameters_crowd = {"Agents": agents}
@@ -475,70 +950,113 @@ def dynamic_xml_to_dict(xml_data: str) -> DynamicCrowdDataType:
     return dynamical_parameters_crowd
 
 
-def geometry_xml_to_dict(xml_data: str) -> GeometryDataType:
+def dynamic_xml_to_arrays(xml_data: XMLSourceType) -> CrowdArraysDataType:
     """
-    Convert an XML string representing geometric data into a dictionary.
+    Convert an XML document representing agents' dynamic parameters into columnar arrays, with one row per agent.
 
     Parameters
     ----------
-    xml_data : str
-        A string containing XML data.
+    xml_data : XMLSourceType
+        XML data as a string or bytes, path of the XML file, or binary stream.
 
     Returns
     -------
-    GeometryDataType
-        A dictionary representation of the XML data.
+    CrowdArraysDataType
+        A dictionary with the arrays "agent_id", "position", "velocity", "theta", "omega", "fp" and "mp". The arrays
+        "position", "velocity" and "fp" have a shape (number of agents, 2).
 
     Raises
     ------
     ValueError
         If the XML structure or attribute types are incorrect.
     """
-    try:
-        root = ET.fromstring(xml_data)
-    except ET.ParseError as e:
-        raise ValueError(f"Malformed XML: {e}") from e
+    columns: dict[str, list[Any]] = {key: [] for key in _DYNAMIC_COLUMNS}
+
+    for agent_idx, agent in enumerate(_iterparse_children(xml_data, "Agent")):
+        agent_data = _parse_dynamic_agent(agent, agent_idx)
+        columns["agent_id"].append(agent_data["Id"])
+        for key, (section, attribute) in _DYNAMIC_COLUMNS.items():
+            if section:
+                columns[key].append(agent_data[section][attribute])
+
+    return {
+        "agent_id": np.array(columns["agent_id"], dtype=np.int64),
+        "position": np.array(columns["position"], dtype=np.float64).reshape(-1, 2),
+        "velocity": np.array(columns["velocity"], dtype=np.float64).reshape(-1, 2),
+        "theta": np.array(columns["theta"], dtype=np.float64),
+        "omega": np.array(columns["omega"], dtype=np.float64),
+        "fp": np.array(columns["fp"], dtype=np.float64).reshape(-1, 2),
+        "mp": np.array(columns["mp"], dtype=np.float64),
+    }
 
-    # --- Extract and validate dimensions ---
-    dimensions = root.find("Dimensions")
-    if dimensions is None:
-        raise ValueError("Missing required <Dimensions> section in XML.")
 
-    try:
-        dimensions_dict = {"Lx": float(dimensions.attrib["Lx"]), "Ly": float(dimensions.attrib["Ly"])}
-    except KeyError as e:
-        raise ValueError(f"Missing '{e.args[0]}' attribute in <Dimensions>.") from e
-    except ValueError as e:
-        raise ValueError(f"Type error in <Dimensions>: {e}") from e
+def geometry_xml_to_dict(xml_data: XMLSourceType) -> GeometryDataType:
+    """
+    Convert an XML document representing geometric data into a dictionary.
+
+    Parameters
+    ----------
+    xml_data : XMLSourceType
+        XML data as a string or bytes, path of the XML file, or binary stream.
 
-    # --- Extract and validate walls and corners ---
+    Returns
+    -------
+    GeometryDataType
+        A dictionary representation of the XML data.
+
+    Raises
+    ------
+    ValueError
+        If the XML structure or attribute types are incorrect.
+    """
+    dimensions_dict: dict[str, float] | None = None
     walls: dict[str, Any] = {}
-    for wall_idx, wall in enumerate(root.findall("Wall")):
-        # Validate required wall attributes
-        try:
-            wall_id = int(wall.attrib["Id"])
-            id_material = str(wall.attrib["MaterialId"])
-        except KeyError as e:
-            raise ValueError(f"Missing '{e.args[0]}' attribute in <Wall> at position {wall_idx}.") from e
-        except ValueError as e:
-            raise ValueError(f"Type error in <Wall> at position {wall_idx}: {e}") from e
+    wall_idx = 0
+    for element in _iterparse_children(xml_data):
+        # --- Extract and validate dimensions ---
+        if element.tag == "Dimensions" and dimensions_dict is None:
+            try:
+                dimensions_dict = {"Lx": float(element.attrib["Lx"]), "Ly": float(element.attrib["Ly"])}
+            except KeyError as e:
+                raise ValueError(f"Missing '{e.args[0]}' attribute in <Dimensions>.") from e
+            except ValueError as e:
+                raise ValueError(f"Type error in <Dimensions>: {e}") from e
 
-        # Validate corners section
-        corners: dict[str, dict[str, tuple[float, float]]] = {}
-        for i, corner in enumerate(wall.findall("Corner")):
+        # --- Extract and validate walls and corners ---
+        elif element.tag == "Wall":
+            # Validate required wall attributes
             try:
-                coords = fun.from_string_to_tuple(corner.attrib["Coordinates"])
+                wall_id = int(element.attrib["Id"])
+                id_material = str(element.attrib["MaterialId"])
             except KeyError as e:
-                raise ValueError(f"Missing 'Coordinates' attribute in <Corner> at position {i} for <Wall> with Id={wall_id}.") from e
+                raise ValueError(f"Missing '{e.args[0]}' attribute in <Wall> at position {wall_idx}.") from e
             except ValueError as e:
-                raise ValueError(f"Type error in 'Coordinates' of <Corner> at position {i} for <Wall> with Id={wall_id}: {e}") from e
-            corners[f"Corner{i}"] = {"Coordinates": coords}
+                raise ValueError(f"Type error in <Wall> at position {wall_idx}: {e}") from e
 
-        walls[f"Wall{wall_id}"] = {
-            "Id": wall_id,
-            "MaterialId": id_material,
-            "Corners": corners,
-        }
+            # Validate corners section
+            corners: dict[str, dict[str, tuple[float, float]]] = {}
+            for i, corner in enumerate(element.findall("Corner")):
+                try:
+                    coords = fun.from_string_to_tuple(corner.attrib["Coordinates"])
+                except KeyError as e:
+                    raise ValueError(
+                        f"Missing 'Coordinates' attribute in <Corner> at position {i} for <Wall> with Id={wall_id}."
+                    ) from e
+                except ValueError as e:
+                    raise ValueError(
+                        f"Type error in 'Coordinates' of <Corner> at position {i} for <Wall> with Id={wall_id}: {e}"
+                    ) from e
+                corners[f"Corner{i}"] = {"Coordinates": coords}
+
+            walls[f"Wall{wall_id}"] = {
+                "Id": wall_id,
+                "MaterialId": id_material,
+                "Corners": corners,
+            }
+            wall_idx += 1
+
+    if dimensions_dict is None:
+        raise ValueError("Missing required <Dimensions> section in XML.")
 
     # --- Construct the final dictionary ---
     boundaries_dict = {"Geometry": {"Dimensions": dimensions_dict, "Wall": walls}}
@@ -546,14 +1064,14 @@ def geometry_xml_to_dict(xml_data: str) -> GeometryDataType:
     return boundaries_dict
 
 
-def materials_xml_to_dict(xml_data: str) -> MaterialsDataType:
+def materials_xml_to_dict(xml_data: XMLSourceType) -> MaterialsDataType:
     """
-    Convert an XML string representing material properties into a dictionary.
+    Convert an XML document representing material properties into a dictionary.
 
     Parameters
     ----------
-    xml_data : str
-        A string containing XML data.
+    xml_data : XMLSourceType
+        XML data as a string or bytes, path of the XML file, or binary stream.
 
     Returns
     -------
@@ -565,53 +1083,50 @@ def materials_xml_to_dict(xml_data: str) -> MaterialsDataType:
     ValueError
         If the XML structure or attribute types are incorrect.
     """
-    try:
-        root = ET.fromstring(xml_data)
-    except ET.ParseError as e:
-        raise ValueError(f"Malformed XML: {e}") from e
+    intrinsic_materials: IntrinsicMaterialDataType | None = None
+    binary_contacts: PairMaterialsDataType | None = None
+    for element in _iterparse_children(xml_data):
+        # --- Validate and extract Intrinsic materials ---
+        if element.tag == "Intrinsic" and intrinsic_materials is None:
+            intrinsic_materials = []
+            for idx, material in enumerate(element):
+                try:
+                    instrinsic_material_dict = {
+                        "Id": str(material.attrib["Id"]),
+                        "YoungModulus": float(material.attrib["YoungModulus"]),
+                        "ShearModulus": float(material.attrib["ShearModulus"]),
+                    }
+                except KeyError as e:
+                    raise ValueError(f"Missing '{e.args[0]}' attribute in <Material> at position {idx}.") from e
+                except ValueError as e:
+                    raise ValueError(f"Type error in <Material> at position {idx}: {e}") from e
 
-    # --- Validate and extract Intrinsic materials ---
-    intrinsic_element = root.find("Intrinsic")
-    if intrinsic_element is None:
-        raise ValueError("Missing required <Intrinsic> section in XML.")
+                intrinsic_materials.append(instrinsic_material_dict)
 
-    intrinsic_materials: IntrinsicMaterialDataType = []
-    for idx, material in enumerate(intrinsic_element):
-        try:
-            instrinsic_material_dict = {
-                "Id": str(material.attrib["Id"]),
-                "YoungModulus": float(material.attrib["YoungModulus"]),
-                "ShearModulus": float(material.attrib["ShearModulus"]),
-            }
-        except KeyError as e:
-            raise ValueError(f"Missing '{e.args[0]}' attribute in <Material> at position {idx}.") from e
-        except ValueError as e:
-            raise ValueError(f"Type error in <Material> at position {idx}: {e}") from e
+        # --- Validate and extract Binary contacts ---
+        elif element.tag == "Binary" and binary_contacts is None:
+            binary_contacts = []
+            for idx, contact in enumerate(element):
+                try:
+                    contact_dict = {
+                        "Id1": str(contact.attrib["Id1"]),
+                        "Id2": str(contact.attrib["Id2"]),
+                        "GammaNormal": float(contact.attrib["GammaNormal"]),
+                        "GammaTangential": float(contact.attrib["GammaTangential"]),
+                        "KineticFriction": float(contact.attrib["KineticFriction"]),
+                    }
+                except KeyError as e:
+                    raise ValueError(f"Missing '{e.args[0]}' attribute in <Contact> at position {idx}.") from e
+                except ValueError as e:
+                    raise ValueError(f"Type error in <Contact> at position {idx}: {e}") from e
 
-        intrinsic_materials.append(instrinsic_material_dict)
+                binary_contacts.append(contact_dict)
 
-    # --- Validate and extract Binary contacts ---
-    binary_element = root.find("Binary")
-    if binary_element is None:
+    if intrinsic_materials is None:
+        raise ValueError("Missing required <Intrinsic> section in XML.")
+    if binary_contacts is None:
         raise ValueError("Missing required <Binary> section in XML.")
 
-    binary_contacts: PairMaterialsDataType = []
-    for idx, contact in enumerate(binary_element):
-        try:
-            contact_dict = {
-                "Id1": str(contact.attrib["Id1"]),
-                "Id2": str(contact.attrib["Id2"]),
-                "GammaNormal": float(contact.attrib["GammaNormal"]),
-                "GammaTangential": float(contact.attrib["GammaTangential"]),
-                "KineticFriction": float(contact.attrib["KineticFriction"]),
-            }
-        except KeyError as e:
-            raise ValueError(f"Missing '{e.args[0]}' attribute in <Contact> at position {idx}.") from e
-        except ValueError as e:
-            raise ValueError(f"Type error in <Contact> at position {idx}: {e}") from e
-
-        binary_contacts.append(contact_dict)
-
     # --- Assemble the dictionary ---
     material_dict: MaterialsDataType = {
         "Materials": {
@@ -623,90 +1138,158 @@ def materials_xml_to_dict(xml_data: str) -> MaterialsDataType:
     return material_dict
 
 
-def interactions_xml_to_dict(xml_data: str) -> InteractionsDataType:
+def _parse_interactions_agent(agent: ET.Element, agent_idx: int) -> dict[str, Any]:
     """
-    Convert an XML string describing interactions between agents and with boundaries into a dictionary.
+    Convert an <Agent> element of an interactions XML file into a dictionary.
 
     Parameters
     ----------
-    xml_data : str
-        A string containing XML data.
+    agent : ET.Element
+        The <Agent> element.
+    agent_idx : int
+        Position of the agent in the file, used in the error messages.
 
     Returns
     -------
-    InteractionsDataType
-        A dictionary representation of the XML data.
+    dict[str, Any]
+        The "Id" of the agent and its "NeighbouringAgents", with their interactions.
 
     Raises
     ------
     ValueError
-        If the XML structure or attribute types are incorrect.
+        If an attribute is missing or has an incorrect type.
     """
+    # Validate required attribute
+    if "Id" not in agent.attrib:
+        raise ValueError(f"Missing 'Id' attribute in <Agent> at position {agent_idx}.")
     try:
-        root = ET.fromstring(xml_data)
-    except ET.ParseError as e:
-        raise ValueError(f"Malformed XML: {e}") from e
+        agent_id = int(agent.attrib["Id"])
+    except ValueError as e:
+        raise ValueError(f"Invalid 'Id' value in <Agent> at position {agent_idx}: '{agent.attrib['Id']}' is not an integer.") from e
 
-    interactions_dict: InteractionsDataType = {"Interactions": {}}
+    agent_data: dict[str, Any] = {"Id": agent_id, "NeighbouringAgents": {}}
 
-    # Iterate through all Agent elements in the XML
-    for agent_idx, agent in enumerate(root.findall("Agent")):
-        # Validate required attribute
-        if "Id" not in agent.attrib:
-            raise ValueError(f"Missing 'Id' attribute in <Agent> at position {agent_idx}.")
+    # Iterate through neighboring agents
+    for neighbor_idx, neighbor_agent in enumerate(agent.findall("Agent")):
+        if "Id" not in neighbor_agent.attrib:
+            raise ValueError(f"Missing 'Id' attribute in <Agent> (neighbor) at position {neighbor_idx} under Agent {agent_id}.")
         try:
-            agent_id = int(agent.attrib["Id"])
+            neighbor_id = int(neighbor_agent.attrib["Id"])
         except ValueError as e:
             raise ValueError(
-                f"Invalid 'Id' value in <Agent> at position {agent_idx}: '{agent.attrib['Id']}' is not an integer."
+                f"Invalid 'Id' value in <Agent> (neighbor) at position {neighbor_idx} under Agent {agent_id}: "
+                "'{neighbor_agent.attrib['Id']}' is not an integer."
             ) from e
 
-        agent_key = f"Agent{agent_id}"
-        interactions_dict["Interactions"][agent_key] = {"Id": agent_id, "NeighbouringAgents": {}}
+        neighbor_key = f"Agent{neighbor_id}"
+        agent_data["NeighbouringAgents"][neighbor_key] = {"Id": neighbor_id, "Interactions": {}}
 
-        # Iterate through neighboring agents
-        for neighbor_idx, neighbor_agent in enumerate(agent.findall("Agent")):
-            if "Id" not in neighbor_agent.attrib:
-                raise ValueError(f"Missing 'Id' attribute in <Agent> (neighbor) at position {neighbor_idx} under Agent {agent_id}.")
+        # Iterate through interactions
+        for interaction_idx, interaction in enumerate(neighbor_agent.findall("Interaction")):
+            required_attrs = ["ParentShape", "ChildShape", "TangentialRelativeDisplacement", "Fn", "Ft"]
+            for attr in required_attrs:
+                if attr not in interaction.attrib:
+                    raise ValueError(
+                        f"Missing '{attr}' attribute in <Interaction> at position {interaction_idx} "
+                        f"under Neighbor Agent {neighbor_id} of Agent {agent_id}."
+                    )
             try:
-                neighbor_id = int(neighbor_agent.attrib["Id"])
+                parent_shape_id = int(interaction.attrib["ParentShape"])
+                child_shape_id = int(interaction.attrib["ChildShape"])
+                ft = fun.from_string_to_tuple(interaction.attrib["Ft"])
+                fn = fun.from_string_to_tuple(interaction.attrib["Fn"])
+                tangential_rel_displacement = fun.from_string_to_tuple(interaction.attrib["TangentialRelativeDisplacement"])
             except ValueError as e:
                 raise ValueError(
-                    f"Invalid 'Id' value in <Agent> (neighbor) at position {neighbor_idx} under Agent {agent_id}: "
-                    "'{neighbor_agent.attrib['Id']}' is not an integer."
+                    f"Type error in <Interaction> at position {interaction_idx} "
+                    f"under Neighbor Agent {neighbor_id} of Agent {agent_id}: {e}"
                 ) from e
 
-            neighbor_key = f"Agent{neighbor_id}"
-            interactions_dict["Interactions"][agent_key]["NeighbouringAgents"][neighbor_key] = {"Id": neighbor_id, "Interactions": {}}
-
-            # Iterate through interactions
-            for interaction_idx, interaction in enumerate(neighbor_agent.findall("Interaction")):
-                required_attrs = ["ParentShape", "ChildShape", "TangentialRelativeDisplacement", "Fn", "Ft"]
-                for attr in required_attrs:
-                    if attr not in interaction.attrib:
-                        raise ValueError(
-                            f"Missing '{attr}' attribute in <Interaction> at position {interaction_idx} "
-                            f"under Neighbor Agent {neighbor_id} of Agent {agent_id}."
-                        )
-                try:
-                    parent_shape_id = int(interaction.attrib["ParentShape"])
-                    child_shape_id = int(interaction.attrib["ChildShape"])
-                    ft = fun.from_string_to_tuple(interaction.attrib["Ft"])
-                    fn = fun.from_string_to_tuple(interaction.attrib["Fn"])
-                    tangential_rel_displacement = fun.from_string_to_tuple(interaction.attrib["TangentialRelativeDisplacement"])
-                except ValueError as e:
-                    raise ValueError(
-                        f"Type error in <Interaction> at position {interaction_idx} "
-                        f"under Neighbor Agent {neighbor_id} of Agent {agent_id}: {e}"
-                    ) from e
+            interaction_key = f"Interaction_{parent_shape_id}_{child_shape_id}"
+            agent_data["NeighbouringAgents"][neighbor_key]["Interactions"][interaction_key] = {
+                "ParentShape": parent_shape_id,
+                "ChildShape": child_shape_id,
+                "TangentialRelativeDisplacement": tangential_rel_displacement,
+                "Fn": fn,
+                "Ft": ft,
+            }
+
+    return agent_data
+
+
+def interactions_xml_to_dict(xml_data: XMLSourceType) -> InteractionsDataType:
+    """
+    Convert an XML document describing interactions between agents and with boundaries into a dictionary.
+
+    Parameters
+    ----------
+    xml_data : XMLSourceType
+        XML data as a string or bytes, path of the XML file, or binary stream.
 
-                interaction_key = f"Interaction_{parent_shape_id}_{child_shape_id}"
-                interactions_dict["Interactions"][agent_key]["NeighbouringAgents"][neighbor_key]["Interactions"][interaction_key] = {
-                    "ParentShape": parent_shape_id,
-                    "ChildShape": child_shape_id,
-                    "TangentialRelativeDisplacement": tangential_rel_displacement,
-                    "Fn": fn,
-                    "Ft": ft,
-                }
+    Returns
+    -------
+    InteractionsDataType
+        A dictionary representation of the XML data.
+
+    Raises
+    ------
+    ValueError
+        If the XML structure or attribute types are incorrect.
+    """
+    interactions_dict: InteractionsDataType = {"Interactions": {}}
+
+    # Iterate through all Agent elements in the XML
+    for agent_idx, agent in enumerate(_iterparse_children(xml_data, "Agent")):
+        agent_data = _parse_interactions_agent(agent, agent_idx)
+        interactions_dict["Interactions"][f"Agent{agent_data['Id']}"] = agent_data
 
     return interactions_dict
+
+
+def interactions_xml_to_arrays(xml_data: XMLSourceType) -> CrowdArraysDataType:
+    """
+    Convert an XML document describing interactions between agents into columnar arrays.
+
+    The array "agent_id" lists all the agents of the file, in order. The other arrays have one row per interaction.
+    Neighbouring agents without any interaction are not represented.
+
+    Parameters
+    ----------
+    xml_data : XMLSourceType
+        XML data as a string or bytes, path of the XML file, or binary stream.
+
+    Returns
+    -------
+    CrowdArraysDataType
+        A dictionary with the arrays "agent_id", "parent_agent_id", "child_agent_id", "parent_shape", "child_shape",
+        "tangential_relative_displacement", "fn" and "ft". The last three arrays have a shape (number of interactions, 2).
+
+    Raises
+    ------
+    ValueError
+        If the XML structure or attribute types are incorrect.
+    """
+    columns: dict[str, list[Any]] = {key: [] for key in _INTERACTIONS_COLUMNS}
+    agent_ids = []
+
+    for agent_idx, agent in enumerate(_iterparse_children(xml_data, "Agent")):
+        agent_data = _parse_interactions_agent(agent, agent_idx)
+        agent_ids.append(agent_data["Id"])
+        for neighbor_data in agent_data["NeighbouringAgents"].values():
+            for interaction_data in neighbor_data["Interactions"].values():
+                columns["parent_agent_id"].append(agent_data["Id"])
+                columns["child_agent_id"].append(neighbor_data["Id"])
+                for key, attribute in _INTERACTIONS_COLUMNS.items():
+                    if attribute:
+                        columns[key].append(interaction_data[attribute])
+
+    return {
+        "agent_id": np.array(agent_ids, dtype=np.int64),
+        "parent_agent_id": np.array(columns["parent_agent_id"], dtype=np.int64),
+        "child_agent_id": np.array(columns["child_agent_id"], dtype=np.int64),
+        "parent_shape": np.array(columns["parent_shape"], dtype=np.int64),
+        "child_shape": np.array(columns["child_shape"], dtype=np.int64),
+        "tangential_relative_displacement": np.array(columns["tangential_relative_displacement"], dtype=np.float64).reshape(-1, 2),
+        "fn": np.array(columns["fn"], dtype=np.float64).reshape(-1, 2),
+        "ft": np.array(columns["ft"], dtype=np.float64).reshape(-1, 2),
+    }
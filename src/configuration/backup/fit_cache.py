@@ -0,0 +1,270 @@
+"""Contains a persistent cache of the scale factors fitted to create agent shapes, stored in a SQLite database."""
+
+# Copyright  2025  Institute of Light and Matter, CNRS UMR 5306, University Claude Bernard Lyon 1
+# Contributors: Oscar DUFOUR, Maxime STAPELLE, Alexandre NICOLAS
+
+# This software is a computer program designed to generate a realistic crowd from anthropometric data and
+# simulate the mechanical interactions that occur within it and with obstacles.
+
+# This software is governed by the CeCILL  license under French law and abiding by the rules of distribution
+# of free software.  You can  use, modify and/ or redistribute the software under the terms of the CeCILL
+# license as circulated by CEA, CNRS and INRIA at the following URL "http://www.cecill.info".
+
+# As a counterpart to the access to the source code and  rights to copy, modify and redistribute granted by
+# the license, users are provided only with a limited warranty  and the software's author,  the holder of the
+# economic rights,  and the successive licensors  have only  limited liability.
+
+# In this respect, the user's attention is drawn to the risks associated with loading,  using,  modifying
+# and/or developing or reproducing the software by the user in light of its specific status of free software,
+# that may mean  that it is complicated to manipulate,  and  that  also therefore means  that it is reserved
+# for developers  and  experienced professionals having in-depth computer knowledge. Users are therefore
+# encouraged to load and test the software's suitability as regards their requirements in conditions enabling
+# the security of their systems and/or data to be ensured and,  more generally, to use and operate it in the
+# same conditions as regards security.
+
+# The fact that you are presently reading this means that you have had knowledge of the CeCILL license and that
+# you accept its terms.
+
+import sqlite3
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+from numpy.typing import NDArray
+
+import configuration.utils.constants as cst
+
+# The cache used by the shape fits of the current context, see `use_fit_cache`
+_active_fit_cache: ContextVar["FitCache | None"] = ContextVar("active_fit_cache", default=None)
+
+
+def make_fit_key(kind: str, sex: str | None, measures: Iterable[float]) -> str:
+    """
+    Build the key of a fit in the cache, from the measures quantised to `FIT_CACHE_QUANTUM`.
+
+    Parameters
+    ----------
+    kind : str
+        The kind of fit, e.g. "pedestrian2D", "bike2D" or "pedestrian3D".
+    sex : str | None
+        The sex of the pedestrian, or None for bikes.
+    measures : Iterable[float]
+        The measures (cm) the fit depends on, in a fixed order.
+
+    Returns
+    -------
+    str
+        The key of the fit.
+    """
+    quantised_measures = ",".join(str(round(float(measure) / cst.FIT_CACHE_QUANTUM)) for measure in measures)
+    return f"{kind}:{sex or ''}:{quantised_measures}"
+
+
+@dataclass
+class FitCache:
+    """
+    Least-recently-used cache of fitted scale factors, persisted in a SQLite database.
+
+    Attributes
+    ----------
+    path : Path
+        The path of the SQLite database, created if it does not exist.
+    max_entries : int
+        The maximum number of fits kept in the cache; the least recently used ones are evicted above it.
+    hits : int
+        The number of lookups that found a fit in the cache.
+    misses : int
+        The number of lookups that did not find a fit in the cache.
+    """
+
+    path: Path
+    max_entries: int = cst.FIT_CACHE_MAX_ENTRIES
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+    _connection: sqlite3.Connection = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """
+        Open the database and create its table if needed.
+
+        Raises
+        ------
+        TypeError
+            If `path` is not a Path object.
+        ValueError
+            If `max_entries` is not a positive integer, or if the database was written with another layout version.
+        """
+        if not isinstance(self.path, Path):
+            raise TypeError("`path` should be a Path object.")
+        if not isinstance(self.max_entries, int) or self.max_entries < 1:
+            raise ValueError("`max_entries` should be a positive integer.")
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(self.path)
+        with self._connection:
+            version = self._connection.execute("PRAGMA user_version").fetchone()[0]
+            if version == 0:
+                self._connection.execute(f"PRAGMA user_version = {cst.FIT_CACHE_VERSION}")
+            elif version != cst.FIT_CACHE_VERSION:
+                self._connection.close()
+                raise ValueError(f"Unsupported fit cache version {version} (expected {cst.FIT_CACHE_VERSION}).")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS fits (key TEXT PRIMARY KEY, scale_factors BLOB NOT NULL, last_used INTEGER NOT NULL)"
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS fits_last_used ON fits (last_used)")
+
+    def __len__(self) -> int:
+        """
+        Get the number of fits in the cache.
+
+        Returns
+        -------
+        int
+            The number of fits in the cache.
+        """
+        return int(self._connection.execute("SELECT COUNT(*) FROM fits").fetchone()[0])
+
+    def _next_use(self) -> int:
+        """
+        Get the rank of a new use of a fit, greater than the ones of all the fits in the cache.
+
+        Returns
+        -------
+        int
+            The rank of the use.
+        """
+        return int(self._connection.execute("SELECT COALESCE(MAX(last_used), 0) + 1 FROM fits").fetchone()[0])
+
+    def get(self, key: str) -> NDArray[np.float64] | None:
+        """
+        Look up the scale factors of a fit, and mark it as recently used.
+
+        Parameters
+        ----------
+        key : str
+            The key of the fit, see `make_fit_key`.
+
+        Returns
+        -------
+        NDArray[np.float64] | None
+            The fitted scale factors, or None if the fit is not in the cache.
+        """
+        row = self._connection.execute("SELECT scale_factors FROM fits WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        with self._connection:
+            self._connection.execute("UPDATE fits SET last_used = ? WHERE key = ?", (self._next_use(), key))
+        return np.frombuffer(row[0], dtype=np.float64).copy()
+
+    def put(self, key: str, scale_factors: NDArray[np.float64]) -> None:
+        """
+        Store the scale factors of a fit, evicting the least recently used fits above `max_entries`.
+
+        Parameters
+        ----------
+        key : str
+            The key of the fit, see `make_fit_key`.
+        scale_factors : NDArray[np.float64]
+            The fitted scale factors.
+        """
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO fits (key, scale_factors, last_used) VALUES (?, ?, ?)",
+                (key, np.asarray(scale_factors, dtype=np.float64).tobytes(), self._next_use()),
+            )
+            number_evicted = len(self) - self.max_entries
+            if number_evicted > 0:
+                self._connection.execute(
+                    "DELETE FROM fits WHERE key IN (SELECT key FROM fits ORDER BY last_used LIMIT ?)", (number_evicted,)
+                )
+
+    def clear(self) -> None:
+        """Remove all the fits from the cache and reset the counters."""
+        with self._connection:
+            self._connection.execute("DELETE FROM fits")
+        self.hits = 0
+        self.misses = 0
+
+    def close(self) -> None:
+        """Close the database."""
+        self._connection.close()
+
+
+@contextmanager
+def use_fit_cache(path: Path, max_entries: int = cst.FIT_CACHE_MAX_ENTRIES) -> Iterator[FitCache]:
+    """
+    Cache the scale factors fitted to create the agent shapes within the block.
+
+    Inside the block, `Shapes2D.create_pedestrian_shapes`, `Shapes2D.create_bike_shapes` and
+    `Shapes3D.create_pedestrian3D` look up their scale factors in the cache, keyed by the agent type, the sex and the
+    measures quantised to `FIT_CACHE_QUANTUM`, and only run their optimisation on a miss.
+
+    Parameters
+    ----------
+    path : Path
+        The path of the SQLite database of the cache.
+    max_entries : int
+        The maximum number of fits kept in the cache.
+
+    Yields
+    ------
+    FitCache
+        The cache, whose `hits` and `misses` count the lookups done within the block.
+    """
+    cache = FitCache(path, max_entries)
+    token = _active_fit_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _active_fit_cache.reset(token)
+        cache.close()
+
+
+def get_active_fit_cache() -> FitCache | None:
+    """
+    Get the cache of fitted scale factors of the current context.
+
+    Returns
+    -------
+    FitCache | None
+        The cache of the enclosing `use_fit_cache()` block, or None outside of such a block.
+    """
+    return _active_fit_cache.get()
+
+
+def fit_with_cache(
+    kind: str, sex: str | None, measures: Iterable[float], fit: Callable[[], NDArray[np.float64]]
+) -> NDArray[np.float64]:
+    """
+    Get the scale factors of a fit from the active cache, or compute them and store them in it.
+
+    Parameters
+    ----------
+    kind : str
+        The kind of fit, e.g. "pedestrian2D", "bike2D" or "pedestrian3D".
+    sex : str | None
+        The sex of the pedestrian, or None for bikes.
+    measures : Iterable[float]
+        The measures (cm) the fit depends on, in a fixed order.
+    fit : Callable[[], NDArray[np.float64]]
+        The function computing the scale factors, called outside of a `use_fit_cache()` block or on a miss.
+
+    Returns
+    -------
+    NDArray[np.float64]
+        The fitted scale factors.
+    """
+    cache = get_active_fit_cache()
+    if cache is None:
+        return np.asarray(fit(), dtype=np.float64)
+    key = make_fit_key(kind, sex, measures)
+    scale_factors = cache.get(key)
+    if scale_factors is None:
+        scale_factors = np.asarray(fit(), dtype=np.float64)
+        cache.put(key, scale_factors)
+    return scale_factors
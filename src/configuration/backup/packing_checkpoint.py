@@ -0,0 +1,189 @@
+"""Contains functions to save and restore the state of an iterative packing algorithm to and from a compact binary file."""
+
+# Copyright  2025  Institute of Light and Matter, CNRS UMR 5306, University Claude Bernard Lyon 1
+# Contributors: Oscar DUFOUR, Maxime STAPELLE, Alexandre NICOLAS
+
+# This software is a computer program designed to generate a realistic crowd from anthropometric data and
+# simulate the mechanical interactions that occur within it and with obstacles.
+
+# This software is governed by the CeCILL  license under French law and abiding by the rules of distribution
+# of free software.  You can  use, modify and/ or redistribute the software under the terms of the CeCILL
+# license as circulated by CEA, CNRS and INRIA at the following URL "http://www.cecill.info".
+
+# As a counterpart to the access to the source code and  rights to copy, modify and redistribute granted by
+# the license, users are provided only with a limited warranty  and the software's author,  the holder of the
+# economic rights,  and the successive licensors  have only  limited liability.
+
+# In this respect, the user's attention is drawn to the risks associated with loading,  using,  modifying
+# and/or developing or reproducing the software by the user in light of its specific status of free software,
+# that may mean  that it is complicated to manipulate,  and  that  also therefore means  that it is reserved
+# for developers  and  experienced professionals having in-depth computer knowledge. Users are therefore
+# encouraged to load and test the software's suitability as regards their requirements in conditions enabling
+# the security of their systems and/or data to be ensured and,  more generally, to use and operate it in the
+# same conditions as regards security.
+
+# The fact that you are presently reading this means that you have had knowledge of the CeCILL license and that
+# you accept its terms.
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, TypeAlias
+
+import numpy as np
+from numpy.typing import NDArray
+
+import configuration.utils.constants as cst
+
+#: Represents the state of the legacy global NumPy random generator, as returned by `np.random.get_state()`.
+RandomStateType: TypeAlias = tuple[str, NDArray[np.uint32], int, int, float]
+
+
+@dataclass
+class PackingCheckpoint:
+    """
+    Snapshot of the state of an iterative packing algorithm.
+
+    Attributes
+    ----------
+    iteration : int
+        Number of packing iterations already completed.
+    temperature : float
+        Temperature of the annealing schedule after the completed iterations.
+    elapsed_time : float
+        Wall time (in seconds) spent in the packing algorithm so far.
+    initial_positions : NDArray[np.float64]
+        Positions (in cm) of the agents when the packing started, with shape (number of agents, 2). They are used to
+        check that a checkpoint is resumed on the crowd it was created from.
+    positions : NDArray[np.float64]
+        Current positions (in cm) of the agents, with shape (number of agents, 2).
+    rotations : NDArray[np.float64]
+        Rotation (in degrees) applied to each agent since the packing started, with shape (number of agents,).
+    rng_state : RandomStateType
+        State of the global NumPy random generator, as returned by `np.random.get_state()`.
+    """
+
+    iteration: int
+    temperature: float
+    elapsed_time: float
+    initial_positions: NDArray[np.float64]
+    positions: NDArray[np.float64]
+    rotations: NDArray[np.float64]
+    rng_state: RandomStateType
+
+    def __post_init__(self) -> None:
+        """
+        Validate the checkpoint after the dataclass initialization.
+
+        Raises
+        ------
+        ValueError
+            If the iteration count is negative or if the pose arrays have inconsistent shapes.
+        """
+        if self.iteration < 0:
+            raise ValueError("`iteration` should be a non-negative integer.")
+        number_agents = self.positions.shape[0]
+        if self.positions.shape != (number_agents, 2) or self.initial_positions.shape != (number_agents, 2):
+            raise ValueError("`positions` and `initial_positions` should be arrays of shape (number of agents, 2).")
+        if self.rotations.shape != (number_agents,):
+            raise ValueError("`rotations` should be an array of shape (number of agents,).")
+
+
+def save_packing_checkpoint(checkpoint: PackingCheckpoint, checkpoint_path: Path) -> None:
+    """
+    Save a packing checkpoint to an uncompressed `.npz` file.
+
+    The file is first written next to its destination and then atomically moved in place, so that an interrupted
+    save never corrupts the previous checkpoint.
+
+    Parameters
+    ----------
+    checkpoint : PackingCheckpoint
+        The state of the packing algorithm to save.
+    checkpoint_path : Path
+        The path of the checkpoint file.
+
+    Raises
+    ------
+    TypeError
+        If `checkpoint_path` is not a Path object.
+    ValueError
+        If `checkpoint_path` does not have a .npz extension.
+    """
+    if not isinstance(checkpoint_path, Path):
+        raise TypeError("`checkpoint_path` should be a Path object.")
+    if checkpoint_path.suffix != ".npz":
+        raise ValueError("`checkpoint_path` should have a .npz extension.")
+
+    checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+    rng_name, rng_keys, rng_position, rng_has_gauss, rng_cached_gaussian = checkpoint.rng_state
+    temporary_path = checkpoint_path.with_name(f"{checkpoint_path.name}.tmp")
+    with open(temporary_path, "wb") as checkpoint_file:
+        np.savez(
+            checkpoint_file,
+            version=np.array(cst.PACKING_CHECKPOINT_VERSION, dtype=np.int64),
+            iteration=np.array(checkpoint.iteration, dtype=np.int64),
+            temperature=np.array(checkpoint.temperature, dtype=np.float64),
+            elapsed_time=np.array(checkpoint.elapsed_time, dtype=np.float64),
+            initial_positions=np.asarray(checkpoint.initial_positions, dtype=np.float64),
+            positions=np.asarray(checkpoint.positions, dtype=np.float64),
+            rotations=np.asarray(checkpoint.rotations, dtype=np.float64),
+            rng_name=np.array(rng_name),
+            rng_keys=np.asarray(rng_keys, dtype=np.uint32),
+            rng_position=np.array(rng_position, dtype=np.int64),
+            rng_has_gauss=np.array(rng_has_gauss, dtype=np.int64),
+            rng_cached_gaussian=np.array(rng_cached_gaussian, dtype=np.float64),
+        )
+    os.replace(temporary_path, checkpoint_path)
+
+
+def load_packing_checkpoint(checkpoint_path: Path) -> PackingCheckpoint:
+    """
+    Load a packing checkpoint from a `.npz` file written by `save_packing_checkpoint`.
+
+    Parameters
+    ----------
+    checkpoint_path : Path
+        The path of the checkpoint file.
+
+    Returns
+    -------
+    PackingCheckpoint
+        The state of the packing algorithm stored in the file.
+
+    Raises
+    ------
+    TypeError
+        If `checkpoint_path` is not a Path object.
+    FileNotFoundError
+        If the checkpoint file does not exist.
+    ValueError
+        If the checkpoint was written with an unsupported layout version.
+    """
+    if not isinstance(checkpoint_path, Path):
+        raise TypeError("`checkpoint_path` should be a Path object.")
+    if not checkpoint_path.exists():
+        raise FileNotFoundError(f"Checkpoint file not found: {checkpoint_path}")
+
+    with np.load(checkpoint_path, allow_pickle=False) as data:
+        stored: dict[str, Any] = {key: data[key] for key in data.files}
+
+    version = int(stored["version"])
+    if version != cst.PACKING_CHECKPOINT_VERSION:
+        raise ValueError(f"Unsupported checkpoint version {version} (expected {cst.PACKING_CHECKPOINT_VERSION}).")
+
+    return PackingCheckpoint(
+        iteration=int(stored["iteration"]),
+        temperature=float(stored["temperature"]),
+        elapsed_time=float(stored["elapsed_time"]),
+        initial_positions=stored["initial_positions"],
+        positions=stored["positions"],
+        rotations=stored["rotations"],
+        rng_state=(
+            str(stored["rng_name"]),
+            stored["rng_keys"],
+            int(stored["rng_position"]),
+            int(stored["rng_has_gauss"]),
+            float(stored["rng_cached_gaussian"]),
+        ),
+    )
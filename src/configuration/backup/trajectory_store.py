@@ -0,0 +1,544 @@
+"""Append-only, memory-mapped store of the agent trajectories of a simulation."""
+
+# Copyright  2025  Institute of Light and Matter, CNRS UMR 5306, University Claude Bernard Lyon 1
+# Contributors: Oscar DUFOUR, Maxime STAPELLE, Alexandre NICOLAS
+
+# This software is a computer program designed to generate a realistic crowd from anthropometric data and
+# simulate the mechanical interactions that occur within it and with obstacles.
+
+# This software is governed by the CeCILL  license under French law and abiding by the rules of distribution
+# of free software.  You can  use, modify and/ or redistribute the software under the terms of the CeCILL
+# license as circulated by CEA, CNRS and INRIA at the following URL "http://www.cecill.info".
+
+# As a counterpart to the access to the source code and  rights to copy, modify and redistribute granted by
+# the license, users are provided only with a limited warranty  and the software's author,  the holder of the
+# economic rights,  and the successive licensors  have only  limited liability.
+
+# In this respect, the user's attention is drawn to the risks associated with loading,  using,  modifying
+# and/or developing or reproducing the software by the user in light of its specific status of free software,
+# that may mean  that it is complicated to manipulate,  and  that  also therefore means  that it is reserved
+# for developers  and  experienced professionals having in-depth computer knowledge. Users are therefore
+# encouraged to load and test the software's suitability as regards their requirements in conditions enabling
+# the security of their systems and/or data to be ensured and,  more generally, to use and operate it in the
+# same conditions as regards security.
+
+# The fact that you are presently reading this means that you have had knowledge of the CeCILL license and that
+# you accept its terms.
+
+from pathlib import Path
+from types import TracebackType
+from typing import IO, Any
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+import configuration.backup.dict_to_xml_and_reverse as dict_to_xml
+import configuration.backup.xml_to_Chaos as xml_to_chaos
+import configuration.utils.constants as cst
+from configuration.utils.typing_custom import TrajectoryArraysDataType
+
+#: Layout of the fixed-size beginning of a trajectory store file. It is followed by the agent IDs (int64), padded
+#: to `TRAJECTORY_STORE_ALIGNMENT` bytes, and then by one record per time step.
+_HEADER_DTYPE = np.dtype(
+    [
+        ("magic", "S8"),
+        ("version", "<u4"),
+        ("number_agents", "<u4"),
+        ("header_size", "<u8"),
+    ]
+)
+
+
+def _get_record_dtype(number_agents: int) -> np.dtype[Any]:
+    """
+    Get the layout of the record storing the kinematics of all agents at one time step.
+
+    Parameters
+    ----------
+    number_agents : int
+        The number of agents in the store.
+
+    Returns
+    -------
+    np.dtype[Any]
+        The structured data type of a record.
+    """
+    return np.dtype(
+        [
+            ("time", "<f8"),
+            ("position", "<f8", (number_agents, 2)),
+            ("velocity", "<f8", (number_agents, 2)),
+            ("theta", "<f8", (number_agents,)),
+            ("omega", "<f8", (number_agents,)),
+        ]
+    )
+
+
+def _read_header(store_file: IO[bytes]) -> tuple[NDArray[np.int64], int]:
+    """
+    Read the header of a trajectory store file.
+
+    Parameters
+    ----------
+    store_file : IO[bytes]
+        The store file, opened in binary mode at its beginning.
+
+    Returns
+    -------
+    NDArray[np.int64]
+        The IDs of the agents in the store.
+    int
+        The size of the header in bytes, i.e. the offset of the first record.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a trajectory store or its version is not supported.
+    """
+    header_bytes = store_file.read(_HEADER_DTYPE.itemsize)
+    if len(header_bytes) < _HEADER_DTYPE.itemsize:
+        raise ValueError("Not a trajectory store file: the header is truncated.")
+    header = np.frombuffer(header_bytes, dtype=_HEADER_DTYPE)[0]
+    if bytes(header["magic"]) != cst.TRAJECTORY_STORE_MAGIC:
+        raise ValueError("Not a trajectory store file.")
+    if int(header["version"]) != cst.TRAJECTORY_STORE_VERSION:
+        raise ValueError(f"Unsupported trajectory store version {int(header['version'])}, expected {cst.TRAJECTORY_STORE_VERSION}.")
+
+    number_agents = int(header["number_agents"])
+    agent_ids = np.frombuffer(store_file.read(8 * number_agents), dtype="<i8").astype(np.int64)
+    if len(agent_ids) != number_agents:
+        raise ValueError("Not a trajectory store file: the agent IDs are truncated.")
+    return agent_ids, int(header["header_size"])
+
+
+def _get_number_records(store_path: Path, header_size: int, record_size: int) -> int:
+    """
+    Get the number of complete records of a trajectory store file.
+
+    A record partially written, e.g. by an interrupted run, is ignored.
+
+    Parameters
+    ----------
+    store_path : Path
+        The path of the store file.
+    header_size : int
+        The size of the header in bytes.
+    record_size : int
+        The size of a record in bytes.
+
+    Returns
+    -------
+    int
+        The number of complete records.
+    """
+    return max(0, store_path.stat().st_size - header_size) // record_size
+
+
+class TrajectoryStoreWriter:
+    """
+    Append the kinematics of the agents, time step after time step, to a trajectory store file.
+
+    The time steps are buffered in memory and written to disk by chunks of `chunk_size` steps. The file is never
+    rewritten: the records are only appended after its header, so that it can be read while the simulation runs.
+
+    Parameters
+    ----------
+    store_path : Path
+        The path of the store file.
+    agent_ids : ArrayLike
+        The IDs of the agents, in the order of the rows of the appended arrays.
+    chunk_size : int, optional
+        The number of time steps buffered before writing to disk, by default `TRAJECTORY_STORE_CHUNK_SIZE`.
+    append : bool, optional
+        Whether to append to an existing store with the same agents instead of overwriting it, by default False.
+
+    Raises
+    ------
+    TypeError
+        If `store_path` is not a Path object.
+    ValueError
+        If the agent IDs are empty or not unique, if `chunk_size` is not a positive integer, or if the existing store
+        has other agents.
+    """
+
+    def __init__(
+        self,
+        store_path: Path,
+        agent_ids: ArrayLike,
+        chunk_size: int = cst.TRAJECTORY_STORE_CHUNK_SIZE,
+        append: bool = False,
+    ) -> None:
+        if not isinstance(store_path, Path):
+            raise TypeError("`store_path` should be a Path object.")
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            raise ValueError("`chunk_size` should be a positive integer.")
+        self.agent_ids: NDArray[np.int64] = np.asarray(agent_ids, dtype=np.int64).reshape(-1)
+        if len(self.agent_ids) == 0:
+            raise ValueError("A trajectory store needs at least one agent.")
+        if len(np.unique(self.agent_ids)) != len(self.agent_ids):
+            raise ValueError("The agent IDs of a trajectory store should be unique.")
+
+        self._record_dtype = _get_record_dtype(len(self.agent_ids))
+        self._buffer = np.zeros(chunk_size, dtype=self._record_dtype)
+        self._buffer_size = 0
+        self._last_time = -np.inf
+
+        self._file: IO[bytes]
+        if append and store_path.exists():
+            self._file = open(store_path, "r+b")
+            stored_agent_ids, header_size = _read_header(self._file)
+            if not np.array_equal(stored_agent_ids, self.agent_ids):
+                self._file.close()
+                raise ValueError(f"The agents of the trajectory store {store_path} differ from `agent_ids`.")
+            number_records = _get_number_records(store_path, header_size, self._record_dtype.itemsize)
+            # Drop a record partially written by an interrupted run
+            self._file.truncate(header_size + number_records * self._record_dtype.itemsize)
+            if number_records > 0:
+                self._file.seek(header_size + (number_records - 1) * self._record_dtype.itemsize)
+                self._last_time = float(np.frombuffer(self._file.read(8), dtype="<f8")[0])
+            self._file.seek(0, 2)
+        else:
+            store_path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(store_path, "wb")
+            ids_size = 8 * len(self.agent_ids)
+            header_size = -(-(_HEADER_DTYPE.itemsize + ids_size) // cst.TRAJECTORY_STORE_ALIGNMENT) * cst.TRAJECTORY_STORE_ALIGNMENT
+            header = np.array(
+                [(cst.TRAJECTORY_STORE_MAGIC, cst.TRAJECTORY_STORE_VERSION, len(self.agent_ids), header_size)],
+                dtype=_HEADER_DTYPE,
+            )
+            self._file.write(header.tobytes())
+            self._file.write(self.agent_ids.astype("<i8").tobytes())
+            self._file.write(b"\0" * (header_size - _HEADER_DTYPE.itemsize - ids_size))
+
+    def append(
+        self,
+        time: float,
+        position: ArrayLike,
+        velocity: ArrayLike,
+        theta: ArrayLike,
+        omega: ArrayLike,
+    ) -> None:
+        """
+        Append the kinematics of all agents at a time step.
+
+        Parameters
+        ----------
+        time : float
+            The time of the step. It should not be lower than the time of the previous step.
+        position : ArrayLike
+            The positions of the agents, of shape (number of agents, 2). Missing agents are NaN.
+        velocity : ArrayLike
+            The velocities of the agents, of shape (number of agents, 2). Missing agents are NaN.
+        theta : ArrayLike
+            The orientations of the agents, of shape (number of agents,). Missing agents are NaN.
+        omega : ArrayLike
+            The angular velocities of the agents, of shape (number of agents,). Missing agents are NaN.
+
+        Raises
+        ------
+        ValueError
+            If the time is lower than the time of the previous step, or if an array has a wrong shape.
+        """
+        if time < self._last_time:
+            raise ValueError(f"Time {time} is lower than the time of the previous step {self._last_time}.")
+        number_agents = len(self.agent_ids)
+        columns = {"position": position, "velocity": velocity, "theta": theta, "omega": omega}
+        record = self._buffer[self._buffer_size]
+        for key, values in columns.items():
+            values_array = np.asarray(values, dtype=np.float64)
+            expected_shape = (number_agents, 2) if key in ("position", "velocity") else (number_agents,)
+            if values_array.shape != expected_shape:
+                raise ValueError(f"`{key}` should have shape {expected_shape}, got {values_array.shape}.")
+            record[key] = values_array
+        record["time"] = time
+
+        self._last_time = time
+        self._buffer_size += 1
+        if self._buffer_size == len(self._buffer):
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the buffered time steps to disk."""
+        if self._buffer_size > 0:
+            self._file.write(self._buffer[: self._buffer_size].tobytes())
+            self._buffer_size = 0
+        self._file.flush()
+
+    def close(self) -> None:
+        """Write the buffered time steps to disk and close the file."""
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def __enter__(self) -> "TrajectoryStoreWriter":
+        """
+        Enter the runtime context of the writer.
+
+        Returns
+        -------
+        TrajectoryStoreWriter
+            The writer itself.
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """
+        Close the writer when leaving its runtime context.
+
+        Parameters
+        ----------
+        exc_type : type[BaseException] | None
+            The type of the exception raised in the context, if any.
+        exc_value : BaseException | None
+            The exception raised in the context, if any.
+        traceback : TracebackType | None
+            The traceback of the exception raised in the context, if any.
+        """
+        self.close()
+
+
+class TrajectoryStoreReader:
+    """
+    Read a trajectory store file through a memory map, without loading it.
+
+    Only the complete records present when the reader is created are visible.
+
+    Parameters
+    ----------
+    store_path : Path
+        The path of the store file.
+
+    Raises
+    ------
+    TypeError
+        If `store_path` is not a Path object.
+    FileNotFoundError
+        If the store file does not exist.
+    ValueError
+        If the file is not a trajectory store or its version is not supported.
+    """
+
+    def __init__(self, store_path: Path) -> None:
+        if not isinstance(store_path, Path):
+            raise TypeError("`store_path` should be a Path object.")
+        if not store_path.exists():
+            raise FileNotFoundError(f"Trajectory store not found: {store_path}")
+
+        with open(store_path, "rb") as store_file:
+            self.agent_ids, header_size = _read_header(store_file)
+        self._agent_index = {agent_id: agent_idx for agent_idx, agent_id in enumerate(self.agent_ids.tolist())}
+
+        record_dtype = _get_record_dtype(len(self.agent_ids))
+        number_records = _get_number_records(store_path, header_size, record_dtype.itemsize)
+        self._records: NDArray[Any]
+        if number_records > 0:
+            self._records = np.memmap(store_path, dtype=record_dtype, mode="r", offset=header_size, shape=(number_records,))
+        else:
+            self._records = np.zeros(0, dtype=record_dtype)
+
+    def __len__(self) -> int:
+        """
+        Get the number of time steps in the store.
+
+        Returns
+        -------
+        int
+            The number of time steps.
+        """
+        return len(self._records)
+
+    @property
+    def times(self) -> NDArray[np.float64]:
+        """
+        Get the times of the steps in the store, in increasing order.
+
+        Returns
+        -------
+        NDArray[np.float64]
+            The times of the steps.
+        """
+        return np.array(self._records["time"], dtype=np.float64)
+
+    def query(
+        self,
+        t_min: float | None = None,
+        t_max: float | None = None,
+        agent_ids: ArrayLike | None = None,
+    ) -> TrajectoryArraysDataType:
+        """
+        Get the kinematics of a subset of agents over a time range.
+
+        Only the records of the requested time range are read from disk.
+
+        Parameters
+        ----------
+        t_min : float | None, optional
+            The lower bound of the time range, included. By default, the range starts at the first step.
+        t_max : float | None, optional
+            The upper bound of the time range, included. By default, the range ends at the last step.
+        agent_ids : ArrayLike | None, optional
+            The IDs of the requested agents. By default, all agents are returned, in the order of the store.
+
+        Returns
+        -------
+        TrajectoryArraysDataType
+            A dictionary with the arrays "time" (T,), "agent_id" (N,), "position" (T, N, 2), "velocity" (T, N, 2),
+            "theta" (T, N) and "omega" (T, N).
+
+        Raises
+        ------
+        ValueError
+            If an agent ID is not in the store.
+        """
+        times = self._records["time"]
+        start = int(np.searchsorted(times, t_min, side="left")) if t_min is not None else 0
+        stop = int(np.searchsorted(times, t_max, side="right")) if t_max is not None else len(times)
+        records = self._records[start : max(start, stop)]
+
+        if agent_ids is None:
+            selected_ids = self.agent_ids.copy()
+            agent_indices: slice | list[int] = slice(None)
+        else:
+            selected_ids = np.asarray(agent_ids, dtype=np.int64).reshape(-1)
+            missing_ids = [agent_id for agent_id in selected_ids.tolist() if agent_id not in self._agent_index]
+            if missing_ids:
+                raise ValueError(f"Agent IDs not in the trajectory store: {missing_ids}.")
+            agent_indices = [self._agent_index[agent_id] for agent_id in selected_ids.tolist()]
+
+        return {
+            "time": np.array(records["time"], dtype=np.float64),
+            "agent_id": selected_ids,
+            "position": np.array(records["position"][:, agent_indices], dtype=np.float64),
+            "velocity": np.array(records["velocity"][:, agent_indices], dtype=np.float64),
+            "theta": np.array(records["theta"][:, agent_indices], dtype=np.float64),
+            "omega": np.array(records["omega"][:, agent_indices], dtype=np.float64),
+        }
+
+    def close(self) -> None:
+        """Release the memory map of the store file."""
+        self._records = np.zeros(0, dtype=self._records.dtype)
+
+    def __enter__(self) -> "TrajectoryStoreReader":
+        """
+        Enter the runtime context of the reader.
+
+        Returns
+        -------
+        TrajectoryStoreReader
+            The reader itself.
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """
+        Close the reader when leaving its runtime context.
+
+        Parameters
+        ----------
+        exc_type : type[BaseException] | None
+            The type of the exception raised in the context, if any.
+        exc_value : BaseException | None
+            The exception raised in the context, if any.
+        traceback : TracebackType | None
+            The traceback of the exception raised in the context, if any.
+        """
+        self.close()
+
+
+def snapshots_to_trajectory_store(
+    folder_path: Path,
+    store_path: Path,
+    chunk_size: int = cst.TRAJECTORY_STORE_CHUNK_SIZE,
+) -> None:
+    """
+    Convert the 'AgentDyn...output t=<time>.xml' snapshot files of a mechanical layer run to a trajectory store.
+
+    The files are parsed one after the other, in time order. The agents of the store are those of the first snapshot;
+    an agent missing from a later snapshot is NaN at that time step.
+
+    Parameters
+    ----------
+    folder_path : Path
+        Path to the folder containing the snapshot files.
+    store_path : Path
+        The path of the store file.
+    chunk_size : int, optional
+        The number of time steps buffered before writing to disk, by default `TRAJECTORY_STORE_CHUNK_SIZE`.
+
+    Raises
+    ------
+    ValueError
+        If the folder has no snapshot file, or if a snapshot has agents that are not in the first one.
+    """
+    times, file_paths = xml_to_chaos.get_snapshot_files_from_XML(folder_path)
+    if len(file_paths) == 0:
+        raise ValueError(f"No snapshot file found in {folder_path}.")
+
+    first_snapshot = dict_to_xml.dynamic_xml_to_arrays(file_paths[0])
+    agent_ids = first_snapshot["agent_id"]
+    agent_index = {agent_id: agent_idx for agent_idx, agent_id in enumerate(agent_ids.tolist())}
+
+    with TrajectoryStoreWriter(store_path, agent_ids, chunk_size=chunk_size) as writer:
+        for time_loc, file_path in zip(times.tolist(), file_paths, strict=True):
+            snapshot = first_snapshot if file_path == file_paths[0] else dict_to_xml.dynamic_xml_to_arrays(file_path)
+            try:
+                agent_indices = [agent_index[agent_id] for agent_id in snapshot["agent_id"].tolist()]
+            except KeyError as e:
+                raise ValueError(f"Agent {e.args[0]} of {file_path.name} is not in the first snapshot.") from e
+
+            columns = {
+                "position": np.full((len(agent_ids), 2), np.nan),
+                "velocity": np.full((len(agent_ids), 2), np.nan),
+                "theta": np.full(len(agent_ids), np.nan),
+                "omega": np.full(len(agent_ids), np.nan),
+            }
+            for key, values in columns.items():
+                values[agent_indices] = snapshot[key]
+            writer.append(time_loc, **columns)
+
+
+def export_trajectory_store_to_CSV(store_path: Path, PathCSV: Path) -> None:
+    """
+    Export a trajectory store to the CSV file of all trajectories, with header: t,ID,x,y,vx,vy.
+
+    Parameters
+    ----------
+    store_path : Path
+        The path of the store file.
+    PathCSV : Path
+        Path to the folder containing the CSV files.
+    """
+    PathCSV.mkdir(parents=True, exist_ok=True)
+    with TrajectoryStoreReader(store_path) as reader:
+        trajectories = reader.query()
+    data = np.concatenate((trajectories["position"], trajectories["velocity"]), axis=2)
+    xml_to_chaos.write_trajectories_to_CSV(PathCSV, trajectories["time"], trajectories["agent_id"], data)
+
+
+def export_trajectory_store_to_CHAOS(store_path: Path, PathCSV: Path, dt: float, max_workers: int | None = None) -> None:
+    """
+    Export a trajectory store to the CSV file of all trajectories and to the files required by the ChAOS software.
+
+    Parameters
+    ----------
+    store_path : Path
+        The path of the store file.
+    PathCSV : Path
+        Path to the folder containing the CSV files. The ChAOS files are written in its 'ForCHAOS' subfolder.
+    dt : float
+        Timestep to use for interpolation in the CHAOS output.
+    max_workers : int | None, optional
+        Number of processes writing the ChAOS files, see `export_from_CSV_to_CHAOS`.
+    """
+    export_trajectory_store_to_CSV(store_path, PathCSV)
+    xml_to_chaos.export_from_CSV_to_CHAOS(PathCSV, dt, max_workers=max_workers)
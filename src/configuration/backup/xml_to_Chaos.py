@@ -25,15 +25,21 @@
 # The fact that you are presently reading this means that you have had knowledge of the CeCILL license and that
 # you accept its terms.
 
+import os
 import re
 import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Any
 
 import numpy as np
 import pandas as pd
+from numpy.typing import NDArray
 
 regex_nb = r"[+-]?(?:\d+\.\d*|\.\d+|\d+)(?:[eE][+-]?\d+)?"
 trajectories_csv_filename = "all_trajectories.csv"
+snapshot_filename_pattern = re.compile(r"AgentDyn.*output t=(" + regex_nb + r").xml")
+pair_pattern = re.compile(rf"({regex_nb}),({regex_nb})")
 
 
 def get_list_of_agents_and_times_from_XML(
@@ -86,6 +92,142 @@ def get_list_of_agents_and_times_from_XML(
     return sorted(ID_agents), sorted(times), filenames
 
 
+def get_snapshot_files_from_XML(folder_path: Path) -> tuple[NDArray[np.float64], list[Path]]:
+    """
+    List the snapshot files of a folder, sorted by time, without parsing them.
+
+    Parameters
+    ----------
+    folder_path : Path
+        Path to the folder containing XML files.
+
+    Returns
+    -------
+    NDArray[np.float64]
+        Sorted array of the times extracted from the filenames.
+    list[Path]
+        Paths to the snapshot files, in the same order as the times.
+
+    Notes
+    -----
+    Assumes XML files are named with the pattern 'AgentDyn...output t=<time>.xml'.
+    """
+    snapshots: list[tuple[float, Path]] = []
+    for fichier in folder_path.iterdir():
+        m = snapshot_filename_pattern.fullmatch(fichier.name)
+        if m and fichier.is_file():
+            snapshots.append((float(m.group(1)), fichier))
+    snapshots.sort()
+
+    times = np.array([time_loc for time_loc, _ in snapshots], dtype=np.float64)
+    return times, [fichier for _, fichier in snapshots]
+
+
+def parse_snapshot_XML(file_path: Path) -> tuple[list[str], NDArray[np.float64]]:
+    """
+    Parse the positions and velocities of the agents in a snapshot file, in a single streaming pass.
+
+    Parameters
+    ----------
+    file_path : Path
+        Path to the snapshot file.
+
+    Returns
+    -------
+    list[str]
+        IDs of the agents found in the file.
+    NDArray[np.float64]
+        Array of shape (number of agents, 4) with the columns x, y, vx and vy of each agent.
+        The row is NaN when the kinematics of the agent are missing or cannot be parsed.
+    """
+    ID_agents: list[str] = []
+    rows: list[tuple[float, float, float, float]] = []
+    nan_row = (np.nan, np.nan, np.nan, np.nan)
+
+    posvel = nan_row
+    for _, element in ET.iterparse(file_path, events=("end",)):
+        if element.tag == "Kinematics":
+            pos_match = pair_pattern.fullmatch(element.get("Position", ""))
+            vel_match = pair_pattern.fullmatch(element.get("Velocity", ""))
+            if pos_match and vel_match:
+                posvel = (
+                    float(pos_match.group(1)),
+                    float(pos_match.group(2)),
+                    float(vel_match.group(1)),
+                    float(vel_match.group(2)),
+                )
+        elif element.tag == "Agent":
+            ID_agent = element.get("Id")
+            if ID_agent is not None:
+                ID_agents.append(ID_agent)
+                rows.append(posvel)
+            posvel = nan_row
+            # Free the agent once read, so that the memory does not grow with the size of the file
+            element.clear()
+
+    return ID_agents, np.array(rows, dtype=np.float64).reshape(-1, 4)
+
+
+def load_agent_trajectories(
+    folder_path: Path,
+    max_workers: int | None = None,
+) -> tuple[NDArray[np.float64], NDArray[np.str_], NDArray[np.float64]]:
+    """
+    Load the trajectories of all agents from the snapshot files of a folder into dense arrays.
+
+    Each snapshot file is parsed once, in a pool of processes, and the results are gathered into a single array
+    indexed by time and agent.
+
+    Parameters
+    ----------
+    folder_path : Path
+        Path to the folder containing XML files.
+    max_workers : int | None, optional
+        Number of processes parsing the files. With 1, the files are parsed sequentially in the current process.
+        By default, the number of processors of the machine is used.
+
+    Returns
+    -------
+    NDArray[np.float64]
+        Sorted array of shape (T,) of the times extracted from the filenames.
+    NDArray[np.str_]
+        Sorted array of shape (N,) of the unique agent IDs found in the files.
+    NDArray[np.float64]
+        Array of shape (T, N, 4) such that data[i, j] = [x, y, vx, vy] of agent `agent_ids[j]` at time `times[i]`.
+        Missing values are NaN.
+
+    Raises
+    ------
+    ValueError
+        If `max_workers` is not a positive integer.
+
+    Notes
+    -----
+    Assumes XML files are named with the pattern 'AgentDyn...output t=<time>.xml'.
+    """
+    if max_workers is not None and (not isinstance(max_workers, int) or max_workers < 1):
+        raise ValueError("`max_workers` should be a positive integer.")
+
+    times, file_paths = get_snapshot_files_from_XML(folder_path)
+
+    snapshots: list[tuple[list[str], NDArray[np.float64]]]
+    if max_workers == 1 or len(file_paths) <= 1:
+        snapshots = [parse_snapshot_XML(file_path) for file_path in file_paths]
+    else:
+        nb_workers = min(max_workers or os.cpu_count() or 1, len(file_paths))
+        with ProcessPoolExecutor(max_workers=nb_workers) as executor:
+            chunksize = max(1, len(file_paths) // (4 * nb_workers))
+            snapshots = list(executor.map(parse_snapshot_XML, file_paths, chunksize=chunksize))
+
+    agent_ids = np.array(sorted({ID_agent for ID_agents, _ in snapshots for ID_agent in ID_agents}), dtype=np.str_)
+    data = np.full((len(times), len(agent_ids), 4), np.nan, dtype=np.float64)
+    for time_idx, (ID_agents, rows) in enumerate(snapshots):
+        if ID_agents:
+            data[time_idx, np.searchsorted(agent_ids, ID_agents)] = rows
+
+    return times, agent_ids, data
+
+
 def create_dict_of_agent_trajectories(
     folder_path: Path,
 ) -> tuple[list[float], dict[str, dict[float, dict[str, float]]]]:
@@ -114,48 +256,60 @@ def create_dict_of_agent_trajectories(
 
     Notes
     -----
-    Assumes XML files are named and structured as expected by `get_list_of_agents_and_times_from_XML`.
+    The files are parsed once by `load_agent_trajectories`, which should be preferred for large outputs.
     """
-    ID_agents, times, filenames = get_list_of_agents_and_times_from_XML(folder_path)
-
-    agents: dict[str, dict[float, dict[str, float]]] = {ID: {} for ID in ID_agents}
-
-    for time_loc in times:
-        file_path = filenames[int(1000 * time_loc)]
-        agents_tree = ET.parse(file_path).getroot()
-
-        for agent in agents_tree:
-            ID_agent = agent.get("Id")
-            if ID_agent is None:
-                continue
-
-            kinematics = next(agent.iterfind("Kinematics"), None)
-            if kinematics is None:
-                continue
-
-            pos = kinematics.get("Position")
-            vel = kinematics.get("Velocity")
-            if pos is None or vel is None:
-                continue
+    folder_path.mkdir(parents=True, exist_ok=True)
+    times, agent_ids, data = load_agent_trajectories(folder_path)
 
-            pos_match = re.fullmatch(rf"({regex_nb}),({regex_nb})", pos)
-            vel_match = re.fullmatch(rf"({regex_nb}),({regex_nb})", vel)
-            if not pos_match or not vel_match:
-                continue
+    agents: dict[str, dict[float, dict[str, float]]] = {}
+    for agent_idx, ID_agent in enumerate(agent_ids.tolist()):
+        agents[ID_agent] = {}
+        for time_idx in np.flatnonzero(~np.isnan(data[:, agent_idx, 0])):
+            x, y, vx, vy = data[time_idx, agent_idx].tolist()
+            agents[ID_agent][float(times[time_idx])] = {"x": x, "y": y, "vx": vx, "vy": vy}
 
-            agents[ID_agent][time_loc] = {
-                "x": float(pos_match.group(1)),
-                "y": float(pos_match.group(2)),
-                "vx": float(vel_match.group(1)),
-                "vy": float(vel_match.group(2)),
-            }
+    return times.tolist(), agents
 
-        del agents_tree
 
-    return times, agents
+def write_trajectories_to_CSV(
+    PathCSV: Path,
+    times: NDArray[np.float64],
+    agent_ids: NDArray[Any],
+    data: NDArray[np.float64],
+) -> None:
+    """
+    Write dense agent trajectories to a CSV file with header: t,ID,x,y,vx,vy.
 
+    Parameters
+    ----------
+    PathCSV : Path
+        Path to the folder containing the CSV files.
+    times : NDArray[np.float64]
+        Sorted array of shape (T,) of the time points.
+    agent_ids : NDArray[Any]
+        Array of shape (N,) of the agent IDs, in the order in which they are written at each time point.
+    data : NDArray[np.float64]
+        Array of shape (T, N, 4) of the x, y, vx and vy of each agent at each time point, NaN when missing.
+    """
+    ID_agents = [str(ID_agent) for ID_agent in agent_ids.tolist()]
+    row_format = "\n%.4f,%s,%.6f,%.6f,%.6f,%.6f"
+    csv_path = PathCSV / trajectories_csv_filename
 
-def export_dict_to_CSV(PathCSV: Path, PathXML: Path) -> None:
+    with open(csv_path, "w", encoding="utf-8") as monfichier:
+        monfichier.write("t,ID,x,y,vx,vy")
+        # Write one block of rows per time point
+        for time_idx, time_loc in enumerate(times.tolist()):
+            posvel = data[time_idx]
+            agent_indices = np.flatnonzero(~np.isnan(posvel[:, 0]))
+            rows = zip(
+                [ID_agents[agent_idx] for agent_idx in agent_indices],
+                *posvel[agent_indices].T.tolist(),
+                strict=True,
+            )
+            monfichier.write("".join([row_format % (time_loc, *row) for row in rows]))
+
+
+def export_dict_to_CSV(PathCSV: Path, PathXML: Path, max_workers: int | None = None) -> None:
     """
     Export agent trajectories to a CSV file with header: t,ID,x,y,vx,vy.
 
@@ -164,30 +318,66 @@ def export_dict_to_CSV(PathCSV: Path, PathXML: Path) -> None:
     Parameters
     ----------
     PathCSV : Path
-        Path to the folder containing the XML files.
-    PathXML : Path
         Path to the folder containing the CSV files.
+    PathXML : Path
+        Path to the folder containing the XML files.
+    max_workers : int | None, optional
+        Number of processes parsing the XML files, see `load_agent_trajectories`.
     """
-    times, agents = create_dict_of_agent_trajectories(PathXML)
-    ID_agents = sorted(agents.keys())
-    csv_path = PathCSV / trajectories_csv_filename
+    times, agent_ids, data = load_agent_trajectories(PathXML, max_workers=max_workers)
+    write_trajectories_to_CSV(PathCSV, times, agent_ids, data)
 
-    with open(csv_path, "w", encoding="utf-8") as monfichier:
-        monfichier.write("t,ID,x,y,vx,vy")
-        for time_loc in times:
-            for ID_agent in ID_agents:
-                posvel = agents[ID_agent].get(time_loc)
-                if posvel is not None:
-                    monfichier.write(
-                        f"\n{time_loc:.4f},{ID_agent},{posvel['x']:.6f},{posvel['y']:.6f},{posvel['vx']:.6f},{posvel['vy']:.6f}"
-                    )
 
+def write_CHAOS_file(
+    out_path: Path,
+    t_vec: NDArray[np.float64],
+    times: NDArray[np.float64],
+    xs: NDArray[np.float64],
+    ys: NDArray[np.float64],
+) -> None:
+    """
+    Write the trajectory of an agent, linearly interpolated at regular time steps, in the format required by ChAOS.
+
+    Parameters
+    ----------
+    out_path : Path
+        Path to the output file.
+    t_vec : NDArray[np.float64]
+        Times at which the trajectory is interpolated.
+    times : NDArray[np.float64]
+        Sorted times of the trajectory.
+    xs : NDArray[np.float64]
+        x coordinates of the agent at `times`.
+    ys : NDArray[np.float64]
+        y coordinates of the agent at `times`.
+
+    Notes
+    -----
+    Times outside the range [times[0], times[-1]) of the trajectory are skipped.
+    Each line in the output file contains: t, x, y, 0.0
+    """
+    # Find the indices before and after each time, skipping the times outside the trajectory time range
+    idx_after = np.searchsorted(times, t_vec, side="right")
+    inside = (idx_after > 0) & (idx_after < len(times))
+    t_loc = t_vec[inside]
+    idx_after = idx_after[inside]
+    idx_before = idx_after - 1
 
-def export_from_CSV_to_CHAOS(PathCSV: Path, dt: float) -> None:
+    # Linear interpolation
+    coef = (t_loc - times[idx_before]) / (times[idx_after] - times[idx_before])
+    x_interp = (1.0 - coef) * xs[idx_before] + coef * xs[idx_after]
+    y_interp = (1.0 - coef) * ys[idx_before] + coef * ys[idx_after]
+
+    trajectory = np.column_stack((t_loc, x_interp, y_interp))
+    np.savetxt(out_path, trajectory, fmt="%.3f,%.3f,%.3f,0.0", encoding="utf-8")
+
+
+def export_from_CSV_to_CHAOS(PathCSV: Path, dt: float, max_workers: int | None = None) -> None:
     """
     Read agent trajectories from a CSV file and exports them into multiple text files in the format required by the ChAOS software.
 
     For each unique agent ID, creates a file containing interpolated positions at regular time steps.
+    The files are written in a pool of processes.
 
     Parameters
     ----------
@@ -195,53 +385,47 @@ def export_from_CSV_to_CHAOS(PathCSV: Path, dt: float) -> None:
         Path to the folder containing the CSV file containing columns: t, ID, x, y, vx, vy.
     dt : float
         Timestep to use for interpolation in the CHAOS output.
+    max_workers : int | None, optional
+        Number of processes writing the files. With 1, the files are written sequentially in the current process.
+        By default, the number of processors of the machine is used.
+
+    Raises
+    ------
+    ValueError
+        If `max_workers` is not a positive integer.
 
     Notes
     -----
     Each output file is named 'trajXXX.csv' where XXX is the zero-padded agent index.
     Each line in the output file contains: t, x, y, 0.0
     """
+    if max_workers is not None and (not isinstance(max_workers, int) or max_workers < 1):
+        raise ValueError("`max_workers` should be a positive integer.")
+
     PathCSV.mkdir(parents=True, exist_ok=True)
     PathCHAOS = PathCSV / "ForCHAOS"
     PathCHAOS.mkdir(parents=True, exist_ok=True)
 
     path_to_CSV_main_file = PathCSV / trajectories_csv_filename
-    lignes = pd.read_csv(path_to_CSV_main_file, sep=",", header=0, index_col=False)
+    lignes = pd.read_csv(path_to_CSV_main_file, sep=",", header=0, index_col=False, usecols=["t", "ID", "x", "y"])
     lignes["t"] = lignes["t"].astype(float)
     lignes.sort_values(by=["ID", "t"], inplace=True)
 
-    t_min = lignes["t"].min()
-    t_max = lignes["t"].max()
-    t_vec = np.arange(t_min, t_max, dt)
-
-    for cpt_agent, ID in enumerate(sorted(lignes["ID"].unique())):
-        lignes_loc = lignes[lignes["ID"] == ID].reset_index(drop=True)
-        times = lignes_loc["t"].values
-        xs = lignes_loc["x"].values
-        ys = lignes_loc["y"].values
-
-        out_path = PathCHAOS / f"traj{cpt_agent:03d}.csv"
-        with open(out_path, "w", encoding="utf-8") as monfichier:
-            for t in t_vec:
-                # Find indices before and after t
-                idx_after = np.searchsorted(times, t, side="right")
-                if idx_after == 0 or idx_after == len(times):
-                    # If t is outside the trajectory time range, skip
-                    continue
-                idx_before = idx_after - 1
-
-                t_before = times[idx_before]
-                t_after = times[idx_after]
-                x_before = xs[idx_before]
-                x_after = xs[idx_after]
-                y_before = ys[idx_before]
-                y_after = ys[idx_after]
-
-                # Linear interpolation
-                coef = (t - t_before) / (t_after - t_before)
-                x_interp = (1.0 - coef) * x_before + coef * x_after
-                y_interp = (1.0 - coef) * y_before + coef * y_after
-
-                monfichier.write(f"{t:.3f},{x_interp:.3f},{y_interp:.3f},0.0\n")
+    t_vec = np.arange(lignes["t"].min(), lignes["t"].max(), dt)
+
+    # Split the trajectories of all agents at once, the groups being sorted by ID
+    trajectories = [
+        (PathCHAOS / f"traj{cpt_agent:03d}.csv", t_vec, group["t"].to_numpy(), group["x"].to_numpy(), group["y"].to_numpy())
+        for cpt_agent, (_, group) in enumerate(lignes.groupby("ID", sort=True))
+    ]
+
+    if max_workers == 1 or len(trajectories) <= 1:
+        for trajectory in trajectories:
+            write_CHAOS_file(*trajectory)
+    else:
+        nb_workers = min(max_workers or os.cpu_count() or 1, len(trajectories))
+        with ProcessPoolExecutor(max_workers=nb_workers) as executor:
+            chunksize = max(1, len(trajectories) // (4 * nb_workers))
+            list(executor.map(write_CHAOS_file, *zip(*trajectories, strict=True), chunksize=chunksize))
 
     print("\n* Trajectories have been converted to Chaos-compatible files")
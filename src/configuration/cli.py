@@ -0,0 +1,339 @@
+"""Command-line interface generating many crowds in parallel from a JSON or TOML job specification."""
+
+# Copyright  2025  Institute of Light and Matter, CNRS UMR 5306, University Claude Bernard Lyon 1
+# Contributors: Oscar DUFOUR, Maxime STAPELLE, Alexandre NICOLAS
+
+# This software is a computer program designed to generate a realistic crowd from anthropometric data and
+# simulate the mechanical interactions that occur within it and with obstacles.
+
+# This software is governed by the CeCILL  license under French law and abiding by the rules of distribution
+# of free software.  You can  use, modify and/ or redistribute the software under the terms of the CeCILL
+# license as circulated by CEA, CNRS and INRIA at the following URL "http://www.cecill.info".
+
+# As a counterpart to the access to the source code and  rights to copy, modify and redistribute granted by
+# the license, users are provided only with a limited warranty  and the software's author,  the holder of the
+# economic rights,  and the successive licensors  have only  limited liability.
+
+# In this respect, the user's attention is drawn to the risks associated with loading,  using,  modifying
+# and/or developing or reproducing the software by the user in light of its specific status of free software,
+# that may mean  that it is complicated to manipulate,  and  that  also therefore means  that it is reserved
+# for developers  and  experienced professionals having in-depth computer knowledge. Users are therefore
+# encouraged to load and test the software's suitability as regards their requirements in conditions enabling
+# the security of their systems and/or data to be ensured and,  more generally, to use and operate it in the
+# same conditions as regards security.
+
+# The fact that you are presently reading this means that you have had knowledge of the CeCILL license and that
+# you accept its terms.
+
+import argparse
+import json
+import logging
+import os
+import time
+import tomllib
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from shapely.geometry import Polygon
+
+import configuration.utils.constants as cst
+from configuration.backup.crowd_to_npz_and_reverse import save_crowd_data_to_npz
+from configuration.backup.crowd_to_zip_and_reverse import save_crowd_data_to_zip
+from configuration.models.crowd import Crowd
+from configuration.models.measures import CrowdMeasures
+
+
+@dataclass
+class GenerationJob:
+    """
+    Specification of a crowd to generate, pack and save.
+
+    Attributes
+    ----------
+    name : str
+        The name of the job, used as the stem of its output files.
+    output_dir : Path
+        The directory where the output files are written.
+    boundaries : list[list[float]]
+        The corners (cm) of the polygon bounding the room. If empty, the crowd has no boundaries.
+    number_agents : int | None
+        The number of agents of the crowd. Exactly one of `number_agents` and `density` must be given.
+    density : float | None
+        The number of agents per square meter of the room.
+    statistics : dict[str, float] | None
+        Statistics of the crowd overriding the ones of `CrowdStat`. If None, the pedestrians are drawn from the
+        ANSUR II database.
+    male_proportion : float | None
+        The proportion of male pedestrians drawn from the ANSUR II database.
+    height_range : list[float] | None
+        The range of the heights (cm) of the pedestrians drawn from the ANSUR II database.
+    packing : str
+        The packing strategy: "forces" (`Crowd.pack_agents_with_forces`), "grid" (`Crowd.pack_agents_on_grid`) or
+        "none".
+    packing_parameters : dict[str, Any]
+        The keyword arguments of the packing method.
+    seed : int | None
+        The seed of the global NumPy random generator. If None, the generator is not seeded.
+    formats : list[str]
+        The output formats: "zip" (XML files in a ZIP archive) and/or "npz" (binary archive of columnar arrays).
+    """
+
+    name: str
+    output_dir: Path
+    boundaries: list[list[float]] = field(default_factory=list)
+    number_agents: int | None = None
+    density: float | None = None
+    statistics: dict[str, float] | None = None
+    male_proportion: float | None = None
+    height_range: list[float] | None = None
+    packing: str = "forces"
+    packing_parameters: dict[str, Any] = field(default_factory=dict)
+    seed: int | None = None
+    formats: list[str] = field(default_factory=lambda: ["zip"])
+
+    def __post_init__(self) -> None:
+        """
+        Validate the job after the dataclass initialization.
+
+        Raises
+        ------
+        ValueError
+            If not exactly one of `number_agents` and `density` is given, if a density is given without boundaries,
+            or if the packing strategy or an output format is unknown.
+        """
+        self.output_dir = Path(self.output_dir)
+        if (self.number_agents is None) == (self.density is None):
+            raise ValueError(f"Job '{self.name}': exactly one of `number_agents` and `density` should be given.")
+        if self.number_agents is not None and (not isinstance(self.number_agents, int) or self.number_agents < 0):
+            raise ValueError(f"Job '{self.name}': `number_agents` should be a non-negative integer.")
+        if self.density is not None and (self.density < 0 or not self.boundaries):
+            raise ValueError(f"Job '{self.name}': `density` should be non-negative and given with boundaries.")
+        if self.packing not in cst.GENERATION_PACKING_STRATEGIES:
+            raise ValueError(
+                f"Job '{self.name}': unknown packing '{self.packing}'. Expected one of {cst.GENERATION_PACKING_STRATEGIES}."
+            )
+        unknown_formats = set(self.formats) - set(cst.GENERATION_OUTPUT_FORMATS)
+        if not self.formats or unknown_formats:
+            raise ValueError(f"Job '{self.name}': the formats should be some of {cst.GENERATION_OUTPUT_FORMATS}.")
+
+    def get_boundaries(self) -> Polygon:
+        """
+        Get the polygon bounding the room.
+
+        Returns
+        -------
+        Polygon
+            The boundaries of the room, empty if no corner is given.
+        """
+        return Polygon(self.boundaries) if self.boundaries else Polygon()
+
+    def get_number_agents(self) -> int:
+        """
+        Get the number of agents of the crowd, from the density if needed.
+
+        Returns
+        -------
+        int
+            The number of agents of the crowd.
+        """
+        if self.number_agents is not None:
+            return self.number_agents
+        return int(round(float(self.density or 0.0) * self.get_boundaries().area * cst.CM_TO_M**2))
+
+
+def load_generation_jobs(spec_path: Path, output_dir: Path | None = None) -> list[GenerationJob]:
+    """
+    Load the jobs of a JSON or TOML job specification.
+
+    The specification has a list of `jobs`, each one with the fields of `GenerationJob`, and optional `defaults`
+    shared by all the jobs. A job with `repetitions` > 1 is expanded into as many jobs, named `<name>_<index>`, whose
+    seeds (if any) are incremented from the seed of the job.
+
+    Parameters
+    ----------
+    spec_path : Path
+        The path of the specification, with a .json or .toml extension.
+    output_dir : Path | None
+        The directory of the outputs, overriding the one of the specification. By default, the one of the
+        specification, or the directory of the specification.
+
+    Returns
+    -------
+    list[GenerationJob]
+        The jobs to run.
+
+    Raises
+    ------
+    TypeError
+        If `spec_path` is not a Path object.
+    ValueError
+        If the extension is not supported, if a field is unknown, or if the job names are not unique.
+    """
+    if not isinstance(spec_path, Path):
+        raise TypeError("`spec_path` should be a Path object.")
+    if spec_path.suffix == ".json":
+        with open(spec_path, encoding="utf-8") as spec_file:
+            spec = json.load(spec_file)
+    elif spec_path.suffix == ".toml":
+        with open(spec_path, "rb") as spec_file:
+            spec = tomllib.load(spec_file)
+    else:
+        raise ValueError("`spec_path` should have a .json or .toml extension.")
+
+    defaults = {"output_dir": spec_path.parent, **spec.get("defaults", {})}
+    if output_dir is not None:
+        defaults["output_dir"] = output_dir
+    known_fields = {job_field.name for job_field in fields(GenerationJob)} | {"repetitions"}
+    jobs = []
+    for job_index, job_spec in enumerate(spec.get("jobs", [])):
+        job_spec = {"name": f"job{job_index}", **defaults, **job_spec}
+        unknown_fields = job_spec.keys() - known_fields
+        if unknown_fields:
+            raise ValueError(f"Unknown fields in job '{job_spec['name']}': {', '.join(sorted(unknown_fields))}")
+        repetitions = job_spec.pop("repetitions", 1)
+        if repetitions == 1:
+            jobs.append(GenerationJob(**job_spec))
+            continue
+        for repetition in range(repetitions):
+            repeated_spec = {**job_spec, "name": f"{job_spec['name']}_{repetition:0{len(str(repetitions - 1))}d}"}
+            if job_spec.get("seed") is not None:
+                repeated_spec["seed"] = job_spec["seed"] + repetition
+            jobs.append(GenerationJob(**repeated_spec))
+
+    names = [job.name for job in jobs]
+    if len(set(names)) != len(names):
+        raise ValueError("The names of the jobs should be unique.")
+    return jobs
+
+
+def run_generation_job(job: GenerationJob) -> dict[str, Any]:
+    """
+    Create, pack and save the crowd of a job.
+
+    Parameters
+    ----------
+    job : GenerationJob
+        The job to run.
+
+    Returns
+    -------
+    dict[str, Any]
+        The report of the job: its name, its number of agents, its output files, the time (in seconds) spent
+        creating, packing and saving the crowd, and the error message if it failed. A job failing at any step,
+        including the computation of its number of agents, is reported instead of raising.
+    """
+    report: dict[str, Any] = {"name": job.name, "number_agents": None, "outputs": [], "error": None}
+    start_time = time.perf_counter()
+    try:
+        report["number_agents"] = job.get_number_agents()
+        if job.seed is not None:
+            np.random.seed(job.seed)
+        measures = CrowdMeasures() if job.statistics is None else CrowdMeasures(agent_statistics={**cst.CrowdStat, **job.statistics})
+        crowd = Crowd(measures=measures, boundaries=job.get_boundaries())
+        crowd.create_agents(
+            report["number_agents"],
+            male_proportion=job.male_proportion,
+            height_range=None if job.height_range is None else (job.height_range[0], job.height_range[1]),
+        )
+        report["create_time"] = time.perf_counter() - start_time
+
+        if job.packing == "forces":
+            crowd.pack_agents_with_forces(**job.packing_parameters)
+        elif job.packing == "grid":
+            crowd.pack_agents_on_grid(**job.packing_parameters)
+        report["pack_time"] = time.perf_counter() - start_time - report["create_time"]
+
+        job.output_dir.mkdir(parents=True, exist_ok=True)
+        for output_format in job.formats:
+            output_path = job.output_dir / f"{job.name}.{output_format}"
+            if output_format == "zip":
+                save_crowd_data_to_zip(crowd, output_path)
+            else:
+                save_crowd_data_to_npz(crowd, output_path)
+            report["outputs"].append(str(output_path))
+    except Exception as error:  # pylint: disable=broad-exception-caught
+        report["error"] = f"{type(error).__name__}: {error}"
+    report["total_time"] = time.perf_counter() - start_time
+    return report
+
+
+def run_generation_jobs(jobs: list[GenerationJob], max_workers: int | None = None) -> list[dict[str, Any]]:
+    """
+    Run generation jobs in parallel processes.
+
+    Parameters
+    ----------
+    jobs : list[GenerationJob]
+        The jobs to run.
+    max_workers : int | None
+        The maximal number of processes running the jobs. If None, the number of CPUs is used. If 1, the jobs run
+        sequentially in the current process.
+
+    Returns
+    -------
+    list[dict[str, Any]]
+        The report of each job (see `run_generation_job`), in the order of the jobs.
+
+    Raises
+    ------
+    ValueError
+        If `max_workers` is not a positive integer.
+    """
+    if max_workers is not None and (not isinstance(max_workers, int) or max_workers < 1):
+        raise ValueError("`max_workers` should be a positive integer.")
+    if max_workers == 1 or len(jobs) <= 1:
+        return [run_generation_job(job) for job in jobs]
+    nb_workers = min(max_workers or os.cpu_count() or 1, len(jobs))
+    with ProcessPoolExecutor(max_workers=nb_workers) as executor:
+        return list(executor.map(run_generation_job, jobs))
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Run the `shapes-generate` command.
+
+    Parameters
+    ----------
+    argv : list[str] | None
+        The arguments of the command. If None, the ones of the command line.
+
+    Returns
+    -------
+    int
+        The exit status: 0 if all the jobs succeeded, 1 otherwise.
+    """
+    parser = argparse.ArgumentParser(prog="shapes-generate", description="Generate crowds from a JSON or TOML job specification.")
+    parser.add_argument("spec", type=Path, help="path of the .json or .toml job specification")
+    parser.add_argument("-o", "--output-dir", type=Path, default=None, help="directory of the outputs, overriding the specification")
+    parser.add_argument("-j", "--max-workers", type=int, default=None, help="number of parallel processes (default: number of CPUs)")
+    parser.add_argument("--report", type=Path, default=None, help="path of the JSON timing report (default: <output dir>/report.json)")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    start_time = time.perf_counter()
+    jobs = load_generation_jobs(args.spec, args.output_dir)
+    reports = run_generation_jobs(jobs, args.max_workers)
+    total_time = time.perf_counter() - start_time
+
+    for report in reports:
+        if report["error"] is None:
+            logging.info(f"{report['name']}: {report['number_agents']} agents in {report['total_time']:.2f} s")
+        else:
+            logging.error(f"{report['name']}: failed with {report['error']}")
+    number_failed = sum(report["error"] is not None for report in reports)
+    logging.info(f"{len(reports) - number_failed}/{len(reports)} jobs succeeded in {total_time:.2f} s")
+
+    report_path = args.report
+    if report_path is None:
+        report_path = (args.output_dir or (jobs[0].output_dir if jobs else args.spec.parent)) / "report.json"
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(report_path, "w", encoding="utf-8") as report_file:
+        json.dump({"total_time": total_time, "jobs": reports}, report_file, indent=2)
+    return 1 if number_failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -25,12 +25,20 @@
 # The fact that you are presently reading this means that you have had knowledge of the CeCILL license and that
 # you accept its terms.
 
+import hashlib
+import json
 import logging
+import os
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
-from typing import get_args
+from typing import Any, get_args
 
 import numpy as np
 import pandas as pd
+from numpy.typing import NDArray
 from shapely.geometry import MultiPolygon
 
 import configuration.utils.constants as cst
@@ -99,12 +107,54 @@ def read_anthropometric_data(sex: Sex, data_dir_path: Path) -> pd.DataFrame:
     return df
 
 
+def get_anthropometric_columns(df: pd.DataFrame) -> dict[str, NDArray[Any]]:
+    """
+    Extract the typed columns used by the models from the anthropometric data.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The anthropometric data, as prepared by `prepare_anthropometric_data`.
+
+    Returns
+    -------
+    dict[str, NDArray[Any]]
+        The "sex" column as uint8 codes (the values of `Sex`), and the float64 columns of `ANSUR_DATA_COLUMNS`
+        indexed by measure name.
+    """
+    columns: dict[str, NDArray[Any]] = {"sex": np.array([cst.Sex[sex].value for sex in df["sex"]], dtype=np.uint8)}
+    for name, column in cst.ANSUR_DATA_COLUMNS.items():
+        columns[name] = df[column].to_numpy(dtype=np.float64)
+    return columns
+
+
+def get_bike_columns(df: pd.DataFrame) -> dict[str, NDArray[Any]]:
+    """
+    Extract the typed geometry columns from the bike data.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The bike data, as read by `prepare_bike_data`.
+
+    Returns
+    -------
+    dict[str, NDArray[Any]]
+        The float64 columns of `BIKE_DATA_COLUMNS` in cm, indexed by name. Missing values are NaN.
+    """
+    return {
+        name: pd.to_numeric(df[column], errors="coerce").to_numpy(dtype=np.float64) * cst.MM_TO_CM
+        for name, column in cst.BIKE_DATA_COLUMNS.items()
+    }
+
+
 def prepare_anthropometric_data(data_dir_path: Path) -> None:
     """
     Prepare and save anthropometric data as a pickle file.
 
     This function reads anthropometric data for both males and females, combines them into a single DataFrame,
-    and saves the result as a pickle file for efficient future access.
+    and saves the result as a pickle file for efficient future access. The columns used by the models are also
+    saved as typed arrays in npy/ANSUREIIPublic, see `get_anthropometric_columns`.
 
     Parameters
     ----------
@@ -117,12 +167,15 @@ def prepare_anthropometric_data(data_dir_path: Path) -> None:
     df_female = read_anthropometric_data("female", data_dir_path)
     df = pd.concat([df_male, df_female], ignore_index=True)
     fun.save_pickle(df, dir_path / "ANSUREIIPublic.pkl")
+    fun.save_columns(get_anthropometric_columns(df), data_dir_path / "npy" / "ANSUREIIPublic")
 
 
 def prepare_bike_data(data_dir_path: Path) -> None:
     """
     Prepare bike data by reading a CSV file, processing it, and saving as a pickle file.
 
+    The geometry columns are also saved as typed arrays in npy/bike_data, see `get_bike_columns`.
+
     Parameters
     ----------
     data_dir_path : Path
@@ -130,31 +183,253 @@ def prepare_bike_data(data_dir_path: Path) -> None:
     """
     df = pd.read_csv(data_dir_path / "csv" / "geometrics.mtb-news.de.csv", sep=";")
     fun.save_pickle(df, data_dir_path / "pkl" / "bike_data.pkl")
+    fun.save_columns(get_bike_columns(df), data_dir_path / "npy" / "bike_data")
 
 
-def prepare_data() -> None:
+@dataclass
+class PreparationStep:
     """
-    Prepare the data for the application by processing anthropometric and bike data.
+    Derived artefacts of the data directory, with the inputs and parameters they are prepared from.
 
-    This function checks for the existence of preprocessed data files and, if not found,
-    initiates the data preparation process. It performs the following steps:
-    1. Prepares anthropometric data by calling `prepare_anthropometric_data()`.
-    2. Prepares bike data by calling `prepare_bike_data()`.
-    3. Prepares 3D body data by calling `prepare_3D_body_data()`.
+    Paths are relative to the data directory. An output can be a directory, standing for all the files in it.
     """
-    data_dir_path = Path(__file__).parent.parent.parent.parent.absolute() / "data"
-    if (
-        not (data_dir_path / "pkl" / "bike_data.pkl").exists()
-        or not (data_dir_path / "pkl" / "ANSUREIIPublic.pkl").exists()
-        or not (data_dir_path / "pkl" / "male_3dBody_light.pkl").exists()
-        or not (data_dir_path / "pkl" / "female_3dBody_light.pkl").exists()
-    ):
-        logging.info("Preparing anthropometric data and bike data...")
-        prepare_anthropometric_data(data_dir_path)
-        prepare_bike_data(data_dir_path)
-        logging.info("Preparing 3D body data...")
-        prepare_3D_body_data(data_dir_path)
-        logging.info("Data prepared successfully")
+
+    prepare: Callable[[Path], None]
+    inputs: list[str]
+    outputs: list[str]
+    parameters: dict[str, Any] = field(default_factory=dict)
+    dependencies: list[str] = field(default_factory=list)
+
+
+def get_preparation_steps() -> dict[str, PreparationStep]:
+    """
+    Get the steps of the preparation of the data, by name.
+
+    Returns
+    -------
+    dict[str, PreparationStep]
+        The preparation steps. A step only depends on the steps producing its inputs.
+    """
+    sexes = [sex.name for sex in cst.Sex]
+    return {
+        "anthropometric_data": PreparationStep(
+            prepare=prepare_anthropometric_data,
+            inputs=[f"csv/ANSURII{sex.upper()}Public.csv" for sex in sexes],
+            outputs=["pkl/ANSUREIIPublic.pkl", "npy/ANSUREIIPublic"],
+            parameters={
+                "MM_TO_CM": cst.MM_TO_CM,
+                "INCH_TO_CM": cst.INCH_TO_CM,
+                "LB_TO_KG": cst.LB_TO_KG,
+                "ANSUR_DATA_COLUMNS": cst.ANSUR_DATA_COLUMNS,
+            },
+        ),
+        "bike_data": PreparationStep(
+            prepare=prepare_bike_data,
+            inputs=["csv/geometrics.mtb-news.de.csv"],
+            outputs=["pkl/bike_data.pkl", "npy/bike_data"],
+            parameters={"MM_TO_CM": cst.MM_TO_CM, "BIKE_DATA_COLUMNS": cst.BIKE_DATA_COLUMNS},
+        ),
+        "3D_body_data": PreparationStep(
+            prepare=prepare_3D_body_data,
+            inputs=[f"pkl/{sex}_3dBody.pkl" for sex in sexes],
+            outputs=[f"pkl/{fun.get_3D_body_name(sex)}.pkl" for sex in sexes],
+            parameters={
+                "POLYGON_TOLERANCE": cst.POLYGON_TOLERANCE,
+                "DISTANCE_BTW_TARGET_KEYS_ALTITUDES": cst.DISTANCE_BTW_TARGET_KEYS_ALTITUDES,
+            },
+        ),
+        "3D_body_arrays": PreparationStep(
+            prepare=prepare_3D_body_arrays,
+            inputs=[f"pkl/{fun.get_3D_body_name(sex)}.pkl" for sex in sexes],
+            outputs=[f"npy/{fun.get_3D_body_name(sex, lod)}" for sex in sexes for lod in range(len(cst.BODY3D_LODS))],
+            parameters={"BODY3D_LODS": cst.BODY3D_LODS},
+            dependencies=["3D_body_data"],
+        ),
+    }
+
+
+def compute_file_hashes(data_dir_path: Path, paths: list[str]) -> dict[str, str] | None:
+    """
+    Compute the SHA-256 hashes of files of the data directory.
+
+    Parameters
+    ----------
+    data_dir_path : Path
+        The path to the root data directory.
+    paths : list[str]
+        The paths of the files, relative to the data directory. A directory stands for all the files in it.
+
+    Returns
+    -------
+    dict[str, str] | None
+        The hexadecimal hash of each file, indexed by its path relative to the data directory, or None if one of
+        the paths does not exist or is an empty directory.
+    """
+    file_paths: list[Path] = []
+    for path in paths:
+        full_path = data_dir_path / path
+        if full_path.is_dir():
+            dir_file_paths = sorted(file_path for file_path in full_path.rglob("*") if file_path.is_file())
+            if not dir_file_paths:
+                return None
+            file_paths.extend(dir_file_paths)
+        elif full_path.is_file():
+            file_paths.append(full_path)
+        else:
+            return None
+
+    hashes: dict[str, str] = {}
+    for file_path in file_paths:
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as file:
+            for chunk in iter(partial(file.read, 1 << 20), b""):
+                digest.update(chunk)
+        hashes[file_path.relative_to(data_dir_path).as_posix()] = digest.hexdigest()
+    return hashes
+
+
+def load_manifest(data_dir_path: Path) -> dict[str, dict[str, Any]]:
+    """
+    Load the manifest of the prepared data.
+
+    Parameters
+    ----------
+    data_dir_path : Path
+        The path to the root data directory.
+
+    Returns
+    -------
+    dict[str, dict[str, Any]]
+        For each preparation step, the hashes of its inputs and outputs and its parameters when it was last
+        prepared. Empty if there is no manifest, or if it is unreadable or of another version.
+    """
+    manifest_path = data_dir_path / cst.DATA_MANIFEST_FILE_NAME
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(manifest, dict) or manifest.get("version") != cst.DATA_MANIFEST_VERSION:
+        return {}
+    steps = manifest.get("steps")
+    return steps if isinstance(steps, dict) else {}
+
+
+def save_manifest(data_dir_path: Path, steps: dict[str, dict[str, Any]]) -> None:
+    """
+    Save the manifest of the prepared data, atomically.
+
+    Parameters
+    ----------
+    data_dir_path : Path
+        The path to the root data directory.
+    steps : dict[str, dict[str, Any]]
+        For each preparation step, the hashes of its inputs and outputs and its parameters.
+    """
+    manifest_path = data_dir_path / cst.DATA_MANIFEST_FILE_NAME
+    temporary_path = manifest_path.with_suffix(".tmp")
+    temporary_path.write_text(
+        json.dumps({"version": cst.DATA_MANIFEST_VERSION, "steps": steps}, indent=2, sort_keys=True), encoding="utf-8"
+    )
+    temporary_path.replace(manifest_path)
+
+
+def is_step_up_to_date(step: PreparationStep, record: dict[str, Any] | None, data_dir_path: Path) -> bool:
+    """
+    Check whether the outputs of a preparation step are up to date.
+
+    Parameters
+    ----------
+    step : PreparationStep
+        The preparation step.
+    record : dict[str, Any] | None
+        The record of the step in the manifest, if any.
+    data_dir_path : Path
+        The path to the root data directory.
+
+    Returns
+    -------
+    bool
+        True if the step was recorded with the current hashes of its inputs and outputs and with the current
+        parameters, False otherwise.
+    """
+    if record is None:
+        return False
+    return (
+        record.get("parameters") == json.loads(json.dumps(step.parameters))
+        and record.get("inputs") == compute_file_hashes(data_dir_path, step.inputs)
+        and record.get("outputs") == compute_file_hashes(data_dir_path, step.outputs)
+    )
+
+
+def prepare_data(data_dir_path: Path | None = None, max_workers: int | None = None) -> None:
+    """
+    Prepare the data for the application, incrementally.
+
+    The steps of `get_preparation_steps()` prepare the anthropometric data, the bike data, the light 3D bodies and
+    the arrays of their levels of detail. A manifest records, for each step, the SHA-256 hashes of its inputs and
+    outputs and its parameters. Only the steps whose inputs, parameters or outputs changed since they were
+    recorded are run again; the independent ones run in parallel. A step whose inputs are missing is skipped if
+    its outputs exist (e.g. the light 3D bodies are shipped without the original ones).
+
+    Parameters
+    ----------
+    data_dir_path : Path | None, optional
+        The path to the root data directory. Defaults to the "data" directory of the repository.
+    max_workers : int | None, optional
+        The maximal number of processes running the steps. If None, the number of CPUs is used. If 1, the steps
+        run sequentially in the current process.
+
+    Raises
+    ------
+    ValueError
+        If `max_workers` is not a positive integer.
+    FileNotFoundError
+        If neither the inputs nor the outputs of a step exist.
+    """
+    if max_workers is not None and (not isinstance(max_workers, int) or max_workers < 1):
+        raise ValueError("`max_workers` should be a positive integer.")
+    if data_dir_path is None:
+        data_dir_path = Path(__file__).parent.parent.parent.parent.absolute() / "data"
+
+    steps = get_preparation_steps()
+    records = load_manifest(data_dir_path)
+    done: set[str] = set()
+    while len(done) < len(steps):
+        # Run the steps whose dependencies are done, together
+        ready_names = [name for name, step in steps.items() if name not in done and set(step.dependencies) <= done]
+        stale_names: list[str] = []
+        for name in ready_names:
+            step = steps[name]
+            if is_step_up_to_date(step, records.get(name), data_dir_path):
+                logging.info(f"Data of step {name} are up to date")
+            elif compute_file_hashes(data_dir_path, step.inputs) is None:
+                if compute_file_hashes(data_dir_path, step.outputs) is None:
+                    raise FileNotFoundError(f"Neither the inputs nor the outputs of step {name} exist: {step.inputs}")
+                logging.info(f"Inputs of step {name} are missing, its existing outputs are kept")
+            else:
+                stale_names.append(name)
+
+        if stale_names:
+            logging.info(f"Preparing data of steps {', '.join(stale_names)}...")
+            if max_workers == 1 or len(stale_names) == 1:
+                for name in stale_names:
+                    steps[name].prepare(data_dir_path)
+            else:
+                nb_workers = min(max_workers or os.cpu_count() or 1, len(stale_names))
+                with ProcessPoolExecutor(max_workers=nb_workers) as executor:
+                    for future in [executor.submit(steps[name].prepare, data_dir_path) for name in stale_names]:
+                        future.result()
+
+            for name in stale_names:
+                step = steps[name]
+                records[name] = {
+                    "inputs": compute_file_hashes(data_dir_path, step.inputs),
+                    "parameters": json.loads(json.dumps(step.parameters)),
+                    "outputs": compute_file_hashes(data_dir_path, step.outputs),
+                }
+            save_manifest(data_dir_path, records)
+            logging.info("Data prepared successfully")
+        done.update(ready_names)
 
 
 def prepare_3D_body_data(data_dir_path: Path) -> None:
@@ -163,7 +438,7 @@ def prepare_3D_body_data(data_dir_path: Path) -> None:
 
     For each sex (male/female):
     1. Loads original 3D body shape data from <sex>_3dBody.pkl
-    2. Creates target bins at 3cm intervals (controlled by DISTANCE_BTW_TARGET_KEYS_ALTITUDES)
+    2. Creates target bins at 2cm intervals (controlled by DISTANCE_BTW_TARGET_KEYS_ALTITUDES)
     3. Selects the nearest available height to each bin's boundary values
     4. Simplifies each Polygon that compose each MultiPolygon using Douglas-Peucker algorithm with specified tolerance
     5. Saves optimized data to <sex>_3dBody_light.pkl
@@ -179,30 +454,43 @@ def prepare_3D_body_data(data_dir_path: Path) -> None:
         If either the input directory structure is invalid or source pickle file
         for a sex is missing.
     """
-    # [Rest of function implementation unchanged]
-
     for sex in cst.Sex:
         pickle_path = data_dir_path / "pkl" / f"{sex.name}_3dBody.pkl"
         if not pickle_path.exists():
             raise FileNotFoundError(f"Pickle file not found: {pickle_path}")
 
         shapes3D: dict[float, MultiPolygon] = fun.load_pickle(str(pickle_path))
-        keys = sorted(float(k) for k in shapes3D.keys())
-        if not keys:
+        if not shapes3D:
             continue
 
-        target_keys = np.arange(0.0, keys[-1] + 1, cst.DISTANCE_BTW_TARGET_KEYS_ALTITUDES)
-        filtered_shapes3D: dict[float, MultiPolygon] = {}
-        used_bins = set()
-
-        for key in keys:
-            bin_idx = np.argmin(np.abs(target_keys - key))
-            bin_value = target_keys[bin_idx]
-            if bin_value not in used_bins:
-                filtered_shapes3D[key] = MultiPolygon(
-                    [geom.simplify(tolerance=cst.POLYGON_TOLERANCE, preserve_topology=True) for geom in shapes3D[key].geoms]
-                )
-                used_bins.add(bin_value)
-
+        filtered_shapes3D = fun.compute_3D_body_lod(shapes3D, *cst.BODY3D_LODS[0], keep_highest_slice=False)
         output_path = data_dir_path / "pkl" / f"{sex.name}_3dBody_light.pkl"
         fun.save_pickle(filtered_shapes3D, output_path)
+
+
+def prepare_3D_body_arrays(data_dir_path: Path) -> None:
+    """
+    Save every level of detail of the 3D bodies as memory-mappable arrays, from the <sex>_3dBody_light.pkl files.
+
+    The light body is the finest level; the coarser levels of `BODY3D_LODS` are computed from it. The arrays (see
+    `save_ragged_multipolygons`) of each level are saved in npy/<name> (see `get_3D_body_name`). Loading them does
+    not unpickle any shapely geometry, and their pages are shared between the processes that load them.
+
+    Parameters
+    ----------
+    data_dir_path : Path
+        Path to root directory containing the "pkl" subdirectory with the light pickle files.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the light pickle file for a sex is missing.
+    """
+    for sex in cst.Sex:
+        pickle_path = data_dir_path / "pkl" / f"{sex.name}_3dBody_light.pkl"
+        if not pickle_path.exists():
+            raise FileNotFoundError(f"Pickle file not found: {pickle_path}")
+        shapes3D: dict[float, MultiPolygon] = fun.load_pickle(str(pickle_path))
+        for lod, (slice_spacing, tolerance) in enumerate(cst.BODY3D_LODS):
+            lod_shapes3D = shapes3D if lod == 0 else fun.compute_3D_body_lod(shapes3D, slice_spacing, tolerance)
+            fun.save_ragged_multipolygons(lod_shapes3D, data_dir_path / "npy" / fun.get_3D_body_name(sex.name, lod))
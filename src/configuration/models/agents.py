@@ -26,6 +26,7 @@
 # you accept its terms.
 
 import numpy as np
+import shapely
 import shapely.affinity as affin
 from numpy.typing import NDArray
 from shapely.geometry import MultiPoint, MultiPolygon, Point, Polygon
@@ -49,12 +50,18 @@ class Agent:
     measures : dict[str, float | Sex] | AgentMeasures
         The measures associated with the agent. Can be a dictionary with measure names as keys and float values
         or Sex (Literal["male","female"]), or an AgentMeasures object.
+    lod : int, optional
+        The level of detail of the 3D shapes, an index in `BODY3D_LODS`. Defaults to 0 (the finest).
     """
 
+    #: Whether the 3D shapes of the agent are built on their first access, see `from_trusted`.
+    _shapes3D_pending: bool = False
+
     def __init__(
         self,
         agent_type: cst.AgentTypes,
         measures: dict[str, float | Sex] | AgentMeasures,
+        lod: int = 0,
     ) -> None:
         """
         Initialize an Agent instance.
@@ -65,6 +72,8 @@ class Agent:
             The type of the agent.
         measures : dict[str, float | Sex] | AgentMeasures
             The measures associated with the agent.
+        lod : int, optional
+            The level of detail of the 3D shapes, an index in `BODY3D_LODS`. Defaults to 0 (the finest).
 
         Raises
         ------
@@ -74,7 +83,7 @@ class Agent:
         self._agent_type = self._validate_agent_type(agent_type)
         self._measures = self._initialize_measures(agent_type, measures)
         self._shapes2D = self._initialize_shapes2D(agent_type)
-        self._shapes3D = self._initialize_shapes3D(agent_type)
+        self._shapes3D = self._initialize_shapes3D(agent_type, lod)
 
         if self._shapes2D.shapes:
             # Compute the moment of inertia of the agent being created
@@ -104,6 +113,115 @@ class Agent:
                     self._shapes3D.shapes[height], xoff=-centroid_body.x, yoff=-centroid_body.y
                 )
 
+    @classmethod
+    def from_trusted(
+        cls,
+        agent_type: cst.AgentTypes,
+        measures: AgentMeasures,
+        shapes2D: Shapes2D,
+        shapes3D: Shapes3D | None = None,
+    ) -> "Agent":
+        """
+        Create an agent from trusted measures and shapes, without any fitting nor validation.
+
+        The measures are used as they are, including the moment of inertia, and the 2D shapes are assumed to be
+        already placed at the position and orientation of the agent. If no 3D shapes are given for a pedestrian,
+        its 3D body is built from the measures on the first access to `shapes3D`, at the current position and
+        orientation of the 2D shapes.
+
+        Parameters
+        ----------
+        agent_type : AgentTypes
+            The type of the agent.
+        measures : AgentMeasures
+            The measures of the agent, assumed to be valid and to include the moment of inertia.
+        shapes2D : Shapes2D
+            The 2D shapes of the agent, assumed to be valid.
+        shapes3D : Shapes3D | None, optional
+            The 3D shapes of the agent. If None, they are built lazily for pedestrians.
+
+        Returns
+        -------
+        Agent
+            The created agent.
+        """
+        agent = cls.__new__(cls)
+        agent._agent_type = agent_type
+        agent._measures = measures
+        agent._shapes2D = shapes2D
+        agent._shapes3D = shapes3D if shapes3D is not None else Shapes3D.from_trusted(agent_type, {})
+        agent._shapes3D_pending = shapes3D is None and agent_type == cst.AgentTypes.pedestrian
+        return agent
+
+    def _build_pending_shapes3D(self) -> None:
+        """Build the 3D shapes of a pedestrian created with `from_trusted`, at the pose of its 2D shapes."""
+        self._shapes3D_pending = False
+        self._shapes3D = self._build_shapes3D(self._shapes3D.lod)
+
+    def _build_shapes3D(self, lod: int) -> Shapes3D:
+        """
+        Build the 3D shapes of a pedestrian at a level of detail, at the pose of its 2D shapes.
+
+        The template at the level of detail is scaled with the fitted scale factors of the current 3D shapes, so the
+        fit is only run if they have none.
+
+        Parameters
+        ----------
+        lod : int
+            The level of detail, an index in `BODY3D_LODS`.
+
+        Returns
+        -------
+        Shapes3D
+            The built 3D shapes.
+        """
+        shapes3D = Shapes3D.from_trusted(self._agent_type, {}, lod, self._shapes3D.scale_factors, self._shapes3D.fitted_measures)
+        shapes3D.create_pedestrian3D(self._measures)
+
+        # Rotate the body from its initial orientation of 90° to the orientation of the agent, then center it
+        # on the position of the agent, for all the slices in one vectorised call
+        multipolygons = list(shapes3D.shapes.values())
+        centroid_body = shapely.get_coordinates(shapely.centroid(multipolygons)).mean(axis=0)
+        position = self.get_position()
+        angle = np.radians(self.get_agent_orientation() - 90.0)
+        rotation = np.array([[np.cos(angle), np.sin(angle)], [-np.sin(angle), np.cos(angle)]])
+        placed_multipolygons = shapely.transform(
+            multipolygons, lambda coordinates: (coordinates - centroid_body) @ rotation + (position.x, position.y)
+        )
+        shapes3D.shapes = dict(zip(shapes3D.shapes.keys(), placed_multipolygons.tolist(), strict=True))
+        return shapes3D
+
+    def get_shapes3D_at_lod(self, lod: int) -> ShapeDataType:
+        """
+        Get the 3D shapes of the agent at a level of detail, without changing its own 3D shapes.
+
+        Parameters
+        ----------
+        lod : int
+            The level of detail, an index in `BODY3D_LODS`.
+
+        Returns
+        -------
+        ShapeDataType
+            The 3D shapes of the agent if they are at the level of detail `lod` (or if it is not a pedestrian), else
+            its body built from the template at the level of detail `lod`, at the pose of its 2D shapes.
+
+        Raises
+        ------
+        ValueError
+            If `lod` is not an index in `BODY3D_LODS`.
+        """
+        if not isinstance(lod, int) or not 0 <= lod < len(cst.BODY3D_LODS):
+            raise ValueError(f"lod should be an integer between 0 and {len(cst.BODY3D_LODS) - 1}.")
+        if self._agent_type != cst.AgentTypes.pedestrian or (lod == self._shapes3D.lod and not self._shapes3D_pending):
+            return self._shapes3D.shapes
+        shapes3D = self._build_shapes3D(lod)
+        # Keep the fitted scale factors, so that the body is not fitted again at another level of detail
+        if self._shapes3D.scale_factors is None:
+            self._shapes3D.scale_factors = shapes3D.scale_factors
+            self._shapes3D.fitted_measures = shapes3D.fitted_measures
+        return shapes3D.shapes
+
     def _validate_agent_type(self, agent_type: cst.AgentTypes) -> cst.AgentTypes:
         """
         Validate the provided agent type.
@@ -177,7 +295,7 @@ class Agent:
             shapes2D.create_bike_shapes(self._measures)
         return shapes2D
 
-    def _initialize_shapes3D(self, agent_type: cst.AgentTypes) -> Shapes3D:
+    def _initialize_shapes3D(self, agent_type: cst.AgentTypes, lod: int = 0) -> Shapes3D:
         """
         Initialize the 3D shapes for the agent.
 
@@ -185,13 +303,15 @@ class Agent:
         ----------
         agent_type : AgentTypes
             The type of the agent (e.g., pedestrian, bike).
+        lod : int, optional
+            The level of detail of the 3D shapes, an index in `BODY3D_LODS`. Defaults to 0 (the finest).
 
         Returns
         -------
         Shapes3D
             Initialized 3D shapes for the agent.
         """
-        shapes3D = Shapes3D(agent_type=agent_type)
+        shapes3D = Shapes3D(agent_type=agent_type, lod=lod)
         if agent_type == cst.AgentTypes.pedestrian:
             shapes3D.create_pedestrian3D(self._measures)
         return shapes3D
@@ -251,15 +371,21 @@ class Agent:
             self.translate(wanted_position.x - current_position.x, wanted_position.y - current_position.y)
             self.rotate(wanted_orientation - current_orientation)
 
-            # Create and update the 3D shapes if they exist
-            if self.shapes3D is not None:
+            # The scale factors fitted on the former measures no longer apply to the 3D body
+            self._shapes3D.scale_factors = None
+            self._shapes3D.fitted_measures = None
+
+            # Create and update the 3D shapes if they exist. The 3D shapes still to be built will follow the new
+            # measures and the pose of the 2D shapes when they are built.
+            if not self._shapes3D_pending:
+                if self.shapes3D is not None:
+                    self.shapes3D.create_pedestrian3D(self._measures)
+                else:
+                    self.shapes3D = Shapes3D(agent_type=cst.AgentTypes.pedestrian)
                 self.shapes3D.create_pedestrian3D(self._measures)
-            else:
-                self.shapes3D = Shapes3D(agent_type=cst.AgentTypes.pedestrian)
-            self.shapes3D.create_pedestrian3D(self._measures)
-            current_position = self.get_centroid_body3D()
-            self.translate_body3D(dx=wanted_position.x - current_position.x, dy=wanted_position.y - current_position.y, dz=0.0)
-            self.rotate_body3D(angle=wanted_orientation - 90)
+                current_position = self.get_centroid_body3D()
+                self.translate_body3D(dx=wanted_position.x - current_position.x, dy=wanted_position.y - current_position.y, dz=0.0)
+                self.rotate_body3D(angle=wanted_orientation - 90)
 
         if self.agent_type == cst.AgentTypes.bike:
             if isinstance(value, dict):
@@ -301,6 +427,8 @@ class Agent:
         Shapes3D | None
             Dataclass object holding all 3D shapes defining the agent's 3D features, if available. None if not set.
         """
+        if self._shapes3D_pending:
+            self._build_pending_shapes3D()
         return self._shapes3D
 
     @shapes3D.setter
@@ -323,6 +451,59 @@ class Agent:
         if isinstance(value, dict):
             value = Shapes3D(agent_type=self.agent_type, shapes=value)
         self._shapes3D = value
+        self._shapes3D_pending = False
+
+    @property
+    def shapes3D_pending(self) -> bool:
+        """
+        Whether the 3D shapes are still to be built on their first access.
+
+        Returns
+        -------
+        bool
+            True for an agent created with `from_trusted` whose 3D shapes have not been accessed yet.
+        """
+        return self._shapes3D_pending
+
+    @property
+    def lod(self) -> int:
+        """
+        Level of detail of the 3D shapes.
+
+        Returns
+        -------
+        int
+            The index in `BODY3D_LODS` of the level of detail of the 3D shapes.
+        """
+        lod: int = self._shapes3D.lod
+        return lod
+
+    @lod.setter
+    def lod(self, value: int) -> None:
+        """
+        Change the level of detail of the 3D shapes.
+
+        The 3D body of a pedestrian is rebuilt at the new level of detail on the next access to `shapes3D`, at the
+        pose of its 2D shapes, from the template scaled with the fitted scale factors of its current body.
+
+        Parameters
+        ----------
+        value : int
+            The new level of detail, an index in `BODY3D_LODS`.
+
+        Raises
+        ------
+        ValueError
+            If `value` is not an index in `BODY3D_LODS`.
+        """
+        if not isinstance(value, int) or not 0 <= value < len(cst.BODY3D_LODS):
+            raise ValueError(f"lod should be an integer between 0 and {len(cst.BODY3D_LODS) - 1}.")
+        if value == self._shapes3D.lod:
+            return
+        self._shapes3D = Shapes3D.from_trusted(
+            self._agent_type, {}, value, self._shapes3D.scale_factors, self._shapes3D.fitted_measures
+        )
+        self._shapes3D_pending = self._agent_type == cst.AgentTypes.pedestrian
 
     def translate(self, dx: float, dy: float) -> None:
         """
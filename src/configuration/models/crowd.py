@@ -25,16 +25,39 @@
 # The fact that you are presently reading this means that you have had knowledge of the CeCILL license and that
 # you accept its terms.
 
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, cast
+
 import numpy as np
+import shapely
 import shapely.affinity as affin
 from numpy.typing import NDArray
 from shapely.geometry import Point, Polygon
 
 import configuration.utils.constants as cst
+import configuration.utils.functions as fun
+from configuration.backup.packing_checkpoint import (
+    PackingCheckpoint,
+    RandomStateType,
+    load_packing_checkpoint,
+    save_packing_checkpoint,
+)
 from configuration.models.agents import Agent
-from configuration.models.measures import CrowdMeasures, create_pedestrian_measures, draw_agent_measures, draw_agent_type
+from configuration.models.measures import (
+    AgentMeasures,
+    CrowdMeasures,
+    create_pedestrian_measures,
+    draw_agent_measures,
+    draw_agent_type,
+    draw_agent_types,
+    draw_agents_measures,
+    get_default_sampler,
+)
 from configuration.models.shapes2D import Shapes2D
-from configuration.utils.typing_custom import DynamicCrowdDataType, GeometryDataType, StaticCrowdDataType
+from configuration.models.shapes3D import Shapes3D
+from configuration.utils.typing_custom import DynamicCrowdDataType, GeometryDataType, ShapeDataType, StaticCrowdDataType
 
 
 class Crowd:
@@ -95,15 +118,20 @@ class Crowd:
         elif not isinstance(boundaries, Polygon):
             raise ValueError("'boundaries' should be a shapely Polygon instance even if empty")
 
+        # Crowd statistics are only computed when needed if the validation is deferred
+        self._statistics_outdated = False
+
         # If agents are provided (measures must be None)
         if agents is not None:
             if not isinstance(agents, list):
                 raise ValueError("'agents' should be a list of Agent instances")
-            if agents and not all(isinstance(agent, Agent) for agent in agents):
+            if agents and not fun.is_validation_deferred() and not all(isinstance(agent, Agent) for agent in agents):
                 raise ValueError("All elements in 'agents' must be Agent instances")
             self._agents = agents
             # Calculate measures from agents
-            self._measures = CrowdMeasures(agent_statistics=self.get_crowd_statistics()["measures"])
+            self._measures = None
+            if not fun.is_validation_deferred():
+                self._update_measures()
         # If measures are provided (agents must be None)
         elif measures is not None:
             if isinstance(measures, CrowdMeasures):
@@ -125,6 +153,68 @@ class Crowd:
 
         self._boundaries = boundaries
 
+    @classmethod
+    def from_trusted(cls, agents: list[Agent], boundaries: Polygon | None = None, measures: CrowdMeasures | None = None) -> "Crowd":
+        """
+        Create a crowd from trusted agents, without any validation.
+
+        The type checks of the agents are skipped and the crowd statistics are only computed when the measures of
+        the crowd are first accessed. Call `validate()` to check the crowd explicitly.
+
+        Parameters
+        ----------
+        agents : list[Agent]
+            List of Agent instances, assumed to be valid.
+        boundaries : Polygon | None
+            A shapely Polygon instance defining the boundaries. If None, the crowd has no boundaries.
+        measures : CrowdMeasures | None
+            The measures of the crowd. If None, they are computed from the agents when first needed.
+
+        Returns
+        -------
+        Crowd
+            The created crowd.
+        """
+        crowd = cls.__new__(cls)
+        crowd._agents = agents
+        crowd._boundaries = Polygon() if boundaries is None else boundaries
+        crowd._measures = measures
+        crowd._statistics_outdated = measures is None
+        return crowd
+
+    def validate(self) -> None:
+        """
+        Validate the crowd, its boundaries and all its agents, then update the crowd statistics.
+
+        This is meant to be called once after bulk operations performed with `from_trusted` constructors or inside
+        a `deferred_validation()` block.
+
+        Raises
+        ------
+        ValueError
+            If the agents or the boundaries have an invalid type, or if the measures or shapes of an agent are invalid.
+        """
+        if not isinstance(self._agents, list) or not all(isinstance(agent, Agent) for agent in self._agents):
+            raise ValueError("'agents' should be a list of Agent instances")
+        if not isinstance(self._boundaries, Polygon):
+            raise ValueError("'boundaries' should be a shapely Polygon instance")
+        for agent in self._agents:
+            agent.measures.validate()
+            agent.shapes2D.validate()
+            # The 3D shapes still to be built are not validated, so that they are not built here
+            if not agent.shapes3D_pending and agent.shapes3D is not None:
+                agent.shapes3D.validate()
+        self._statistics_outdated = True
+        self._update_measures()
+
+    def _update_measures(self) -> None:
+        """Compute the crowd statistics if they are outdated and store them in the crowd measures."""
+        if self._measures is None:
+            self._measures = CrowdMeasures(agent_statistics=self.get_crowd_statistics()["measures"])
+        elif self._statistics_outdated:
+            self._measures.agent_statistics = self.get_crowd_statistics()["measures"]
+        self._statistics_outdated = False
+
     @property
     def agents(self) -> list[Agent]:
         """
@@ -152,10 +242,15 @@ class Crowd:
         ValueError
             If `value` is not a list or if any element in `value` is not an instance of Agent.
         """
+        if fun.is_validation_deferred():
+            self._agents = value
+            self._statistics_outdated = True
+            return
         if not isinstance(value, list) or not all(isinstance(agent, Agent) for agent in value):
             raise ValueError("'agents' should be a list of Agent instances")
         self._agents = value
-        self._measures.agent_statistics = self.get_crowd_statistics()["measures"]
+        self._statistics_outdated = True
+        self._update_measures()
 
     @property
     def measures(self) -> CrowdMeasures:
@@ -167,7 +262,8 @@ class Crowd:
         CrowdMeasures
             A CrowdMeasures object containing the measures of the crowd.
         """
-        return self._measures
+        self._update_measures()
+        return cast(CrowdMeasures, self._measures)
 
     @property
     def boundaries(self) -> Polygon:
@@ -227,21 +323,98 @@ class Crowd:
 
         # Case 2: Use the default ANSURII database if no other data is available
         elif not self.measures.agent_statistics:
-            drawn_agent_data = np.random.choice(np.array(list(self.measures.default_database.values()), dtype="object"))
+            drawn_agent_data = self.measures.default_database[np.random.randint(len(self.measures.default_database))]
             agent_measures = create_pedestrian_measures(drawn_agent_data)
             self.agents.append(Agent(agent_type=cst.AgentTypes.pedestrian, measures=agent_measures))
 
-    def create_agents(self, number_agents: int = cst.DEFAULT_AGENT_NUMBER) -> None:
+    def create_agents(
+        self,
+        number_agents: int = cst.DEFAULT_AGENT_NUMBER,
+        male_proportion: float | None = None,
+        height_range: tuple[float, float] | None = None,
+        lod: int = 0,
+    ) -> None:
         """
         Create multiple agents in the crowd from the given CrowdMeasures (ANSURII database by default).
 
+        Without agent statistics, the pedestrians are drawn with replacement from the rows of the ANSURII database, with
+        the stratified index of `get_default_sampler`, which can target a male proportion and a height range.
+
         Parameters
         ----------
         number_agents : int
             Number of agents to create.
+        male_proportion : float | None
+            The expected proportion of male pedestrians drawn from the ANSURII database, in [0,1]. If None, it is the one
+            of the (filtered) database.
+        height_range : tuple[float, float] | None
+            The inclusive range of the heights (cm) of the pedestrians drawn from the ANSURII database. If None, all the
+            heights are allowed.
+        lod : int, optional
+            The level of detail of the 3D bodies of the pedestrians, an index in `BODY3D_LODS`. Defaults to 0 (the finest).
+
+        Raises
+        ------
+        ValueError
+            If `male_proportion` or `height_range` are given with agent statistics, or if `male_proportion` is not in [0,1].
+        """
+        # The measures and shapes come from our own generator, so their validation is skipped
+        with fun.deferred_validation():
+            if not self.measures.agent_statistics:
+                proportions = None
+                if male_proportion is not None:
+                    if not 0 <= male_proportion <= 1:
+                        raise ValueError("Probability p must be between 0 and 1.")
+                    proportions = {cst.Sex.male.value: male_proportion, cst.Sex.female.value: 1 - male_proportion}
+                drawn_indices = get_default_sampler().sample(
+                    number_agents,
+                    proportions,
+                    column=None if height_range is None else cst.PedestrianParts.height.name,
+                    bounds=height_range,
+                )
+                for agent_idx in drawn_indices.tolist():
+                    agent_measures = create_pedestrian_measures(self.measures.default_database[agent_idx])
+                    self.agents.append(Agent(agent_type=cst.AgentTypes.pedestrian, measures=agent_measures, lod=lod))
+                return
+            if male_proportion is not None or height_range is not None:
+                raise ValueError("male_proportion and height_range only apply to agents drawn from the ANSURII database.")
+
+            # Draw the measures of all the agents of each type in one vectorised call, then create them in order
+            agent_types = draw_agent_types(self.measures, number_agents)
+            drawn_measures = {
+                agent_type: iter(draw_agents_measures(agent_type, self.measures, agent_types.count(agent_type)))
+                for agent_type in (cst.AgentTypes.pedestrian, cst.AgentTypes.bike)
+            }
+            for agent_type in agent_types:
+                self.agents.append(Agent(agent_type=agent_type, measures=next(drawn_measures[agent_type]), lod=lod))
+
+    def compute_moments_of_inertia(self, exact: bool = False) -> NDArray[np.float64]:
+        """
+        Compute the moments of inertia of all agents of the crowd in one call.
+
+        Parameters
+        ----------
+        exact : bool
+            If False (default), the polygonal 2D representations of all agents are processed in a single
+            vectorised call. If True, the exact analytic computation for unions of disks and rectangles is used.
+
+        Returns
+        -------
+        NDArray[np.float64]
+            The moment of inertia (kg·m²) of each agent, in the order of `self.agents`.
         """
-        for _ in range(number_agents):
-            self.add_one_agent()
+        weights = [float(agent.measures.measures[cst.CommonMeasures.weight.name]) for agent in self.agents]
+        moments_of_inertia: NDArray[np.float64]
+        if not exact:
+            moments_of_inertia = fun.compute_moments_of_inertia(
+                [agent.shapes2D.get_geometric_shape() for agent in self.agents], weights
+            )
+            return moments_of_inertia
+        moments_of_inertia = np.zeros(self.get_number_agents(), dtype=np.float64)
+        for i_agent, (agent, weight) in enumerate(zip(self.agents, weights, strict=True)):
+            disks, rectangles = agent.shapes2D.get_disks_and_rectangles()
+            moments_of_inertia[i_agent] = fun.compute_moment_of_inertia_of_disks_and_rectangles(disks, rectangles, weight)
+        return moments_of_inertia
 
     def calculate_interpenetration(self) -> tuple[float, float]:
         """
@@ -435,9 +608,11 @@ class Crowd:
         Update the position and orientation of 3D shapes of all agents based on their 2D shapes.
 
         This method iterates through each agent in the crowd and updates its 3D shapes position and orientation
-        based on the corresponding 2D shapes.
+        based on the corresponding 2D shapes. The 3D shapes still to be built already follow the 2D shapes.
         """
         for agent in self.agents:
+            if agent.shapes3D_pending:
+                continue
             desired_orientation = agent.get_agent_orientation()
             actual_orientation = 0.0
             agent.rotate_body3D(desired_orientation - actual_orientation)
@@ -450,6 +625,24 @@ class Crowd:
                 dz=0.0 - actual_lowest_height,
             )
 
+    def set_lod(self, lod: int | None = None) -> None:
+        """
+        Set the level of detail of the 3D shapes of all agents.
+
+        The 3D bodies of the pedestrians are rebuilt at the new level of detail on their next access, from the
+        templates scaled with their fitted scale factors, without fitting them again.
+
+        Parameters
+        ----------
+        lod : int | None, optional
+            The level of detail, an index in `BODY3D_LODS`. If None, the finest level fitting the vertex budget
+            of a scene of this crowd is selected with `Shapes3D.select_lod`.
+        """
+        if lod is None:
+            lod = Shapes3D.select_lod(crowd_size=max(1, len(self._agents)))
+        for agent in self._agents:
+            agent.lod = lod
+
     def translate_crowd(self, dx: float, dy: float) -> None:
         """
         Translate all agents in the crowd by a specified offset.
@@ -469,11 +662,101 @@ class Crowd:
         if all(agent.agent_type == cst.AgentTypes.pedestrian for agent in self.agents):
             self.update_shapes3D_based_on_shapes2D()
 
+    def calculate_packing_forces(self, i_agent: int, repulsion_length: float, temperature: float) -> NDArray[np.float64]:
+        """
+        Calculate the forces applied to one agent during one iteration of the packing algorithm.
+
+        Parameters
+        ----------
+        i_agent : int
+            Index of the agent in the crowd.
+        repulsion_length : float
+            Exponential decay coefficient for repulsive forces between agents.
+        temperature : float
+            Current temperature of the packing algorithm.
+
+        Returns
+        -------
+        NDArray[np.float64]
+            Array [x_translation (cm), y_translation (cm), rotation (degrees)] to apply to the agent.
+        """
+        forces: NDArray[np.float64] = np.array([0.0, 0.0, 0.0])
+        current_geometric = self.agents[i_agent].shapes2D.get_geometric_shape()
+        current_centroid: Point = current_geometric.centroid
+
+        # Compute repulsive force between agents
+        for j_agent, neigh_agent in enumerate(self.agents):
+            if i_agent == j_agent:
+                continue
+            neigh_geometric = neigh_agent.shapes2D.get_geometric_shape()
+            neigh_centroid: Point = neigh_geometric.centroid
+            forces[:-1] += Crowd.calculate_repulsive_force(current_centroid, neigh_centroid, repulsion_length)
+            if current_geometric.intersects(neigh_geometric):
+                forces[:-1] += Crowd.calculate_contact_force(current_centroid, neigh_centroid)
+                forces[-1] += Crowd.calculate_rotational_force(temperature)
+
+        # Compute repulsive force between agent and wall
+        if not (self.boundaries.is_empty or self.boundaries.contains(current_geometric)):
+            forces += self.calculate_boundary_forces(current_geometric, temperature)
+
+        return forces
+
+    def get_agent_positions(self) -> NDArray[np.float64]:
+        """
+        Get the positions of all agents of the crowd.
+
+        Returns
+        -------
+        NDArray[np.float64]
+            Array of shape (number of agents, 2) with the x and y coordinates (in cm) of each agent.
+        """
+        positions = np.zeros((self.get_number_agents(), 2), dtype=np.float64)
+        for i_agent, agent in enumerate(self.agents):
+            position = agent.get_position()
+            positions[i_agent] = position.x, position.y
+        return positions
+
+    def restore_packing_checkpoint(self, checkpoint: PackingCheckpoint) -> None:
+        """
+        Move the agents to the poses stored in a packing checkpoint and restore the random generator state.
+
+        The crowd must be in the state it had when the checkpointed packing started: each agent is rotated by the
+        stored rotation around its position, then translated to its stored position.
+
+        Parameters
+        ----------
+        checkpoint : PackingCheckpoint
+            The packing checkpoint to restore.
+
+        Raises
+        ------
+        ValueError
+            If the checkpoint was not created from this crowd.
+        """
+        current_positions = self.get_agent_positions()
+        if current_positions.shape != checkpoint.initial_positions.shape or not np.allclose(
+            current_positions, checkpoint.initial_positions
+        ):
+            raise ValueError("The checkpoint does not match the crowd: the agents differ from the ones it was created from.")
+
+        for agent, position, rotation in zip(self.agents, checkpoint.positions.tolist(), checkpoint.rotations.tolist(), strict=True):
+            agent.rotate(float(rotation))
+            current_position = agent.get_position()
+            agent.translate(float(position[0]) - current_position.x, float(position[1]) - current_position.y)
+        np.random.set_state(checkpoint.rng_state)
+
     def pack_agents_with_forces(
         self,
         repulsion_length: float = cst.DEFAULT_REPULSION_LENGTH,
         desired_direction: float = cst.DEFAULT_DESIRED_DIRECTION,
         variable_orientation: bool = cst.DEFAULT_VARIABLE_ORIENTATION,
+        checkpoint_path: Path | None = None,
+        checkpoint_interval: int = cst.DEFAULT_CHECKPOINT_INTERVAL,
+        resume: bool = False,
+        progress_callback: Callable[[int, int, float], None] | None = None,
+        nb_iterations: int | None = None,
+        initial_temperature: float | None = None,
+        additive_cooling: float | None = None,
     ) -> None:
         """
         Simulate crowd dynamics using physics-based forces to resolve agent overlaps.
@@ -492,6 +775,29 @@ class Crowd:
         variable_orientation : bool
             Whether to apply rotational forces during packing. When True, enables
             random angular adjustments based on collision forces.
+        checkpoint_path : Path | None
+            Path of the `.npz` file where the poses of the agents, the temperature and the random generator state
+            are saved every `checkpoint_interval` iterations. If None (default), no checkpoint is written.
+        checkpoint_interval : int
+            Number of iterations between two checkpoints.
+        resume : bool
+            Whether to resume the packing from the checkpoint stored at `checkpoint_path`, if it exists. The crowd
+            must then be in the state it had when the checkpointed packing started.
+        progress_callback : Callable[[int, int, float], None] | None
+            Function called after each iteration with the number of completed iterations, the total number of
+            iterations and the elapsed wall time in seconds.
+        nb_iterations : int | None
+            Number of packing iterations. If None, `MAX_NB_ITERATIONS` is used.
+        initial_temperature : float | None
+            Temperature of the annealing schedule at the first iteration. If None, `INITIAL_TEMPERATURE` is used.
+        additive_cooling : float | None
+            Decrease of the temperature at each iteration. If None, `ADDITIVE_COOLING` is used.
+
+        Raises
+        ------
+        ValueError
+            If `checkpoint_interval` is not strictly positive, if `resume` is True without a `checkpoint_path`, or if
+            `nb_iterations`, `initial_temperature` or `additive_cooling` is negative.
 
         Notes
         -----
@@ -510,38 +816,46 @@ class Crowd:
             desired_direction=desired_direction,
             variable_orientation=variable_orientation,
         )
-
-        # Initially, all agents have 0° orientation (head facing right), so we need to rotate them to the desired direction
-        for current_agent in self.agents:
-            current_agent.rotate(desired_direction)
-
-        Temperature = cst.INITIAL_TEMPERATURE
-        for _ in range(cst.MAX_NB_ITERATIONS):
+        if checkpoint_interval <= 0:
+            raise ValueError("`checkpoint_interval` should be a strictly positive integer.")
+        if resume and checkpoint_path is None:
+            raise ValueError("`checkpoint_path` should be provided to resume the packing.")
+
+        # The annealing schedule defaults to the module constants, read at call time
+        nb_iterations = cst.MAX_NB_ITERATIONS if nb_iterations is None else nb_iterations
+        initial_temperature = cst.INITIAL_TEMPERATURE if initial_temperature is None else initial_temperature
+        additive_cooling = cst.ADDITIVE_COOLING if additive_cooling is None else additive_cooling
+        if nb_iterations < 0 or initial_temperature < 0 or additive_cooling < 0:
+            raise ValueError("`nb_iterations`, `initial_temperature` and `additive_cooling` should be non-negative.")
+        initial_positions = self.get_agent_positions()
+        if resume and checkpoint_path is not None and checkpoint_path.exists():
+            checkpoint = load_packing_checkpoint(checkpoint_path)
+            self.restore_packing_checkpoint(checkpoint)
+            rotations = checkpoint.rotations.copy()
+            Temperature = checkpoint.temperature
+            first_iteration = checkpoint.iteration
+            previous_elapsed_time = checkpoint.elapsed_time
+        else:
+            # Initially, all agents have 0° orientation (head facing right), so we need to rotate them to the desired direction
+            for current_agent in self.agents:
+                current_agent.rotate(desired_direction)
+            rotations = np.full(self.get_number_agents(), desired_direction, dtype=np.float64)
+            Temperature = initial_temperature
+            first_iteration = 0
+            previous_elapsed_time = 0.0
+
+        start_time = time.perf_counter()
+        for iteration in range(first_iteration, nb_iterations):
             # Check for overlaps and apply forces if necessary
             for i_agent, current_agent in enumerate(self.agents):
                 # Format: [x_translation (cm), y_translation (cm), rotation (degrees)]
-                forces: NDArray[np.float64] = np.array([0.0, 0.0, 0.0])
-                current_geometric = current_agent.shapes2D.get_geometric_shape()
-                current_centroid: Point = current_geometric.centroid
-
-                # Compute repulsive force between agents
-                for j_agent, neigh_agent in enumerate(self.agents):
-                    if i_agent == j_agent:
-                        continue
-                    neigh_geometric = neigh_agent.shapes2D.get_geometric_shape()
-                    neigh_centroid: Point = neigh_geometric.centroid
-                    forces[:-1] += Crowd.calculate_repulsive_force(current_centroid, neigh_centroid, repulsion_length)
-                    if current_geometric.intersects(neigh_geometric):
-                        forces[:-1] += Crowd.calculate_contact_force(current_centroid, neigh_centroid)
-                        forces[-1] += Crowd.calculate_rotational_force(Temperature)
-
-                # Compute repulsive force between agent and wall
-                if not (self.boundaries.is_empty or self.boundaries.contains(current_geometric)):
-                    forces += self.calculate_boundary_forces(current_geometric, Temperature)
+                forces = self.calculate_packing_forces(i_agent, repulsion_length, Temperature)
+                current_centroid: Point = current_agent.shapes2D.get_geometric_shape().centroid
 
                 # Rotate pedestrian
                 if variable_orientation:
                     current_agent.rotate(forces[-1])
+                    rotations[i_agent] += forces[-1]
 
                 # Translate pedestrian
                 new_position = Point(np.array(current_centroid.coords[0], dtype=np.float64) + forces[:-1])
@@ -551,7 +865,26 @@ class Crowd:
                     current_agent.translate(forces[:-1][0], forces[:-1][1])
 
             # Decrease the temperature at each iteration
-            Temperature = max(0.0, Temperature - cst.ADDITIVE_COOLING)
+            Temperature = max(0.0, Temperature - additive_cooling)
+
+            completed_iterations = iteration + 1
+            elapsed_time = previous_elapsed_time + time.perf_counter() - start_time
+            is_checkpoint_iteration = completed_iterations % checkpoint_interval == 0 or completed_iterations == nb_iterations
+            if checkpoint_path is not None and is_checkpoint_iteration:
+                save_packing_checkpoint(
+                    PackingCheckpoint(
+                        iteration=completed_iterations,
+                        temperature=Temperature,
+                        elapsed_time=elapsed_time,
+                        initial_positions=initial_positions,
+                        positions=self.get_agent_positions(),
+                        rotations=rotations,
+                        rng_state=cast(RandomStateType, np.random.get_state()),
+                    ),
+                    checkpoint_path,
+                )
+            if progress_callback is not None:
+                progress_callback(completed_iterations, nb_iterations, elapsed_time)
 
         # Translate all agents and wall to get the minimum x-coordinates and minimum y-coordinates at (0., 0.)
         min_x = min(min(agent.shapes2D.get_geometric_shape().bounds[0] for agent in self.agents), self.boundaries.bounds[0])
@@ -754,11 +1087,17 @@ class Crowd:
 
 
 def create_agents_from_dynamic_static_geometry_parameters(
-    static_dict: StaticCrowdDataType, dynamic_dict: DynamicCrowdDataType, geometry_dict: GeometryDataType
+    static_dict: StaticCrowdDataType,
+    dynamic_dict: DynamicCrowdDataType,
+    geometry_dict: GeometryDataType,
+    refit: bool = False,
 ) -> Crowd:
     """
     Create agents from dynamic and static geometry parameters.
 
+    By default, the agents are rebuilt directly from the disks, mass and moment of inertia stored in the files, without
+    any fitting, and their 3D bodies are only built if they are accessed (see `Agent.from_trusted`).
+
     Parameters
     ----------
     static_dict : StaticCrowdDataType
@@ -767,6 +1106,9 @@ def create_agents_from_dynamic_static_geometry_parameters(
         Dictionary containing dynamic crowd data.
     geometry_dict : GeometryDataType
         Dictionary containing geometry data.
+    refit : bool, optional
+        Whether to create each agent from the measures of its stored disks, fitting its 2D and 3D shapes and computing
+        its moment of inertia again, instead of using the stored disks. By default False.
 
     Returns
     -------
@@ -798,44 +1140,125 @@ def create_agents_from_dynamic_static_geometry_parameters(
             continue
 
         agent_id: int = agent_data["Id"]
-        wanted_center_of_mass: tuple[float, float] = agent_positions.get(agent_id, (0.0, 0.0))  # m
-        wanted_center_of_mass = np.array(wanted_center_of_mass) * cst.M_TO_CM  # cm
-        wanted_orientation: float = np.degrees(agent_orientations.get(agent_id, 0.0))  # radian
-
-        agent_shape2D = Shapes2D(agent_type=cst.AgentTypes.pedestrian)
-
-        for shape_name, shape_data in agent_data.get("Shapes", {}).items():
-            # Calculate global position of the shape
-            rel_x, rel_y = shape_data["Position"]  # m
-            agent_shape2D.add_shape(
-                name=shape_name,
-                shape_type=cst.ShapeTypes.disk.name,
-                material=cst.MaterialNames.human_naked.name,
-                radius=shape_data["Radius"] * cst.M_TO_CM,
-                x=rel_x * cst.M_TO_CM,
-                y=rel_y * cst.M_TO_CM,
-            )
+        wanted_center_of_mass: NDArray[np.float64] = np.array(agent_positions.get(agent_id, (0.0, 0.0))) * cst.M_TO_CM  # cm
+        wanted_orientation: float = np.degrees(agent_orientations.get(agent_id, 0.0))  # degrees
+
+        if refit:
+            all_agents.append(_refit_agent_from_static_parameters(agent_data, wanted_center_of_mass, wanted_orientation))
+        else:
+            all_agents.append(_rebuild_agent_from_static_parameters(agent_data, wanted_center_of_mass, wanted_orientation))
+
+    if refit:
+        return Crowd(agents=all_agents, boundaries=boundaries)
+    return Crowd.from_trusted(all_agents, boundaries=boundaries)
+
 
-        agent_measures = {
+def _rebuild_agent_from_static_parameters(
+    agent_data: dict[str, Any], wanted_center_of_mass: NDArray[np.float64], wanted_orientation: float
+) -> Agent:
+    """
+    Rebuild a pedestrian from its stored disks, mass and moment of inertia, without any fitting.
+
+    Parameters
+    ----------
+    agent_data : dict[str, Any]
+        The static parameters of the agent, with its disks given relative to its center of mass at an orientation of 0°.
+    wanted_center_of_mass : NDArray[np.float64]
+        The position of the center of mass of the agent (cm).
+    wanted_orientation : float
+        The orientation of the agent (degrees).
+
+    Returns
+    -------
+    Agent
+        The rebuilt agent, whose 3D body is built on its first access.
+    """
+    shapes_data = agent_data.get("Shapes", {})
+    relative_positions = np.array([shape_data["Position"] for shape_data in shapes_data.values()], dtype=np.float64).reshape(-1, 2)
+    radii = np.array([shape_data["Radius"] for shape_data in shapes_data.values()], dtype=np.float64) * cst.M_TO_CM
+
+    # Rotate the disk positions to the orientation of the agent, then place them around its center of mass
+    angle = np.radians(wanted_orientation)
+    rotation = np.array([[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]])
+    centers = wanted_center_of_mass + relative_positions * cst.M_TO_CM @ rotation.T
+    disks = shapely.buffer(shapely.points(centers), radii, quad_segs=cst.DISK_QUAD_SEGS)
+
+    shapes: ShapeDataType = {
+        shape_name: {
+            "type": cst.ShapeTypes.disk.name,
+            "material": shape_data.get("MaterialId", cst.MaterialNames.human_naked.name),
+            "object": disk,
+        }
+        for (shape_name, shape_data), disk in zip(shapes_data.items(), disks, strict=True)
+    }
+    agent_shape2D = Shapes2D.from_trusted(cst.AgentTypes.pedestrian, shapes)
+
+    agent_measures = AgentMeasures.from_trusted(
+        cst.AgentTypes.pedestrian,
+        {
             "sex": "male",
             "bideltoid_breadth": agent_shape2D.get_bideltoid_breadth(),
             "chest_depth": agent_shape2D.get_chest_depth(),
             "height": agent_data["Height"] * cst.M_TO_CM,  # m
             "weight": agent_data["Mass"],  # kg
-        }
-        new_agent = Agent(agent_type=cst.AgentTypes.pedestrian, measures=agent_measures)
+            cst.CommonMeasures.moment_of_inertia.name: agent_data["MomentOfInertia"],  # kg*m^2
+        },
+    )
+    return Agent.from_trusted(cst.AgentTypes.pedestrian, agent_measures, agent_shape2D)
 
-        actual_position = new_agent.get_position()
-        actual_orientation = new_agent.get_agent_orientation()
-        new_agent.translate(wanted_center_of_mass[0] - actual_position.x, wanted_center_of_mass[1] - actual_position.y)
-        new_agent.rotate(wanted_orientation - actual_orientation)
 
-        current_position = new_agent.get_centroid_body3D()
-        new_agent.translate_body3D(
-            dx=wanted_center_of_mass[0] - current_position.x, dy=wanted_center_of_mass[1] - current_position.y, dz=0.0
-        )
-        new_agent.rotate_body3D(angle=wanted_orientation)
+def _refit_agent_from_static_parameters(
+    agent_data: dict[str, Any], wanted_center_of_mass: NDArray[np.float64], wanted_orientation: float
+) -> Agent:
+    """
+    Create a pedestrian from the measures of its stored disks, fitting its 2D and 3D shapes again.
 
-        all_agents.append(new_agent)
+    Parameters
+    ----------
+    agent_data : dict[str, Any]
+        The static parameters of the agent, with its disks given relative to its center of mass at an orientation of 0°.
+    wanted_center_of_mass : NDArray[np.float64]
+        The position of the center of mass of the agent (cm).
+    wanted_orientation : float
+        The orientation of the agent (degrees).
+
+    Returns
+    -------
+    Agent
+        The created agent.
+    """
+    agent_shape2D = Shapes2D(agent_type=cst.AgentTypes.pedestrian)
+
+    for shape_name, shape_data in agent_data.get("Shapes", {}).items():
+        # Calculate global position of the shape
+        rel_x, rel_y = shape_data["Position"]  # m
+        agent_shape2D.add_shape(
+            name=shape_name,
+            shape_type=cst.ShapeTypes.disk.name,
+            material=cst.MaterialNames.human_naked.name,
+            radius=shape_data["Radius"] * cst.M_TO_CM,
+            x=rel_x * cst.M_TO_CM,
+            y=rel_y * cst.M_TO_CM,
+        )
 
-    return Crowd(agents=all_agents, boundaries=boundaries)
+    agent_measures = {
+        "sex": "male",
+        "bideltoid_breadth": agent_shape2D.get_bideltoid_breadth(),
+        "chest_depth": agent_shape2D.get_chest_depth(),
+        "height": agent_data["Height"] * cst.M_TO_CM,  # m
+        "weight": agent_data["Mass"],  # kg
+    }
+    new_agent = Agent(agent_type=cst.AgentTypes.pedestrian, measures=agent_measures)
+
+    actual_position = new_agent.get_position()
+    actual_orientation = new_agent.get_agent_orientation()
+    new_agent.translate(wanted_center_of_mass[0] - actual_position.x, wanted_center_of_mass[1] - actual_position.y)
+    new_agent.rotate(wanted_orientation - actual_orientation)
+
+    current_position = new_agent.get_centroid_body3D()
+    new_agent.translate_body3D(
+        dx=wanted_center_of_mass[0] - current_position.x, dy=wanted_center_of_mass[1] - current_position.y, dz=0.0
+    )
+    new_agent.rotate_body3D(angle=wanted_orientation)
+
+    return new_agent
@@ -25,6 +25,7 @@
 # The fact that you are presently reading this means that you have had knowledge of the CeCILL license and that
 # you accept its terms.
 
+from functools import lru_cache
 from pathlib import Path
 
 from shapely.geometry import MultiPolygon, Point, box
@@ -35,6 +36,38 @@ from configuration.utils import functions as fun
 from configuration.utils.typing_custom import Sex, ShapeDataType, ShapeType
 
 
+@lru_cache(maxsize=2 * len(cst.BODY3D_LODS))
+def _load_shapes3D(sex: Sex, lod: int) -> dict[float, MultiPolygon]:
+    """
+    Load the 3D body template of a sex at a level of detail.
+
+    The memory-mappable arrays of the level are used when they exist. Otherwise, the light body is unpickled and,
+    for a coarser level, reduced with `compute_3D_body_lod`.
+
+    Parameters
+    ----------
+    sex : Sex
+        Biological sex of the body, either "male" or "female".
+    lod : int
+        The level of detail, an index in `BODY3D_LODS`.
+
+    Returns
+    -------
+    dict[float, MultiPolygon]
+        The MultiPolygons of the body, indexed by height.
+    """
+    data_dir_path = Path(__file__).parent.parent.parent.parent.absolute() / "data"
+    arrays_dir_path = data_dir_path / "npy" / fun.get_3D_body_name(sex, lod)
+    shapes3D: dict[float, MultiPolygon]
+    if arrays_dir_path.exists():
+        shapes3D = fun.load_ragged_multipolygons(str(arrays_dir_path))
+        return shapes3D
+    shapes3D = fun.load_pickle(str(data_dir_path / "pkl" / f"{fun.get_3D_body_name(sex)}.pkl"))
+    if lod > 0:
+        shapes3D = fun.compute_3D_body_lod(shapes3D, *cst.BODY3D_LODS[lod])
+    return shapes3D
+
+
 class InitialPedestrian:
     """
     Class representing the initial pedestrian state including its 2D shape data and basic measurements.
@@ -45,7 +78,7 @@ class InitialPedestrian:
         Biological sex of the pedestrian, must be either "male" or "female".
     """
 
-    def __init__(self, sex: Sex) -> None:
+    def __init__(self, sex: Sex, lod: int = 0) -> None:
         """
         Initialize a pedestrian agent with biomechanical properties.
 
@@ -53,6 +86,8 @@ class InitialPedestrian:
         ----------
         sex : Sex
             Biological sex of the pedestrian, must be either "male" or "female".
+        lod : int, optional
+            Level of detail of the 3D body, an index in `BODY3D_LODS`. Defaults to 0 (the finest).
 
         Attributes
         ----------
@@ -78,11 +113,12 @@ class InitialPedestrian:
         """
         if isinstance(sex, str) and sex not in ["male", "female"]:
             raise ValueError("The sex should be either 'male' or 'female'.")
+        if not isinstance(lod, int) or not 0 <= lod < len(cst.BODY3D_LODS):
+            raise ValueError(f"The level of detail should be an integer between 0 and {len(cst.BODY3D_LODS) - 1}.")
 
         self._agent_type: cst.AgentTypes = cst.AgentTypes.pedestrian
         self._shapes2D: ShapeDataType = self._initialize_shapes()
-        dir_path = Path(__file__).parent.parent.parent.parent.absolute() / "data" / "pkl"
-        self._shapes3D: dict[float, MultiPolygon] = fun.load_pickle(str(dir_path / f"{sex}_3dBody_light.pkl"))
+        self._shapes3D: dict[float, MultiPolygon] = _load_shapes3D(sex, lod)
 
         # Initialize measures
         bideltoid_breadth: float = 0.0
@@ -26,15 +26,72 @@
 # you accept its terms.
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, cast
 
 import numpy as np
+from numpy.typing import NDArray
 
 import configuration.utils.constants as cst
 from configuration.utils import functions as fun
+from configuration.utils.sampler import StratifiedIndexSampler, TruncatedGaussianCopula, compute_normal_scores_correlation
 from configuration.utils.typing_custom import Sex
 
 
+@lru_cache(maxsize=1)
+def load_default_columns() -> dict[str, NDArray[Any]]:
+    """
+    Load the typed columns of the ANSUR II dataset used by the models.
+
+    The columns saved by the data factory in npy/ANSUREIIPublic are memory-mapped, without pandas. If they do not
+    exist, they are extracted from the pickled DataFrame.
+
+    Returns
+    -------
+    dict[str, NDArray[Any]]
+        The "sex" column as uint8 codes (the values of `Sex`), and the float64 columns of `ANSUR_DATA_COLUMNS`
+        indexed by measure name.
+    """
+    data_dir_path = Path(__file__).parent.parent.parent.parent.absolute() / "data"
+    columns_dir_path = data_dir_path / "npy" / "ANSUREIIPublic"
+    columns: dict[str, NDArray[Any]]
+    if columns_dir_path.exists():
+        columns = fun.load_columns(str(columns_dir_path))
+        return columns
+
+    from configuration.data.datafactory import get_anthropometric_columns  # pylint: disable=import-outside-toplevel
+
+    columns = get_anthropometric_columns(fun.load_pickle(str(data_dir_path / "pkl" / "ANSUREIIPublic.pkl")))
+    return columns
+
+
+@lru_cache(maxsize=1)
+def load_default_bike_columns() -> dict[str, NDArray[Any]]:
+    """
+    Load the typed geometry columns of the bike dataset.
+
+    The columns saved by the data factory in npy/bike_data are memory-mapped, without pandas. If they do not exist,
+    they are extracted from the pickled DataFrame.
+
+    Returns
+    -------
+    dict[str, NDArray[Any]]
+        The float64 columns of `BIKE_DATA_COLUMNS` in cm, indexed by name. Missing values are NaN.
+    """
+    data_dir_path = Path(__file__).parent.parent.parent.parent.absolute() / "data"
+    columns_dir_path = data_dir_path / "npy" / "bike_data"
+    columns: dict[str, NDArray[Any]]
+    if columns_dir_path.exists():
+        columns = fun.load_columns(str(columns_dir_path))
+        return columns
+
+    from configuration.data.datafactory import get_bike_columns  # pylint: disable=import-outside-toplevel
+
+    columns = get_bike_columns(fun.load_pickle(str(data_dir_path / "pkl" / "bike_data.pkl")))
+    return columns
+
+
 @dataclass
 class AgentMeasures:
     """Class to store body charasteristics dynamically based on agent type."""
@@ -43,8 +100,35 @@ class AgentMeasures:
     measures: dict[str, float | Sex] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
+        """Validate the measures after object initialization, unless the validation is deferred."""
+        if not fun.is_validation_deferred():
+            self.validate()
+
+    @classmethod
+    def from_trusted(cls, agent_type: cst.AgentTypes, measures: dict[str, float | Sex]) -> "AgentMeasures":
+        """
+        Create an AgentMeasures instance from trusted data, without any validation.
+
+        Parameters
+        ----------
+        agent_type : AgentTypes
+            The type of the agent.
+        measures : dict[str, float | Sex]
+            The measures of the agent, assumed to be valid for this agent type.
+
+        Returns
+        -------
+        AgentMeasures
+            The created instance.
+        """
+        agent_measures = cls.__new__(cls)
+        agent_measures.agent_type = agent_type
+        agent_measures.measures = measures
+        return agent_measures
+
+    def validate(self) -> None:
         """
-        Validate the measures based on the agent type after object initialization.
+        Validate the measures based on the agent type.
 
         Raises
         ------
@@ -109,12 +193,52 @@ class AgentMeasures:
         return len(self.measures)
 
 
+@lru_cache(maxsize=1)
+def get_default_sampler() -> StratifiedIndexSampler:
+    """
+    Build the stratified index of the rows of the ANSUR II dataset, by sex.
+
+    Returns
+    -------
+    StratifiedIndexSampler
+        The sampler of the rows of the dataset (the keys of `CrowdMeasures.default_database`), whose strata are the
+        values of `Sex` and whose columns are the ones of `ANSUR_DATA_COLUMNS`, indexed by measure name.
+    """
+    default_columns = load_default_columns()
+    return StratifiedIndexSampler(
+        strata=default_columns["sex"], columns={name: default_columns[name] for name in cst.ANSUR_DATA_COLUMNS}
+    )
+
+
+@lru_cache(maxsize=2)
+def get_default_correlation(sex: Sex) -> NDArray[np.float64]:
+    """
+    Fit the correlation between the sampled pedestrian measures on the ANSUR II dataset, for one sex.
+
+    Parameters
+    ----------
+    sex : Literal["male","female"]
+        The sex of the pedestrians.
+
+    Returns
+    -------
+    NDArray[np.float64]
+        The correlation matrix of the Gaussian copula of the measures of `PEDESTRIAN_SAMPLED_MEASURES`, in this order.
+    """
+    default_columns = load_default_columns()
+    is_sex = default_columns["sex"] == cst.Sex[sex].value
+    samples = np.column_stack([default_columns[name][is_sex] for name in cst.PEDESTRIAN_SAMPLED_MEASURES])
+    correlation: NDArray[np.float64] = compute_normal_scores_correlation(samples)
+    return correlation
+
+
 @dataclass
 class CrowdMeasures:
     """Collection of dictionaries (databases and statistics) representing the characteristics of the crowd, used to create agents."""
 
     default_database: dict[int, dict[str, float]] = field(default_factory=dict)
     agent_statistics: dict[str, float] = field(default_factory=dict)
+    correlations: dict[str, NDArray[np.float64]] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
         """
@@ -123,19 +247,31 @@ class CrowdMeasures:
         Raises
         ------
         ValueError
-            If `default_database`, or `agent_statistics` are not dictionaries.
+            If `default_database`, `agent_statistics` or `correlations` are not dictionaries.
         ValueError
             If any required statistics are missing in `agent_statistics`.
+        ValueError
+            If a key of `correlations` is not "male", "female" or "bike", or if a correlation matrix does not match
+            the number of sampled measures.
         """
         # Check if the provided databases are dictionaries
         if not isinstance(self.default_database, dict):
             raise ValueError("default_database should be a dictionary.")
         if not isinstance(self.agent_statistics, dict):
             raise ValueError("agent_statistics should be a dictionary.")
-
-        # Fill the default database with the ANSURII dataset
-        dir_path = Path(__file__).parent.parent.parent.parent.absolute() / "data" / "pkl"
-        self.default_database = (fun.load_pickle(str(dir_path / "ANSUREIIPublic.pkl"))).transpose().to_dict()
+        if not isinstance(self.correlations, dict):
+            raise ValueError("correlations should be a dictionary.")
+
+        # Fill the default database with the columns of the ANSURII dataset used by the models
+        default_columns = load_default_columns()
+        sex_names = {sex.value: sex.name for sex in cst.Sex}
+        rows = zip(
+            [sex_names[code] for code in default_columns["sex"].tolist()],
+            *(default_columns[name].tolist() for name in cst.ANSUR_DATA_COLUMNS),
+            strict=True,
+        )
+        labels = ("sex", *cst.ANSUR_DATA_COLUMNS.values())
+        self.default_database = {agent_idx: dict(zip(labels, row, strict=True)) for agent_idx, row in enumerate(rows)}
 
         # Check if the agent statistics are provided for all parts
         if self.agent_statistics:
@@ -144,6 +280,57 @@ class CrowdMeasures:
             if missing_parts:
                 raise ValueError(f"Missing statistics for the crowd: {', '.join(missing_parts)}")
 
+        # Check if the correlation matrices match the sampled measures
+        for key, correlation in self.correlations.items():
+            if key not in ("male", "female", "bike"):
+                raise ValueError(f"Invalid correlation key '{key}'. Expected 'male', 'female' or 'bike'.")
+            number_measures = len(cst.BIKE_SAMPLED_MEASURES if key == "bike" else cst.PEDESTRIAN_SAMPLED_MEASURES)
+            if np.shape(correlation) != (number_measures, number_measures):
+                raise ValueError(f"The '{key}' correlation should be a {number_measures}x{number_measures} matrix.")
+
+    def get_sampler(self, key: str) -> TruncatedGaussianCopula:
+        """
+        Build the joint distribution of the measures of one kind of agent from the crowd statistics.
+
+        The marginals are the truncated normal distributions given by `agent_statistics`. The correlation is the one
+        given in `correlations` if any, otherwise the one fitted on the ANSUR II dataset for pedestrians, and none
+        (independent measures) for bikes.
+
+        Parameters
+        ----------
+        key : str
+            "male" or "female" for the pedestrians of this sex, or "bike" for bikes.
+
+        Returns
+        -------
+        TruncatedGaussianCopula
+            The distribution of the measures of `PEDESTRIAN_SAMPLED_MEASURES` or `BIKE_SAMPLED_MEASURES`, in this order.
+
+        Raises
+        ------
+        ValueError
+            If `key` is not "male", "female" or "bike".
+        """
+        if key == "bike":
+            prefixes = ["bike_" if name == cst.CommonMeasures.weight.name else "" for name in cst.BIKE_SAMPLED_MEASURES]
+            names: tuple[str, ...] = cst.BIKE_SAMPLED_MEASURES
+            default_correlation = None
+        elif key in ("male", "female"):
+            prefixes = [f"{key}_"] * len(cst.PEDESTRIAN_SAMPLED_MEASURES)
+            names = cst.PEDESTRIAN_SAMPLED_MEASURES
+            default_correlation = get_default_correlation(cast(Sex, key))
+        else:
+            raise ValueError(f"Invalid sampler key '{key}'. Expected 'male', 'female' or 'bike'.")
+
+        stats = self.agent_statistics
+        return TruncatedGaussianCopula(
+            mean=np.array([stats[f"{prefix}{name}_mean"] for prefix, name in zip(prefixes, names, strict=True)]),
+            std_dev=np.array([stats[f"{prefix}{name}_std_dev"] for prefix, name in zip(prefixes, names, strict=True)]),
+            min_val=np.array([stats[f"{prefix}{name}_min"] for prefix, name in zip(prefixes, names, strict=True)]),
+            max_val=np.array([stats[f"{prefix}{name}_max"] for prefix, name in zip(prefixes, names, strict=True)]),
+            correlation=self.correlations.get(key, default_correlation),
+        )
+
 
 def draw_agent_measures(agent_type: cst.AgentTypes, crowd_measures: CrowdMeasures) -> AgentMeasures:
     """
@@ -161,129 +348,102 @@ def draw_agent_measures(agent_type: cst.AgentTypes, crowd_measures: CrowdMeasure
     AgentMeasures
         An object containing the randomly drawn measures for the specified agent type.
     """
-    if agent_type == cst.AgentTypes.pedestrian:
-        return _draw_pedestrian_measures(crowd_measures)
-    if agent_type == cst.AgentTypes.bike:
-        return _draw_bike_measures(crowd_measures)
-    raise ValueError(f"Invalid agent type '{agent_type}'. Please provide a valid agent type.")
+    return draw_agents_measures(agent_type, crowd_measures, 1)[0]
 
 
-def _draw_pedestrian_measures(crowd_measures: CrowdMeasures) -> AgentMeasures:
+def draw_agents_measures(agent_type: cst.AgentTypes, crowd_measures: CrowdMeasures, number_agents: int) -> list[AgentMeasures]:
     """
-    Draw pedestrian-specific measures from the crowd statistics.
+    Draw the measures of several agents of the same type at once.
 
-    Parameters
-    ----------
-    crowd_measures : CrowdMeasures
-        An object containing statistical measures for the crowd, including
-        pedestrian-specific measurements.
-
-    Returns
-    -------
-    AgentMeasures
-        An object containing the randomly drawn measures for a pedestrian agent, including:
-            - sex : Literal["male","female"]
-                The randomly drawn sex of the pedestrian ("male" or "female").
-            - bideltoid_breadth : float
-                The shoulder width of the pedestrian.
-            - chest_depth : float
-                The chest depth of the pedestrian.
-            - height : float
-                The height of the pedestrian (set to a default value).
-            - weight : float
-                The weight of the pedestrian.
-    """
-    agent_sex = fun.draw_sex(crowd_measures.agent_statistics["male_proportion"])
-    measures = {
-        cst.PedestrianParts.sex.name: agent_sex,
-        cst.PedestrianParts.bideltoid_breadth.name: _draw_measure(crowd_measures, agent_sex, cst.PedestrianParts.bideltoid_breadth),
-        cst.PedestrianParts.chest_depth.name: _draw_measure(crowd_measures, agent_sex, cst.PedestrianParts.chest_depth),
-        cst.PedestrianParts.height.name: _draw_measure(crowd_measures, agent_sex, cst.PedestrianParts.height),
-        cst.CommonMeasures.weight.name: _draw_measure(crowd_measures, agent_sex, cst.CommonMeasures.weight),
-    }
-    return AgentMeasures(agent_type=cst.AgentTypes.pedestrian, measures=measures)
-
-
-def _draw_bike_measures(crowd_measures: CrowdMeasures) -> AgentMeasures:
-    """
-    Draw bike-specific measures from the crowd statistics.
+    The measures of each agent are drawn jointly from the distribution given by `CrowdMeasures.get_sampler`, so that
+    they are correlated. For pedestrians, the sexes are drawn first from the male proportion, then the measures of
+    all the pedestrians of each sex are drawn in a single vectorised call.
 
     Parameters
     ----------
+    agent_type : AgentTypes
+        The type of the agents. Must be either AgentTypes.pedestrian or AgentTypes.bike.
     crowd_measures : CrowdMeasures
-        An object containing statistical measures for the crowd, including bike-specific measurements.
+        An object containing statistical measures for the crowd, including both pedestrian and bike-specific measurements.
+    number_agents : int
+        The number of agents for which to draw measures.
 
     Returns
     -------
-    AgentMeasures
-        An object containing the randomly drawn measures for a bike agent, including:
-            - wheel_width : float
-            - total_length : float
-            - handlebar_length : float
-            - top_tube_length : float
-            - weight : float
-    """
-    measures = {
-        cst.BikeParts.wheel_width.name: _draw_measure(crowd_measures, None, cst.BikeParts.wheel_width),
-        cst.BikeParts.total_length.name: _draw_measure(crowd_measures, None, cst.BikeParts.total_length),
-        cst.BikeParts.handlebar_length.name: _draw_measure(crowd_measures, None, cst.BikeParts.handlebar_length),
-        cst.BikeParts.top_tube_length.name: _draw_measure(crowd_measures, None, cst.BikeParts.top_tube_length),
-        cst.CommonMeasures.weight.name: _draw_measure(crowd_measures, None, cst.CommonMeasures.weight),
-    }
+    list[AgentMeasures]
+        The randomly drawn measures of each agent. Pedestrians have a sex, a bideltoid breadth, a chest depth, a height
+        and a weight; bikes have a wheel width, a total length, a handlebar length, a top tube length and a weight.
 
-    return AgentMeasures(agent_type=cst.AgentTypes.bike, measures=dict(measures))
+    Raises
+    ------
+    ValueError
+        If the agent type is invalid, or if the male proportion is not in [0,1].
+    """
+    if agent_type == cst.AgentTypes.pedestrian:
+        male_proportion = crowd_measures.agent_statistics["male_proportion"]
+        if not 0 <= male_proportion <= 1:
+            raise ValueError("Probability p must be between 0 and 1.")
+        is_male = np.random.uniform(0, 1, number_agents) < male_proportion
+        samples = np.empty((number_agents, len(cst.PEDESTRIAN_SAMPLED_MEASURES)), dtype=np.float64)
+        sexes: tuple[Sex, ...] = ("male", "female")
+        for sex, has_sex in zip(sexes, (is_male, ~is_male), strict=True):
+            samples[has_sex] = crowd_measures.get_sampler(sex).sample(int(np.count_nonzero(has_sex)))
+        return [
+            AgentMeasures(
+                agent_type=cst.AgentTypes.pedestrian,
+                measures={
+                    cst.PedestrianParts.sex.name: "male" if agent_is_male else "female",
+                    **dict(zip(cst.PEDESTRIAN_SAMPLED_MEASURES, agent_samples, strict=True)),
+                },
+            )
+            for agent_is_male, agent_samples in zip(is_male.tolist(), samples.tolist(), strict=True)
+        ]
+    if agent_type == cst.AgentTypes.bike:
+        bike_samples = crowd_measures.get_sampler("bike").sample(number_agents)
+        return [
+            AgentMeasures(agent_type=cst.AgentTypes.bike, measures=dict(zip(cst.BIKE_SAMPLED_MEASURES, agent_samples, strict=True)))
+            for agent_samples in bike_samples.tolist()
+        ]
+    raise ValueError(f"Invalid agent type '{agent_type}'. Please provide a valid agent type.")
 
 
-def _draw_measure(crowd_measures: CrowdMeasures, sex: Sex | None, part_enum: cst.PedestrianParts | cst.BikeParts) -> float:
+def draw_agent_type(crowd_measures: CrowdMeasures) -> cst.AgentTypes:
     """
-    Draw a measure for a specific body part or bike component, from a truncated normal distribution.
+    Draw a random agent type using tower sampling.
 
     Parameters
     ----------
     crowd_measures : CrowdMeasures
-        An object containing statistical measures for the crowd.
-    sex : Literal["male","female"] or None
-        The sex of the agent ("male" or "female") for pedestrians, or None for bikes.
-    part_enum : PedestrianParts or BikeParts
-        The enum representing the body part or bike component to measure.
+        An instance of CrowdMeasures containing the statistics of different agent types in the crowd.
 
     Returns
     -------
-    float
-        A randomly drawn measure from the truncated normal distribution.
-    """
-    # Initialize prefix based on sex
-    prefix = f"{sex}_" if sex else ""
-
-    # Check if part_enum.name is "weight" and sex is truthy
-    if str(part_enum.name) == "weight":
-        # if sex:
-        #     prefix = "pedestrian_"
-        if not sex:
-            prefix = "bike_"
-
-    stats = crowd_measures.agent_statistics
-    mean = stats[f"{prefix}{part_enum.name}_mean"]
-    std_dev = stats[f"{prefix}{part_enum.name}_std_dev"]
-    min_val = stats[f"{prefix}{part_enum.name}_min"]
-    max_val = stats[f"{prefix}{part_enum.name}_max"]
+    AgentTypes
+        The randomly selected agent type (pedestrian or bike) based on the given proportions.
 
-    return float(fun.draw_from_trunc_normal(mean, std_dev, min_val, max_val))
+    Raises
+    ------
+    ValueError
+        If the sum of pedestrian and bike proportions is not equal to 1.
+    """
+    return draw_agent_types(crowd_measures, 1)[0]
 
 
-def draw_agent_type(crowd_measures: CrowdMeasures) -> cst.AgentTypes:
+def draw_agent_types(crowd_measures: CrowdMeasures, number_agents: int) -> list[cst.AgentTypes]:
     """
-    Draw a random agent type using tower sampling.
+    Draw the types of several agents at once using tower sampling.
 
     Parameters
     ----------
     crowd_measures : CrowdMeasures
         An instance of CrowdMeasures containing the statistics of different agent types in the crowd.
+    number_agents : int
+        The number of agent types to draw.
 
     Returns
     -------
-    AgentTypes
-        The randomly selected agent type (pedestrian or bike) based on the given proportions.
+    list[AgentTypes]
+        The randomly selected agent types (pedestrian or bike) based on the given proportions.
 
     Raises
     ------
@@ -298,25 +458,11 @@ def draw_agent_type(crowd_measures: CrowdMeasures) -> cst.AgentTypes:
     if pedestrian_proportion + bike_proportion != 1.0:
         raise ValueError("The proportions of pedestrian and bike agents should sum to 1.")
 
-    # Draw a random agent type based on the proportions
-    cumulative_proportion = 0.0
-    random_value = np.random.uniform(0, 1)
-
-    # Loop through the agent types and return the one that corresponds to the random value
-    for agent_type in cst.AgentTypes:
-        proportion = 0.0
-        if agent_type == cst.AgentTypes.pedestrian:
-            proportion = pedestrian_proportion
-        elif agent_type == cst.AgentTypes.bike:
-            proportion = bike_proportion
-
-        cumulative_proportion += proportion
-
-        if random_value <= cumulative_proportion:
-            return agent_type
-
-    # If the random value is greater than the sum of proportions, return pedestrian by default
-    return cst.AgentTypes.pedestrian
+    # A random value up to the pedestrian proportion gives a pedestrian, and a bike otherwise
+    is_pedestrian = np.random.uniform(0, 1, number_agents) <= pedestrian_proportion
+    return [
+        cst.AgentTypes.pedestrian if agent_is_pedestrian else cst.AgentTypes.bike for agent_is_pedestrian in is_pedestrian.tolist()
+    ]
 
 
 def create_pedestrian_measures(agent_data: dict[str, float]) -> AgentMeasures:
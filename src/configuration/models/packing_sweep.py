@@ -0,0 +1,333 @@
+"""Contains functions to sweep the parameters of the packing of a crowd, and compare the speed and quality of the runs."""
+
+# Copyright  2025  Institute of Light and Matter, CNRS UMR 5306, University Claude Bernard Lyon 1
+# Contributors: Oscar DUFOUR, Maxime STAPELLE, Alexandre NICOLAS
+
+# This software is a computer program designed to generate a realistic crowd from anthropometric data and
+# simulate the mechanical interactions that occur within it and with obstacles.
+
+# This software is governed by the CeCILL  license under French law and abiding by the rules of distribution
+# of free software.  You can  use, modify and/ or redistribute the software under the terms of the CeCILL
+# license as circulated by CEA, CNRS and INRIA at the following URL "http://www.cecill.info".
+
+# As a counterpart to the access to the source code and  rights to copy, modify and redistribute granted by
+# the license, users are provided only with a limited warranty  and the software's author,  the holder of the
+# economic rights,  and the successive licensors  have only  limited liability.
+
+# In this respect, the user's attention is drawn to the risks associated with loading,  using,  modifying
+# and/or developing or reproducing the software by the user in light of its specific status of free software,
+# that may mean  that it is complicated to manipulate,  and  that  also therefore means  that it is reserved
+# for developers  and  experienced professionals having in-depth computer knowledge. Users are therefore
+# encouraged to load and test the software's suitability as regards their requirements in conditions enabling
+# the security of their systems and/or data to be ensured and,  more generally, to use and operate it in the
+# same conditions as regards security.
+
+# The fact that you are presently reading this means that you have had knowledge of the CeCILL license and that
+# you accept its terms.
+
+import csv
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from shapely.ops import unary_union
+
+import configuration.utils.constants as cst
+from configuration.models.agents import Agent
+from configuration.models.crowd import Crowd
+from configuration.models.shapes2D import Shapes2D
+
+# The crowd packed by the runs of the current worker process, see `_initialise_sweep_worker`
+_sweep_crowd: Crowd | None = None
+
+
+def copy_crowd_for_packing(crowd: Crowd) -> Crowd:
+    """
+    Copy the agents of a crowd that are moved by the packing, without their 3D shapes.
+
+    The shapely geometries are immutable and the packing replaces them rather than modifying them, so only the
+    dictionaries of the 2D shapes are copied. The measures are shared, and the 3D shapes of the pedestrians are built
+    lazily from the 2D shapes if they are accessed.
+
+    Parameters
+    ----------
+    crowd : Crowd
+        The crowd to copy.
+
+    Returns
+    -------
+    Crowd
+        A crowd whose agents can be packed without changing the ones of `crowd`.
+    """
+    agents = [
+        Agent.from_trusted(
+            agent.agent_type,
+            agent.measures,
+            Shapes2D.from_trusted(agent.agent_type, {name: dict(shape) for name, shape in agent.shapes2D.shapes.items()}),
+        )
+        for agent in crowd.agents
+    ]
+    return Crowd.from_trusted(agents, boundaries=crowd.boundaries, measures=crowd.measures)
+
+
+def get_grid_configurations(parameter_grid: dict[str, list[Any]]) -> list[dict[str, Any]]:
+    """
+    Get all the combinations of the values of the packing parameters.
+
+    Parameters
+    ----------
+    parameter_grid : dict[str, list[Any]]
+        The values of each packing parameter to sweep (see `PACKING_SWEEP_PARAMETERS`).
+
+    Returns
+    -------
+    list[dict[str, Any]]
+        The configurations of the grid, as keyword arguments of `Crowd.pack_agents_with_forces`.
+
+    Raises
+    ------
+    ValueError
+        If a parameter is unknown or has no value.
+    """
+    _check_parameter_names(parameter_grid)
+    if any(len(values) == 0 for values in parameter_grid.values()):
+        raise ValueError("Each swept parameter should have at least one value.")
+    names = list(parameter_grid)
+    return [dict(zip(names, values, strict=True)) for values in itertools.product(*parameter_grid.values())]
+
+
+def get_random_configurations(parameter_ranges: dict[str, Any], number_configurations: int) -> list[dict[str, Any]]:
+    """
+    Draw random configurations of the packing parameters, with the global NumPy random generator.
+
+    Parameters
+    ----------
+    parameter_ranges : dict[str, Any]
+        The range of each packing parameter to sweep (see `PACKING_SWEEP_PARAMETERS`): a list of values to choose
+        from, or a tuple (low, high) of bounds, drawn uniformly as integers if both bounds are integers and as floats
+        otherwise.
+    number_configurations : int
+        The number of configurations to draw.
+
+    Returns
+    -------
+    list[dict[str, Any]]
+        The drawn configurations, as keyword arguments of `Crowd.pack_agents_with_forces`.
+
+    Raises
+    ------
+    ValueError
+        If a parameter is unknown, if a range is invalid, or if `number_configurations` is negative.
+    """
+    _check_parameter_names(parameter_ranges)
+    if not isinstance(number_configurations, int) or number_configurations < 0:
+        raise ValueError("`number_configurations` should be a non-negative integer.")
+
+    drawn_values: dict[str, list[Any]] = {}
+    for name, value_range in parameter_ranges.items():
+        if isinstance(value_range, list) and value_range:
+            drawn_values[name] = [value_range[index] for index in np.random.randint(len(value_range), size=number_configurations)]
+        elif isinstance(value_range, tuple) and len(value_range) == 2 and value_range[0] <= value_range[1]:
+            low, high = value_range
+            if isinstance(low, int) and isinstance(high, int) and not isinstance(low, bool):
+                drawn_values[name] = np.random.randint(low, high + 1, size=number_configurations).tolist()
+            else:
+                drawn_values[name] = np.random.uniform(low, high, size=number_configurations).tolist()
+        else:
+            raise ValueError(f"The range of '{name}' should be a non-empty list of values or a (low, high) tuple.")
+    return [{name: values[index] for name, values in drawn_values.items()} for index in range(number_configurations)]
+
+
+def _check_parameter_names(parameters: dict[str, Any]) -> None:
+    """
+    Check that the swept parameters are packing parameters.
+
+    Parameters
+    ----------
+    parameters : dict[str, Any]
+        The swept parameters.
+
+    Raises
+    ------
+    ValueError
+        If a parameter is not in `PACKING_SWEEP_PARAMETERS`.
+    """
+    unknown_names = set(parameters) - set(cst.PACKING_SWEEP_PARAMETERS)
+    if unknown_names:
+        raise ValueError(
+            f"Unknown packing parameters: {', '.join(sorted(unknown_names))}. Expected some of {cst.PACKING_SWEEP_PARAMETERS}."
+        )
+
+
+def evaluate_packing_configuration(crowd: Crowd, configuration: dict[str, Any], seed: int | None = 0) -> dict[str, Any]:
+    """
+    Pack a copy of a crowd with a configuration of the packing parameters, and measure the run.
+
+    Parameters
+    ----------
+    crowd : Crowd
+        The crowd to pack, left unchanged.
+    configuration : dict[str, Any]
+        The keyword arguments of `Crowd.pack_agents_with_forces`.
+    seed : int | None
+        The seed of the global NumPy random generator before the packing, so that all the configurations are
+        compared on the same random draws. If None, the generator is not seeded.
+
+    Returns
+    -------
+    dict[str, Any]
+        The configuration, followed by the runtime (s), the interpenetration areas (cm²) between agents and with
+        the boundaries, the density (agents/m²) and the packing fraction of the agents in the convex hull of the
+        packed crowd.
+    """
+    packed_crowd = copy_crowd_for_packing(crowd)
+    if seed is not None:
+        np.random.seed(seed)
+    start_time = time.perf_counter()
+    packed_crowd.pack_agents_with_forces(**configuration)
+    runtime = time.perf_counter() - start_time
+
+    interpenetration_between_agents, interpenetration_with_boundaries = packed_crowd.calculate_interpenetration()
+    geometric_shapes = [agent.shapes2D.get_geometric_shape() for agent in packed_crowd.agents]
+    hull_area = unary_union(geometric_shapes).convex_hull.area if geometric_shapes else 0.0
+    return {
+        **configuration,
+        "runtime": runtime,
+        "interpenetration_between_agents": interpenetration_between_agents,
+        "interpenetration_with_boundaries": interpenetration_with_boundaries,
+        "density": packed_crowd.get_number_agents() / (hull_area * cst.CM_TO_M**2) if hull_area > 0 else 0.0,
+        "packing_fraction": sum(shape.area for shape in geometric_shapes) / hull_area if hull_area > 0 else 0.0,
+    }
+
+
+def _initialise_sweep_worker(crowd: Crowd) -> None:
+    """
+    Store the crowd packed by the runs of a worker process, so that it is sent once per worker.
+
+    Parameters
+    ----------
+    crowd : Crowd
+        The crowd to pack.
+    """
+    global _sweep_crowd  # pylint: disable=global-statement
+    _sweep_crowd = crowd
+
+
+def _evaluate_in_worker(configuration: dict[str, Any], seed: int | None) -> dict[str, Any]:
+    """
+    Evaluate a configuration on the crowd of the worker process.
+
+    Parameters
+    ----------
+    configuration : dict[str, Any]
+        The keyword arguments of `Crowd.pack_agents_with_forces`.
+    seed : int | None
+        The seed of the global NumPy random generator before the packing.
+
+    Returns
+    -------
+    dict[str, Any]
+        The measures of the run, see `evaluate_packing_configuration`.
+    """
+    if _sweep_crowd is None:
+        raise RuntimeError("The sweep worker was not initialised with a crowd.")
+    return evaluate_packing_configuration(_sweep_crowd, configuration, seed)
+
+
+def run_packing_sweep(
+    crowd: Crowd, configurations: list[dict[str, Any]], seed: int | None = 0, max_workers: int | None = None
+) -> list[dict[str, Any]]:
+    """
+    Pack copies of a crowd with several configurations of the packing parameters, in parallel processes.
+
+    The agents are generated once: the crowd is sent once to each worker process, and each run packs a cheap copy
+    of it (see `copy_crowd_for_packing`).
+
+    Parameters
+    ----------
+    crowd : Crowd
+        The crowd to pack, left unchanged.
+    configurations : list[dict[str, Any]]
+        The configurations of the packing parameters, e.g. from `get_grid_configurations` or
+        `get_random_configurations`.
+    seed : int | None
+        The seed of the global NumPy random generator before each packing. If None, the generator is not seeded.
+    max_workers : int | None
+        The maximal number of processes running the packings. If None, the number of CPUs is used. If 1, the
+        packings run sequentially in the current process.
+
+    Returns
+    -------
+    list[dict[str, Any]]
+        The table of the runs: one row per configuration, in their order, see `evaluate_packing_configuration`.
+
+    Raises
+    ------
+    ValueError
+        If `max_workers` is not a positive integer, or if a configuration has an unknown parameter.
+    """
+    if max_workers is not None and (not isinstance(max_workers, int) or max_workers < 1):
+        raise ValueError("`max_workers` should be a positive integer.")
+    for configuration in configurations:
+        _check_parameter_names(configuration)
+
+    base_crowd = copy_crowd_for_packing(crowd)
+    if max_workers == 1 or len(configurations) <= 1:
+        return [evaluate_packing_configuration(base_crowd, configuration, seed) for configuration in configurations]
+    nb_workers = min(max_workers or os.cpu_count() or 1, len(configurations))
+    with ProcessPoolExecutor(max_workers=nb_workers, initializer=_initialise_sweep_worker, initargs=(base_crowd,)) as executor:
+        return list(executor.map(_evaluate_in_worker, configurations, itertools.repeat(seed)))
+
+
+def select_fastest_configuration(table: list[dict[str, Any]], overlap_tolerance: float) -> dict[str, Any] | None:
+    """
+    Select the fastest run whose interpenetration between agents and with the boundaries is within a tolerance.
+
+    Parameters
+    ----------
+    table : list[dict[str, Any]]
+        The table of the runs, see `run_packing_sweep`.
+    overlap_tolerance : float
+        The maximal total interpenetration area (cm²).
+
+    Returns
+    -------
+    dict[str, Any] | None
+        The row of the fastest run within the tolerance, or None if no run is within it.
+    """
+    valid_rows = [
+        row for row in table if row["interpenetration_between_agents"] + row["interpenetration_with_boundaries"] <= overlap_tolerance
+    ]
+    if not valid_rows:
+        return None
+    return min(valid_rows, key=lambda row: row["runtime"])
+
+
+def save_sweep_table(table: list[dict[str, Any]], output_csv_path: Path) -> None:
+    """
+    Save the table of the runs of a sweep to a CSV file.
+
+    Parameters
+    ----------
+    table : list[dict[str, Any]]
+        The table of the runs, see `run_packing_sweep`.
+    output_csv_path : Path
+        The path of the CSV file.
+
+    Raises
+    ------
+    TypeError
+        If `output_csv_path` is not a Path object.
+    """
+    if not isinstance(output_csv_path, Path):
+        raise TypeError("`output_csv_path` should be a Path object.")
+    columns = list(dict.fromkeys(column for row in table for column in row))
+    output_csv_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_csv_path, "w", newline="", encoding="utf-8") as csv_file:
+        writer = csv.DictWriter(csv_file, fieldnames=columns)
+        writer.writeheader()
+        writer.writerows(table)
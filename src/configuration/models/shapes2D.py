@@ -37,6 +37,7 @@ from shapely.ops import unary_union
 
 import configuration.utils.constants as cst
 import configuration.utils.functions as fun
+from configuration.backup.fit_cache import fit_with_cache
 from configuration.models.initial_agents import InitialBike, InitialPedestrian
 from configuration.models.measures import AgentMeasures
 from configuration.utils.typing_custom import MaterialType, ShapeDataType, ShapeType
@@ -56,8 +57,35 @@ class Shapes2D:
     shapes: ShapeDataType = field(default_factory=dict)
 
     def __post_init__(self) -> None:
+        """Validate the shapes after initialization, unless the validation is deferred."""
+        if not fun.is_validation_deferred():
+            self.validate()
+
+    @classmethod
+    def from_trusted(cls, agent_type: cst.AgentTypes, shapes: ShapeDataType) -> "Shapes2D":
+        """
+        Create a Shapes2D instance from trusted data, without any validation.
+
+        Parameters
+        ----------
+        agent_type : AgentTypes
+            The type of the agent.
+        shapes : ShapeDataType
+            The shapes of the agent, assumed to be valid.
+
+        Returns
+        -------
+        Shapes2D
+            The created instance.
+        """
+        agent_shapes = cls.__new__(cls)
+        agent_shapes.agent_type = agent_type
+        agent_shapes.shapes = shapes
+        return agent_shapes
+
+    def validate(self) -> None:
         """
-        Validate the provided shapes and agent type after initialization.
+        Validate the provided shapes and agent type.
 
         Raises
         ------
@@ -324,16 +352,18 @@ class Shapes2D:
 
             return float(penalty_chest + penalty_shoulder_breadth)
 
-        # Optimize the scaling factors to minimize the penalty
+        # Optimize the scaling factors to minimize the penalty, unless they are in the active fit cache
         bounds = np.array([[1e-5, 3.0], [1e-5, 3.0]])
         guess_parameters = np.array([0.9, 0.9])
-        optimized_scaling = dual_annealing(
-            objectif_fun,
-            bounds=bounds,
-            maxfun=cst.NB_FUNCTION_EVALS,
-            x0=guess_parameters,
+        optimized_scale_factor_x, optimized_scale_factor_y = fit_with_cache(
+            "pedestrian2D",
+            str(sex_name),
+            (
+                float(measurements.measures[cst.PedestrianParts.chest_depth.name]),
+                float(measurements.measures[cst.PedestrianParts.bideltoid_breadth.name]),
+            ),
+            lambda: dual_annealing(objectif_fun, bounds=bounds, maxfun=cst.NB_FUNCTION_EVALS, x0=guess_parameters).x,
         )
-        optimized_scale_factor_x, optimized_scale_factor_y = optimized_scaling.x
 
         # Adjust the initial pedestrian shapes based on the optimized scaling factors
         adjusted_centers = [
@@ -444,16 +474,15 @@ class Shapes2D:
 
             return float(penalty_rider_length + penalty_bike_width + penalty_bike_length + penalty_rider_width)
 
-        # Optimize the scaling factors to minimize the penalty
+        # Optimize the scaling factors to minimize the penalty, unless they are in the active fit cache
         bounds = np.array([[1e-5, 3.0], [1e-5, 3.0], [1e-5, 3.0], [1e-5, 3.0]])
         guess_parameters = np.array([0.99, 0.99, 0.99, 0.99])
-        optimised_scaling = dual_annealing(
-            objective_fun,
-            bounds=bounds,
-            maxfun=cst.NB_FUNCTION_EVALS,
-            x0=guess_parameters,
-        )
-        opt_bike_sfx, opt_bike_sfy, opt_rider_sfx, opt_rider_sfy = optimised_scaling.x  # optimised scaling factors
+        opt_bike_sfx, opt_bike_sfy, opt_rider_sfx, opt_rider_sfy = fit_with_cache(
+            "bike2D",
+            None,
+            (float(measurements.measures[part.name]) for part in cst.BikeParts),
+            lambda: dual_annealing(objective_fun, bounds=bounds, maxfun=cst.NB_FUNCTION_EVALS, x0=guess_parameters).x,
+        )  # optimised scaling factors
 
         # Adjust the initial bike shapes based on the optimized scaling factors
         adjusted_shapes = {
@@ -530,6 +559,35 @@ class Shapes2D:
         """
         return unary_union(self.get_geometric_shapes())
 
+    def get_disks_and_rectangles(self) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """
+        Get the exact parameters of the disks and rectangles composing the agent 2D representation.
+
+        Returns
+        -------
+        tuple[NDArray[np.float64], NDArray[np.float64]]
+            An array of shape (n, 3) with the center coordinates and the radius of each disk (cm), and an array of
+            shape (m, 4, 2) with the coordinates of the four corners of each rectangle (cm).
+
+        Raises
+        ------
+        ValueError
+            If the agent 2D representation contains a shape that is neither a disk nor a rectangle.
+        """
+        disks, rectangles = [], []
+        for shape in self.shapes.values():
+            shape_object: Polygon = shape["object"]
+            coordinates = np.array(shape_object.exterior.coords)[:-1]
+            if shape["type"] == cst.ShapeTypes.disk.name:
+                # The vertices of the buffered disk lie on its circle
+                center = np.array(shape_object.centroid.coords[0])
+                disks.append([*center, np.max(np.linalg.norm(coordinates - center, axis=1))])
+            elif shape["type"] == cst.ShapeTypes.rectangle.name:
+                rectangles.append(coordinates)
+            else:
+                raise ValueError(f"Shape type '{shape['type']}' is neither a disk nor a rectangle.")
+        return np.array(disks, dtype=np.float64).reshape(-1, 3), np.array(rectangles, dtype=np.float64).reshape(-1, 4, 2)
+
     def get_area(self) -> float:
         """
         Compute the area of the agent 2D representation.
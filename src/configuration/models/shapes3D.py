@@ -26,18 +26,78 @@
 # you accept its terms.
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 import numpy as np
+import shapely
 from numpy.typing import NDArray
 from scipy.optimize import dual_annealing
 from shapely.affinity import scale
-from shapely.geometry import MultiPoint, MultiPolygon
+from shapely.geometry import MultiPolygon
 
 import configuration.utils.constants as cst
 import configuration.utils.functions as fun
+from configuration.backup.fit_cache import fit_with_cache
 from configuration.models.initial_agents import InitialPedestrian
 from configuration.models.measures import AgentMeasures
-from configuration.utils.typing_custom import ShapeDataType
+from configuration.utils.typing_custom import Sex, ShapeDataType
+
+
+@lru_cache(maxsize=1)
+def _get_lod_vertex_counts() -> tuple[int, ...]:
+    """
+    Get the number of vertices of the 3D body templates at each level of detail.
+
+    Returns
+    -------
+    tuple[int, ...]
+        For each level of `BODY3D_LODS`, the largest number of vertices of the male and female templates.
+    """
+    sexes: tuple[Sex, ...] = ("male", "female")
+    return tuple(
+        max(int(shapely.get_num_coordinates(list(InitialPedestrian(sex, lod).shapes3D.values())).sum()) for sex in sexes)
+        for lod in range(len(cst.BODY3D_LODS))
+    )
+
+
+@lru_cache(maxsize=2 * len(cst.BODY3D_LODS))
+def _get_initial_pedestrian(sex: Sex, lod: int = 0) -> InitialPedestrian:
+    """
+    Get the initial pedestrian of a sex at a level of detail, shared by all the 3D bodies built from it.
+
+    Parameters
+    ----------
+    sex : Sex
+        Biological sex of the pedestrian, either "male" or "female".
+    lod : int, optional
+        The level of detail of its 3D body, an index in `BODY3D_LODS`. Defaults to 0 (the finest).
+
+    Returns
+    -------
+    InitialPedestrian
+        The initial pedestrian, which must not be modified.
+    """
+    return InitialPedestrian(sex, lod)
+
+
+@lru_cache(maxsize=2)
+def _get_homothety_center(sex: Sex) -> NDArray[np.float64]:
+    """
+    Get the center of the scaling of the 3D body template of a sex.
+
+    Parameters
+    ----------
+    sex : Sex
+        Biological sex of the template, either "male" or "female".
+
+    Returns
+    -------
+    NDArray[np.float64]
+        The (x, y) centroid of the centroids of the slices of the finest template, in cm.
+    """
+    centroids = shapely.get_coordinates(shapely.centroid(list(_get_initial_pedestrian(sex).shapes3D.values())))
+    homothety_center: NDArray[np.float64] = centroids.mean(axis=0)
+    return homothety_center
 
 
 @dataclass
@@ -46,10 +106,97 @@ class Shapes3D:
 
     agent_type: cst.AgentTypes
     shapes: ShapeDataType = field(default_factory=dict)
+    lod: int = 0
+    #: The fitted horizontal scale factors of the pedestrian template, reused to build the body at another level of detail.
+    scale_factors: tuple[float, float] | None = field(default=None, compare=False, repr=False)
+    #: The sex, chest depth and bideltoid breadth (cm) that `scale_factors` were fitted on.
+    fitted_measures: tuple[str, float, float] | None = field(default=None, compare=False, repr=False)
 
     def __post_init__(self) -> None:
+        """Validate the shapes after initialization, unless the validation is deferred."""
+        if not fun.is_validation_deferred():
+            self.validate()
+
+    @classmethod
+    def from_trusted(
+        cls,
+        agent_type: cst.AgentTypes,
+        shapes: ShapeDataType,
+        lod: int = 0,
+        scale_factors: tuple[float, float] | None = None,
+        fitted_measures: tuple[str, float, float] | None = None,
+    ) -> "Shapes3D":
         """
-        Validate dataclass attributes after initialization.
+        Create a Shapes3D instance from trusted data, without any validation.
+
+        Parameters
+        ----------
+        agent_type : AgentTypes
+            The type of the agent.
+        shapes : ShapeDataType
+            The shapes of the agent, assumed to be valid.
+        lod : int, optional
+            The level of detail of the shapes, an index in `BODY3D_LODS`. Defaults to 0 (the finest).
+        scale_factors : tuple[float, float] | None, optional
+            The fitted scale factors of the pedestrian template, see `create_pedestrian3D`. Defaults to None.
+        fitted_measures : tuple[str, float, float] | None, optional
+            The sex, chest depth and bideltoid breadth that `scale_factors` were fitted on. Defaults to None.
+
+        Returns
+        -------
+        Shapes3D
+            The created instance.
+        """
+        agent_shapes = cls.__new__(cls)
+        agent_shapes.agent_type = agent_type
+        agent_shapes.shapes = shapes
+        agent_shapes.lod = lod
+        agent_shapes.scale_factors = scale_factors
+        agent_shapes.fitted_measures = fitted_measures
+        return agent_shapes
+
+    @staticmethod
+    def select_lod(vertices_per_agent: int | None = None, crowd_size: int | None = None) -> int:
+        """
+        Select the finest level of detail of the 3D bodies that fits in a budget of vertices.
+
+        Parameters
+        ----------
+        vertices_per_agent : int | None, optional
+            The maximal number of vertices of the 3D body of an agent.
+        crowd_size : int | None, optional
+            The number of agents of the scene, sharing the budget `BODY3D_SCENE_VERTEX_BUDGET`. Only used if
+            `vertices_per_agent` is None.
+
+        Returns
+        -------
+        int
+            The index in `BODY3D_LODS` of the finest level whose templates fit in the budget, or of the coarsest
+            level if none does. The finest level is returned if no budget is given.
+
+        Raises
+        ------
+        ValueError
+            If `vertices_per_agent` or `crowd_size` is not a positive integer.
+        """
+        if vertices_per_agent is None:
+            if crowd_size is None:
+                return 0
+            if not isinstance(crowd_size, int) or crowd_size <= 0:
+                raise ValueError("`crowd_size` should be a positive integer.")
+            vertices_per_agent = cst.BODY3D_SCENE_VERTEX_BUDGET // crowd_size
+        elif not isinstance(vertices_per_agent, int) or vertices_per_agent <= 0:
+            raise ValueError("`vertices_per_agent` should be a positive integer.")
+
+        vertex_counts = _get_lod_vertex_counts()
+        for lod, vertex_count in enumerate(vertex_counts):
+            if vertex_count <= vertices_per_agent:
+                return lod
+        return len(vertex_counts) - 1
+
+    def validate(self) -> None:
+        """
+        Validate dataclass attributes.
 
         Raises
         ------
@@ -59,6 +206,7 @@ class Shapes3D:
                 - Shapes container is not a dictionary
                 - Shape values are not Shapely MultiPolygon objects
                 - Height keys cannot be converted to float values
+                - Level of detail is not an index in `BODY3D_LODS`
         """
         # Validate the provided agent type
         if not isinstance(self.agent_type, cst.AgentTypes):
@@ -77,6 +225,10 @@ class Shapes3D:
             except ValueError:
                 raise ValueError(f"Invalid height type for '{height}': {type(height)}") from None
 
+        # Validate the provided level of detail
+        if not isinstance(self.lod, int) or not 0 <= self.lod < len(cst.BODY3D_LODS):
+            raise ValueError(f"lod should be an integer between 0 and {len(cst.BODY3D_LODS) - 1}.")
+
     def create_pedestrian3D(self, measurements: AgentMeasures) -> None:
         """
         Create a 3D representation of a pedestrian based on provided measurements.
@@ -96,11 +248,14 @@ class Shapes3D:
         - The method uses an initial pedestrian representation based on the provided sex.
         - Scaling factors are calculated for each dimension (x, y, z) based on
           the ratio of target measurements to initial measurements.
+        - The scaling factors are fitted on the finest template, then applied to the slices of the template at
+          the level of detail `lod`, so that every level represents the same body. The fitted factors are kept in
+          `scale_factors`, and the fit is skipped if they were fitted on the same measures (`fitted_measures`).
         """
         # Extract sex from measurements and create initial pedestrian object
         sex_name = measurements.measures[cst.PedestrianParts.sex.name]
         if isinstance(sex_name, str) and sex_name in ["male", "female"]:
-            initial_pedestrian = InitialPedestrian(sex_name)
+            initial_pedestrian = _get_initial_pedestrian(sex_name)
         else:
             raise ValueError(f"Invalid sex name: {sex_name}. Expected 'male' or 'female'.")
 
@@ -114,63 +269,85 @@ class Shapes3D:
         scale_factor_z = float(measurements.measures[cst.PedestrianParts.height.name]) / float(
             initial_pedestrian.measures[cst.PedestrianParts.height.name]
         )
-        reference_multipolygon = initial_pedestrian.get_reference_multipolygon()
+
+        # Fit the horizontal scale factors, unless they were already fitted on these measures for another level of detail
         wanted_chest_depth = float(measurements.measures[cst.PedestrianParts.chest_depth.name])
         wanted_bideltoid_breadth = float(measurements.measures[cst.PedestrianParts.bideltoid_breadth.name])
-
-        def objectif_fun(scaling_factor: NDArray[np.float64]) -> float:
-            """
-            Objective function to minimize the difference between the scaled bideltoid breadth and the target value.
-
-            Parameters
-            ----------
-            scaling_factor : NDArray[np.float64]
-                The scaling factor for the x, y, and z dimensions.
-
-            Returns
-            -------
-            float
-                The absolute difference between the scaled bideltoid breadth and the target value.
-            """
-            # Extract scaling factors for x, y, and z dimensions
-            scale_factor_x = scaling_factor[0]
-            scale_factor_y = scaling_factor[1]
-            homothety_center = reference_multipolygon.centroid
-            scaled_multipolygon = scale(
-                reference_multipolygon,
-                xfact=scale_factor_x,
-                yfact=scale_factor_y,
-                origin=homothety_center,
+        fitted_measures = (sex_name, wanted_chest_depth, wanted_bideltoid_breadth)
+        if self.scale_factors is None or self.fitted_measures != fitted_measures:
+            reference_multipolygon = initial_pedestrian.get_reference_multipolygon()
+
+            def objectif_fun(scaling_factor: NDArray[np.float64]) -> float:
+                """
+                Objective function to minimize the difference between the scaled bideltoid breadth and the target value.
+
+                Parameters
+                ----------
+                scaling_factor : NDArray[np.float64]
+                    The scaling factor for the x, y, and z dimensions.
+
+                Returns
+                -------
+                float
+                    The absolute difference between the scaled bideltoid breadth and the target value.
+                """
+                # Extract scaling factors for x, y, and z dimensions
+                scale_factor_x = scaling_factor[0]
+                scale_factor_y = scaling_factor[1]
+                homothety_center = reference_multipolygon.centroid
+                scaled_multipolygon = scale(
+                    reference_multipolygon,
+                    xfact=scale_factor_x,
+                    yfact=scale_factor_y,
+                    origin=homothety_center,
+                )
+                # Compute the scaled bideltoid breadth
+                scaled_bideltoid_breadth = fun.compute_bideltoid_breadth_from_multipolygon(scaled_multipolygon)
+                scaled_chest_depth = fun.compute_chest_depth_from_multipolygon(scaled_multipolygon)
+                penalty_chest: float = (scaled_chest_depth - wanted_chest_depth) ** 2
+                penalty_bideltoid: float = (scaled_bideltoid_breadth - wanted_bideltoid_breadth) ** 2
+                return float(penalty_chest + penalty_bideltoid)
+
+            # Optimize the scaling factors to minimize the penalty, unless they are in the active fit cache
+            bounds = np.array([[1e-5, 3.0], [1e-5, 3.0]])
+            guess_parameters = np.array([scale_factor_x, scale_factor_y])
+            fitted_scale_factors = fit_with_cache(
+                "pedestrian3D",
+                sex_name,
+                (wanted_chest_depth, wanted_bideltoid_breadth),
+                lambda: dual_annealing(objectif_fun, bounds=bounds, x0=guess_parameters, maxfun=cst.NB_FUNCTION_EVALS).x,
             )
-            # Compute the scaled bideltoid breadth
-            scaled_bideltoid_breadth = fun.compute_bideltoid_breadth_from_multipolygon(scaled_multipolygon)
-            scaled_chest_depth = fun.compute_chest_depth_from_multipolygon(scaled_multipolygon)
-            penalty_chest: float = (scaled_chest_depth - wanted_chest_depth) ** 2
-            penalty_bideltoid: float = (scaled_bideltoid_breadth - wanted_bideltoid_breadth) ** 2
-            return float(penalty_chest + penalty_bideltoid)
-
-        # Optimize the scaling factors to minimize the penalty
-        bounds = np.array([[1e-5, 3.0], [1e-5, 3.0]])
-        guess_parameters = np.array([scale_factor_x, scale_factor_y])
-        optimized_scaling = dual_annealing(objectif_fun, bounds=bounds, x0=guess_parameters, maxfun=cst.NB_FUNCTION_EVALS)
-        optimized_scale_factor_x, optimized_scale_factor_y = optimized_scaling.x
+            self.scale_factors = (float(fitted_scale_factors[0]), float(fitted_scale_factors[1]))
+            self.fitted_measures = fitted_measures
+        optimized_scale_factor_x, optimized_scale_factor_y = self.scale_factors
+
+        # Calculate the center point for scaling (centroid of all initial shapes)
+        homothety_center = _get_homothety_center(sex_name)
+
+        # Scale all the slices of the initial 3D representation at the wanted level of detail in one vectorised call,
+        # each with the scaling factors of its height
+        lod_shapes3D = _get_initial_pedestrian(sex_name, self.lod).shapes3D
+        heights = list(lod_shapes3D.keys())
+        multipolygons = list(lod_shapes3D.values())
+        slice_scale_factors = np.array(
+            [
+                (
+                    fun.rectangular_function(height, optimized_scale_factor_x, sex_name),
+                    fun.rectangular_function(height, optimized_scale_factor_y, sex_name),
+                )
+                for height in heights
+            ]
+        )
+        vertex_scale_factors = np.repeat(slice_scale_factors, shapely.get_num_coordinates(multipolygons), axis=0)
+        scaled_multipolygons = shapely.transform(
+            multipolygons, lambda coordinates: (coordinates - homothety_center) * vertex_scale_factors + homothety_center
+        )
 
         # Initialize dictionary to store scaled 3D shapes
         current_body3D: ShapeDataType = {}
-
-        # Calculate the center point for scaling (centroid of all initial shapes)
-        homothety_center = MultiPoint([multipolygon.centroid for multipolygon in initial_pedestrian.shapes3D.values()]).centroid
-
-        # Scale each component of the initial 3D representation
-        for height, multipolygon in initial_pedestrian.shapes3D.items():
-            scaled_multipolygon = scale(
-                multipolygon,
-                xfact=fun.rectangular_function(height, optimized_scale_factor_x, sex_name),
-                yfact=fun.rectangular_function(height, optimized_scale_factor_y, sex_name),
-                origin=homothety_center,
-            )
+        for height, scaled_multipolygon in zip(heights, scaled_multipolygons.tolist(), strict=True):
             scaled_height = height * scale_factor_z
-            current_body3D[scaled_height] = MultiPolygon(scaled_multipolygon)
+            current_body3D[scaled_height] = scaled_multipolygon
 
         # Update the shapes attribute with the new 3D representation
         self.shapes = current_body3D
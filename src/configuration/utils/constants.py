@@ -48,6 +48,32 @@ POLYGON_TOLERANCE: float = 0.04  # Size of minimum distance between two points
 DISTANCE_BTW_TARGET_KEYS_ALTITUDES: float = 2.0  # Minimum distance between two target keys
 NB_FUNCTION_EVALS: int = 80  # Number of function evaluations
 DISK_NUMBER: int = 5
+BODY3D_ARRAY_FILE_NAMES: tuple[str, ...] = (
+    "heights.npy",
+    "coordinates.npy",
+    "ring_offsets.npy",
+    "polygon_offsets.npy",
+    "multipolygon_offsets.npy",
+)  # Files of the ragged-array layout of a 3D body
+BODY3D_LODS: tuple[tuple[float, float], ...] = (
+    (DISTANCE_BTW_TARGET_KEYS_ALTITUDES, POLYGON_TOLERANCE),
+    (4.0, 0.25),
+    (8.0, 0.75),
+    (16.0, 2.0),
+)  # (Slice spacing, simplification tolerance) in cm of each level of detail of the 3D bodies, from the finest
+BODY3D_SCENE_VERTEX_BUDGET: int = 1_000_000  # Number of vertices of a whole 3D scene the levels of detail are chosen for
+ANSUR_DATA_COLUMNS: dict[str, str] = {
+    "bideltoid_breadth": "bideltoid breadth [cm]",
+    "chest_depth": "chest depth [cm]",
+    "height": "height [cm]",
+    "weight": "weight [kg]",
+}  # Columns of the ANSUR II dataset used by the models (besides the sex), by measure name
+BIKE_DATA_COLUMNS: dict[str, str] = {
+    "reach": "Reach",
+    "stack": "Stack",
+    "top_tube_length": "Top Tube Length",
+    "wheelbase": "Wheelbase",
+}  # Geometry columns (in mm) of the bike dataset, saved in cm
 
 DEFAULT_FLOOR_DAMPING: float = 2.0  # Damping coefficient for the floor
 DEFAULT_ANGULAR_DAMPING: float = 5.0  # Damping coefficient for the angular velocity
@@ -88,6 +114,16 @@ GRID_SIZE_X_BIKE: float = 200.0  # cm
 GRID_SIZE_Y_BIKE: float = 200.0  # cm
 INITIAL_TEMPERATURE: float = 1.0  # Initial temperature for the packing algorithm
 ADDITIVE_COOLING: float = 0.1  # Cooling rate for the simulated annealing algorithm T<- max(T, T - COOLING_RATE)
+PACKING_SWEEP_PARAMETERS: tuple[str, ...] = (
+    "repulsion_length",
+    "desired_direction",
+    "variable_orientation",
+    "nb_iterations",
+    "initial_temperature",
+    "additive_cooling",
+)  # Parameters of `Crowd.pack_agents_with_forces` that can be swept
+DEFAULT_CHECKPOINT_INTERVAL: int = 10  # Number of packing iterations between two checkpoints
+PACKING_CHECKPOINT_VERSION: int = 1  # Version of the binary layout of the packing checkpoints
 
 # Crowd Statistics
 DEFAULT_PEDESTRIAN_HEIGHT: float = 170.0  # cm
@@ -111,6 +147,28 @@ INITIAL_NORMAL_FORCE_X: float = 0.0  # N
 INITIAL_NORMAL_FORCE_Y: float = 0.0  # N
 INITIAL_TANGENTIAL_RELATIVE_DISPLACEMENT_X: float = 0.0  # m
 INITIAL_TANGENTIAL_RELATIVE_DISPLACEMENT_Y: float = 0.0  # m
+CIRCLE_TEST_TOLERANCE: float = 1.0e-9  # Relative tolerance of the circle tests used to find the intersecting disks
+
+# Batch generation
+GENERATION_PACKING_STRATEGIES: tuple[str, ...] = ("forces", "grid", "none")  # Packing strategies of the generation jobs
+GENERATION_OUTPUT_FORMATS: tuple[str, ...] = ("zip", "npz")  # Output formats of the generation jobs
+
+# Data preparation
+DATA_MANIFEST_FILE_NAME: str = "manifest.json"  # Manifest of the inputs, parameters and outputs of the prepared data
+DATA_MANIFEST_VERSION: int = 1  # Version of the layout of the manifest
+
+# Backup
+XML_WRITE_BUFFER_SIZE: int = 1 << 16  # Number of characters buffered by the XML writers before writing to the stream
+CROWD_ARCHIVE_VERSION: int = 1  # Version of the layout of the binary crowd archives
+CROWD_XML_FILE_NAMES: tuple[str, ...] = ("Agents.xml", "AgentDynamics.xml", "Geometry.xml", "Materials.xml")  # Files of a crowd ZIP
+ZIP_SPOOL_MAX_SIZE: int = 1 << 24  # Size in bytes above which a ZIP member serialised in a thread is spooled to disk
+TRAJECTORY_STORE_MAGIC: bytes = b"SHAPETRJ"  # First bytes of a trajectory store file
+TRAJECTORY_STORE_VERSION: int = 1  # Version of the layout of the trajectory store files
+TRAJECTORY_STORE_CHUNK_SIZE: int = 256  # Number of time steps buffered by the trajectory store writer before writing to disk
+TRAJECTORY_STORE_ALIGNMENT: int = 64  # Alignment in bytes of the first record of a trajectory store file
+FIT_CACHE_VERSION: int = 1  # Version of the layout of the cache of fitted scale factors
+FIT_CACHE_MAX_ENTRIES: int = 100_000  # Number of fitted scale factors kept in the cache before evicting the least recently used
+FIT_CACHE_QUANTUM: float = 0.1  # cm, resolution of the measures in the keys of the cache of fitted scale factors
 
 
 class BackupDataTypes(Enum):
@@ -244,6 +302,19 @@ CrowdStat = MappingProxyType(
         "bike_weight_std_dev": 5.0,  # kg
     }
 )
+PEDESTRIAN_SAMPLED_MEASURES: tuple[str, ...] = (
+    PedestrianParts.bideltoid_breadth.name,
+    PedestrianParts.chest_depth.name,
+    PedestrianParts.height.name,
+    CommonMeasures.weight.name,
+)  # Pedestrian measures drawn jointly from the crowd statistics, in the order of their correlation matrix
+BIKE_SAMPLED_MEASURES: tuple[str, ...] = (
+    BikeParts.wheel_width.name,
+    BikeParts.total_length.name,
+    BikeParts.handlebar_length.name,
+    BikeParts.top_tube_length.name,
+    CommonMeasures.weight.name,
+)  # Bike measures drawn jointly from the crowd statistics, in the order of their correlation matrix
 
 
 class MaterialNames(Enum):
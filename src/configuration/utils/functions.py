@@ -27,13 +27,17 @@
 
 import csv
 import io
+import itertools
 import pickle
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
 from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
-import pandas as pd
+import shapely
 from numpy.typing import NDArray
 from scipy.stats import truncnorm
 from shapely.geometry import MultiPolygon, Polygon
@@ -41,6 +45,45 @@ from shapely.geometry import MultiPolygon, Polygon
 import configuration.utils.constants as cst
 from configuration.utils.typing_custom import Sex
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Whether the validation of the models (and the crowd statistics) is currently deferred, see `deferred_validation`
+_validation_deferred: ContextVar[bool] = ContextVar("validation_deferred", default=False)
+
+
+@contextmanager
+def deferred_validation() -> Iterator[None]:
+    """
+    Defer the validation of the models created or updated within the block.
+
+    Inside the block, `AgentMeasures`, `Shapes2D` and `Shapes3D` skip their validation at initialization, and `Crowd`
+    skips the type checks of its agents and postpones the computation of its statistics until they are needed. It
+    is meant for bulk operations on trusted data; call the `validate()` methods once at the end if needed.
+
+    Yields
+    ------
+    None
+        Control is given back to the block with the validation deferred.
+    """
+    token = _validation_deferred.set(True)
+    try:
+        yield
+    finally:
+        _validation_deferred.reset(token)
+
+
+def is_validation_deferred() -> bool:
+    """
+    Check whether the validation of the models is currently deferred.
+
+    Returns
+    -------
+    bool
+        True inside a `deferred_validation()` block, False otherwise.
+    """
+    return _validation_deferred.get()
+
 
 @lru_cache(maxsize=4)
 def load_pickle(file_path: str) -> Any:
@@ -100,7 +143,200 @@ def save_pickle(data: Any, file_path: Path) -> None:
         pickle.dump(data, f)
 
 
-def load_csv(filename: Path) -> pd.DataFrame:
+def save_ragged_multipolygons(shapes: dict[float, MultiPolygon], dir_path: Path) -> None:
+    """
+    Save a 3D body (MultiPolygons indexed by height) as flat NumPy arrays in a directory.
+
+    The layout is the ragged-array encoding of shapely: the sorted heights, the `(n, 2)` array of all the
+    coordinates, and the offsets delimiting the rings, the polygons and the multipolygons in it. Each array is
+    stored in its own `.npy` file so that it can be memory-mapped.
+
+    Parameters
+    ----------
+    shapes : dict[float, MultiPolygon]
+        The MultiPolygons of the body, indexed by height.
+    dir_path : Path
+        The directory where the arrays are saved. It is created if needed.
+
+    Raises
+    ------
+    TypeError
+        If `dir_path` is not a `Path` object.
+    """
+    if not isinstance(dir_path, Path):
+        raise TypeError("dir_path must be a Path object.")
+    heights = sorted(shapes.keys())
+    _, coordinates, (ring_offsets, polygon_offsets, multipolygon_offsets) = shapely.to_ragged_array(
+        [shapes[height] for height in heights]
+    )
+    dir_path.mkdir(parents=True, exist_ok=True)
+    arrays = (np.asarray(heights, dtype=np.float64), coordinates, ring_offsets, polygon_offsets, multipolygon_offsets)
+    for file_name, array in zip(cst.BODY3D_ARRAY_FILE_NAMES, arrays, strict=True):
+        np.save(dir_path / file_name, np.ascontiguousarray(array))
+
+
+@lru_cache(maxsize=4)
+def load_ragged_multipolygons(dir_path: str) -> dict[float, MultiPolygon]:
+    """
+    Load a 3D body saved by `save_ragged_multipolygons`.
+
+    The arrays are memory-mapped, so their pages are shared between the processes loading the same body, and the
+    MultiPolygons are created in a single vectorised call.
+
+    Parameters
+    ----------
+    dir_path : str
+        The directory containing the arrays.
+
+    Returns
+    -------
+    dict[float, MultiPolygon]
+        The MultiPolygons of the body, indexed by height.
+
+    Raises
+    ------
+    TypeError
+        If `dir_path` is not a string.
+    FileNotFoundError
+        If one of the arrays does not exist.
+    """
+    if not isinstance(dir_path, str):
+        raise TypeError("dir_path must be a string.")
+    file_paths = [Path(dir_path) / file_name for file_name in cst.BODY3D_ARRAY_FILE_NAMES]
+    for file_path in file_paths:
+        if not file_path.exists():
+            raise FileNotFoundError(f"The file {file_path} does not exist.")
+    heights, coordinates, *offsets = (np.load(file_path, mmap_mode="r") for file_path in file_paths)
+    multipolygons = shapely.from_ragged_array(shapely.GeometryType.MULTIPOLYGON, coordinates, tuple(offsets))
+    return dict(zip(heights.tolist(), multipolygons.tolist(), strict=True))
+
+
+def get_3D_body_name(sex: str, lod: int = 0) -> str:
+    """
+    Get the name of the data files of a 3D body template at a given level of detail.
+
+    Parameters
+    ----------
+    sex : str
+        The sex of the body, "male" or "female".
+    lod : int, optional
+        The level of detail, an index in `BODY3D_LODS`. Defaults to 0 (the finest).
+
+    Returns
+    -------
+    str
+        The name, without extension, of the pickle file or of the arrays directory of the body.
+    """
+    return f"{sex}_3dBody_light" if lod == 0 else f"{sex}_3dBody_lod{lod}"
+
+
+def compute_3D_body_lod(
+    shapes3D: dict[float, MultiPolygon], slice_spacing: float, tolerance: float, keep_highest_slice: bool = True
+) -> dict[float, MultiPolygon]:
+    """
+    Reduce a 3D body to one slice per bin of altitude and simplify the polygons of each slice.
+
+    The lowest slice nearest to each bin of `slice_spacing` cm is kept, as well as the highest slice if
+    `keep_highest_slice` is True so that the height of the body is preserved, and each polygon is simplified with
+    the Douglas-Peucker algorithm.
+
+    Parameters
+    ----------
+    shapes3D : dict[float, MultiPolygon]
+        The MultiPolygons of the body, indexed by height.
+    slice_spacing : float
+        The size of the bins of altitude, in cm.
+    tolerance : float
+        The tolerance of the simplification, in cm.
+    keep_highest_slice : bool, optional
+        Whether the highest slice is kept even if its bin already has a slice. Defaults to True. The light body
+        (the finest level) is built with False.
+
+    Returns
+    -------
+    dict[float, MultiPolygon]
+        The kept MultiPolygons, simplified and indexed by increasing height.
+    """
+    heights = sorted(shapes3D.keys(), key=float)
+    if not heights:
+        return {}
+
+    target_heights = np.arange(0.0, float(heights[-1]) + 1, slice_spacing)
+    used_bins: set[int] = set()
+    lod_shapes3D: dict[float, MultiPolygon] = {}
+    for height in heights:
+        bin_idx = int(np.argmin(np.abs(target_heights - float(height))))
+        if bin_idx not in used_bins or (keep_highest_slice and height == heights[-1]):
+            lod_shapes3D[float(height)] = MultiPolygon(
+                [geom.simplify(tolerance=tolerance, preserve_topology=True) for geom in shapes3D[height].geoms]
+            )
+            used_bins.add(bin_idx)
+    return lod_shapes3D
+
+
+def save_columns(columns: dict[str, NDArray[Any]], dir_path: Path) -> None:
+    """
+    Save typed columns of a dataset as one `.npy` file per column in a directory.
+
+    Parameters
+    ----------
+    columns : dict[str, NDArray[Any]]
+        The columns of the dataset, indexed by name. They all have the same length.
+    dir_path : Path
+        The directory where the columns are saved. It is created if needed, and the columns it holds that are
+        not in `columns` are removed.
+
+    Raises
+    ------
+    TypeError
+        If `dir_path` is not a `Path` object.
+    ValueError
+        If the columns do not have the same length.
+    """
+    if not isinstance(dir_path, Path):
+        raise TypeError("dir_path must be a Path object.")
+    if len({len(column) for column in columns.values()}) > 1:
+        raise ValueError("All the columns should have the same length.")
+    dir_path.mkdir(parents=True, exist_ok=True)
+    for file_path in dir_path.glob("*.npy"):
+        if file_path.stem not in columns:
+            file_path.unlink()
+    for name, column in columns.items():
+        np.save(dir_path / f"{name}.npy", np.ascontiguousarray(column))
+
+
+@lru_cache(maxsize=4)
+def load_columns(dir_path: str) -> dict[str, NDArray[Any]]:
+    """
+    Load the typed columns of a dataset saved by `save_columns`, without pandas.
+
+    The columns are memory-mapped, so their pages are shared between the processes loading the same dataset.
+
+    Parameters
+    ----------
+    dir_path : str
+        The directory containing the columns.
+
+    Returns
+    -------
+    dict[str, NDArray[Any]]
+        The read-only columns of the dataset, indexed by name.
+
+    Raises
+    ------
+    TypeError
+        If `dir_path` is not a string.
+    FileNotFoundError
+        If the directory does not exist.
+    """
+    if not isinstance(dir_path, str):
+        raise TypeError("dir_path must be a string.")
+    if not Path(dir_path).is_dir():
+        raise FileNotFoundError(f"The directory {dir_path} does not exist.")
+    return {file_path.stem: np.load(file_path, mmap_mode="r") for file_path in sorted(Path(dir_path).glob("*.npy"))}
+
+
+def load_csv(filename: Path) -> "pd.DataFrame":
     """
     Load data from a CSV file into a pandas DataFrame.
 
@@ -129,6 +365,8 @@ def load_csv(filename: Path) -> pd.DataFrame:
         raise FileNotFoundError(f"The file {filename} does not exist.")
     if not filename.suffix == ".csv":
         raise ValueError(f"The file {filename} is not a CSV file.")
+    import pandas as pd  # pylint: disable=import-outside-toplevel
+
     return pd.read_csv(filename)
 
 
@@ -298,50 +536,417 @@ def compute_moment_of_inertia(geometric_shape: Polygon | MultiPolygon, weight: f
     -----
     For the MultiPolygon case, it computes the moment of inertia for each polygon and sums them up, weighted by their respective areas.
     """
+    return float(compute_moments_of_inertia([geometric_shape], [weight])[0])
+
+
+def compute_moments_of_inertia(
+    geometric_shapes: Sequence[Polygon | MultiPolygon], weights: Sequence[float] | NDArray[np.float64]
+) -> NDArray[np.float64]:
+    """
+    Compute the moments of inertia of a batch of 2D Polygons or MultiPolygons at once.
+
+    The second moments of area of all the polygons are obtained with a single vectorised shoelace sum over the
+    coordinates of their rings (exteriors oriented counter-clockwise, holes clockwise). Each polygon is considered
+    about its own centroid, and the weight of a MultiPolygon is split between its polygons according to their area.
+
+    Parameters
+    ----------
+    geometric_shapes : Sequence[Polygon | MultiPolygon]
+        The geometrical representations as shapely Polygon or MultiPolygon objects (cm).
+    weights : Sequence[float] | NDArray[np.float64]
+        The weight (kg) associated with each geometrical representation.
+
+    Returns
+    -------
+    NDArray[np.float64]
+        The moment of inertia (kg·m²) of each geometrical representation.
+
+    Raises
+    ------
+    TypeError
+        If one of the geometrical representations is not a Shapely Polygon or MultiPolygon.
+    ValueError
+        If the number of weights differs from the number of geometrical representations.
+    """
+    if not all(isinstance(geometric_shape, (Polygon, MultiPolygon)) for geometric_shape in geometric_shapes):
+        raise TypeError("Input must be a Shapely Polygon or MultiPolygon.")
+    shape_weights = np.asarray(weights, dtype=np.float64)
+    if shape_weights.shape != (len(geometric_shapes),):
+        raise ValueError("There should be exactly one weight per geometrical representation.")
+
+    # Split the MultiPolygons into polygons and share the weights according to the areas
+    polygons, shape_index = shapely.get_parts(np.asarray(geometric_shapes, dtype=object), return_index=True)
+    polygons = shapely.orient_polygons(polygons)
+    polygon_areas = shapely.area(polygons)
+    polygon_weights = (
+        shape_weights[shape_index] * polygon_areas / shapely.area(np.asarray(geometric_shapes, dtype=object))[shape_index]
+    )
+
+    # Shoelace sums over the edges of every ring, each polygon being shifted to its centroid
+    rings, ring_polygon_index = shapely.get_rings(polygons, return_index=True)
+    coordinates, coordinate_ring_index = shapely.get_coordinates(rings, return_index=True)
+    coordinate_polygon_index = ring_polygon_index[coordinate_ring_index]
+    coordinates = coordinates - shapely.get_coordinates(shapely.centroid(polygons))[coordinate_polygon_index]
+    Pn, Pn1 = coordinates[:-1], coordinates[1:]
+    is_edge = coordinate_ring_index[:-1] == coordinate_ring_index[1:]
+    cross_products = Pn[:, 0] * Pn1[:, 1] - Pn1[:, 0] * Pn[:, 1]
+    dot_product_terms = np.einsum("ij,ij->i", Pn, Pn) + np.einsum("ij,ij->i", Pn, Pn1) + np.einsum("ij,ij->i", Pn1, Pn1)
+    second_moments = np.bincount(
+        coordinate_polygon_index[:-1][is_edge], weights=(cross_products * dot_product_terms)[is_edge], minlength=len(polygons)
+    )
+
+    rho = polygon_weights / polygon_areas  # Density (mass per unit area)
+    polygon_moments = rho * second_moments / 12.0 * 1e-4  # convert to kg·m^2
+    return np.bincount(shape_index, weights=polygon_moments, minlength=len(geometric_shapes)).astype(np.float64)
+
+
+def _arc_area_moments(center: NDArray[np.float64], radius: float, start_angle: float, end_angle: float) -> NDArray[np.float64]:
+    """
+    Compute the contribution of a counter-clockwise circular arc to the area moments of the region it bounds.
+
+    The area moments are obtained from Green's theorem as line integrals along the boundary of the region.
+
+    Parameters
+    ----------
+    center : NDArray[np.float64]
+        Center of the circle (cm).
+    radius : float
+        Radius of the circle (cm).
+    start_angle : float
+        Angle at which the arc starts (radians).
+    end_angle : float
+        Angle at which the arc ends (radians), greater than `start_angle`.
+
+    Returns
+    -------
+    NDArray[np.float64]
+        The contributions to the area, to the first moments ∫x dA and ∫y dA, and to the second moments ∫x² dA and ∫y² dA.
+    """
+    cx, cy = center
+    r = radius
+
+    def antiderivatives(theta: float) -> NDArray[np.float64]:
+        sin, cos = np.sin(theta), np.cos(theta)
+        int_cos2 = theta / 2.0 + np.sin(2.0 * theta) / 4.0
+        int_sin2 = theta / 2.0 - np.sin(2.0 * theta) / 4.0
+        int_cos3 = sin - sin**3 / 3.0
+        int_sin3 = -cos + cos**3 / 3.0
+        int_cos4 = 3.0 * theta / 8.0 + np.sin(2.0 * theta) / 4.0 + np.sin(4.0 * theta) / 32.0
+        int_sin4 = 3.0 * theta / 8.0 - np.sin(2.0 * theta) / 4.0 + np.sin(4.0 * theta) / 32.0
+        return np.array(
+            [
+                r * cx * sin + r**2 * int_cos2,
+                r * (cx**2 * sin + 2.0 * cx * r * int_cos2 + r**2 * int_cos3) / 2.0,
+                r * (-(cy**2) * cos + 2.0 * cy * r * int_sin2 + r**2 * int_sin3) / 2.0,
+                r * (cx**3 * sin + 3.0 * cx**2 * r * int_cos2 + 3.0 * cx * r**2 * int_cos3 + r**3 * int_cos4) / 3.0,
+                r * (-(cy**3) * cos + 3.0 * cy**2 * r * int_sin2 + 3.0 * cy * r**2 * int_sin3 + r**3 * int_sin4) / 3.0,
+            ]
+        )
+
+    arc_moments: NDArray[np.float64] = antiderivatives(end_angle) - antiderivatives(start_angle)
+    return arc_moments
+
+
+def _segment_area_moments(start_point: NDArray[np.float64], end_point: NDArray[np.float64]) -> NDArray[np.float64]:
+    """
+    Compute the contribution of an oriented segment to the area moments of the region it bounds.
+
+    Parameters
+    ----------
+    start_point : NDArray[np.float64]
+        First point of the segment (cm).
+    end_point : NDArray[np.float64]
+        Last point of the segment (cm).
+
+    Returns
+    -------
+    NDArray[np.float64]
+        The contributions to the area, to the first moments ∫x dA and ∫y dA, and to the second moments ∫x² dA and ∫y² dA.
+    """
+    (x0, y0), (x1, y1) = start_point, end_point
+    dx, dy = x1 - x0, y1 - y0
+    return np.array(
+        [
+            dy * (x0 + x1) / 2.0,
+            dy * (x0**2 + x0 * x1 + x1**2) / 6.0,
+            -dx * (y0**2 + y0 * y1 + y1**2) / 6.0,
+            dy * (x0 + x1) * (x0**2 + x1**2) / 12.0,
+            -dx * (y0 + y1) * (y0**2 + y1**2) / 12.0,
+        ]
+    )
+
+
+def _circle_circle_intersections(
+    center1: NDArray[np.float64], radius1: float, center2: NDArray[np.float64], radius2: float
+) -> NDArray[np.float64]:
+    """
+    Compute the intersection points of two circles.
+
+    Parameters
+    ----------
+    center1 : NDArray[np.float64]
+        Center of the first circle.
+    radius1 : float
+        Radius of the first circle.
+    center2 : NDArray[np.float64]
+        Center of the second circle.
+    radius2 : float
+        Radius of the second circle.
+
+    Returns
+    -------
+    NDArray[np.float64]
+        Array of shape (k, 2) with the k intersection points (k in {0, 2}).
+    """
+    delta = center2 - center1
+    distance = float(np.hypot(*delta))
+    if distance == 0.0 or distance >= radius1 + radius2 or distance <= abs(radius1 - radius2):
+        return np.empty((0, 2))
+    direction = np.arctan2(delta[1], delta[0])
+    half_opening = np.arccos((radius1**2 + distance**2 - radius2**2) / (2.0 * radius1 * distance))
+    angles = np.array([direction - half_opening, direction + half_opening])
+    return center1 + radius1 * np.column_stack((np.cos(angles), np.sin(angles)))
+
+
+def _circle_segment_intersections(
+    center: NDArray[np.float64], radius: float, start_point: NDArray[np.float64], end_point: NDArray[np.float64]
+) -> NDArray[np.float64]:
+    """
+    Compute the intersection points of a circle and a segment.
+
+    Parameters
+    ----------
+    center : NDArray[np.float64]
+        Center of the circle.
+    radius : float
+        Radius of the circle.
+    start_point : NDArray[np.float64]
+        First point of the segment.
+    end_point : NDArray[np.float64]
+        Last point of the segment.
+
+    Returns
+    -------
+    NDArray[np.float64]
+        Array of shape (k, 2) with the k intersection points (k in {0, 1, 2}).
+    """
+    direction = end_point - start_point
+    offset = start_point - center
+    a = float(direction @ direction)
+    b = 2.0 * float(direction @ offset)
+    c = float(offset @ offset) - radius**2
+    discriminant = b**2 - 4.0 * a * c
+    if a == 0.0 or discriminant < 0.0:
+        return np.empty((0, 2))
+    roots = (-b + np.array([-1.0, 1.0]) * np.sqrt(discriminant)) / (2.0 * a)
+    roots = roots[(roots >= 0.0) & (roots <= 1.0)]
+    intersections: NDArray[np.float64] = start_point + roots[:, np.newaxis] * direction
+    return intersections
+
+
+def _segment_segment_intersections(
+    start_point1: NDArray[np.float64],
+    end_point1: NDArray[np.float64],
+    start_point2: NDArray[np.float64],
+    end_point2: NDArray[np.float64],
+) -> NDArray[np.float64]:
+    """
+    Compute the intersection point of two segments, parallel segments being considered as not intersecting.
 
-    def polygon_inertia(polygon: Polygon, poly_weight: float) -> float:
-        """
-        Compute the moment of inertia for a 2D Polygon.
-
-        Parameters
-        ----------
-        polygon : Polygon
-            The geometrical representation as a Polygon object (cm).
-        poly_weight : float
-            The agent weight (kg).
-
-        Returns
-        -------
-        float
-            The moment of inertia of the polygon (kg·m²).
-        """
-        vertices = np.array(polygon.exterior.coords)
-        centroid = np.array(polygon.centroid.coords[0])
-        vertices = vertices - centroid  # Shift to centroid
-        N = len(vertices) - 1  # Last point repeats the first
-        rho = poly_weight / polygon.area  # Density (mass per unit area)
-        I_z = 0.0
-        for n in range(N):
-            Pn = np.array(vertices[n])
-            Pn1 = np.array(vertices[(n + 1) % N])
-            cross_product_magnitude = abs(cross2d(Pn, Pn1))
-            dot_product_terms = np.dot(Pn, Pn) + np.dot(Pn, Pn1) + np.dot(Pn1, Pn1)
-            I_z += cross_product_magnitude * dot_product_terms
-        moment_of_inertia: float = rho * I_z / 12.0
-        moment_of_inertia *= 1e-4  # convert to kg·m^2
-        return moment_of_inertia
-
-    if isinstance(geometric_shape, Polygon):
-        return polygon_inertia(geometric_shape, weight)
-    if isinstance(geometric_shape, MultiPolygon):
-        total_area = geometric_shape.area
-        moment = 0.0
-        for poly in geometric_shape.geoms:
-            poly_area = poly.area
-            poly_weight = weight * (poly_area / total_area)
-            moment += polygon_inertia(poly, poly_weight)
-        return moment
-    raise TypeError("Input must be a Shapely Polygon or MultiPolygon.")
+    Parameters
+    ----------
+    start_point1 : NDArray[np.float64]
+        First point of the first segment.
+    end_point1 : NDArray[np.float64]
+        Last point of the first segment.
+    start_point2 : NDArray[np.float64]
+        First point of the second segment.
+    end_point2 : NDArray[np.float64]
+        Last point of the second segment.
+
+    Returns
+    -------
+    NDArray[np.float64]
+        Array of shape (k, 2) with the k intersection points (k in {0, 1}).
+    """
+    direction1 = end_point1 - start_point1
+    direction2 = end_point2 - start_point2
+    denominator = cross2d(direction1, direction2)
+    if denominator == 0.0:
+        return np.empty((0, 2))
+    offset = start_point2 - start_point1
+    t1 = cross2d(offset, direction2) / denominator
+    t2 = cross2d(offset, direction1) / denominator
+    if not (0.0 <= t1 <= 1.0 and 0.0 <= t2 <= 1.0):
+        return np.empty((0, 2))
+    return (start_point1 + t1 * direction1)[np.newaxis, :]
+
+
+def _primitive_signed_distance(
+    point: NDArray[np.float64], owner: int, disks: NDArray[np.float64], rectangles: NDArray[np.float64]
+) -> tuple[float, NDArray[np.float64]]:
+    """
+    Compute the signed distance from a point to the boundary of a disk or of a counter-clockwise rectangle.
+
+    Parameters
+    ----------
+    point : NDArray[np.float64]
+        The point to locate.
+    owner : int
+        Index of the primitive: the disks come first, followed by the rectangles.
+    disks : NDArray[np.float64]
+        Array of shape (n, 3) with the center and the radius of each disk.
+    rectangles : NDArray[np.float64]
+        Array of shape (m, 4, 2) with the counter-clockwise corners of each rectangle.
+
+    Returns
+    -------
+    tuple[float, NDArray[np.float64]]
+        The signed distance (negative inside the primitive) and the outward normal of the closest part of its boundary.
+    """
+    if owner < len(disks):
+        offset = point - disks[owner, :2]
+        distance = float(np.hypot(*offset))
+        normal = offset / distance if distance > 0.0 else np.array([1.0, 0.0])
+        return distance - float(disks[owner, 2]), normal
+    corners = rectangles[owner - len(disks)]
+    directions = np.roll(corners, -1, axis=0) - corners
+    normals = np.column_stack((directions[:, 1], -directions[:, 0])) / np.hypot(directions[:, 0], directions[:, 1])[:, np.newaxis]
+    distances = np.einsum("ij,ij->i", normals, point - corners)
+    closest_edge = int(np.argmax(distances))
+    return float(distances[closest_edge]), normals[closest_edge]
+
+
+def _is_boundary_point_covered(
+    point: NDArray[np.float64],
+    normal: NDArray[np.float64],
+    owner: int,
+    disks: NDArray[np.float64],
+    rectangles: NDArray[np.float64],
+    tolerance: float,
+) -> bool:
+    """
+    Check whether a point of the boundary of a primitive lies inside the union of the other primitives.
+
+    Parameters
+    ----------
+    point : NDArray[np.float64]
+        The boundary point.
+    normal : NDArray[np.float64]
+        The outward normal of the boundary of the primitive at this point.
+    owner : int
+        Index of the primitive the point belongs to: the disks come first, followed by the rectangles.
+    disks : NDArray[np.float64]
+        Array of shape (n, 3) with the center and the radius of each disk.
+    rectangles : NDArray[np.float64]
+        Array of shape (m, 4, 2) with the counter-clockwise corners of each rectangle.
+    tolerance : float
+        Distance under which a point is considered to lie on the boundary of another primitive.
+
+    Returns
+    -------
+    bool
+        True if the point is covered, in which case it does not belong to the boundary of the union.
+    """
+    for other in range(len(disks) + len(rectangles)):
+        if other == owner:
+            continue
+        distance, other_normal = _primitive_signed_distance(point, other, disks, rectangles)
+        if distance < -tolerance:
+            return True
+        # Boundaries shared with the same orientation are only kept once
+        if abs(distance) <= tolerance and other < owner and float(normal @ other_normal) > 0.0:
+            return True
+    return False
+
+
+def compute_moment_of_inertia_of_disks_and_rectangles(
+    disks: NDArray[np.float64], rectangles: NDArray[np.float64], weight: float
+) -> float:
+    """
+    Compute the exact moment of inertia of a union of disks and rectangles about its centroid.
+
+    Unlike `compute_moment_of_inertia`, the disks are not approximated by polygons and their overlaps are handled
+    exactly: the boundary of the union is made of the arcs and edges of the primitives that are not covered by any
+    other primitive, and the area moments are obtained analytically from Green's theorem along this boundary.
+
+    Parameters
+    ----------
+    disks : NDArray[np.float64]
+        Array of shape (n, 3) with the x and y coordinates of the center and the radius of each disk (cm).
+    rectangles : NDArray[np.float64]
+        Array of shape (m, 4, 2) with the coordinates of the four consecutive corners of each rectangle (cm).
+    weight : float
+        The agent weight (kg), uniformly distributed over the union.
+
+    Returns
+    -------
+    float
+        The moment of inertia of the union about its centroid (kg·m²).
+
+    Raises
+    ------
+    ValueError
+        If the arrays do not have the expected shapes, or if the union is empty.
+    """
+    disks = np.asarray(disks, dtype=np.float64).reshape(-1, 3)
+    rectangles = np.asarray(rectangles, dtype=np.float64).reshape(-1, 4, 2)
+    if np.any(disks[:, 2] <= 0.0):
+        raise ValueError("The radius of every disk should be strictly positive.")
+
+    # Orient the corners of every rectangle counter-clockwise
+    signed_areas = np.sum(rectangles[:, :, 0] * np.roll(rectangles[:, :, 1], -1, axis=1), axis=1) - np.sum(
+        np.roll(rectangles[:, :, 0], -1, axis=1) * rectangles[:, :, 1], axis=1
+    )
+    rectangles = np.where((signed_areas < 0.0)[:, np.newaxis, np.newaxis], rectangles[:, ::-1], rectangles)
+    edges: list[tuple[int, NDArray[np.float64], NDArray[np.float64]]] = [
+        (len(disks) + i_rectangle, rectangles[i_rectangle, k], rectangles[i_rectangle, (k + 1) % 4])
+        for i_rectangle in range(len(rectangles))
+        for k in range(4)
+    ]
+    extent = max(float(np.max(np.abs(disks[:, :2]) + disks[:, 2:3], initial=0.0)), float(np.max(np.abs(rectangles), initial=0.0)))
+    tolerance = 1e-9 * max(extent, 1.0)
+
+    moments = np.zeros(5)
+    for i_disk, (cx, cy, radius) in enumerate(disks):
+        center = np.array([cx, cy])
+        crossings = [_circle_circle_intersections(center, radius, other[:2], other[2]) for j, other in enumerate(disks) if j != i_disk]
+        crossings += [_circle_segment_intersections(center, radius, start, end) for _, start, end in edges]
+        crossing_points = np.concatenate([np.empty((0, 2)), *crossings])
+        angles = np.sort(np.mod(np.arctan2(crossing_points[:, 1] - cy, crossing_points[:, 0] - cx), 2.0 * np.pi))
+        if len(angles) == 0:
+            angles = np.array([0.0])
+        for start_angle, end_angle in zip(angles, np.append(angles[1:], angles[0] + 2.0 * np.pi), strict=True):
+            middle_angle = (start_angle + end_angle) / 2.0
+            normal = np.array([np.cos(middle_angle), np.sin(middle_angle)])
+            if end_angle - start_angle > 0.0 and not _is_boundary_point_covered(
+                center + radius * normal, normal, i_disk, disks, rectangles, tolerance
+            ):
+                moments += _arc_area_moments(center, radius, start_angle, end_angle)
+
+    for owner, start, end in edges:
+        direction = end - start
+        crossings = [_circle_segment_intersections(disk[:2], disk[2], start, end) for disk in disks]
+        crossings += [
+            _segment_segment_intersections(start, end, other_start, other_end)
+            for other, other_start, other_end in edges
+            if other != owner
+        ]
+        crossing_points = np.concatenate([np.empty((0, 2)), *crossings])
+        parameters = np.unique(
+            np.clip(np.concatenate(([0.0, 1.0], (crossing_points - start) @ direction / (direction @ direction))), 0.0, 1.0)
+        )
+        normal = np.array([direction[1], -direction[0]]) / np.hypot(*direction)
+        for start_parameter, end_parameter in itertools.pairwise(parameters):
+            middle_point = start + (start_parameter + end_parameter) / 2.0 * direction
+            if not _is_boundary_point_covered(middle_point, normal, owner, disks, rectangles, tolerance):
+                moments += _segment_area_moments(start + start_parameter * direction, start + end_parameter * direction)
+
+    area, first_moment_x, first_moment_y, second_moment_x, second_moment_y = moments
+    if area <= 0.0:
+        raise ValueError("The union of the disks and rectangles should have a strictly positive area.")
+    polar_moment_about_centroid = second_moment_x + second_moment_y - (first_moment_x**2 + first_moment_y**2) / area
+    return float(weight / area * polar_moment_about_centroid * 1e-4)  # convert to kg·m^2
 
 
 def validate_material(material: str) -> None:
@@ -385,6 +990,158 @@ def rotate_vectors(vector_dict: dict[str, tuple[float, float]], theta: float) ->
     return rotated_dict
 
 
+def _compute_largest_extents_within_bands(
+    coordinates: NDArray[np.float64], group_index: NDArray[np.intp], number_groups: int, band_axis: int, tolerance: float
+) -> NDArray[np.float64]:
+    """
+    Compute, for each group of points, the largest distance along one axis between points lying in a same narrow band.
+
+    For each point, the band contains the points that follow it in the order of the band coordinate (within its
+    group) and whose band coordinate exceeds its own by at most `tolerance`. The extreme coordinates of every band
+    are obtained with range minimum/maximum queries on a sparse table, which gives exactly the same result as
+    comparing every pair of points of the band.
+
+    Parameters
+    ----------
+    coordinates : NDArray[np.float64]
+        Array of shape (n, 2) with the coordinates of all the points.
+    group_index : NDArray[np.intp]
+        Array of shape (n,) with the index of the group of each point.
+    number_groups : int
+        The number of groups.
+    band_axis : int
+        The axis (0 for x, 1 for y) along which the bands are defined; the distances are measured along the other axis.
+    tolerance : float
+        The width of the bands.
+
+    Returns
+    -------
+    NDArray[np.float64]
+        The largest distance within a band for each group (0.0 for groups without points).
+    """
+    largest_extents = np.zeros(number_groups, dtype=np.float64)
+    number_points = len(coordinates)
+    if number_points == 0:
+        return largest_extents
+
+    # Sort the points by group, then by band coordinate
+    order = np.lexsort((coordinates[:, band_axis], group_index))
+    band_values = coordinates[order, band_axis]
+    measured_values = coordinates[order, 1 - band_axis]
+    sorted_groups = group_index[order]
+    group_bounds = np.searchsorted(sorted_groups, np.arange(number_groups + 1))
+    group_ends = group_bounds[sorted_groups + 1]
+
+    # The band of each point ends at the first following point of its group that is farther than the tolerance
+    starts = np.arange(number_points)
+    ends = np.empty(number_points, dtype=np.intp)
+    for group_start, group_end in itertools.pairwise(group_bounds):
+        group_values = band_values[group_start:group_end]
+        ends[group_start:group_end] = group_start + np.searchsorted(group_values, group_values + tolerance, side="right")
+    ends = np.maximum(ends, starts + 1)
+    while True:  # Exactly reproduce the test |y_j - y_i| <= tolerance despite rounding errors
+        to_extend = (ends < group_ends) & (band_values[np.minimum(ends, number_points - 1)] - band_values <= tolerance)
+        if not to_extend.any():
+            break
+        ends += to_extend
+    while True:
+        to_shrink = (ends > starts + 1) & (band_values[ends - 1] - band_values > tolerance)
+        if not to_shrink.any():
+            break
+        ends -= to_shrink
+
+    # Sparse tables of the minimum and maximum over ranges of length 2^k
+    maxima, minima = [measured_values], [measured_values]
+    length = 1
+    while 2 * length <= number_points:
+        maxima.append(np.maximum(maxima[-1][:-length], maxima[-1][length:]))
+        minima.append(np.minimum(minima[-1][:-length], minima[-1][length:]))
+        length *= 2
+    levels = np.floor(np.log2(ends - starts)).astype(np.intp)
+    band_maxima = np.empty(number_points)
+    band_minima = np.empty(number_points)
+    for level in np.unique(levels):
+        selected = levels == level
+        first, last = starts[selected], ends[selected] - (1 << level)
+        band_maxima[selected] = np.maximum(maxima[level][first], maxima[level][last])
+        band_minima[selected] = np.minimum(minima[level][first], minima[level][last])
+
+    distances = np.maximum(band_maxima - measured_values, measured_values - band_minima)
+    np.maximum.at(largest_extents, sorted_groups, distances)
+    return largest_extents
+
+
+def _get_centered_coordinates(multi_polygons: Sequence[MultiPolygon]) -> tuple[NDArray[np.float64], NDArray[np.intp]]:
+    """
+    Get the boundary coordinates of a batch of MultiPolygons, each of them being shifted to its centroid.
+
+    Parameters
+    ----------
+    multi_polygons : Sequence[MultiPolygon]
+        The MultiPolygon objects.
+
+    Returns
+    -------
+    tuple[NDArray[np.float64], NDArray[np.intp]]
+        The array of shape (n, 2) with the coordinates of all the points, and the index of the MultiPolygon each point belongs to.
+
+    Raises
+    ------
+    ValueError
+        If one of the inputs is not a MultiPolygon.
+    """
+    if not all(isinstance(multi_polygon, MultiPolygon) for multi_polygon in multi_polygons):
+        raise ValueError("Input must be a Shapely MultiPolygon object.")
+    geometries = np.asarray(multi_polygons, dtype=object)
+    coordinates, group_index = shapely.get_coordinates(geometries, return_index=True)
+    centroids = shapely.get_coordinates(shapely.centroid(geometries))
+    return coordinates - centroids[group_index], group_index
+
+
+def compute_bideltoid_breadths_from_multipolygons(multi_polygons: Sequence[MultiPolygon]) -> NDArray[np.float64]:
+    """
+    Compute the bideltoid breadth of a batch of MultiPolygon objects at once.
+
+    Parameters
+    ----------
+    multi_polygons : Sequence[MultiPolygon]
+        The MultiPolygon objects.
+
+    Returns
+    -------
+    NDArray[np.float64]
+        The largest horizontal distance (bideltoid breadth) of each MultiPolygon.
+
+    Notes
+    -----
+    Only pairs of points whose y-coordinates differ by at most 0.1 are considered, as in `compute_bideltoid_breadth_from_multipolygon`.
+    """
+    coordinates, group_index = _get_centered_coordinates(multi_polygons)
+    return _compute_largest_extents_within_bands(coordinates, group_index, len(multi_polygons), band_axis=1, tolerance=1e-1)
+
+
+def compute_chest_depths_from_multipolygons(multi_polygons: Sequence[MultiPolygon]) -> NDArray[np.float64]:
+    """
+    Compute the chest depth of a batch of MultiPolygon objects at once.
+
+    Parameters
+    ----------
+    multi_polygons : Sequence[MultiPolygon]
+        The MultiPolygon objects.
+
+    Returns
+    -------
+    NDArray[np.float64]
+        The largest vertical distance (chest depth) of each MultiPolygon.
+
+    Notes
+    -----
+    Only pairs of points whose x-coordinates differ by at most 0.1 are considered, as in `compute_chest_depth_from_multipolygon`.
+    """
+    coordinates, group_index = _get_centered_coordinates(multi_polygons)
+    return _compute_largest_extents_within_bands(coordinates, group_index, len(multi_polygons), band_axis=0, tolerance=1e-1)
+
+
 def compute_bideltoid_breadth_from_multipolygon(multi_polygon: MultiPolygon) -> float:
     """
     Compute the largest horizontal distance (bideltoid breadth) between points in a MultiPolygon object.
@@ -406,32 +1163,7 @@ def compute_bideltoid_breadth_from_multipolygon(multi_polygon: MultiPolygon) ->
     """
     if not isinstance(multi_polygon, MultiPolygon):
         raise ValueError("Input must be a Shapely MultiPolygon object.")
-
-    # Assuming multi_polygon is a Shapely MultiPolygon object
-    center_of_mass = multi_polygon.centroid
-
-    # Combine boundary coordinates from all polygons, subtracting centroid
-    all_coords = np.array(
-        [(coord[0] - center_of_mass.x, coord[1] - center_of_mass.y) for poly in multi_polygon.geoms for coord in poly.boundary.coords]
-    )
-
-    # Sort points by their y-coordinate
-    sorted_coords = all_coords[np.argsort(all_coords[:, 1])]
-
-    # Use a sliding window to find pairs of points with similar y-coordinates
-    tolerance = 1e-1  # Adjust this value based on precision needs
-    max_distance = 0.0
-    i = 0
-    while i < len(sorted_coords):
-        j = i + 1
-        while j < len(sorted_coords) and abs(sorted_coords[j, 1] - sorted_coords[i, 1]) <= tolerance:
-            # Compute horizontal distance (x-difference)
-            distance = abs(sorted_coords[j, 0] - sorted_coords[i, 0])
-            max_distance = max(max_distance, distance)
-            j += 1
-        i += 1
-
-    return max_distance
+    return float(compute_bideltoid_breadths_from_multipolygons([multi_polygon])[0])
 
 
 def compute_chest_depth_from_multipolygon(multi_polygon: MultiPolygon) -> float:
@@ -455,32 +1187,7 @@ def compute_chest_depth_from_multipolygon(multi_polygon: MultiPolygon) -> float:
     """
     if not isinstance(multi_polygon, MultiPolygon):
         raise ValueError("Input must be a Shapely MultiPolygon object.")
-
-    # Assuming multi_polygon is a Shapely MultiPolygon object
-    center_of_mass = multi_polygon.centroid
-
-    # Combine boundary coordinates from all polygons, subtracting centroid
-    all_coords = np.array(
-        [(coord[0] - center_of_mass.x, coord[1] - center_of_mass.y) for poly in multi_polygon.geoms for coord in poly.boundary.coords]
-    )
-
-    # Sort points by their x-coordinate
-    sorted_coords = all_coords[np.argsort(all_coords[:, 0])]
-
-    # Use a sliding window to find pairs of points with similar x-coordinates
-    tolerance = 1e-1  # Adjust this value based on precision needs
-    max_distance = 0.0
-    i = 0
-    while i < len(sorted_coords):
-        j = i + 1
-        while j < len(sorted_coords) and abs(sorted_coords[j, 0] - sorted_coords[i, 0]) <= tolerance:
-            # Compute vertical distance (y-difference)
-            distance = abs(sorted_coords[j, 1] - sorted_coords[i, 1])
-            max_distance = max(max_distance, distance)
-            j += 1
-        i += 1
-
-    return max_distance
+    return float(compute_chest_depths_from_multipolygons([multi_polygon])[0])
 
 
 def from_string_to_tuple(string: str) -> tuple[float, float]:
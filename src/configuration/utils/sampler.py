@@ -0,0 +1,365 @@
+"""Vectorised samplers of measures: correlated truncated-normal draws, and stratified bootstrap of table rows."""
+
+# Copyright  2025  Institute of Light and Matter, CNRS UMR 5306, University Claude Bernard Lyon 1
+# Contributors: Oscar DUFOUR, Maxime STAPELLE, Alexandre NICOLAS
+
+# This software is a computer program designed to generate a realistic crowd from anthropometric data and
+# simulate the mechanical interactions that occur within it and with obstacles.
+
+# This software is governed by the CeCILL  license under French law and abiding by the rules of distribution
+# of free software.  You can  use, modify and/ or redistribute the software under the terms of the CeCILL
+# license as circulated by CEA, CNRS and INRIA at the following URL "http://www.cecill.info".
+
+# As a counterpart to the access to the source code and  rights to copy, modify and redistribute granted by
+# the license, users are provided only with a limited warranty  and the software's author,  the holder of the
+# economic rights,  and the successive licensors  have only  limited liability.
+
+# In this respect, the user's attention is drawn to the risks associated with loading,  using,  modifying
+# and/or developing or reproducing the software by the user in light of its specific status of free software,
+# that may mean  that it is complicated to manipulate,  and  that  also therefore means  that it is reserved
+# for developers  and  experienced professionals having in-depth computer knowledge. Users are therefore
+# encouraged to load and test the software's suitability as regards their requirements in conditions enabling
+# the security of their systems and/or data to be ensured and,  more generally, to use and operate it in the
+# same conditions as regards security.
+
+# The fact that you are presently reading this means that you have had knowledge of the CeCILL license and that
+# you accept its terms.
+
+from dataclasses import dataclass, field
+
+import numpy as np
+from numpy.typing import NDArray
+from scipy.special import ndtr, ndtri
+
+
+def compute_normal_scores_correlation(samples: NDArray[np.float64]) -> NDArray[np.float64]:
+    """
+    Fit the correlation matrix of a Gaussian copula to samples.
+
+    The correlation is the one of the normal scores of the samples, i.e. of the standard normal quantiles of their
+    ranks, so that it does not depend on the marginal distributions.
+
+    Parameters
+    ----------
+    samples : NDArray[np.float64]
+        The samples, of shape (number of samples, number of variables).
+
+    Returns
+    -------
+    NDArray[np.float64]
+        The correlation matrix, of shape (number of variables, number of variables).
+
+    Raises
+    ------
+    ValueError
+        If there are less than two samples or no variable.
+    """
+    samples = np.asarray(samples, dtype=np.float64)
+    if samples.ndim != 2 or samples.shape[0] < 2 or samples.shape[1] < 1:
+        raise ValueError("samples should be a 2D array with at least two samples and one variable.")
+    number_samples = samples.shape[0]
+    ranks = samples.argsort(axis=0).argsort(axis=0) + 1
+    scores = ndtri(ranks / (number_samples + 1))
+    return np.atleast_2d(np.corrcoef(scores, rowvar=False))
+
+
+@dataclass
+class TruncatedGaussianCopula:
+    """
+    Joint distribution of variables with truncated-normal marginals, linked by a Gaussian copula.
+
+    Each variable follows a normal distribution of mean `mean` and standard deviation `std_dev` truncated to
+    [`min_val`, `max_val`], and the dependence between the variables is the one of a multivariate normal
+    distribution of correlation matrix `correlation` (the identity, i.e. independent variables, if None).
+    """
+
+    mean: NDArray[np.float64]
+    std_dev: NDArray[np.float64]
+    min_val: NDArray[np.float64]
+    max_val: NDArray[np.float64]
+    correlation: NDArray[np.float64] | None = None
+    _cholesky: NDArray[np.float64] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """
+        Validate the parameters and factorise the correlation matrix.
+
+        Raises
+        ------
+        ValueError
+            If the parameters do not have the same length, if a standard deviation is not positive, if a lower
+            bound is not below its upper bound, or if the correlation matrix is not a symmetric positive-definite
+            matrix with a unit diagonal.
+        """
+        self.mean = np.atleast_1d(np.asarray(self.mean, dtype=np.float64))
+        self.std_dev = np.atleast_1d(np.asarray(self.std_dev, dtype=np.float64))
+        self.min_val = np.atleast_1d(np.asarray(self.min_val, dtype=np.float64))
+        self.max_val = np.atleast_1d(np.asarray(self.max_val, dtype=np.float64))
+        number_variables = len(self.mean)
+        if self.mean.ndim != 1 or any(
+            parameter.shape != (number_variables,) for parameter in (self.std_dev, self.min_val, self.max_val)
+        ):
+            raise ValueError("mean, std_dev, min_val and max_val should be 1D arrays of the same length.")
+        if np.any(self.std_dev <= 0):
+            raise ValueError("Standard deviations must be greater than zero.")
+        if np.any(self.min_val >= self.max_val):
+            raise ValueError("min_val must be less than max_val.")
+
+        if self.correlation is None:
+            self.correlation = np.eye(number_variables)
+        self.correlation = np.asarray(self.correlation, dtype=np.float64)
+        if self.correlation.shape != (number_variables, number_variables):
+            raise ValueError(f"correlation should be a {number_variables}x{number_variables} matrix.")
+        if not np.allclose(self.correlation, self.correlation.T) or not np.allclose(np.diag(self.correlation), 1.0):
+            raise ValueError("correlation should be a symmetric matrix with a unit diagonal.")
+        try:
+            self._cholesky = np.linalg.cholesky(self.correlation).astype(np.float64)
+        except np.linalg.LinAlgError:
+            raise ValueError("correlation should be positive definite.") from None
+
+    @classmethod
+    def fit(
+        cls, samples: NDArray[np.float64], min_val: NDArray[np.float64], max_val: NDArray[np.float64]
+    ) -> "TruncatedGaussianCopula":
+        """
+        Fit the distribution to samples, within given bounds.
+
+        The marginals take the mean and the standard deviation of the samples, and the correlation is fitted with
+        `compute_normal_scores_correlation`.
+
+        Parameters
+        ----------
+        samples : NDArray[np.float64]
+            The samples, of shape (number of samples, number of variables).
+        min_val : NDArray[np.float64]
+            The lower bound of each variable.
+        max_val : NDArray[np.float64]
+            The upper bound of each variable.
+
+        Returns
+        -------
+        TruncatedGaussianCopula
+            The fitted distribution.
+        """
+        samples = np.asarray(samples, dtype=np.float64)
+        return cls(
+            mean=samples.mean(axis=0),
+            std_dev=samples.std(axis=0, ddof=1),
+            min_val=min_val,
+            max_val=max_val,
+            correlation=compute_normal_scores_correlation(samples),
+        )
+
+    def sample(self, number_samples: int) -> NDArray[np.float64]:
+        """
+        Draw samples of all the variables at once, with the global NumPy random generator.
+
+        Correlated standard normal variables are mapped to uniform ones by the normal cumulative distribution
+        function, then to each truncated-normal marginal by the inverse of its cumulative distribution function.
+        The inversion is done in the tail of the normal distribution nearest to the truncation interval, so that
+        it stays accurate for intervals far from the mean.
+
+        Parameters
+        ----------
+        number_samples : int
+            The number of samples to draw.
+
+        Returns
+        -------
+        NDArray[np.float64]
+            The samples, of shape (number_samples, number of variables), within the bounds of each variable.
+
+        Raises
+        ------
+        ValueError
+            If `number_samples` is not a non-negative integer.
+        """
+        if not isinstance(number_samples, int) or number_samples < 0:
+            raise ValueError("`number_samples` should be a non-negative integer.")
+        number_variables = len(self.mean)
+        uniform = ndtr(np.random.standard_normal((number_samples, number_variables)) @ self._cholesky.T)
+
+        # Standardised bounds, reflected for the intervals above the mean to invert in the lower tail
+        lower = (self.min_val - self.mean) / self.std_dev
+        upper = (self.max_val - self.mean) / self.std_dev
+        reflected = lower > 0
+        sign = np.where(reflected, -1.0, 1.0)
+        lower_cdf = ndtr(np.where(reflected, -upper, lower))
+        upper_cdf = ndtr(np.where(reflected, -lower, upper))
+        uniform = np.where(reflected, 1.0 - uniform, uniform)
+
+        standard_samples = sign * ndtri(lower_cdf + uniform * (upper_cdf - lower_cdf))
+        samples: NDArray[np.float64] = np.clip(self.mean + self.std_dev * standard_samples, self.min_val, self.max_val)
+        return samples
+
+
+@dataclass
+class StratifiedIndexSampler:
+    """
+    Bootstrap sampler of the rows of a table, with an index of the rows of each stratum.
+
+    The rows of each stratum (e.g. each sex) are sorted once by each column, so that the rows of a stratum with
+    values of a column within given bounds, or within given quantiles of the stratum, form a contiguous slice of the
+    index found by binary search. Draws are therefore done without scanning the table.
+    """
+
+    strata: NDArray[np.integer]
+    columns: dict[str, NDArray[np.float64]]
+    _sorted_indices: dict[tuple[int, str | None], NDArray[np.int64]] = field(init=False, repr=False)
+    _sorted_values: dict[tuple[int, str], NDArray[np.float64]] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """
+        Validate the table and build the index of each stratum.
+
+        Raises
+        ------
+        ValueError
+            If the strata or a column are not 1D arrays with one value per row.
+        """
+        self.strata = np.asarray(self.strata)
+        if self.strata.ndim != 1:
+            raise ValueError("strata should be a 1D array.")
+        number_rows = len(self.strata)
+        for name, values in self.columns.items():
+            if np.shape(values) != (number_rows,):
+                raise ValueError(f"The column '{name}' should have one value per row.")
+
+        self._sorted_indices = {}
+        self._sorted_values = {}
+        for stratum in np.unique(self.strata).tolist():
+            stratum_indices = np.flatnonzero(self.strata == stratum)
+            self._sorted_indices[stratum, None] = stratum_indices
+            for name, values in self.columns.items():
+                order = np.argsort(values[stratum_indices], kind="stable")
+                self._sorted_indices[stratum, name] = stratum_indices[order]
+                self._sorted_values[stratum, name] = np.asarray(values[stratum_indices[order]], dtype=np.float64)
+
+    @property
+    def stratum_codes(self) -> list[int]:
+        """
+        Get the codes of the strata of the table.
+
+        Returns
+        -------
+        list[int]
+            The sorted codes of the strata.
+        """
+        return sorted({stratum for stratum, _ in self._sorted_indices})
+
+    def get_candidates(
+        self,
+        stratum: int,
+        column: str | None = None,
+        bounds: tuple[float, float] | None = None,
+        quantiles: tuple[float, float] | None = None,
+    ) -> NDArray[np.int64]:
+        """
+        Get the rows of a stratum matching a filter on one column.
+
+        Parameters
+        ----------
+        stratum : int
+            The code of the stratum.
+        column : str | None
+            The column to filter on. If None, all the rows of the stratum are returned.
+        bounds : tuple[float, float] | None
+            The inclusive bounds of the values of `column`.
+        quantiles : tuple[float, float] | None
+            The quantiles of `column` within the stratum between which the rows are kept, in [0, 1].
+
+        Returns
+        -------
+        NDArray[np.int64]
+            The indices of the matching rows, sorted by `column` (a view of the index).
+
+        Raises
+        ------
+        ValueError
+            If the stratum or the column do not exist, or if the filter is invalid.
+        """
+        if (stratum, None) not in self._sorted_indices:
+            raise ValueError(f"Unknown stratum {stratum}. Expected one of {self.stratum_codes}.")
+        if column is None:
+            if bounds is not None or quantiles is not None:
+                raise ValueError("A column is needed to filter on bounds or quantiles.")
+            return self._sorted_indices[stratum, None]
+        if column not in self.columns:
+            raise ValueError(f"Unknown column '{column}'. Expected one of {list(self.columns)}.")
+
+        sorted_values = self._sorted_values[stratum, column]
+        start, stop = 0, len(sorted_values)
+        if bounds is not None:
+            if bounds[0] > bounds[1]:
+                raise ValueError("The lower bound should not be greater than the upper bound.")
+            start = max(start, int(np.searchsorted(sorted_values, bounds[0], side="left")))
+            stop = min(stop, int(np.searchsorted(sorted_values, bounds[1], side="right")))
+        if quantiles is not None:
+            if not 0 <= quantiles[0] <= quantiles[1] <= 1:
+                raise ValueError("The quantiles should satisfy 0 <= lower quantile <= upper quantile <= 1.")
+            start = max(start, int(np.floor(quantiles[0] * len(sorted_values))))
+            stop = min(stop, int(np.ceil(quantiles[1] * len(sorted_values))))
+        return self._sorted_indices[stratum, column][start : max(start, stop)]
+
+    def sample(
+        self,
+        number_samples: int,
+        proportions: dict[int, float] | None = None,
+        column: str | None = None,
+        bounds: tuple[float, float] | None = None,
+        quantiles: tuple[float, float] | None = None,
+    ) -> NDArray[np.int64]:
+        """
+        Draw rows with replacement, with the global NumPy random generator.
+
+        The number of rows of each stratum is drawn from a multinomial distribution with the target proportions, then
+        the rows of each stratum are drawn uniformly among the ones matching the filter, and shuffled together.
+
+        Parameters
+        ----------
+        number_samples : int
+            The number of rows to draw.
+        proportions : dict[int, float] | None
+            The target proportion of each stratum, summing to 1. If None, each matching row is equally likely.
+        column : str | None
+            The column to filter on, see `get_candidates`.
+        bounds : tuple[float, float] | None
+            The inclusive bounds of the values of `column`.
+        quantiles : tuple[float, float] | None
+            The quantiles of `column` within each stratum between which the rows are kept, in [0, 1].
+
+        Returns
+        -------
+        NDArray[np.int64]
+            The indices of the drawn rows.
+
+        Raises
+        ------
+        ValueError
+            If `number_samples` is not a non-negative integer, if the proportions are invalid, or if a stratum to draw
+            from has no row matching the filter.
+        """
+        if not isinstance(number_samples, int) or number_samples < 0:
+            raise ValueError("`number_samples` should be a non-negative integer.")
+        candidates = {stratum: self.get_candidates(stratum, column, bounds, quantiles) for stratum in self.stratum_codes}
+        if proportions is None:
+            total_candidates = sum(len(stratum_candidates) for stratum_candidates in candidates.values())
+            if total_candidates == 0:
+                raise ValueError("No row matches the filter.")
+            proportions = {stratum: len(stratum_candidates) / total_candidates for stratum, stratum_candidates in candidates.items()}
+        elif any(stratum not in candidates for stratum in proportions):
+            raise ValueError(f"Unknown stratum in the proportions. Expected some of {self.stratum_codes}.")
+        weights = np.array(list(proportions.values()), dtype=np.float64)
+        if np.any(weights < 0) or not np.isclose(weights.sum(), 1.0):
+            raise ValueError("The proportions should be non-negative and sum to 1.")
+
+        counts = np.random.multinomial(number_samples, weights / weights.sum())
+        samples: list[NDArray[np.int64]] = [np.empty(0, dtype=np.int64)]
+        for stratum, count in zip(proportions, counts.tolist(), strict=True):
+            if count == 0:
+                continue
+            stratum_candidates = candidates[stratum]
+            if len(stratum_candidates) == 0:
+                raise ValueError(f"No row of stratum {stratum} matches the filter.")
+            samples.append(stratum_candidates[np.random.randint(len(stratum_candidates), size=count)])
+        return np.random.permutation(np.concatenate(samples))
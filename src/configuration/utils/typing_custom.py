@@ -25,8 +25,10 @@
 # The fact that you are presently reading this means that you have had knowledge of the CeCILL license and that
 # you accept its terms.
 
-from typing import Literal, TypeAlias
+from pathlib import Path
+from typing import IO, Any, Literal, TypeAlias
 
+from numpy.typing import NDArray
 from shapely.geometry import MultiPolygon, Polygon
 
 #: Represents biological sex categories.
@@ -145,3 +147,14 @@ InteractionsDataType: TypeAlias = dict[
         ],
     ],
 ]
+
+#: Represents a source of XML data: the XML document itself, the path of an XML file or a binary stream.
+XMLSourceType: TypeAlias = str | bytes | Path | IO[bytes]
+
+#: Represents columnar crowd data, with one array per attribute ("agent_id", "position", ...) and one row per agent,
+#: shape or interaction.
+CrowdArraysDataType: TypeAlias = dict[str, NDArray[Any]]
+
+#: Represents columnar trajectory data, with one array per quantity ("time", "position", ...) indexed by time step
+#: and agent.
+TrajectoryArraysDataType: TypeAlias = dict[str, NDArray[Any]]
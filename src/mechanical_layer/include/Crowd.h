@@ -36,10 +36,15 @@ extern std::list<Agent*> mech_active_agents;
 
 /*  Functions   */
 //     Initialise scene
-int initialiseSetting(const std::string& dynamicsFile, std::vector<unsigned>& nb_shapes_allagents, std::vector<unsigned>& shapeIDagent,
-                      std::vector<int>& edges, std::vector<double>& radius_allshapes, std::vector<double>& masses,
-                      std::vector<double>& mois, std::vector<double2>& delta_gtos);
+void createAgents(std::vector<unsigned>& nb_shapes_allagents, std::vector<unsigned>& shapeIDagent, std::vector<int>& edges,
+                  std::vector<double>& radius_allshapes, std::vector<double>& masses, std::vector<double>& mois,
+                  std::vector<double2>& delta_gtos);
+void deleteAgents();
 int updateSetting(const std::string& dynamicsFile);
+void updateSettingFromBuffers(const double* positions, const double* velocities, const double* thetas, const double* omegas,
+                              const double* drivingForces, const double* drivingTorques);
+void setAgentState(uint32_t a, const double2& position, const double2& velocity, double theta, double omega, const double2& Fp,
+                   double Mp);
 //      Prepare mechanical layer
 bool is_mechanically_active(const Agent* agent);
 bool get_future_collision();
@@ -47,7 +52,9 @@ void determine_agents_neighbours();
 
 //      Handle mechanical layer
 void handleMechanicalLayer(const std::string& dynamicsFile);
+void runMechanicalLayer(bool storeInteractionsInMemory);
 //      Output
 void generateDynamicsOutputFile(const std::string& dynamicsFile);
+void copyAgentsState(double* positions, double* velocities, double* thetas, double* omegas);
 
 #endif   // SRC_MECHANICAL_LAYER_INCLUDE_CROWD_H_
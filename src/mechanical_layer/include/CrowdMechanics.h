@@ -37,6 +37,13 @@ extern "C"
 {
     //  extern C is a trick for Python ctypes to work
     int CrowdMechanics(char** files);
+
+    //  In-memory API: the static data is read once, then each step reads and fills caller-owned buffers
+    int CrowdMechanicsInitialise(char** files);
+    uint32_t CrowdMechanicsGetNumberAgents();
+    const char* CrowdMechanicsGetAgentId(uint32_t agent);
+    int CrowdMechanicsStep(double* positions, double* velocities, double* thetas, double* omegas, const double* drivingForces,
+                           const double* drivingTorques);
 }
 
 #endif   // SRC_MECHANICAL_LAYER_INCLUDE_CROWDMECHANICS_H_
@@ -34,6 +34,7 @@
 #include <list>
 #include <map>
 #include <string>
+#include <tuple>
 #include <vector>
 
 /*
@@ -104,6 +105,10 @@ extern std::map<uint32_t, int32_t> shapesMaterial;
 extern std::string pathStatic;
 extern std::string pathDynamic;
 
+//  Contacts kept between two calls of the in-memory API, in place of the AgentInteractions file
+extern std::map<std::pair<unsigned, unsigned>, double2> storedSlip;        //  Key: ids of the two shapes in the crowd
+extern std::map<std::tuple<unsigned, int, int>, double2> storedSlipWall;   //  Key: id of the shape in the crowd, obstacle, wall
+
 /*
     Model parameters and user-defined constants
                                                 */
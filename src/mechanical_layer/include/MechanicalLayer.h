@@ -100,10 +100,13 @@ struct MechanicalLayer
     int readInteractionsInputFile(const std::string& interactionsFile);
     std::pair<bool, bool> existsContacts();   //  Do contacts exist?
     void generateInteractionsOutputFile(const std::string& interactionsFile, const std::pair<bool, bool>& exists);
+    //  In-memory counterparts of the AgentInteractions file (storedSlip and storedSlipWall)
+    void restoreInteractions();
+    void storeInteractions(const std::pair<bool, bool>& exists);
 
    public:
     /// Constructor for the MechanicalLayer class.
-    explicit MechanicalLayer(std::list<Agent*>& mech_active_agents);
+    explicit MechanicalLayer(std::list<Agent*>& mech_active_agents, bool storeInteractionsInMemory = false);
     /// Destructor for the MechanicalLayer class.
     ~MechanicalLayer();
 };
@@ -38,12 +38,30 @@ using std::string, std::vector, std::list, std::cerr, std::cout, std::endl, std:
 
 //  Global variable: Mechanically active agents
 list<Agent*> mech_active_agents;
+//  Number of agents allocated by createAgents(), which differs from nAgents once a new Agents file has been read
+static uint32_t nAllocatedAgents = 0;
+
+/**
+ * @brief The function deletes the agents created by createAgents(), if any.
+ */
+void deleteAgents()
+{
+    if (!agents)
+        return;
+    for (uint32_t a = 0; a < nAllocatedAgents; a++)
+    {
+        delete agents[a];
+    }
+    delete[] agents;
+    agents = nullptr;
+    nAllocatedAgents = 0;
+    mech_active_agents.clear();
+}
 
 /**
  * @brief The function creates all agents from the data stored by InputStatic.cpp.
- *        It also creates the kinematics and dynamics of the agents by calling updateSetting().
+ *        Their kinematics and dynamics are then set by updateSetting() or updateSettingFromBuffers().
  *
- * @param dynamicsFile The input file containing the current state and driving forces for all agents
  * @param nb_shapes_allagents The number of shapes by agent (size: number of agents)
  * @param shapeIDagent A correspondence between the shape ids (index) and the agent (value) (size: number of shapes)
  * @param edges The indices of the first shape for each agent (size:  number of agents + 1)
@@ -51,17 +69,15 @@ list<Agent*> mech_active_agents;
  * @param masses The masses of the agents
  * @param mois The moment of inertia of the agents
  * @param delta_gtos The relative positions of the shapes with respect to the center of mass of each agent
- *
- * @return EXIT_SUCCESS if no issue with the Dynamics file
- *         EXIT_FAILURE otherwise
- *         (the return code comes from updateSetting())
  */
-int initialiseSetting(const std::string& dynamicsFile, std::vector<unsigned>& nb_shapes_allagents, std::vector<unsigned>& shapeIDagent,
-                      std::vector<int>& edges, std::vector<double>& radius_allshapes, std::vector<double>& masses,
-                      std::vector<double>& mois, std::vector<double2>& delta_gtos)
+void createAgents(std::vector<unsigned>& nb_shapes_allagents, std::vector<unsigned>& shapeIDagent, std::vector<int>& edges,
+                  std::vector<double>& radius_allshapes, std::vector<double>& masses, std::vector<double>& mois,
+                  std::vector<double2>& delta_gtos)
 {
-    /*  Allocate agents */
+    /*  Allocate agents, after freeing those of a previous call  */
+    deleteAgents();
     agents = new Agent*[nAgents];
+    nAllocatedAgents = nAgents;
 
     /*  Create ids of shapes for agents */
     vector<unsigned> Id_shapes(shapeIDagent.size());
@@ -88,9 +104,6 @@ int initialiseSetting(const std::string& dynamicsFile, std::vector<unsigned>& nb
         agents[a] = new Agent(a, Ids_shapes_agent, nb_shapes_allagents[a], delta_gtos_curr, radius_shapes, theta_body_init, mass_curr,
                               moi_curr);
     }
-
-    /*  Update the agents with the Dynamics file  */
-    return updateSetting(dynamicsFile);
 }
 /**
  * @brief The function updates all agents with the agentDynamics (dynamic data) XML files.
@@ -205,23 +218,7 @@ int updateSetting(const string& dynamicsFile)
             return EXIT_FAILURE;
         }
         //  Update agent with the kinematics and dynamics
-        agents[a]->_x = position.first;
-        agents[a]->_y = position.second;
-        agents[a]->_theta = theta;
-        agents[a]->_vx = velocity.first;
-        agents[a]->_vy = velocity.second;
-        agents[a]->_w = omega;
-        const double inverseTauMechTranslation = agentProperties[a].first;
-        const double inverseTauMechRotation = agentProperties[a].second;
-        agents[a]->_vx_des = Fp.first / inverseTauMechTranslation / agents[a]->_mass;   //  vx_des := Fpx/m * tau_mech
-        agents[a]->_vy_des = Fp.second / inverseTauMechTranslation / agents[a]->_mass;
-        agents[a]->_w_des = Mp / inverseTauMechRotation / agents[a]->_moi;   //  w_des  := Mp/I  * tau_mech
-        if (!(agents[a]->_vx_des == 0. && agents[a]->_vy_des == 0.))
-            agents[a]->_theta_des = atan2(agents[a]->_vy_des, agents[a]->_vx_des);
-        else
-            agents[a]->_theta_des = 0.;
-        agents[a]->_v_des = double2(agents[a]->_vx_des, agents[a]->_vy_des);
-        agents[a]->_neighbours.clear();
+        setAgentState(a, position, velocity, theta, omega, Fp, Mp);
 
         agentElement = agentElement->NextSiblingElement("Agent");
         agentCounter++;
@@ -238,6 +235,65 @@ int updateSetting(const string& dynamicsFile)
     return EXIT_SUCCESS;
 }
 
+/**
+ * @brief The function updates all agents with caller-owned buffers, in place of the AgentDynamics XML file.
+ *        It initiates the list of neighbours by calling determine_agents_neighbours().
+ *
+ * All buffers are contiguous and ordered as the agents in the Agents XML file (see agentMapInverse).
+ *
+ * @param positions The positions of the centers of mass, as x0, y0, x1, y1... (size: 2 * number of agents)
+ * @param velocities The velocities of the centers of mass, as vx0, vy0, vx1, vy1... (size: 2 * number of agents)
+ * @param thetas The orientations of the agents (size: number of agents)
+ * @param omegas The angular velocities of the agents (size: number of agents)
+ * @param drivingForces The driving forces Fp, as Fpx0, Fpy0, Fpx1, Fpy1... (size: 2 * number of agents)
+ * @param drivingTorques The driving torques Mp (size: number of agents)
+ */
+void updateSettingFromBuffers(const double* positions, const double* velocities, const double* thetas, const double* omegas,
+                              const double* drivingForces, const double* drivingTorques)
+{
+    for (uint32_t a = 0; a < nAgents; a++)
+    {
+        setAgentState(a, {positions[2 * a], positions[2 * a + 1]}, {velocities[2 * a], velocities[2 * a + 1]}, thetas[a], omegas[a],
+                      {drivingForces[2 * a], drivingForces[2 * a + 1]}, drivingTorques[a]);
+    }
+
+    /*  Update neighbours before calling the mechanical layer   */
+    determine_agents_neighbours();
+}
+
+/**
+ * @brief The function sets the kinematics and the driving force and torque of an agent.
+ *
+ * @param a The internal id of the agent
+ * @param position The position of the center of mass
+ * @param velocity The velocity of the center of mass
+ * @param theta The orientation of the agent
+ * @param omega The angular velocity of the agent
+ * @param Fp The driving force
+ * @param Mp The driving torque
+ */
+void setAgentState(uint32_t a, const double2& position, const double2& velocity, double theta, double omega, const double2& Fp,
+                   double Mp)
+{
+    agents[a]->_x = position.first;
+    agents[a]->_y = position.second;
+    agents[a]->_theta = theta;
+    agents[a]->_vx = velocity.first;
+    agents[a]->_vy = velocity.second;
+    agents[a]->_w = omega;
+    const double inverseTauMechTranslation = agentProperties[a].first;
+    const double inverseTauMechRotation = agentProperties[a].second;
+    agents[a]->_vx_des = Fp.first / inverseTauMechTranslation / agents[a]->_mass;   //  vx_des := Fpx/m * tau_mech
+    agents[a]->_vy_des = Fp.second / inverseTauMechTranslation / agents[a]->_mass;
+    agents[a]->_w_des = Mp / inverseTauMechRotation / agents[a]->_moi;   //  w_des  := Mp/I  * tau_mech
+    if (!(agents[a]->_vx_des == 0. && agents[a]->_vy_des == 0.))
+        agents[a]->_theta_des = atan2(agents[a]->_vy_des, agents[a]->_vx_des);
+    else
+        agents[a]->_theta_des = 0.;
+    agents[a]->_v_des = double2(agents[a]->_vx_des, agents[a]->_vy_des);
+    agents[a]->_neighbours.clear();
+}
+
 /**
  * @brief Updates the list of neighbors for each agent in the crowd.
  *
@@ -282,6 +338,19 @@ void determine_agents_neighbours()
     }
 }
 
+/**
+ * @brief Executes the mechanical layer and saves its output to the dynamics file.
+ *
+ * @param dynamicsFile The input dynamics file will be overwritten with the output of the mechanical layer.
+ */
+void handleMechanicalLayer(const std::string& dynamicsFile)
+{
+    runMechanicalLayer(false);
+
+    /*  Save output of mechanical layer to file */
+    generateDynamicsOutputFile(dynamicsFile);
+}
+
 /**
  * @brief Executes the mechanical layer.
  *
@@ -289,16 +358,16 @@ void determine_agents_neighbours()
  * It performs the following steps:
  * 1. Handles mechanically active agents using the mechanical layer.
  * 2. Handles non-mechanically active agents (simple positional update)
- * 3. Generates an output file with the new position and velocity, plus their angular counterparts.
  *
- * @param dynamicsFile The input dynamics file will be overwritten with the output of the mechanical layer.
+ * @param storeInteractionsInMemory Whether the contacts between two calls are kept in memory (storedSlip and storedSlipWall)
+ *                                  rather than in the AgentInteractions file.
  */
-void handleMechanicalLayer(const std::string& dynamicsFile)
+void runMechanicalLayer(bool storeInteractionsInMemory)
 {
     /*  Handle mechanically active agents: mechanical layer */
     if (get_future_collision())
     {
-        const MechanicalLayer* crowdMech = new MechanicalLayer(mech_active_agents);
+        const MechanicalLayer* crowdMech = new MechanicalLayer(mech_active_agents, storeInteractionsInMemory);
         delete crowdMech;
     }
 
@@ -317,9 +386,6 @@ void handleMechanicalLayer(const std::string& dynamicsFile)
         agent->_w = (1.0 - exp(-dt * inverseTauMechRotation)) * agent->_w_des + exp(-dt * inverseTauMechRotation) * agent->_w;
         agent->move();
     }
-
-    /*  Save output of mechanical layer to file */
-    generateDynamicsOutputFile(dynamicsFile);
 }
 
 /**
@@ -445,3 +511,27 @@ void generateDynamicsOutputFile(const std::string& dynamicsFile)
 
     outputDoc.close();
 }
+
+/**
+ * @brief The function copies the final state of the agents to caller-owned buffers, in place of the AgentDynamics XML file.
+ *
+ * All buffers are contiguous and ordered as the agents in the Agents XML file (see agentMapInverse).
+ *
+ * @param positions The positions of the centers of mass, as x0, y0, x1, y1... (size: 2 * number of agents)
+ * @param velocities The velocities of the centers of mass, as vx0, vy0, vx1, vy1... (size: 2 * number of agents)
+ * @param thetas The orientations of the agents (size: number of agents)
+ * @param omegas The angular velocities of the agents (size: number of agents)
+ */
+void copyAgentsState(double* positions, double* velocities, double* thetas, double* omegas)
+{
+    for (uint32_t a = 0; a < nAgents; a++)
+    {
+        const Agent* agent = agents[a];
+        positions[2 * a] = agent->_x;
+        positions[2 * a + 1] = agent->_y;
+        velocities[2 * a] = agent->_vx;
+        velocities[2 * a + 1] = agent->_vy;
+        thetas[a] = agent->_theta;
+        omegas[a] = agent->_w;
+    }
+}
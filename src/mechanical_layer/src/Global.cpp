@@ -31,10 +31,11 @@
 
 #include <sstream>
 #include <string>
+#include <tuple>
 #include <utility>
 #include <vector>
 
-using std::map, std::string, std::vector, std::pair, std::stringstream;
+using std::map, std::string, std::vector, std::pair, std::tuple, std::stringstream;
 
 /*
     Operations on new types: definitions
@@ -95,6 +96,10 @@ map<uint32_t, int32_t> shapesMaterial;
 string pathStatic;    //  Folder where the static  data should be saved
 string pathDynamic;   //  Folder where the dynamic data should be placed
 
+//  Contacts (tangential relative displacements) kept in memory by CrowdMechanicsStep
+map<pair<unsigned, unsigned>, double2> storedSlip;
+map<tuple<unsigned, int, int>, double2> storedSlipWall;
+
 /*
     Utilities functions
                         */
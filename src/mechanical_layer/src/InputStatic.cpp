@@ -33,6 +33,7 @@
 #include <vector>
 
 #include "../3rdparty/tinyxml/tinyxml2.h"
+#include "Crowd.h"
 
 using std::cout, std::cerr, std::string, std::endl, std::vector, std::map;
 
@@ -395,13 +396,7 @@ int readAgents(const std::string& file, std::vector<unsigned>& nShapesPerAgent,
 {
     if (agents)
     {
-        for (uint32_t a = 0; a < nAgents; ++a)
-        {
-            delete agents[a];
-            agents[a] = nullptr;
-        }
-        delete agents;
-        agents = nullptr;
+        deleteAgents();
         agentMap.clear();
         agentMapInverse.clear();
         agentProperties.clear();
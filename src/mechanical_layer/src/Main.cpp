@@ -31,13 +31,51 @@
 
 #include "CrowdMechanics.h"
 
-using std::string, std::map, std::vector;
+using std::string, std::map, std::vector, std::cerr, std::endl;
+
+/**
+ * @brief Reads the static files (materials, geometry and agents) and creates the agents.
+ *
+ * @param files An array of file names, ordered as for CrowdMechanics(). The Parameters file should have been read beforehand.
+ *
+ * @return  EXIT_SUCCESS if the files were read successfully.
+ *          EXIT_FAILURE in case of issue(s) with any of the XML files' contents
+ */
+static int loadStaticFiles(char** files)
+{
+    /*  Read MATERIALS  */
+    //  Mapping between user-given id's and indexes in the program
+    map<string, int32_t> materialMapping;
+    if (const string materialsFile = pathStatic + files[1]; readMaterials(materialsFile, materialMapping) == EXIT_FAILURE)
+        return EXIT_FAILURE;
+
+    /*  Read GEOMETRY   */
+    if (const string geometryFile = pathStatic + files[2]; readGeometry(geometryFile, materialMapping) == EXIT_FAILURE)
+        return EXIT_FAILURE;
+
+    /*  Read AGENTS */
+    vector<unsigned> nb_shapes_allagents, shapeIDagent;
+    vector<int> edges;
+    vector<double> radius_allshapes, masses, mois;
+    vector<double2> delta_gtos;
+    if (const string agentsFile = pathStatic + files[3];
+        readAgents(agentsFile, nb_shapes_allagents, shapeIDagent, edges, radius_allshapes, masses, mois, delta_gtos,
+                   materialMapping) == EXIT_FAILURE)
+        return EXIT_FAILURE;
+
+    /*  Initialise simulation  */
+    createAgents(nb_shapes_allagents, shapeIDagent, edges, radius_allshapes, masses, mois, delta_gtos);
+    //  The shapes have changed: contacts kept in memory are meaningless
+    storedSlip.clear();
+    storedSlipWall.clear();
+    return EXIT_SUCCESS;
+}
 
 //  extern C is a trick for Python ctypes to work
 extern "C"
 {
     /**
-     * @brief The main function of CrowdMechanics, and the only one to be called when used as a library.
+     * @brief The main function of CrowdMechanics, and the only one to be called when used as a library with files.
      *
      * It reads static and dynamic XML files,
      * stores everything and simulates the dynamics of the agents.
@@ -62,34 +100,9 @@ extern "C"
         //  Store the dynamics file name, whether it is the first run or not
         const string dynamicsFile = pathDynamic + files[4];
 
-        if (loadStaticData)
-        {
-            /*  Read MATERIALS  */
-            //  Mapping between user-given id's and indexes in the program
-            map<string, int32_t> materialMapping;
-            if (const string materialsFile = pathStatic + files[1]; readMaterials(materialsFile, materialMapping) == EXIT_FAILURE)
-                return EXIT_FAILURE;
-
-            /*  Read GEOMETRY   */
-            if (const string geometryFile = pathStatic + files[2]; readGeometry(geometryFile, materialMapping) == EXIT_FAILURE)
-                return EXIT_FAILURE;
-
-            /*  Read AGENTS */
-            vector<unsigned> nb_shapes_allagents, shapeIDagent;
-            vector<int> edges;
-            vector<double> radius_allshapes, masses, mois;
-            vector<double2> delta_gtos;
-            if (const string agentsFile = pathStatic + files[3];
-                readAgents(agentsFile, nb_shapes_allagents, shapeIDagent, edges, radius_allshapes, masses, mois, delta_gtos,
-                           materialMapping) == EXIT_FAILURE)
-                return EXIT_FAILURE;
-
-            /*  Initialise simulation  */
-            if (initialiseSetting(dynamicsFile, nb_shapes_allagents, shapeIDagent, edges, radius_allshapes, masses, mois,
-                                  delta_gtos) == EXIT_FAILURE)
-                return EXIT_FAILURE;
-        }
-        else if (updateSetting(dynamicsFile) == EXIT_FAILURE)
+        if (loadStaticData && loadStaticFiles(files) == EXIT_FAILURE)
+            return EXIT_FAILURE;
+        if (updateSetting(dynamicsFile) == EXIT_FAILURE)
             return EXIT_FAILURE;
 
         /*  Main program procedure  */
@@ -98,4 +111,83 @@ extern "C"
         loadStaticData = false;
         return EXIT_SUCCESS;
     }
+
+    /**
+     * @brief Reads the parameters and the static files, to be called once before CrowdMechanicsStep().
+     *
+     * The static files are always read, as if loadStaticData were true.
+     *
+     * @param files An array of file names, given in the same order as for CrowdMechanics():
+     *      - Parameters (directories, time step...)
+     *      - Materials (with Young's modulus and the shear modulus
+     *      - Geometry (obstacles)
+     *      - Agents
+     *
+     * @return  EXIT_SUCCESS if the files were read successfully.
+     *          EXIT_FAILURE in case of issue(s) with any of the XML files' contents
+     */
+    int CrowdMechanicsInitialise(char** files)
+    {
+        if (const string parametersFile = files[0]; readParameters(parametersFile) == EXIT_FAILURE)
+            return EXIT_FAILURE;
+        if (loadStaticFiles(files) == EXIT_FAILURE)
+            return EXIT_FAILURE;
+
+        loadStaticData = false;
+        return EXIT_SUCCESS;
+    }
+
+    /**
+     * @brief Gets the number of agents read from the Agents file, ie the number of rows of the buffers of CrowdMechanicsStep().
+     *
+     * @return The number of agents.
+     */
+    uint32_t CrowdMechanicsGetNumberAgents() { return loadStaticData ? 0 : nAgents; }
+
+    /**
+     * @brief Gets the user-given id of an agent, in the order of the buffers of CrowdMechanicsStep().
+     *
+     * @param agent The index of the agent in the buffers.
+     *
+     * @return The id of the agent, or nullptr if there is no such agent.
+     */
+    const char* CrowdMechanicsGetAgentId(uint32_t agent)
+    {
+        if (loadStaticData || agent >= agentMapInverse.size())
+            return nullptr;
+        return agentMapInverse[agent].c_str();
+    }
+
+    /**
+     * @brief Simulates the dynamics of the agents during one time step, without any file.
+     *
+     * The kinematics are read from and overwritten in caller-owned contiguous buffers, ordered as the agents in the Agents
+     * file. The contacts between agents and with obstacles are kept in memory from one call to the next.
+     *
+     * @param positions The positions of the centers of mass, as x0, y0, x1, y1... (size: 2 * number of agents), updated
+     * @param velocities The velocities of the centers of mass, as vx0, vy0, vx1, vy1... (size: 2 * number of agents), updated
+     * @param thetas The orientations of the agents (size: number of agents), updated
+     * @param omegas The angular velocities of the agents (size: number of agents), updated
+     * @param drivingForces The driving forces Fp, as Fpx0, Fpy0, Fpx1, Fpy1... (size: 2 * number of agents)
+     * @param drivingTorques The driving torques Mp (size: number of agents)
+     *
+     * @return  EXIT_SUCCESS if the program executed successfully.
+     *          EXIT_FAILURE if the static data has not been loaded
+     */
+    int CrowdMechanicsStep(double* positions, double* velocities, double* thetas, double* omegas, const double* drivingForces,
+                           const double* drivingTorques)
+    {
+        if (loadStaticData)
+        {
+            cerr << "Error: the static data must be loaded with CrowdMechanicsInitialise before any step" << endl;
+            return EXIT_FAILURE;
+        }
+        updateSettingFromBuffers(positions, velocities, thetas, omegas, drivingForces, drivingTorques);
+
+        /*  Main program procedure  */
+        runMechanicalLayer(true);
+
+        copyAgentsState(positions, velocities, thetas, omegas);
+        return EXIT_SUCCESS;
+    }
 }
@@ -51,8 +51,10 @@ using std::list, std::map, std::set, std::vector, std::string, std::tuple, std::
  * the output Interactions file.
  *
  * @param mech_active_agents Reference to a list of pointers to Agent objects representing the active agents in the crowd.
+ * @param storeInteractionsInMemory Whether the existing contacts are read from and saved to memory (storedSlip and
+ *                                  storedSlipWall) instead of the Interactions file.
  */
-MechanicalLayer::MechanicalLayer(list<Agent*>& mech_active_agents)
+MechanicalLayer::MechanicalLayer(list<Agent*>& mech_active_agents, bool storeInteractionsInMemory)
     : nb_active_agents(mech_active_agents.size()),
       nb_active_shapes(0),
       vgn(nb_active_agents),
@@ -158,7 +160,9 @@ MechanicalLayer::MechanicalLayer(list<Agent*>& mech_active_agents)
     /*  Check if an Interactions File already exists    */
     const string interactionsFile = pathDynamic + "AgentInteractions.xml";
     struct stat buffer{};
-    if (stat(interactionsFile.c_str(), &buffer) != -1)
+    if (storeInteractionsInMemory)
+        restoreInteractions();
+    else if (stat(interactionsFile.c_str(), &buffer) != -1)
         readInteractionsInputFile(interactionsFile);
 
     /*  MECHANICAL Loop */
@@ -181,7 +185,10 @@ MechanicalLayer::MechanicalLayer(list<Agent*>& mech_active_agents)
     }
 
     /*  Output the interactions file */
-    generateInteractionsOutputFile(interactionsFile, existsContacts());
+    if (storeInteractionsInMemory)
+        storeInteractions(existsContacts());
+    else
+        generateInteractionsOutputFile(interactionsFile, existsContacts());
 }
 
 /**
@@ -296,6 +303,66 @@ int MechanicalLayer::readInteractionsInputFile(const std::string& interactionsFi
     return EXIT_SUCCESS;
 }
 
+/**
+ * @brief This function gets the possible already existing contacts from memory, as readInteractionsInputFile does from the file.
+ *        Only the contacts between mechanically active shapes are kept.
+ */
+void MechanicalLayer::restoreInteractions()
+{
+    //  Correspondence between the ids of the shapes in the crowd and in the mechanical layer
+    map<unsigned, unsigned> activeShapes;
+    for (unsigned cpt_shape = 0; cpt_shape < nb_active_shapes; cpt_shape++)
+        activeShapes[active_shapeIDshape_crowd[cpt_shape]] = cpt_shape;
+
+    for (auto const& [shapes, inputSlip] : storedSlip)
+    {
+        if (!activeShapes.contains(shapes.first) || !activeShapes.contains(shapes.second))
+            continue;
+        const unsigned cpt_shape = activeShapes[shapes.first];
+        const unsigned cpt_shape_neigh = activeShapes[shapes.second];
+        slip[{cpt_shape, cpt_shape_neigh}] = inputSlip;
+        slip[{cpt_shape_neigh, cpt_shape}] = -1 * inputSlip;
+    }
+    for (auto const& [key, inputSlipWall] : storedSlipWall)
+    {
+        if (!activeShapes.contains(get<0>(key)))
+            continue;
+        slip_wall[{activeShapes[get<0>(key)], get<1>(key), get<2>(key)}] = inputSlipWall;
+    }
+}
+
+/**
+ * @brief This function saves the contacts to memory, as generateInteractionsOutputFile does to the file.
+ *        The contacts are identified with the ids of the shapes in the crowd, so that they can be restored whatever
+ *        the mechanically active agents of the next call.
+ *
+ * @param exists A boolean saying if there exists agent-agent or agent-wall contacts
+ */
+void MechanicalLayer::storeInteractions(const pair<bool, bool>& exists)
+{
+    if (!exists.first && !exists.second)
+        return;
+
+    storedSlip.clear();
+    storedSlipWall.clear();
+    if (exists.first)
+    {
+        for (auto const& [shapes, output] : interactionsOutput)
+        {
+            if (output[SLIP] != double2(0., 0.))
+                storedSlip[{active_shapeIDshape_crowd[shapes.first], active_shapeIDshape_crowd[shapes.second]}] = output[SLIP];
+        }
+    }
+    if (exists.second)
+    {
+        for (auto const& [key, output] : interactionsOutputWall)
+        {
+            if (output[SLIP] != double2(0., 0.))
+                storedSlipWall[{active_shapeIDshape_crowd[get<0>(key)], get<1>(key), get<2>(key)}] = output[SLIP];
+        }
+    }
+}
+
 /**
  * @brief Calculates the interactions between a shape and all the other shapes.
  *
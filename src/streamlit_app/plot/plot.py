@@ -46,6 +46,7 @@ import configuration.utils.constants as cst
 import streamlit_app.utils.functions as fun
 from configuration.models.agents import Agent
 from configuration.models.crowd import Crowd
+from configuration.models.shapes3D import Shapes3D
 
 plt.rcParams.update(
     {
@@ -813,7 +814,7 @@ def display_crowd3D_slices_by_slices(crowd: Crowd) -> go.Figure:
     return fig
 
 
-def display_crowd3D_whole_3Dscene(crowd: Crowd) -> go.Figure:
+def display_crowd3D_whole_3Dscene(crowd: Crowd, lod: Optional[int] = None) -> go.Figure:
     """
     Generate a 3D Plotly figure of a 3D crowd.
 
@@ -821,12 +822,19 @@ def display_crowd3D_whole_3Dscene(crowd: Crowd) -> go.Figure:
     ----------
     crowd : Crowd
         The crowd object containing agents.
+    lod : int, optional
+        The level of detail of the displayed bodies, an index in `BODY3D_LODS`. If None, the finest level fitting
+        the vertex budget of a scene of this crowd is selected with `Shapes3D.select_lod`. The bodies at another
+        level than the one of the agents are built from the templates of this level (see `Agent.get_shapes3D_at_lod`).
 
     Returns
     -------
     plotly.graph_objects.Figure
         A Plotly figure object representing the 3D crowd.
     """
+    if lod is None:
+        lod = Shapes3D.select_lod(crowd_size=max(1, len(crowd.agents)))
+
     norm = Normalize(
         vmin=min(agent.shapes2D.get_area() for agent in crowd.agents),
         vmax=max(agent.shapes2D.get_area() for agent in crowd.agents),
@@ -835,43 +843,51 @@ def display_crowd3D_whole_3Dscene(crowd: Crowd) -> go.Figure:
     # Initialize a Plotly figure
     fig = go.Figure()
 
-    # Add each agent's 3D mesh to the plot
-    for id_agent, agent in enumerate(crowd.agents):
+    # Add each agent's 3D mesh to the plot, as a single trace whose polygons are separated by NaN
+    agents_shapes3D = [agent.get_shapes3D_at_lod(lod) for agent in crowd.agents]
+    for id_agent, (agent, shapes3D) in enumerate(zip(crowd.agents, agents_shapes3D, strict=True)):
         rgba_color = cram.cm.hawaii(norm(agent.shapes2D.get_area()))  # pylint: disable=no-member
 
-        # Add each polygon to the 3D plot
-        for _, height in enumerate(sorted(agent.shapes3D.shapes.keys(), key=int)):
+        xs: list[NDArray[np.float64]] = []
+        ys: list[NDArray[np.float64]] = []
+        zs: list[NDArray[np.float64]] = []
+        for height in sorted(shapes3D.keys(), key=float):
             # Get the multipolygon for this height
-            multi_polygon = agent.shapes3D.shapes[height]
+            multi_polygon = shapes3D[height]
 
             # Check if multi_polygon is a MultiPolygon object
             if not isinstance(multi_polygon, MultiPolygon):
                 raise ValueError("multi_polygon is not a MultiPolygon")
 
-            # Plot each polygon
+            # Gather each polygon
             for polygon in multi_polygon.geoms:
                 x, y = polygon.exterior.xy
-                fig.add_trace(
-                    go.Scatter3d(
-                        x=np.array(x),
-                        y=np.array(y),
-                        z=np.full_like(x, height),
-                        mode="lines",
-                        line={
-                            "width": 2,
-                            "color": mcolors.to_hex(rgba_color),
-                        },
-                        showlegend=False,
-                        hovertemplate=f"<b>agent {id_agent}</b><br>"
-                        + "x: %{x:.2f} cm<br>"
-                        + "y: %{y:.2f} cm<br>"
-                        + "z: %{z:.2f} cm<br>"
-                        + "<extra></extra>",
-                    )
-                )
+                xs.extend((np.array(x), np.array([np.nan])))
+                ys.extend((np.array(y), np.array([np.nan])))
+                zs.extend((np.full(len(x) + 1, float(height)),))
+
+        fig.add_trace(
+            go.Scatter3d(
+                x=np.concatenate(xs),
+                y=np.concatenate(ys),
+                z=np.concatenate(zs),
+                mode="lines",
+                line={
+                    "width": 2,
+                    "color": mcolors.to_hex(rgba_color),
+                },
+                connectgaps=False,
+                showlegend=False,
+                hovertemplate=f"<b>agent {id_agent}</b><br>"
+                + "x: %{x:.2f} cm<br>"
+                + "y: %{y:.2f} cm<br>"
+                + "z: %{z:.2f} cm<br>"
+                + "<extra></extra>",
+            )
+        )
 
     # Calculate bounds from agents' 2D shapes
-    bounds = np.array([multipolygon.bounds for agent in crowd.agents for multipolygon in agent.shapes3D.shapes.values()])
+    bounds = np.array([multipolygon.bounds for shapes3D in agents_shapes3D for multipolygon in shapes3D.values()])
     x_min, y_min = bounds[:, [0, 1]].min(axis=0)
     x_max, y_max = bounds[:, [2, 3]].max(axis=0)
 
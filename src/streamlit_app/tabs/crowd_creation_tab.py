@@ -41,6 +41,7 @@ import configuration.backup.dict_to_xml_and_reverse as fun_xml
 import configuration.utils.constants as cst
 import configuration.utils.functions as fun
 import streamlit_app.utils.constants as cst_app
+import streamlit_app.utils.functions as fun_app
 from configuration.models.crowd import Crowd, create_agents_from_dynamic_static_geometry_parameters
 from configuration.models.measures import CrowdMeasures
 from configuration.utils.typing_custom import DynamicCrowdDataType, GeometryDataType, StaticCrowdDataType
@@ -679,10 +680,19 @@ def run_crowd_init() -> None:
                 "The packing of the crowd is ongoing and may take some time. Please be patient.",
                 icon="⏳",
             )
+            my_progress_bar = st.progress(0)
+            status_text = st.empty()
             st.session_state.current_crowd.pack_agents_with_forces(
-                st.session_state.repulsion_length, st.session_state.desired_direction, st.session_state.variable_orientation
+                st.session_state.repulsion_length,
+                st.session_state.desired_direction,
+                st.session_state.variable_orientation,
+                progress_callback=lambda iteration, nb_iterations, elapsed_time: fun_app.update_progress_bar(
+                    my_progress_bar, status_text, iteration / nb_iterations, elapsed_time
+                ),
             )
             st.session_state.simulation_run = False
+            my_progress_bar.empty()
+            status_text.empty()
             info_placeholder.empty()
         else:
             # if some agents are bike, then specify the grid parameters
@@ -780,14 +790,10 @@ def run_crowd_from_config() -> None:
 
     # --- XML Parsing ---
     if all(file is not None and (not hasattr(file, "size") or file.size > 0) for file in files.values()):  #
-        crowd_xml: str = uploaded_agents.read().decode("utf-8")  # type: ignore
-        static_dict: StaticCrowdDataType = fun_xml.static_xml_to_dict(crowd_xml)
-
-        geometry_xml: str = uploaded_geometry.read().decode("utf-8")  # type: ignore
-        geometry_dict: GeometryDataType = fun_xml.geometry_xml_to_dict(geometry_xml)
-
-        dynamic_xml: str = uploaded_dynamics.read().decode("utf-8")  # type: ignore
-        dynamic_dict: DynamicCrowdDataType = fun_xml.dynamic_xml_to_dict(dynamic_xml)
+        # The uploaded files are binary streams, parsed incrementally without reading them fully first
+        static_dict: StaticCrowdDataType = fun_xml.static_xml_to_dict(uploaded_agents)  # type: ignore[arg-type]
+        geometry_dict: GeometryDataType = fun_xml.geometry_xml_to_dict(uploaded_geometry)  # type: ignore[arg-type]
+        dynamic_dict: DynamicCrowdDataType = fun_xml.dynamic_xml_to_dict(uploaded_dynamics)  # type: ignore[arg-type]
 
         # --- Crowd creation ---
         try:
@@ -113,7 +113,9 @@ def filter_mesh_by_z_threshold(
     return filtered_points, filtered_triangles
 
 
-def update_progress_bar(progress_bar: DeltaGenerator, status_text: DeltaGenerator, frac: float) -> None:
+def update_progress_bar(
+    progress_bar: DeltaGenerator, status_text: DeltaGenerator, frac: float, elapsed_time: float | None = None
+) -> None:
     """
     Update a progress bar and status text based on the given completion fraction.
 
@@ -125,6 +127,8 @@ def update_progress_bar(progress_bar: DeltaGenerator, status_text: DeltaGenerato
         The Streamlit text object to display the status message. Typically created using `st.text()`.
     frac : float
         A value between 0 and 1 representing the completion fraction of the task. For example, `frac=0.5` indicates 50% completion.
+    elapsed_time : float | None
+        Wall time (in seconds) already spent on the task, displayed next to the percentage when provided.
 
     Raises
     ------
@@ -140,7 +144,10 @@ def update_progress_bar(progress_bar: DeltaGenerator, status_text: DeltaGenerato
 
     # Update status text
     progress_text = "Operation in progress. Please wait. ⏳"
-    status_text.text(f"{progress_text} {percent_complete}%")
+    if elapsed_time is None:
+        status_text.text(f"{progress_text} {percent_complete}%")
+    else:
+        status_text.text(f"{progress_text} {percent_complete}% ({elapsed_time:.1f} s elapsed)")
 
 
 def compute_range(agent: Agent, axis: Literal["x", "y"]) -> float:
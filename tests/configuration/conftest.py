@@ -0,0 +1,51 @@
+"""Shared fixtures for the configuration tests."""
+
+# Copyright  2025  Institute of Light and Matter, CNRS UMR 5306, University Claude Bernard Lyon 1
+# Contributors: Oscar DUFOUR, Maxime STAPELLE, Alexandre NICOLAS
+
+# This software is a computer program designed to generate a realistic crowd from anthropometric data and
+# simulate the mechanical interactions that occur within it and with obstacles.
+
+# This software is governed by the CeCILL  license under French law and abiding by the rules of distribution
+# of free software.  You can  use, modify and/ or redistribute the software under the terms of the CeCILL
+# license as circulated by CEA, CNRS and INRIA at the following URL "http://www.cecill.info".
+
+# As a counterpart to the access to the source code and  rights to copy, modify and redistribute granted by
+# the license, users are provided only with a limited warranty  and the software's author,  the holder of the
+# economic rights,  and the successive licensors  have only  limited liability.
+
+# In this respect, the user's attention is drawn to the risks associated with loading,  using,  modifying
+# and/or developing or reproducing the software by the user in light of its specific status of free software,
+# that may mean  that it is complicated to manipulate,  and  that  also therefore means  that it is reserved
+# for developers  and  experienced professionals having in-depth computer knowledge. Users are therefore
+# encouraged to load and test the software's suitability as regards their requirements in conditions enabling
+# the security of their systems and/or data to be ensured and,  more generally, to use and operate it in the
+# same conditions as regards security.
+
+# The fact that you are presently reading this means that you have had knowledge of the CeCILL license and that
+# you accept its terms.
+
+from collections.abc import Callable
+
+import numpy as np
+import pytest
+from shapely.geometry import MultiPoint, MultiPolygon, Polygon
+
+
+@pytest.fixture
+def random_multipolygon() -> Callable[[np.random.Generator], MultiPolygon]:
+    """
+    Provide a builder of random MultiPolygons.
+
+    Returns
+    -------
+    Callable[[np.random.Generator], MultiPolygon]
+        A function building, from a random generator, a MultiPolygon made of the convex hulls of random points,
+        with coordinates rounded to create ties.
+    """
+
+    def build(rng: np.random.Generator) -> MultiPolygon:
+        hulls = [MultiPoint(np.round(rng.normal(size=(20, 2)) * 5.0 + rng.normal(size=2) * 10.0, 1)).convex_hull for _ in range(3)]
+        return MultiPolygon([hull for hull in hulls if isinstance(hull, Polygon)])
+
+    return build
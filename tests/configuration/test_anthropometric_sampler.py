@@ -0,0 +1,163 @@
+"""
+Unit tests for the vectorised sampler of correlated measures.
+
+Tests cover:
+    - Samples stay within their bounds and follow the truncated-normal marginals
+    - The correlation of the Gaussian copula is recovered by the fit
+    - Samples are reproducible with the global NumPy seed
+    - Crowd measures are drawn in batches, with correlated pedestrian measures
+    - The stratified index draws rows honouring target proportions and filters, reproducibly
+    - Pedestrians drawn from the ANSUR II database honour a male proportion and a height range
+    - Invalid parameters raise errors
+"""
+
+# Copyright  2025  Institute of Light and Matter, CNRS UMR 5306, University Claude Bernard Lyon 1
+# Contributors: Oscar DUFOUR, Maxime STAPELLE, Alexandre NICOLAS
+
+# This software is a computer program designed to generate a realistic crowd from anthropometric data and
+# simulate the mechanical interactions that occur within it and with obstacles.
+
+# This software is governed by the CeCILL  license under French law and abiding by the rules of distribution
+# of free software.  You can  use, modify and/ or redistribute the software under the terms of the CeCILL
+# license as circulated by CEA, CNRS and INRIA at the following URL "http://www.cecill.info".
+
+# As a counterpart to the access to the source code and  rights to copy, modify and redistribute granted by
+# the license, users are provided only with a limited warranty  and the software's author,  the holder of the
+# economic rights,  and the successive licensors  have only  limited liability.
+
+# In this respect, the user's attention is drawn to the risks associated with loading,  using,  modifying
+# and/or developing or reproducing the software by the user in light of its specific status of free software,
+# that may mean  that it is complicated to manipulate,  and  that  also therefore means  that it is reserved
+# for developers  and  experienced professionals having in-depth computer knowledge. Users are therefore
+# encouraged to load and test the software's suitability as regards their requirements in conditions enabling
+# the security of their systems and/or data to be ensured and,  more generally, to use and operate it in the
+# same conditions as regards security.
+
+# The fact that you are presently reading this means that you have had knowledge of the CeCILL license and that
+# you accept its terms.
+
+import numpy as np
+import pytest
+from scipy.stats import truncnorm
+
+import configuration.utils.constants as cst
+from configuration.models.crowd import Crowd
+from configuration.models.measures import CrowdMeasures, draw_agents_measures
+from configuration.utils.sampler import StratifiedIndexSampler, TruncatedGaussianCopula
+
+
+def test_samples_follow_truncated_normal_marginals() -> None:
+    """Test that the samples stay within their bounds and have the moments of the truncated-normal marginals."""
+    np.random.seed(0)
+    mean, std_dev = np.array([70.0, 26.0, 0.0]), np.array([3.0, 2.0, 1.0])
+    min_val, max_val = np.array([30.0, 15.0, 5.0]), np.array([65.0, 45.0, 6.0])
+    correlation = np.array([[1.0, 0.5, 0.0], [0.5, 1.0, 0.0], [0.0, 0.0, 1.0]])
+    samples = TruncatedGaussianCopula(mean, std_dev, min_val, max_val, correlation).sample(100_000)
+
+    assert samples.shape == (100_000, 3)
+    assert np.all(samples >= min_val) and np.all(samples <= max_val)
+    lower, upper = (min_val - mean) / std_dev, (max_val - mean) / std_dev
+    np.testing.assert_allclose(samples.mean(axis=0), truncnorm.mean(lower, upper, mean, std_dev), rtol=1e-2)
+    np.testing.assert_allclose(samples.std(axis=0), truncnorm.std(lower, upper, mean, std_dev), rtol=2e-2)
+
+
+def test_fit_recovers_correlation() -> None:
+    """Test that fitting the copula to its own samples recovers its parameters."""
+    np.random.seed(1)
+    correlation = np.array([[1.0, 0.8, 0.3], [0.8, 1.0, 0.2], [0.3, 0.2, 1.0]])
+    copula = TruncatedGaussianCopula([50.0, 25.0, 175.0], [2.0, 2.0, 8.0], [30.0, 15.0, 140.0], [65.0, 45.0, 240.0], correlation)
+    samples = copula.sample(50_000)
+
+    fitted_copula = TruncatedGaussianCopula.fit(samples, copula.min_val, copula.max_val)
+    np.testing.assert_allclose(fitted_copula.correlation, correlation, atol=0.02)
+    np.testing.assert_allclose(fitted_copula.mean, copula.mean, rtol=1e-2)
+
+
+def test_samples_are_reproducible() -> None:
+    """Test that the samples only depend on the global NumPy seed."""
+    copula = TruncatedGaussianCopula([0.0, 1.0], [1.0, 2.0], [-1.0, -2.0], [1.0, 3.0], [[1.0, -0.4], [-0.4, 1.0]])
+    np.random.seed(2)
+    first_samples = copula.sample(10)
+    np.random.seed(2)
+    np.testing.assert_array_equal(copula.sample(10), first_samples)
+    assert copula.sample(0).shape == (0, 2)
+
+
+def test_crowd_measures_are_drawn_in_batches() -> None:
+    """Test that the measures of a crowd with custom statistics are drawn in batches, with correlated pedestrian measures."""
+    np.random.seed(3)
+    crowd_measures = CrowdMeasures(agent_statistics=dict(cst.CrowdStat))
+    all_measures = draw_agents_measures(cst.AgentTypes.pedestrian, crowd_measures, 2000)
+
+    assert len(all_measures) == 2000
+    male_samples = np.array(
+        [
+            [agent_measures.measures[name] for name in cst.PEDESTRIAN_SAMPLED_MEASURES]
+            for agent_measures in all_measures
+            if agent_measures.measures["sex"] == "male"
+        ]
+    )
+    assert 900 < len(male_samples) < 1100
+    # Broader pedestrians are heavier, as in the ANSUR II dataset
+    assert np.corrcoef(male_samples[:, 0], male_samples[:, 3])[0, 1] > 0.7
+
+    # The crowd creates its agents from the batches, in the drawn order of the agent types
+    np.random.seed(3)
+    crowd_measures = CrowdMeasures(agent_statistics=dict(cst.CrowdStat) | {"pedestrian_proportion": 0.5, "bike_proportion": 0.5})
+    crowd = Crowd(measures=crowd_measures)
+    crowd.create_agents(6)
+    assert {agent.agent_type for agent in crowd.agents} == {cst.AgentTypes.pedestrian, cst.AgentTypes.bike}
+
+
+def test_stratified_index_honours_proportions_and_filters() -> None:
+    """Test that the stratified index draws rows with the target proportions and filters, reproducibly."""
+    strata = np.array([1, 2] * 50)
+    heights = np.arange(100, dtype=np.float64)
+    sampler = StratifiedIndexSampler(strata=strata, columns={"height": heights})
+
+    np.testing.assert_array_equal(sampler.get_candidates(2, "height", bounds=(10.0, 20.0)), [11, 13, 15, 17, 19])
+    np.testing.assert_array_equal(sampler.get_candidates(1, "height", quantiles=(0.0, 0.1)), [0, 2, 4, 6, 8])
+
+    np.random.seed(4)
+    indices = sampler.sample(10_000, {1: 0.25, 2: 0.75}, column="height", bounds=(20.0, 59.0))
+    assert np.all((heights[indices] >= 20.0) & (heights[indices] <= 59.0))
+    assert 0.23 < np.mean(strata[indices] == 1) < 0.27
+    np.random.seed(4)
+    np.testing.assert_array_equal(sampler.sample(10_000, {1: 0.25, 2: 0.75}, column="height", bounds=(20.0, 59.0)), indices)
+
+    with pytest.raises(ValueError, match="No row of stratum 1"):
+        sampler.sample(10, {1: 1.0}, column="height", bounds=(200.0, 300.0))
+    with pytest.raises(ValueError, match="sum to 1"):
+        sampler.sample(10, {1: 0.5, 2: 0.6})
+    with pytest.raises(ValueError, match="Unknown column"):
+        sampler.get_candidates(1, "weight")
+
+
+def test_crowd_from_database_honours_proportion_and_heights() -> None:
+    """Test that the pedestrians drawn from the ANSUR II database honour a male proportion and a height range."""
+    np.random.seed(5)
+    crowd = Crowd()
+    crowd.create_agents(8, male_proportion=0.0, height_range=(150.0, 170.0))
+
+    assert {agent.measures.measures["sex"] for agent in crowd.agents} == {"female"}
+    assert all(150.0 <= agent.measures.measures["height"] <= 170.0 for agent in crowd.agents)
+    with pytest.raises(ValueError, match="only apply"):
+        Crowd(measures=CrowdMeasures(agent_statistics=dict(cst.CrowdStat))).create_agents(2, male_proportion=0.5)
+
+
+def test_invalid_parameters_raise_errors() -> None:
+    """Test that invalid parameters of the sampler and of the crowd correlations raise errors."""
+    with pytest.raises(ValueError, match="same length"):
+        TruncatedGaussianCopula([0.0, 1.0], [1.0], [-1.0, 0.0], [1.0, 2.0])
+    with pytest.raises(ValueError, match="Standard deviations"):
+        TruncatedGaussianCopula([0.0], [0.0], [-1.0], [1.0])
+    with pytest.raises(ValueError, match="min_val"):
+        TruncatedGaussianCopula([0.0], [1.0], [1.0], [1.0])
+    with pytest.raises(ValueError, match="positive definite"):
+        TruncatedGaussianCopula([0.0, 0.0], [1.0, 1.0], [-1.0, -1.0], [1.0, 1.0], [[1.0, 2.0], [2.0, 1.0]])
+    with pytest.raises(ValueError, match="non-negative integer"):
+        TruncatedGaussianCopula([0.0], [1.0], [-1.0], [1.0]).sample(-1)
+    with pytest.raises(ValueError, match="Invalid correlation key"):
+        CrowdMeasures(agent_statistics=dict(cst.CrowdStat), correlations={"child": np.eye(4)})
+    with pytest.raises(ValueError, match="4x4"):
+        CrowdMeasures(agent_statistics=dict(cst.CrowdStat), correlations={"male": np.eye(3)})
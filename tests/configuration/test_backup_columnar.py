@@ -0,0 +1,106 @@
+"""
+Unit tests for the columnar export of a crowd.
+
+Tests cover:
+    - The arrays computed for the whole crowd are the ones converted from the crowd dictionaries
+    - The XML files written from the arrays are byte-identical to the ones written from the dictionaries
+"""
+
+# Copyright  2025  Institute of Light and Matter, CNRS UMR 5306, University Claude Bernard Lyon 1
+# Contributors: Oscar DUFOUR, Maxime STAPELLE, Alexandre NICOLAS
+
+# This software is a computer program designed to generate a realistic crowd from anthropometric data and
+# simulate the mechanical interactions that occur within it and with obstacles.
+
+# This software is governed by the CeCILL  license under French law and abiding by the rules of distribution
+# of free software.  You can  use, modify and/ or redistribute the software under the terms of the CeCILL
+# license as circulated by CEA, CNRS and INRIA at the following URL "http://www.cecill.info".
+
+# As a counterpart to the access to the source code and  rights to copy, modify and redistribute granted by
+# the license, users are provided only with a limited warranty  and the software's author,  the holder of the
+# economic rights,  and the successive licensors  have only  limited liability.
+
+# In this respect, the user's attention is drawn to the risks associated with loading,  using,  modifying
+# and/or developing or reproducing the software by the user in light of its specific status of free software,
+# that may mean  that it is complicated to manipulate,  and  that  also therefore means  that it is reserved
+# for developers  and  experienced professionals having in-depth computer knowledge. Users are therefore
+# encouraged to load and test the software's suitability as regards their requirements in conditions enabling
+# the security of their systems and/or data to be ensured and,  more generally, to use and operate it in the
+# same conditions as regards security.
+
+# The fact that you are presently reading this means that you have had knowledge of the CeCILL license and that
+# you accept its terms.
+
+import io
+
+import numpy as np
+import pytest
+from shapely.geometry import Polygon
+
+import configuration.backup.crowd_to_dict as fun_dict
+import configuration.backup.crowd_to_npz_and_reverse as fun_npz
+import configuration.backup.dict_to_xml_and_reverse as fun_xml
+from configuration.models.crowd import Crowd
+
+
+@pytest.fixture
+def crowd() -> Crowd:
+    """
+    Fixture to create a crowd of pedestrians placed on a grid, with random orientations.
+
+    Returns
+    -------
+    Crowd
+        A crowd of six pedestrians inside a square room.
+    """
+    np.random.seed(1)
+    current_crowd = Crowd(boundaries=Polygon([(0.0, 0.0), (400.0, 0.0), (400.0, 400.0), (0.0, 400.0)]))
+    current_crowd.create_agents(6)
+    current_crowd.pack_agents_on_grid()
+    for agent in current_crowd.agents:
+        agent.rotate(float(np.random.uniform(-180.0, 180.0)))
+    return current_crowd
+
+
+def test_crowd_arrays_match_dictionaries(crowd: Crowd) -> None:
+    """
+    Test that the columnar arrays are the ones converted from the static and dynamic dictionaries.
+
+    Parameters
+    ----------
+    crowd : Crowd
+        A fixture providing a crowd of pedestrians.
+    """
+    static_arrays, dynamic_arrays = fun_dict.get_crowd_arrays(crowd)
+    expected_static = fun_npz.static_dict_to_arrays(fun_dict.get_static_params(crowd))
+    expected_dynamic = fun_npz.dynamic_dict_to_arrays(fun_dict.get_dynamic_params(crowd))
+    # The NPZ archives store the dynamic identifiers under their own key
+    expected_dynamic["agent_id"] = expected_dynamic.pop("dynamic_agent_id")
+
+    for expected, arrays in ((expected_static, static_arrays), (expected_dynamic, dynamic_arrays)):
+        assert set(arrays) == set(expected)
+        for key, expected_array in expected.items():
+            assert arrays[key].dtype == expected_array.dtype, key
+            np.testing.assert_array_equal(arrays[key], expected_array, err_msg=key)
+
+
+def test_array_writers_match_dictionary_writers(crowd: Crowd) -> None:
+    """
+    Test that the XML files written from the columnar arrays are the ones written from the dictionaries.
+
+    Parameters
+    ----------
+    crowd : Crowd
+        A fixture providing a crowd of pedestrians.
+    """
+    static_arrays, dynamic_arrays = fun_dict.get_crowd_arrays(crowd)
+
+    from_arrays, from_dict = io.BytesIO(), io.BytesIO()
+    fun_xml.write_static_arrays_xml(static_arrays, from_arrays)
+    fun_xml.write_static_xml(fun_dict.get_static_params(crowd), from_dict)
+    assert from_arrays.getvalue() == from_dict.getvalue()
+
+    from_arrays, from_dict = io.BytesIO(), io.BytesIO()
+    fun_xml.write_dynamic_arrays_xml(dynamic_arrays, from_arrays)
+    fun_xml.write_dynamic_xml(fun_dict.get_dynamic_params(crowd), from_dict)
+    assert from_arrays.getvalue() == from_dict.getvalue()
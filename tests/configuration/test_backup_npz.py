@@ -0,0 +1,146 @@
+"""
+Unit tests for the binary crowd archives.
+
+Tests cover:
+    - A crowd saved to a `.npz` archive is loaded back with the same agents and boundaries
+    - Converting an archive to a ZIP of XML files gives the files written from the crowd, and back
+    - Invalid paths and unsupported archive versions raise errors
+"""
+
+# Copyright  2025  Institute of Light and Matter, CNRS UMR 5306, University Claude Bernard Lyon 1
+# Contributors: Oscar DUFOUR, Maxime STAPELLE, Alexandre NICOLAS
+
+# This software is a computer program designed to generate a realistic crowd from anthropometric data and
+# simulate the mechanical interactions that occur within it and with obstacles.
+
+# This software is governed by the CeCILL  license under French law and abiding by the rules of distribution
+# of free software.  You can  use, modify and/ or redistribute the software under the terms of the CeCILL
+# license as circulated by CEA, CNRS and INRIA at the following URL "http://www.cecill.info".
+
+# As a counterpart to the access to the source code and  rights to copy, modify and redistribute granted by
+# the license, users are provided only with a limited warranty  and the software's author,  the holder of the
+# economic rights,  and the successive licensors  have only  limited liability.
+
+# In this respect, the user's attention is drawn to the risks associated with loading,  using,  modifying
+# and/or developing or reproducing the software by the user in light of its specific status of free software,
+# that may mean  that it is complicated to manipulate,  and  that  also therefore means  that it is reserved
+# for developers  and  experienced professionals having in-depth computer knowledge. Users are therefore
+# encouraged to load and test the software's suitability as regards their requirements in conditions enabling
+# the security of their systems and/or data to be ensured and,  more generally, to use and operate it in the
+# same conditions as regards security.
+
+# The fact that you are presently reading this means that you have had knowledge of the CeCILL license and that
+# you accept its terms.
+
+import zipfile
+from pathlib import Path
+
+import numpy as np
+import pytest
+from shapely.geometry import Polygon
+
+import configuration.backup.crowd_to_npz_and_reverse as fun_npz
+import configuration.backup.crowd_to_zip_and_reverse as fun_zip
+import configuration.utils.constants as cst
+from configuration.models.crowd import Crowd
+
+
+@pytest.fixture
+def crowd() -> Crowd:
+    """
+    Fixture to create a small crowd of pedestrians placed on a grid.
+
+    Returns
+    -------
+    Crowd
+        A crowd of four pedestrians inside a square room.
+    """
+    np.random.seed(0)
+    current_crowd = Crowd(boundaries=Polygon([(0.0, 0.0), (300.0, 0.0), (300.0, 300.0), (0.0, 300.0)]))
+    current_crowd.create_agents(4)
+    current_crowd.pack_agents_on_grid()
+    return current_crowd
+
+
+def test_crowd_npz_round_trip(crowd: Crowd, tmp_path: Path) -> None:
+    """
+    Test that a crowd saved to an archive is loaded back with the same arrays, agents and boundaries.
+
+    Parameters
+    ----------
+    crowd : Crowd
+        A fixture providing a crowd of pedestrians.
+    tmp_path : Path
+        A pytest fixture providing a temporary directory for file operations.
+    """
+    npz_path = tmp_path / "crowd.npz"
+    fun_npz.save_crowd_data_to_npz(crowd, npz_path)
+
+    arrays = fun_npz.load_crowd_arrays_from_npz(npz_path)
+    expected_arrays = fun_npz.crowd_to_arrays(crowd)
+    assert set(arrays) == set(fun_npz.CROWD_ARCHIVE_KEYS)
+    for key in fun_npz.CROWD_ARCHIVE_KEYS:
+        np.testing.assert_array_equal(arrays[key], expected_arrays[key])
+    assert arrays["shape_position"].shape == (int(arrays["shape_offsets"][-1]), 2)
+
+    loaded_crowd = fun_npz.load_crowd_from_npz(npz_path)
+    assert loaded_crowd.get_number_agents() == crowd.get_number_agents()
+    np.testing.assert_allclose(loaded_crowd.get_agent_positions(), crowd.get_agent_positions(), atol=0.1)
+    assert loaded_crowd.boundaries.equals(crowd.boundaries)
+
+
+def test_npz_and_xml_zip_conversions(crowd: Crowd, tmp_path: Path) -> None:
+    """
+    Test that an archive converted to XML gives the files written from the crowd, and that they convert back.
+
+    Parameters
+    ----------
+    crowd : Crowd
+        A fixture providing a crowd of pedestrians.
+    tmp_path : Path
+        A pytest fixture providing a temporary directory for file operations.
+    """
+    npz_path = tmp_path / "crowd.npz"
+    fun_npz.save_crowd_data_to_npz(crowd, npz_path)
+    expected_zip_path = tmp_path / "expected.zip"
+    fun_zip.save_crowd_data_to_zip(crowd, expected_zip_path)
+
+    zip_path = tmp_path / "converted.zip"
+    fun_npz.npz_to_xml_zip(npz_path, zip_path)
+    with zipfile.ZipFile(zip_path) as zip_file, zipfile.ZipFile(expected_zip_path) as expected_zip_file:
+        for file_name in cst.CROWD_XML_FILE_NAMES:
+            assert zip_file.read(file_name) == expected_zip_file.read(file_name)
+
+    converted_npz_path = tmp_path / "converted.npz"
+    fun_npz.xml_zip_to_npz(zip_path, converted_npz_path)
+    arrays = fun_npz.load_crowd_arrays_from_npz(npz_path)
+    converted_arrays = fun_npz.load_crowd_arrays_from_npz(converted_npz_path)
+    for key in fun_npz.CROWD_ARCHIVE_KEYS:
+        if arrays[key].dtype.kind in "iU":
+            np.testing.assert_array_equal(converted_arrays[key], arrays[key])
+        else:
+            np.testing.assert_allclose(converted_arrays[key], arrays[key])
+
+
+def test_invalid_archives_raise(crowd: Crowd, tmp_path: Path) -> None:
+    """
+    Test that invalid paths and unsupported archive versions raise errors.
+
+    Parameters
+    ----------
+    crowd : Crowd
+        A fixture providing a crowd of pedestrians.
+    tmp_path : Path
+        A pytest fixture providing a temporary directory for file operations.
+    """
+    with pytest.raises(TypeError):
+        fun_npz.save_crowd_data_to_npz(crowd, "crowd.npz")
+    with pytest.raises(ValueError, match=".npz extension"):
+        fun_npz.save_crowd_data_to_npz(crowd, tmp_path / "crowd.zip")
+    with pytest.raises(FileNotFoundError):
+        fun_npz.load_crowd_arrays_from_npz(tmp_path / "missing.npz")
+
+    npz_path = tmp_path / "crowd.npz"
+    np.savez(npz_path, version=np.array(cst.CROWD_ARCHIVE_VERSION + 1), **fun_npz.crowd_to_arrays(crowd))
+    with pytest.raises(ValueError, match="Unsupported crowd archive version"):
+        fun_npz.load_crowd_arrays_from_npz(npz_path)
@@ -0,0 +1,198 @@
+"""
+Unit tests for the incremental XML readers.
+
+Tests cover:
+    - The readers give the same dictionary from the XML text, its bytes, a file path or a binary stream
+    - The columnar arrays hold the same values as the dictionaries
+    - Malformed XML raises a ValueError
+"""
+
+# Copyright  2025  Institute of Light and Matter, CNRS UMR 5306, University Claude Bernard Lyon 1
+# Contributors: Oscar DUFOUR, Maxime STAPELLE, Alexandre NICOLAS
+
+# This software is a computer program designed to generate a realistic crowd from anthropometric data and
+# simulate the mechanical interactions that occur within it and with obstacles.
+
+# This software is governed by the CeCILL  license under French law and abiding by the rules of distribution
+# of free software.  You can  use, modify and/ or redistribute the software under the terms of the CeCILL
+# license as circulated by CEA, CNRS and INRIA at the following URL "http://www.cecill.info".
+
+# As a counterpart to the access to the source code and  rights to copy, modify and redistribute granted by
+# the license, users are provided only with a limited warranty  and the software's author,  the holder of the
+# economic rights,  and the successive licensors  have only  limited liability.
+
+# In this respect, the user's attention is drawn to the risks associated with loading,  using,  modifying
+# and/or developing or reproducing the software by the user in light of its specific status of free software,
+# that may mean  that it is complicated to manipulate,  and  that  also therefore means  that it is reserved
+# for developers  and  experienced professionals having in-depth computer knowledge. Users are therefore
+# encouraged to load and test the software's suitability as regards their requirements in conditions enabling
+# the security of their systems and/or data to be ensured and,  more generally, to use and operate it in the
+# same conditions as regards security.
+
+# The fact that you are presently reading this means that you have had knowledge of the CeCILL license and that
+# you accept its terms.
+
+from io import BytesIO
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import configuration.backup.dict_to_xml_and_reverse as fun_xml
+from configuration.utils.typing_custom import DynamicCrowdDataType, InteractionsDataType, StaticCrowdDataType
+
+
+@pytest.fixture
+def static_dict() -> StaticCrowdDataType:
+    """
+    Fixture to provide the static parameters of two agents.
+
+    Returns
+    -------
+    StaticCrowdDataType
+        A dictionary containing static parameters for a pedestrian and a custom agent.
+    """
+    return {
+        "Agents": {
+            "Agent0": {
+                "Type": "pedestrian",
+                "Id": 0,
+                "Mass": 81.9,
+                "Height": 1.8,
+                "MomentOfInertia": 1.57,
+                "FloorDamping": 2.0,
+                "AngularDamping": 5.0,
+                "Shapes": {
+                    "disk0": {"Type": "disk", "Radius": 0.08, "MaterialId": "human_clothes", "Position": (-0.09, 0.13)},
+                    "disk1": {"Type": "disk", "Radius": 0.11, "MaterialId": "human_clothes", "Position": (-0.02, 0.06)},
+                },
+            },
+            "Agent1": {
+                "Type": "custom",
+                "Id": 1,
+                "Mass": 66.8,
+                "Height": 1.7,
+                "MomentOfInertia": 1.07,
+                "FloorDamping": 2.0,
+                "AngularDamping": 5.0,
+                "Shapes": {"disk0": {"Type": "disk", "Radius": 0.07, "MaterialId": "human_naked", "Position": (0.02, 0.15)}},
+            },
+        }
+    }
+
+
+@pytest.fixture
+def dynamic_dict() -> DynamicCrowdDataType:
+    """
+    Fixture to provide the dynamic parameters of three agents.
+
+    Returns
+    -------
+    DynamicCrowdDataType
+        A dictionary containing dynamic parameters for three agents.
+    """
+    return {
+        "Agents": {
+            f"Agent{agent_id}": {
+                "Id": agent_id,
+                "Kinematics": {"Position": (0.5 * agent_id, -0.2), "Velocity": (0.0, 1.5), "Theta": 0.25 * agent_id, "Omega": 0.1},
+                "Dynamics": {"Fp": (1000.0, -1000.0), "Mp": 2.0},
+            }
+            for agent_id in range(3)
+        }
+    }
+
+
+def test_readers_accept_text_bytes_path_and_stream(static_dict: StaticCrowdDataType, tmp_path: Path) -> None:
+    """
+    Test that every kind of XML source gives the same dictionary.
+
+    Parameters
+    ----------
+    static_dict : StaticCrowdDataType
+        A fixture providing static parameters.
+    tmp_path : Path
+        A pytest fixture providing a temporary directory for file operations.
+    """
+    xml_data = fun_xml.static_dict_to_xml(static_dict)
+    file_path = tmp_path / "Agents.xml"
+    file_path.write_bytes(xml_data)
+
+    assert fun_xml.static_xml_to_dict(xml_data.decode("utf-8")) == static_dict
+    assert fun_xml.static_xml_to_dict(xml_data) == static_dict
+    assert fun_xml.static_xml_to_dict(file_path) == static_dict
+    with file_path.open("rb") as stream:
+        assert fun_xml.static_xml_to_dict(stream) == static_dict
+
+
+def test_arrays_match_dictionaries(static_dict: StaticCrowdDataType, dynamic_dict: DynamicCrowdDataType) -> None:
+    """
+    Test that the columnar readers return the values of the dictionaries, one row per agent or shape.
+
+    Parameters
+    ----------
+    static_dict : StaticCrowdDataType
+        A fixture providing static parameters.
+    dynamic_dict : DynamicCrowdDataType
+        A fixture providing dynamic parameters.
+    """
+    static_arrays = fun_xml.static_xml_to_arrays(BytesIO(fun_xml.static_dict_to_xml(static_dict)))
+    np.testing.assert_array_equal(static_arrays["agent_id"], [0, 1])
+    np.testing.assert_array_equal(static_arrays["agent_type"], ["pedestrian", "custom"])
+    np.testing.assert_allclose(static_arrays["mass"], [81.9, 66.8])
+    np.testing.assert_array_equal(static_arrays["shape_offsets"], [0, 2, 3])
+    np.testing.assert_array_equal(static_arrays["shape_material"], ["human_clothes", "human_clothes", "human_naked"])
+    np.testing.assert_allclose(static_arrays["shape_position"], [(-0.09, 0.13), (-0.02, 0.06), (0.02, 0.15)])
+
+    dynamic_arrays = fun_xml.dynamic_xml_to_arrays(fun_xml.dynamic_dict_to_xml(dynamic_dict))
+    np.testing.assert_array_equal(dynamic_arrays["agent_id"], [0, 1, 2])
+    np.testing.assert_allclose(dynamic_arrays["position"], [(0.0, -0.2), (0.5, -0.2), (1.0, -0.2)])
+    np.testing.assert_allclose(dynamic_arrays["theta"], [0.0, 0.25, 0.5])
+    np.testing.assert_allclose(dynamic_arrays["fp"], np.tile([1000.0, -1000.0], (3, 1)))
+    np.testing.assert_allclose(dynamic_arrays["mp"], [2.0, 2.0, 2.0])
+
+    interactions_dict: InteractionsDataType = {
+        "Interactions": {
+            "Agent0": {
+                "Id": 0,
+                "NeighbouringAgents": {
+                    "Agent1": {
+                        "Id": 1,
+                        "Interactions": {
+                            "Interaction_0_1": {
+                                "ParentShape": 0,
+                                "ChildShape": 1,
+                                "TangentialRelativeDisplacement": (0.0, 0.5),
+                                "Fn": (1.5, 0.0),
+                                "Ft": (0.0, -0.25),
+                            }
+                        },
+                    }
+                },
+            },
+            "Agent1": {"Id": 1, "NeighbouringAgents": {}},
+        }
+    }
+    interactions_xml = fun_xml.interactions_dict_to_xml(interactions_dict)
+    assert fun_xml.interactions_xml_to_dict(interactions_xml) == interactions_dict
+    interactions_arrays = fun_xml.interactions_xml_to_arrays(interactions_xml)
+    np.testing.assert_array_equal(interactions_arrays["agent_id"], [0, 1])
+    np.testing.assert_array_equal(interactions_arrays["parent_agent_id"], [0])
+    np.testing.assert_array_equal(interactions_arrays["child_shape"], [1])
+    np.testing.assert_allclose(interactions_arrays["tangential_relative_displacement"], [(0.0, 0.5)])
+
+
+@pytest.mark.parametrize("xml_data", ["", "<Agents><Agent Id='0'>", "<Agents></Geometry>"])
+def test_malformed_xml_raises(xml_data: str) -> None:
+    """
+    Test that malformed XML raises a ValueError.
+
+    Parameters
+    ----------
+    xml_data : str
+        A malformed XML document.
+    """
+    with pytest.raises(ValueError, match="Malformed XML"):
+        fun_xml.dynamic_xml_to_dict(xml_data)
+    with pytest.raises(ValueError, match="Malformed XML"):
+        fun_xml.static_xml_to_arrays(xml_data.encode("utf-8"))
@@ -0,0 +1,227 @@
+"""
+Unit tests for the streaming XML writers.
+
+Tests cover:
+    - The streamed XML is byte-identical to the one prettified by minidom, including escaped attributes
+    - Elements without children are self-closed, at any depth
+    - Writing to a path, to a stream or through small buffers gives the same bytes
+"""
+
+# Copyright  2025  Institute of Light and Matter, CNRS UMR 5306, University Claude Bernard Lyon 1
+# Contributors: Oscar DUFOUR, Maxime STAPELLE, Alexandre NICOLAS
+
+# This software is a computer program designed to generate a realistic crowd from anthropometric data and
+# simulate the mechanical interactions that occur within it and with obstacles.
+
+# This software is governed by the CeCILL  license under French law and abiding by the rules of distribution
+# of free software.  You can  use, modify and/ or redistribute the software under the terms of the CeCILL
+# license as circulated by CEA, CNRS and INRIA at the following URL "http://www.cecill.info".
+
+# As a counterpart to the access to the source code and  rights to copy, modify and redistribute granted by
+# the license, users are provided only with a limited warranty  and the software's author,  the holder of the
+# economic rights,  and the successive licensors  have only  limited liability.
+
+# In this respect, the user's attention is drawn to the risks associated with loading,  using,  modifying
+# and/or developing or reproducing the software by the user in light of its specific status of free software,
+# that may mean  that it is complicated to manipulate,  and  that  also therefore means  that it is reserved
+# for developers  and  experienced professionals having in-depth computer knowledge. Users are therefore
+# encouraged to load and test the software's suitability as regards their requirements in conditions enabling
+# the security of their systems and/or data to be ensured and,  more generally, to use and operate it in the
+# same conditions as regards security.
+
+# The fact that you are presently reading this means that you have had knowledge of the CeCILL license and that
+# you accept its terms.
+
+import xml.etree.ElementTree as ET
+from io import BytesIO
+from pathlib import Path
+from xml.dom import minidom
+
+import pytest
+
+import configuration.backup.dict_to_xml_and_reverse as fun_xml
+import configuration.utils.constants as cst
+from configuration.utils.typing_custom import DynamicCrowdDataType, InteractionsDataType, StaticCrowdDataType
+
+
+def prettify_with_minidom(root: ET.Element) -> bytes:
+    """
+    Serialise an element tree the way the XML files used to be written, as a reference.
+
+    Parameters
+    ----------
+    root : ET.Element
+        Root of the element tree.
+
+    Returns
+    -------
+    bytes
+        UTF-8 encoded, pretty-printed XML.
+    """
+    return minidom.parseString(ET.tostring(root, encoding="utf-8")).toprettyxml(indent="    ", encoding="utf-8")
+
+
+@pytest.fixture
+def dynamic_dict() -> DynamicCrowdDataType:
+    """
+    Fixture to provide the dynamic parameters of a few agents.
+
+    Returns
+    -------
+    DynamicCrowdDataType
+        A dictionary containing dynamic parameters for fifty agents.
+    """
+    return {
+        "Agents": {
+            f"Agent{agent_id}": {
+                "Id": agent_id,
+                "Kinematics": {"Position": (0.1 * agent_id, -0.2), "Velocity": (0.0, 1.5), "Theta": 0.25, "Omega": 0.0},
+                "Dynamics": {"Fp": (1000.0, -1000.0), "Mp": 0.0},
+            }
+            for agent_id in range(50)
+        }
+    }
+
+
+def test_static_writer_matches_minidom() -> None:
+    """Test that the static writer escapes the attributes and indents the elements exactly as minidom."""
+    static_dict: StaticCrowdDataType = {
+        "Agents": {
+            "Agent0": {
+                "Type": 'custom & "odd" <type>',
+                "Id": 0,
+                "Mass": 81.9,
+                "Height": 1.8,
+                "MomentOfInertia": 1.57,
+                "FloorDamping": 2.0,
+                "AngularDamping": 5.0,
+                "Shapes": {"disk0": {"Type": "disk", "Radius": 0.08, "MaterialId": "human_clothes", "Position": (-0.09, 0.13)}},
+            },
+            "Agent1": {
+                "Type": "pedestrian",
+                "Id": 1,
+                "Mass": 66.8,
+                "Height": 1.7,
+                "MomentOfInertia": 1.07,
+                "FloorDamping": 2.0,
+                "AngularDamping": 5.0,
+                "Shapes": {},
+            },
+        }
+    }
+    root = ET.Element("Agents")
+    for agent_data in static_dict["Agents"].values():
+        agent = ET.SubElement(
+            root,
+            "Agent",
+            {
+                "Type": agent_data["Type"],
+                "Id": f"{agent_data['Id']}",
+                "Mass": f"{agent_data['Mass']:.2f}",
+                "Height": f"{agent_data['Height']:.2f}",
+                "MomentOfInertia": f"{agent_data['MomentOfInertia']:.2f}",
+                "FloorDamping": f"{agent_data['FloorDamping']:.2f}",
+                "AngularDamping": f"{agent_data['AngularDamping']:.2f}",
+            },
+        )
+        for shape_data in agent_data["Shapes"].values():
+            ET.SubElement(
+                agent,
+                "Shape",
+                {
+                    "Type": shape_data["Type"],
+                    "Radius": f"{shape_data['Radius']:.3f}",
+                    "MaterialId": f"{shape_data['MaterialId']}",
+                    "Position": f"{shape_data['Position'][0]:.3f},{shape_data['Position'][1]:.3f}",
+                },
+            )
+
+    assert fun_xml.static_dict_to_xml(static_dict) == prettify_with_minidom(root)
+    assert fun_xml.static_dict_to_xml({"Agents": {}}) == prettify_with_minidom(ET.Element("Agents"))
+
+
+def test_interactions_writer_matches_minidom() -> None:
+    """Test that agents with and without neighbours are written exactly as minidom."""
+    interactions_dict: InteractionsDataType = {
+        "Interactions": {
+            "Agent0": {
+                "Id": 0,
+                "NeighbouringAgents": {
+                    "Agent1": {
+                        "Id": 1,
+                        "Interactions": {
+                            "Interaction_0_1": {
+                                "ParentShape": 0,
+                                "ChildShape": 1,
+                                "TangentialRelativeDisplacement": (0.0, 0.0),
+                                "Fn": (1.5, 0.0),
+                                "Ft": (0.0, -0.25),
+                            }
+                        },
+                    },
+                    "Agent2": {"Id": 2, "Interactions": {}},
+                },
+            },
+            "Agent1": {"Id": 1},
+        }
+    }
+    root = ET.Element("Interactions")
+    agent_element = ET.SubElement(root, "Agent", Id="0")
+    neighbour_element = ET.SubElement(agent_element, "Agent", Id="1")
+    ET.SubElement(
+        neighbour_element,
+        "Interaction",
+        ParentShape="0",
+        ChildShape="1",
+        TangentialRelativeDisplacement="0.00,0.00",
+        Fn="1.50,0.00",
+        Ft="0.00,-0.25",
+    )
+    ET.SubElement(agent_element, "Agent", Id="2")
+    ET.SubElement(root, "Agent", Id="1")
+
+    assert fun_xml.interactions_dict_to_xml(interactions_dict) == prettify_with_minidom(root)
+
+
+def test_dynamic_writer_outputs_are_identical(
+    dynamic_dict: DynamicCrowdDataType, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test that the dynamic writer gives the same bytes to a path, to a stream and through a small buffer.
+
+    Parameters
+    ----------
+    dynamic_dict : DynamicCrowdDataType
+        A fixture providing dynamic parameters.
+    tmp_path : Path
+        A pytest fixture providing a temporary directory for file operations.
+    monkeypatch : pytest.MonkeyPatch
+        A pytest fixture used to shrink the size of the write buffer.
+    """
+    root = ET.Element("Agents")
+    for agent_data in dynamic_dict["Agents"].values():
+        agent_element = ET.SubElement(root, "Agent", Id=f"{agent_data['Id']}")
+        kinematics_data = agent_data["Kinematics"]
+        ET.SubElement(
+            agent_element,
+            "Kinematics",
+            Position=f"{kinematics_data['Position'][0]:.3f},{kinematics_data['Position'][1]:.3f}",
+            Velocity=f"{kinematics_data['Velocity'][0]:.2f},{kinematics_data['Velocity'][1]:.2f}",
+            Theta=f"{kinematics_data['Theta']:.2f}",
+            Omega=f"{kinematics_data['Omega']:.2f}",
+        )
+        dynamics_data = agent_data["Dynamics"]
+        ET.SubElement(
+            agent_element, "Dynamics", Fp=f"{dynamics_data['Fp'][0]:.2f},{dynamics_data['Fp'][1]:.2f}", Mp=f"{dynamics_data['Mp']:.2f}"
+        )
+    expected_xml = prettify_with_minidom(root)
+
+    file_path = tmp_path / "AgentDynamics.xml"
+    fun_xml.write_dynamic_xml(dynamic_dict, file_path)
+    assert file_path.read_bytes() == expected_xml
+
+    monkeypatch.setattr(cst, "XML_WRITE_BUFFER_SIZE", 10)
+    stream = BytesIO()
+    fun_xml.write_dynamic_xml(dynamic_dict, stream)
+    assert not stream.closed
+    assert stream.getvalue() == expected_xml
@@ -0,0 +1,166 @@
+"""
+Unit tests for the streaming crowd ZIP writer.
+
+Tests cover:
+    - The members streamed with one or several threads are the XML files written from the crowd dictionaries
+    - The members serialised in threads are compressed as the ones written sequentially
+    - The archive can be streamed to a binary stream as well as to a path
+    - Invalid numbers of workers raise errors
+"""
+
+# Copyright  2025  Institute of Light and Matter, CNRS UMR 5306, University Claude Bernard Lyon 1
+# Contributors: Oscar DUFOUR, Maxime STAPELLE, Alexandre NICOLAS
+
+# This software is a computer program designed to generate a realistic crowd from anthropometric data and
+# simulate the mechanical interactions that occur within it and with obstacles.
+
+# This software is governed by the CeCILL  license under French law and abiding by the rules of distribution
+# of free software.  You can  use, modify and/ or redistribute the software under the terms of the CeCILL
+# license as circulated by CEA, CNRS and INRIA at the following URL "http://www.cecill.info".
+
+# As a counterpart to the access to the source code and  rights to copy, modify and redistribute granted by
+# the license, users are provided only with a limited warranty  and the software's author,  the holder of the
+# economic rights,  and the successive licensors  have only  limited liability.
+
+# In this respect, the user's attention is drawn to the risks associated with loading,  using,  modifying
+# and/or developing or reproducing the software by the user in light of its specific status of free software,
+# that may mean  that it is complicated to manipulate,  and  that  also therefore means  that it is reserved
+# for developers  and  experienced professionals having in-depth computer knowledge. Users are therefore
+# encouraged to load and test the software's suitability as regards their requirements in conditions enabling
+# the security of their systems and/or data to be ensured and,  more generally, to use and operate it in the
+# same conditions as regards security.
+
+# The fact that you are presently reading this means that you have had knowledge of the CeCILL license and that
+# you accept its terms.
+
+import io
+import zipfile
+from pathlib import Path
+
+import numpy as np
+import pytest
+from shapely.geometry import Polygon
+
+import configuration.backup.crowd_to_dict as fun_dict
+import configuration.backup.crowd_to_zip_and_reverse as fun_zip
+import configuration.backup.dict_to_xml_and_reverse as fun_xml
+import configuration.utils.constants as cst
+from configuration.models.crowd import Crowd
+
+
+@pytest.fixture
+def crowd() -> Crowd:
+    """
+    Fixture to create a small crowd of pedestrians placed on a grid.
+
+    Returns
+    -------
+    Crowd
+        A crowd of four pedestrians inside a square room.
+    """
+    np.random.seed(0)
+    current_crowd = Crowd(boundaries=Polygon([(0.0, 0.0), (300.0, 0.0), (300.0, 300.0), (0.0, 300.0)]))
+    current_crowd.create_agents(4)
+    current_crowd.pack_agents_on_grid()
+    return current_crowd
+
+
+@pytest.mark.parametrize("max_workers", [1, 2, 4])
+def test_streamed_members_match_xml_files(crowd: Crowd, tmp_path: Path, max_workers: int) -> None:
+    """
+    Test that the streamed members are the XML files written from the crowd dictionaries, whatever the number of threads.
+
+    Parameters
+    ----------
+    crowd : Crowd
+        A fixture providing a crowd of pedestrians.
+    tmp_path : Path
+        A pytest fixture providing a temporary directory for file operations.
+    max_workers : int
+        The number of threads serialising the members.
+    """
+    expected_members = {
+        "Agents.xml": fun_xml.static_dict_to_xml(fun_dict.get_static_params(crowd)),
+        "AgentDynamics.xml": fun_xml.dynamic_dict_to_xml(fun_dict.get_dynamic_params(crowd)),
+        "Geometry.xml": fun_xml.geometry_dict_to_xml(fun_dict.get_geometry_params(crowd)),
+        "Materials.xml": fun_xml.materials_dict_to_xml(fun_dict.get_materials_params()),
+    }
+
+    zip_path = tmp_path / "nested" / "crowd.zip"
+    fun_zip.save_crowd_data_to_zip(crowd, zip_path, max_workers=max_workers)
+    with zipfile.ZipFile(zip_path) as zip_file:
+        assert zip_file.testzip() is None
+        assert tuple(zip_file.namelist()) == cst.CROWD_XML_FILE_NAMES
+        for file_name, expected_content in expected_members.items():
+            assert zip_file.getinfo(file_name).compress_type == zipfile.ZIP_DEFLATED
+            assert zip_file.read(file_name) == expected_content
+
+
+def test_stream_to_binary_stream(crowd: Crowd, tmp_path: Path) -> None:
+    """
+    Test that streaming the archive to a binary stream gives the members of the in-memory and saved archives.
+
+    Parameters
+    ----------
+    crowd : Crowd
+        A fixture providing a crowd of pedestrians.
+    tmp_path : Path
+        A pytest fixture providing a temporary directory for file operations.
+    """
+    zip_path = tmp_path / "crowd.zip"
+    fun_zip.save_crowd_data_to_zip(crowd, zip_path)
+    output_stream = io.BytesIO()
+    fun_zip.stream_crowd_data_to_zip(crowd, output_stream, max_workers=2)
+
+    with (
+        zipfile.ZipFile(zip_path) as saved_zip_file,
+        zipfile.ZipFile(output_stream) as streamed_zip_file,
+        zipfile.ZipFile(fun_zip.write_crowd_data_to_zip(crowd)) as buffered_zip_file,
+    ):
+        for file_name in cst.CROWD_XML_FILE_NAMES:
+            assert streamed_zip_file.read(file_name) == saved_zip_file.read(file_name)
+            assert buffered_zip_file.read(file_name) == saved_zip_file.read(file_name)
+
+
+def test_threads_write_same_compressed_members(crowd: Crowd) -> None:
+    """
+    Test that the members serialised in threads have the CRC and compressed sizes of the ones written sequentially.
+
+    Parameters
+    ----------
+    crowd : Crowd
+        A fixture providing a crowd of pedestrians.
+    """
+    sequential_stream, threaded_stream = io.BytesIO(), io.BytesIO()
+    fun_zip.stream_crowd_data_to_zip(crowd, sequential_stream)
+    fun_zip.stream_crowd_data_to_zip(crowd, threaded_stream, max_workers=2)
+
+    with zipfile.ZipFile(sequential_stream) as sequential_zip_file, zipfile.ZipFile(threaded_stream) as threaded_zip_file:
+        assert threaded_zip_file.testzip() is None
+        for file_name in cst.CROWD_XML_FILE_NAMES:
+            sequential_info, threaded_info = sequential_zip_file.getinfo(file_name), threaded_zip_file.getinfo(file_name)
+            assert (threaded_info.CRC, threaded_info.file_size, threaded_info.compress_size) == (
+                sequential_info.CRC,
+                sequential_info.file_size,
+                sequential_info.compress_size,
+            )
+
+
+@pytest.mark.parametrize("max_workers", [0, -1, 1.5])
+def test_invalid_max_workers_raise(crowd: Crowd, tmp_path: Path, max_workers: int) -> None:
+    """
+    Test that invalid numbers of workers raise a ValueError before anything is written.
+
+    Parameters
+    ----------
+    crowd : Crowd
+        A fixture providing a crowd of pedestrians.
+    tmp_path : Path
+        A pytest fixture providing a temporary directory for file operations.
+    max_workers : int
+        An invalid number of threads.
+    """
+    zip_path = tmp_path / "crowd.zip"
+    with pytest.raises(ValueError, match="max_workers"):
+        fun_zip.save_crowd_data_to_zip(crowd, zip_path, max_workers=max_workers)
+    assert not zip_path.exists()
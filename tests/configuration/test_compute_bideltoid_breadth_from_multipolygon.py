@@ -8,6 +8,8 @@ Test cases cover:
     - Non-MultiPolygon input (should raise ValueError).
     - Degenerate case: all points vertically aligned (breadth zero).
     - Irregular polygon where the maximum horizontal breadth is not between endpoints.
+    - Agreement with a brute-force comparison of all pairs of points on random shapes.
+    - Batch computation for several MultiPolygons at once.
 """
 
 # Copyright  2025  Institute of Light and Matter, CNRS UMR 5306, University Claude Bernard Lyon 1
@@ -35,11 +37,13 @@ Test cases cover:
 # The fact that you are presently reading this means that you have had knowledge of the CeCILL license and that
 # you accept its terms.
 
+from collections.abc import Callable
+
 import numpy as np
 import pytest
 from shapely.geometry import MultiPolygon, Polygon
 
-from configuration.utils.functions import compute_bideltoid_breadth_from_multipolygon
+from configuration.utils.functions import compute_bideltoid_breadths_from_multipolygons, compute_bideltoid_breadth_from_multipolygon
 
 
 def test_simple_horizontal_rectangle() -> None:
@@ -94,3 +98,61 @@ def test_irregular_shape() -> None:
     assert np.isclose(breadth, 2.0, atol=1e-6)
     assert np.isclose(breadth, 2.0, atol=1e-6)
     assert np.isclose(breadth, 2.0, atol=1e-6)
+
+
+def brute_force_breadth(mp: MultiPolygon) -> float:
+    """
+    Compare all pairs of points to compute the expected breadth.
+
+    Parameters
+    ----------
+    mp : MultiPolygon
+        The MultiPolygon to measure.
+
+    Returns
+    -------
+    float
+        The largest distance between two points lying in a band of width 0.1.
+    """
+    coords = np.array([coord for poly in mp.geoms for coord in poly.exterior.coords]) - np.array(mp.centroid.coords[0])
+    in_band = np.abs(coords[:, np.newaxis, 1] - coords[np.newaxis, :, 1]) <= 1e-1
+    return float(np.max(np.abs(coords[:, np.newaxis, 0] - coords[np.newaxis, :, 0])[in_band]))
+
+
+def test_matches_brute_force(random_multipolygon: Callable[[np.random.Generator], MultiPolygon]) -> None:
+    """
+    Test that the band sweep gives exactly the result of the comparison of all pairs of points.
+
+    Parameters
+    ----------
+    random_multipolygon : Callable[[np.random.Generator], MultiPolygon]
+        Builder of random MultiPolygons (fixture).
+    """
+    rng = np.random.default_rng(0)
+    for _ in range(50):
+        mp = random_multipolygon(rng)
+        assert compute_bideltoid_breadth_from_multipolygon(mp) == brute_force_breadth(mp)
+
+
+def test_batch_matches_single_computations(random_multipolygon: Callable[[np.random.Generator], MultiPolygon]) -> None:
+    """
+    Test that the batch computation gives exactly the results of the computations one MultiPolygon at a time.
+
+    Parameters
+    ----------
+    random_multipolygon : Callable[[np.random.Generator], MultiPolygon]
+        Builder of random MultiPolygons (fixture).
+    """
+    rng = np.random.default_rng(1)
+    multipolygons = [random_multipolygon(rng) for _ in range(20)]
+    breadths = compute_bideltoid_breadths_from_multipolygons(multipolygons)
+    assert breadths.shape == (20,)
+    for mp, breadth in zip(multipolygons, breadths, strict=True):
+        assert breadth == compute_bideltoid_breadth_from_multipolygon(mp)
+
+
+def test_batch_non_multipolygon_input() -> None:
+    """Should raise ValueError if one of the inputs is not a MultiPolygon."""
+    mp = MultiPolygon([Polygon([(0, 0), (1, 0), (1, 1)])])
+    with pytest.raises(ValueError):
+        compute_bideltoid_breadths_from_multipolygons([mp, Polygon([(0, 0), (1, 0), (1, 1)])])
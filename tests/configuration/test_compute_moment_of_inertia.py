@@ -8,6 +8,10 @@ Tests cover:
     - Invalid geometry type validation
     - Area scaling consistency
     - Mass distribution in composite geometries
+    - Batch computation for several geometries at once
+    - Polygons with holes
+    - Exact analytic computation for unions of disks and rectangles
+    - Batch computation for all agents of a crowd
 """
 
 # Copyright  2025  Institute of Light and Matter, CNRS UMR 5306, University Claude Bernard Lyon 1
@@ -37,10 +41,18 @@ Tests cover:
 
 import math
 
+import numpy as np
 import pytest
-from shapely.geometry import MultiPolygon, Polygon
+from shapely.geometry import MultiPolygon, Point, Polygon
+from shapely.ops import unary_union
 
-from configuration.utils.functions import compute_moment_of_inertia
+import configuration.utils.constants as cst
+from configuration.models.crowd import Crowd
+from configuration.utils.functions import (
+    compute_moment_of_inertia,
+    compute_moment_of_inertia_of_disks_and_rectangles,
+    compute_moments_of_inertia,
+)
 
 
 def test_square_polygon() -> None:
@@ -94,3 +106,75 @@ def test_scaling_with_area() -> None:
     square2 = Polygon([(0, 0), (2, 0), (2, 2), (0, 2)])
     I2 = compute_moment_of_inertia(square2, weight * 4)
     assert math.isclose(I2, I1 * 16, rel_tol=1e-6)
+
+
+def test_batch_matches_single_computations() -> None:
+    """Test that the batch computation gives the same results as the computations one geometry at a time."""
+    shapes = [
+        Polygon([(0, 0), (1, 0), (1, 1), (0, 1)]),
+        Point(3.0, 2.0).buffer(5.0),
+        MultiPolygon([Polygon([(0, 0), (1, 0), (1, 1), (0, 1)]), Polygon([(2, 0), (4, 0), (4, 3), (2, 3)])]),
+    ]
+    weights = [2.0, 70.0, 4.0]
+    result = compute_moments_of_inertia(shapes, weights)
+    expected = [compute_moment_of_inertia(shape, weight) for shape, weight in zip(shapes, weights, strict=True)]
+    np.testing.assert_allclose(result, expected, rtol=1e-12)
+
+
+def test_polygon_with_hole() -> None:
+    """Test that a hole is removed from the mass distribution."""
+    outer = [(-2, -2), (2, -2), (2, 2), (-2, 2)]
+    inner = [(-1, -1), (1, -1), (1, 1), (-1, 1)]
+    weight = 3.0
+    result = compute_moment_of_inertia(Polygon(outer, [inner]), weight)
+    # Density times the difference of the polar moments of the outer and inner squares (a^4 / 6 for a side a)
+    expected = weight / 12.0 * (4.0**4 - 2.0**4) / 6.0 * 1e-4
+    assert math.isclose(result, expected, rel_tol=1e-12)
+
+
+def test_analytic_single_disk() -> None:
+    """Test the analytic moment of inertia of a disk against m r^2 / 2."""
+    weight, radius = 70.0, 20.0
+    result = compute_moment_of_inertia_of_disks_and_rectangles(np.array([[5.0, -3.0, radius]]), np.empty((0, 4, 2)), weight)
+    assert math.isclose(result, weight * radius**2 / 2.0 * 1e-4, rel_tol=1e-12)
+
+
+def test_analytic_rectangle() -> None:
+    """Test the analytic moment of inertia of a rectangle against m (a^2 + b^2) / 12, whatever the corner order."""
+    corners = np.array([[[0.0, 0.0], [0.0, 1.0], [2.0, 1.0], [2.0, 0.0]]])
+    result = compute_moment_of_inertia_of_disks_and_rectangles(np.empty((0, 3)), corners, 1.0)
+    assert math.isclose(result, (4.0 + 1.0) / 12.0 * 1e-4, rel_tol=1e-12)
+
+
+def test_analytic_duplicated_and_adjacent_primitives() -> None:
+    """Test that duplicated disks count once and that adjacent rectangles behave as their union."""
+    disks = np.array([[0.0, 0.0, 1.0], [0.0, 0.0, 1.0]])
+    assert math.isclose(compute_moment_of_inertia_of_disks_and_rectangles(disks, np.empty((0, 4, 2)), 1.0), 0.5e-4, rel_tol=1e-12)
+    rectangles = np.array([[[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 1.0]], [[1.0, 0.0], [2.0, 0.0], [2.0, 1.0], [1.0, 1.0]]])
+    result = compute_moment_of_inertia_of_disks_and_rectangles(np.empty((0, 3)), rectangles, 1.0)
+    assert math.isclose(result, (4.0 + 1.0) / 12.0 * 1e-4, rel_tol=1e-12)
+
+
+def test_analytic_union_of_overlapping_disks_and_rectangles() -> None:
+    """Test the analytic computation against a finely discretised union of overlapping disks and rectangles."""
+    disks = np.array([[-15.0, 0.0, 8.0], [-7.0, 1.0, 11.0], [0.0, 0.0, 12.0], [7.0, -1.0, 11.0], [15.0, 0.0, 8.0]])
+    rectangles = np.array(
+        [[[-10.0, -5.0], [30.0, -5.0], [30.0, 5.0], [-10.0, 5.0]], [[0.0, -20.0], [5.0, -20.0], [5.0, 20.0], [0.0, 20.0]]]
+    )
+    weight = 75.0
+    fine_union = unary_union(
+        [Point(x, y).buffer(radius, quad_segs=2000) for x, y, radius in disks] + [Polygon(corners) for corners in rectangles]
+    )
+    result = compute_moment_of_inertia_of_disks_and_rectangles(disks, rectangles, weight)
+    assert math.isclose(result, compute_moment_of_inertia(fine_union, weight), rel_tol=1e-5)
+
+
+def test_crowd_moments_of_inertia() -> None:
+    """Test that the crowd batch computation matches the moments of inertia stored when the agents were created."""
+    np.random.seed(0)
+    crowd = Crowd()
+    crowd.create_agents(3)
+    stored = [agent.measures.measures[cst.CommonMeasures.moment_of_inertia.name] for agent in crowd.agents]
+    np.testing.assert_allclose(crowd.compute_moments_of_inertia(), stored, rtol=1e-9)
+    # The polygonal disks are slightly smaller than the exact ones
+    np.testing.assert_allclose(crowd.compute_moments_of_inertia(exact=True), stored, rtol=2e-2)
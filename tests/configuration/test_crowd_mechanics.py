@@ -0,0 +1,241 @@
+"""
+Unit tests for the in-memory interface to the CrowdMechanics library.
+
+Tests cover:
+    - Time steps simulated from NumPy arrays give the same kinematics as the file interface, contacts included
+    - The agents are exposed in the order of the buffers
+    - Initialising the library again replaces the agents of the previous initialisation
+    - Arrays that cannot be passed to the library without copy raise errors
+"""
+
+# Copyright  2025  Institute of Light and Matter, CNRS UMR 5306, University Claude Bernard Lyon 1
+# Contributors: Oscar DUFOUR, Maxime STAPELLE, Alexandre NICOLAS
+
+# This software is a computer program designed to generate a realistic crowd from anthropometric data and
+# simulate the mechanical interactions that occur within it and with obstacles.
+
+# This software is governed by the CeCILL  license under French law and abiding by the rules of distribution
+# of free software.  You can  use, modify and/ or redistribute the software under the terms of the CeCILL
+# license as circulated by CEA, CNRS and INRIA at the following URL "http://www.cecill.info".
+
+# As a counterpart to the access to the source code and  rights to copy, modify and redistribute granted by
+# the license, users are provided only with a limited warranty  and the software's author,  the holder of the
+# economic rights,  and the successive licensors  have only  limited liability.
+
+# In this respect, the user's attention is drawn to the risks associated with loading,  using,  modifying
+# and/or developing or reproducing the software by the user in light of its specific status of free software,
+# that may mean  that it is complicated to manipulate,  and  that  also therefore means  that it is reserved
+# for developers  and  experienced professionals having in-depth computer knowledge. Users are therefore
+# encouraged to load and test the software's suitability as regards their requirements in conditions enabling
+# the security of their systems and/or data to be ensured and,  more generally, to use and operate it in the
+# same conditions as regards security.
+
+# The fact that you are presently reading this means that you have had knowledge of the CeCILL license and that
+# you accept its terms.
+
+import ctypes
+import shutil
+import subprocess
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import configuration.backup.dict_to_xml_and_reverse as dict_to_xml
+from configuration.backup.crowd_mechanics import CrowdMechanics, load_crowd_mechanics_library
+from configuration.utils.typing_custom import CrowdArraysDataType
+
+ROOT_PATH = Path(__file__).parents[2]
+KINEMATICS = ("position", "velocity", "theta", "omega")
+
+
+@pytest.fixture(scope="module")
+def library_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """
+    Build the CrowdMechanics shared library, or skip the tests if it cannot be built.
+
+    Parameters
+    ----------
+    tmp_path_factory : pytest.TempPathFactory
+        Factory of the temporary build directory.
+
+    Returns
+    -------
+    Path
+        The path of the shared library.
+    """
+    if shutil.which("cmake") is None:
+        pytest.skip("cmake is required to build the CrowdMechanics library")
+    build_path = tmp_path_factory.mktemp("build")
+    source_path = ROOT_PATH / "src" / "mechanical_layer"
+    try:
+        subprocess.run(
+            ["cmake", "-S", str(source_path), "-B", str(build_path), "-DBUILD_SHARED_LIBS=ON"], check=True, capture_output=True
+        )
+        subprocess.run(["cmake", "--build", str(build_path)], check=True, capture_output=True)
+    except subprocess.CalledProcessError:
+        pytest.skip("the CrowdMechanics library could not be built")
+    return next(path for path in sorted(build_path.glob("*CrowdMechanics*")) if path.suffix in (".so", ".dylib", ".dll"))
+
+
+@pytest.fixture
+def scenario_path(tmp_path: Path) -> Path:
+    """
+    Copy the scenario of the mechanical layer tutorial, with a Parameters file pointing to the copy.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary directory of the scenario.
+
+    Returns
+    -------
+    Path
+        The path of the Parameters file.
+    """
+    tutorial_path = ROOT_PATH / "tutorials" / "mechanical_layer"
+    shutil.copytree(tutorial_path / "static", tmp_path / "static")
+    shutil.copytree(tutorial_path / "dynamic", tmp_path / "dynamic")
+    parameters_path = tmp_path / "Parameters.xml"
+    parameters_path.write_text(
+        '<?xml version="1.0" encoding="utf-8"?>\n<Parameters>\n'
+        f'    <Directories Static="{tmp_path / "static"}/" Dynamic="{tmp_path / "dynamic"}/"/>\n'
+        '    <Times TimeStep="0.1" TimeStepMechanical="1e-5"/>\n</Parameters>\n'
+    )
+    return parameters_path
+
+
+def run_file_interface(library_path: Path, parameters_path: Path, number_steps: int) -> CrowdArraysDataType:
+    """
+    Simulate time steps with the file interface, restoring the driving forces and torques dropped from the output file.
+
+    The library is loaded from a copy, so that its state is not shared with the in-memory interface.
+
+    Parameters
+    ----------
+    library_path : Path
+        The path of the shared library.
+    parameters_path : Path
+        The path of the Parameters file.
+    number_steps : int
+        The number of time steps.
+
+    Returns
+    -------
+    CrowdArraysDataType
+        The dynamic arrays of the final AgentDynamics file.
+    """
+    library_copy_path = parameters_path.parent / f"file_interface{library_path.suffix}"
+    shutil.copy(library_path, library_copy_path)
+    library = load_crowd_mechanics_library(library_copy_path)
+    files = (ctypes.c_char_p * 5)(
+        str(parameters_path).encode(), b"Materials.xml", b"Geometry.xml", b"Agents.xml", b"AgentDynamics.xml"
+    )
+    dynamics_path = parameters_path.parent / "dynamic" / "AgentDynamics.xml"
+    dynamics = {agent.get("Id"): agent.find("Dynamics") for agent in ET.parse(dynamics_path).getroot()}
+    for _ in range(number_steps):
+        assert library.CrowdMechanics(files) == 0
+        tree = ET.parse(dynamics_path)
+        for agent in tree.getroot():
+            agent_dynamics = dynamics[agent.get("Id")]
+            assert agent_dynamics is not None
+            agent.append(agent_dynamics)
+        tree.write(dynamics_path)
+    assert (parameters_path.parent / "dynamic" / "AgentInteractions.xml").is_file()
+    return dict_to_xml.dynamic_xml_to_arrays(dynamics_path)
+
+
+def test_step_matches_file_interface(library_path: Path, scenario_path: Path) -> None:
+    """
+    Test that the time steps of the in-memory interface give the kinematics of the file interface, contacts included.
+
+    The kinematics are rounded to the 6 significant digits of the files after each in-memory step.
+
+    Parameters
+    ----------
+    library_path : Path
+        The path of the shared library.
+    scenario_path : Path
+        The path of the Parameters file.
+    """
+    number_steps = 3
+    dynamic_arrays = dict_to_xml.dynamic_xml_to_arrays(scenario_path.parent / "dynamic" / "AgentDynamics.xml")
+    crowd_mechanics = CrowdMechanics(library_path, scenario_path)
+    for _ in range(number_steps):
+        crowd_mechanics.step(dynamic_arrays)
+        for key in KINEMATICS:
+            dynamic_arrays[key].flat[:] = [float(f"{value:.6g}") for value in dynamic_arrays[key].flat]
+
+    expected_arrays = run_file_interface(library_path, scenario_path, number_steps)
+    for key in KINEMATICS:
+        np.testing.assert_array_equal(dynamic_arrays[key], expected_arrays[key])
+    np.testing.assert_array_equal(dynamic_arrays["fp"], np.full((4, 2), 100.0))
+
+
+def test_agent_ids(library_path: Path, scenario_path: Path) -> None:
+    """
+    Test that the agents are exposed in the order of the Agents file.
+
+    Parameters
+    ----------
+    library_path : Path
+        The path of the shared library.
+    scenario_path : Path
+        The path of the Parameters file.
+    """
+    crowd_mechanics = CrowdMechanics(library_path, scenario_path)
+    assert crowd_mechanics.number_agents == 4
+    assert crowd_mechanics.agent_ids == ["0", "1", "2", "3"]
+
+
+def test_initialise_again(library_path: Path, scenario_path: Path) -> None:
+    """
+    Test that initialising the library again replaces the agents, so that the time steps are unchanged.
+
+    Parameters
+    ----------
+    library_path : Path
+        The path of the shared library.
+    scenario_path : Path
+        The path of the Parameters file.
+    """
+    dynamic_arrays = dict_to_xml.dynamic_xml_to_arrays(scenario_path.parent / "dynamic" / "AgentDynamics.xml")
+    first_arrays = {key: value.copy() for key, value in dynamic_arrays.items()}
+    CrowdMechanics(library_path, scenario_path).step(first_arrays)
+    second_arrays = {key: value.copy() for key, value in dynamic_arrays.items()}
+    crowd_mechanics = CrowdMechanics(library_path, scenario_path)
+    crowd_mechanics.step(second_arrays)
+
+    assert crowd_mechanics.number_agents == 4
+    for key in KINEMATICS:
+        np.testing.assert_array_equal(second_arrays[key], first_arrays[key])
+
+
+def test_invalid_arrays(library_path: Path, scenario_path: Path) -> None:
+    """
+    Test that arrays with a wrong shape or type, or read-only while overwritten, raise errors before calling the library.
+
+    Parameters
+    ----------
+    library_path : Path
+        The path of the shared library.
+    scenario_path : Path
+        The path of the Parameters file.
+    """
+    crowd_mechanics = CrowdMechanics(library_path, scenario_path)
+    dynamic_arrays = dict_to_xml.dynamic_xml_to_arrays(scenario_path.parent / "dynamic" / "AgentDynamics.xml")
+
+    with pytest.raises(ValueError, match="shape"):
+        crowd_mechanics.step({**dynamic_arrays, "position": dynamic_arrays["position"][:3]})
+    with pytest.raises(ValueError, match="float64"):
+        crowd_mechanics.step({**dynamic_arrays, "theta": dynamic_arrays["theta"].astype(np.float32)})
+    with pytest.raises(ValueError, match="float64"):
+        crowd_mechanics.step({**dynamic_arrays, "velocity": np.asfortranarray(dynamic_arrays["velocity"])})
+    with pytest.raises(ValueError, match="no 'mp'"):
+        crowd_mechanics.step({key: value for key, value in dynamic_arrays.items() if key != "mp"})
+    dynamic_arrays["omega"].flags.writeable = False
+    with pytest.raises(ValueError, match="writeable"):
+        crowd_mechanics.step(dynamic_arrays)
+    with pytest.raises(FileNotFoundError):
+        load_crowd_mechanics_library(scenario_path.parent / "missing.so")
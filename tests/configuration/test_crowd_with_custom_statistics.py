@@ -61,6 +61,8 @@ def crowd() -> Crowd:
     Crowd
         An instance of Crowd with agents created and packed.
     """
+    # The statistics of such a small crowd depend on the draws, so they are seeded to keep the test deterministic
+    np.random.seed(0)
     crowd_measures = CrowdMeasures(agent_statistics=AGENT_STATISTICS)
     crowd = Crowd(measures=crowd_measures)
     crowd.create_agents(number_agents=NUMBER_AGENTS)
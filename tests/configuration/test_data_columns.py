@@ -0,0 +1,133 @@
+"""
+Unit tests for the typed columns of the anthropometric and bike datasets.
+
+Tests cover:
+    - Columns saved as arrays are loaded back memory-mapped, with their types
+    - The ANSUR II columns used by the models, with the sex as uint8 codes
+    - The default database of the crowd measures is filled from the columns
+    - The default bike columns are loaded without pandas
+    - Invalid paths and columns raise errors
+"""
+
+# Copyright  2025  Institute of Light and Matter, CNRS UMR 5306, University Claude Bernard Lyon 1
+# Contributors: Oscar DUFOUR, Maxime STAPELLE, Alexandre NICOLAS
+
+# This software is a computer program designed to generate a realistic crowd from anthropometric data and
+# simulate the mechanical interactions that occur within it and with obstacles.
+
+# This software is governed by the CeCILL  license under French law and abiding by the rules of distribution
+# of free software.  You can  use, modify and/ or redistribute the software under the terms of the CeCILL
+# license as circulated by CEA, CNRS and INRIA at the following URL "http://www.cecill.info".
+
+# As a counterpart to the access to the source code and  rights to copy, modify and redistribute granted by
+# the license, users are provided only with a limited warranty  and the software's author,  the holder of the
+# economic rights,  and the successive licensors  have only  limited liability.
+
+# In this respect, the user's attention is drawn to the risks associated with loading,  using,  modifying
+# and/or developing or reproducing the software by the user in light of its specific status of free software,
+# that may mean  that it is complicated to manipulate,  and  that  also therefore means  that it is reserved
+# for developers  and  experienced professionals having in-depth computer knowledge. Users are therefore
+# encouraged to load and test the software's suitability as regards their requirements in conditions enabling
+# the security of their systems and/or data to be ensured and,  more generally, to use and operate it in the
+# same conditions as regards security.
+
+# The fact that you are presently reading this means that you have had knowledge of the CeCILL license and that
+# you accept its terms.
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import configuration.utils.constants as cst
+import configuration.utils.functions as fun
+from configuration.data import datafactory
+from configuration.models.measures import CrowdMeasures, load_default_bike_columns, load_default_columns
+
+
+def test_columns_round_trip(tmp_path: Path) -> None:
+    """
+    Test that the saved columns are loaded back memory-mapped, with their types.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        A pytest fixture providing a temporary directory for file operations.
+    """
+    columns = {"sex": np.array([1, 2, 2], dtype=np.uint8), "height": np.array([170.5, 160.0, 155.25])}
+    fun.save_columns(columns, tmp_path)
+
+    loaded_columns = fun.load_columns(str(tmp_path))
+    assert loaded_columns.keys() == columns.keys()
+    for name, column in columns.items():
+        assert isinstance(loaded_columns[name], np.memmap)
+        assert loaded_columns[name].dtype == column.dtype
+        np.testing.assert_array_equal(loaded_columns[name], column)
+
+
+def test_anthropometric_columns() -> None:
+    """Test that the ANSUR II columns are typed and match the pickled DataFrame."""
+    df = fun.load_pickle(str(Path(__file__).parent.parent.parent / "data" / "pkl" / "ANSUREIIPublic.pkl"))
+    columns = datafactory.get_anthropometric_columns(df)
+
+    assert columns.keys() == {"sex", *cst.ANSUR_DATA_COLUMNS}
+    assert columns["sex"].dtype == np.uint8
+    assert [cst.Sex(code).name for code in columns["sex"][[0, -1]]] == df["sex"].iloc[[0, -1]].tolist()
+    for name, column in cst.ANSUR_DATA_COLUMNS.items():
+        assert columns[name].dtype == np.float64
+        np.testing.assert_array_equal(columns[name], df[column].to_numpy())
+
+
+def test_bike_columns() -> None:
+    """Test that the bike geometry columns are converted to cm, with NaN for the missing values."""
+    df = pd.DataFrame({"Reach": [400.0, None], "Stack": ["600", ""], "Top Tube Length": [550, 560], "Wheelbase": [1100.0, 1200.0]})
+    columns = datafactory.get_bike_columns(df)
+
+    assert columns.keys() == cst.BIKE_DATA_COLUMNS.keys()
+    np.testing.assert_array_equal(columns["reach"], [40.0, np.nan])
+    np.testing.assert_array_equal(columns["stack"], [60.0, np.nan])
+    np.testing.assert_array_equal(columns["top_tube_length"], [55.0, 56.0])
+
+
+def test_default_database_from_columns() -> None:
+    """Test that the default database of the crowd measures holds one row per line of the columns."""
+    columns = load_default_columns()
+    default_database = CrowdMeasures().default_database
+
+    assert len(default_database) == len(columns["sex"])
+    row = default_database[len(default_database) - 1]
+    assert row.keys() == {"sex", *cst.ANSUR_DATA_COLUMNS.values()}
+    assert row["sex"] == cst.Sex(int(columns["sex"][-1])).name
+    assert row["height [cm]"] == columns["height"][-1]
+
+
+def test_default_bike_columns() -> None:
+    """Test that the default bike columns are the geometry columns of the pickled bike data."""
+    df = fun.load_pickle(str(Path(__file__).parent.parent.parent / "data" / "pkl" / "bike_data.pkl"))
+    expected_columns = datafactory.get_bike_columns(df)
+    columns = load_default_bike_columns()
+
+    assert columns.keys() == expected_columns.keys()
+    for name, column in expected_columns.items():
+        assert columns[name].dtype == np.float64
+        np.testing.assert_array_equal(columns[name], column)
+
+
+def test_invalid_columns_raise(tmp_path: Path) -> None:
+    """
+    Test that invalid paths and columns raise errors.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        A pytest fixture providing a temporary directory for file operations.
+    """
+    with pytest.raises(TypeError):
+        fun.save_columns({}, str(tmp_path))
+    with pytest.raises(ValueError):
+        fun.save_columns({"a": np.zeros(2), "b": np.zeros(3)}, tmp_path)
+    with pytest.raises(TypeError):
+        fun.load_columns(tmp_path)
+    with pytest.raises(FileNotFoundError):
+        fun.load_columns(str(tmp_path / "missing"))
@@ -0,0 +1,201 @@
+"""
+Unit tests for the incremental preparation of the data.
+
+Tests cover:
+    - A first preparation creates the outputs and the manifest, and a second one runs no step
+    - Only the steps whose inputs, parameters or outputs changed are prepared again
+    - Steps whose inputs are missing are skipped if their outputs exist
+    - Independent steps are prepared in parallel
+    - Missing inputs and outputs, and invalid numbers of workers, raise errors
+"""
+
+# Copyright  2025  Institute of Light and Matter, CNRS UMR 5306, University Claude Bernard Lyon 1
+# Contributors: Oscar DUFOUR, Maxime STAPELLE, Alexandre NICOLAS
+
+# This software is a computer program designed to generate a realistic crowd from anthropometric data and
+# simulate the mechanical interactions that occur within it and with obstacles.
+
+# This software is governed by the CeCILL  license under French law and abiding by the rules of distribution
+# of free software.  You can  use, modify and/ or redistribute the software under the terms of the CeCILL
+# license as circulated by CEA, CNRS and INRIA at the following URL "http://www.cecill.info".
+
+# As a counterpart to the access to the source code and  rights to copy, modify and redistribute granted by
+# the license, users are provided only with a limited warranty  and the software's author,  the holder of the
+# economic rights,  and the successive licensors  have only  limited liability.
+
+# In this respect, the user's attention is drawn to the risks associated with loading,  using,  modifying
+# and/or developing or reproducing the software by the user in light of its specific status of free software,
+# that may mean  that it is complicated to manipulate,  and  that  also therefore means  that it is reserved
+# for developers  and  experienced professionals having in-depth computer knowledge. Users are therefore
+# encouraged to load and test the software's suitability as regards their requirements in conditions enabling
+# the security of their systems and/or data to be ensured and,  more generally, to use and operate it in the
+# same conditions as regards security.
+
+# The fact that you are presently reading this means that you have had knowledge of the CeCILL license and that
+# you accept its terms.
+
+import json
+import shutil
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import configuration.utils.constants as cst
+from configuration.data import datafactory
+
+DATA_DIR_PATH = Path(__file__).parent.parent.parent / "data"
+
+
+@pytest.fixture
+def data_dir_path(tmp_path: Path) -> Path:
+    """
+    Fixture to create a data directory with the CSV files and the light 3D bodies, but without the original 3D bodies.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        A pytest fixture providing a temporary directory for file operations.
+
+    Returns
+    -------
+    Path
+        The path to the data directory.
+    """
+    shutil.copytree(DATA_DIR_PATH / "csv", tmp_path / "csv")
+    (tmp_path / "pkl").mkdir()
+    for sex in cst.Sex:
+        shutil.copy(DATA_DIR_PATH / "pkl" / f"{sex.name}_3dBody_light.pkl", tmp_path / "pkl")
+    return tmp_path
+
+
+@pytest.fixture
+def prepared_steps(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """
+    Fixture to record the names of the steps prepared.
+
+    Parameters
+    ----------
+    monkeypatch : pytest.MonkeyPatch
+        A pytest fixture to wrap the preparation functions.
+
+    Returns
+    -------
+    list[str]
+        The names of the prepared steps, filled in the order of the preparation.
+    """
+    names: list[str] = []
+    get_preparation_steps = datafactory.get_preparation_steps
+
+    def recording_steps() -> dict[str, datafactory.PreparationStep]:
+        steps: dict[str, datafactory.PreparationStep] = get_preparation_steps()
+        for name, step in steps.items():
+            step.prepare = record(name, step.prepare)
+        return steps
+
+    def record(name: str, prepare: Callable[[Path], None]) -> Callable[[Path], None]:
+        def recording_prepare(data_dir_path: Path) -> None:
+            names.append(name)
+            prepare(data_dir_path)
+
+        return recording_prepare
+
+    monkeypatch.setattr(datafactory, "get_preparation_steps", recording_steps)
+    return names
+
+
+def test_second_preparation_runs_no_step(data_dir_path: Path, prepared_steps: list[str]) -> None:
+    """
+    Test that a first preparation creates the outputs and the manifest, and that a second one runs no step.
+
+    Parameters
+    ----------
+    data_dir_path : Path
+        A fixture providing a data directory.
+    prepared_steps : list[str]
+        A fixture recording the names of the prepared steps.
+    """
+    datafactory.prepare_data(data_dir_path, max_workers=1)
+
+    assert sorted(prepared_steps) == ["3D_body_arrays", "anthropometric_data", "bike_data"]
+    assert prepared_steps[-1] == "3D_body_arrays"
+    assert (data_dir_path / "pkl" / "ANSUREIIPublic.pkl").exists()
+    assert (data_dir_path / "npy" / "bike_data").is_dir()
+    manifest: dict[str, Any] = json.loads((data_dir_path / cst.DATA_MANIFEST_FILE_NAME).read_text(encoding="utf-8"))
+    assert manifest["version"] == cst.DATA_MANIFEST_VERSION
+    assert manifest["steps"]["bike_data"]["inputs"].keys() == {"csv/geometrics.mtb-news.de.csv"}
+    assert "npy/bike_data/wheelbase.npy" in manifest["steps"]["bike_data"]["outputs"]
+
+    prepared_steps.clear()
+    datafactory.prepare_data(data_dir_path, max_workers=1)
+    assert prepared_steps == []
+
+
+def test_only_changed_steps_are_prepared(data_dir_path: Path, prepared_steps: list[str], monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that only the steps whose inputs, parameters or outputs changed are prepared again.
+
+    Parameters
+    ----------
+    data_dir_path : Path
+        A fixture providing a data directory.
+    prepared_steps : list[str]
+        A fixture recording the names of the prepared steps.
+    monkeypatch : pytest.MonkeyPatch
+        A pytest fixture to change a parameter of the preparation.
+    """
+    datafactory.prepare_data(data_dir_path, max_workers=1)
+
+    # Changed input
+    prepared_steps.clear()
+    csv_path = data_dir_path / "csv" / "geometrics.mtb-news.de.csv"
+    csv_path.write_bytes(csv_path.read_bytes() + b"\n")
+    datafactory.prepare_data(data_dir_path, max_workers=1)
+    assert prepared_steps == ["bike_data"]
+
+    # Missing output
+    prepared_steps.clear()
+    (data_dir_path / "npy" / "male_3dBody_lod1" / "heights.npy").unlink()
+    datafactory.prepare_data(data_dir_path, max_workers=1)
+    assert prepared_steps == ["3D_body_arrays"]
+
+    # Changed parameter
+    prepared_steps.clear()
+    monkeypatch.setattr(cst, "ANSUR_DATA_COLUMNS", {"height": "height [cm]"})
+    datafactory.prepare_data(data_dir_path, max_workers=1)
+    assert prepared_steps == ["anthropometric_data"]
+    assert sorted(path.name for path in (data_dir_path / "npy" / "ANSUREIIPublic").iterdir()) == ["height.npy", "sex.npy"]
+
+
+def test_parallel_preparation(data_dir_path: Path) -> None:
+    """
+    Test that the independent steps prepared in parallel are recorded in the manifest.
+
+    Parameters
+    ----------
+    data_dir_path : Path
+        A fixture providing a data directory.
+    """
+    datafactory.prepare_data(data_dir_path, max_workers=2)
+
+    manifest: dict[str, Any] = json.loads((data_dir_path / cst.DATA_MANIFEST_FILE_NAME).read_text(encoding="utf-8"))
+    assert sorted(manifest["steps"]) == ["3D_body_arrays", "anthropometric_data", "bike_data"]
+    for record in manifest["steps"].values():
+        assert record["outputs"] == datafactory.compute_file_hashes(data_dir_path, list(record["outputs"]))
+
+
+def test_missing_inputs_and_outputs_raise(data_dir_path: Path) -> None:
+    """
+    Test that a step whose inputs and outputs are missing raises an error, as do invalid numbers of workers.
+
+    Parameters
+    ----------
+    data_dir_path : Path
+        A fixture providing a data directory.
+    """
+    (data_dir_path / "pkl" / "male_3dBody_light.pkl").unlink()
+    with pytest.raises(FileNotFoundError):
+        datafactory.prepare_data(data_dir_path, max_workers=1)
+    with pytest.raises(ValueError):
+        datafactory.prepare_data(data_dir_path, max_workers=0)
@@ -0,0 +1,144 @@
+"""
+Unit tests for the persistent cache of the scale factors fitted to create agent shapes.
+
+Tests cover:
+    - Keys quantise the measures to the resolution of the cache
+    - Fits are persisted, and lookups are counted as hits and misses
+    - The least recently used fits are evicted above the size cap
+    - Shapes created on a cache hit match the ones created on a miss
+    - Invalid paths and sizes raise errors
+"""
+
+# Copyright  2025  Institute of Light and Matter, CNRS UMR 5306, University Claude Bernard Lyon 1
+# Contributors: Oscar DUFOUR, Maxime STAPELLE, Alexandre NICOLAS
+
+# This software is a computer program designed to generate a realistic crowd from anthropometric data and
+# simulate the mechanical interactions that occur within it and with obstacles.
+
+# This software is governed by the CeCILL  license under French law and abiding by the rules of distribution
+# of free software.  You can  use, modify and/ or redistribute the software under the terms of the CeCILL
+# license as circulated by CEA, CNRS and INRIA at the following URL "http://www.cecill.info".
+
+# As a counterpart to the access to the source code and  rights to copy, modify and redistribute granted by
+# the license, users are provided only with a limited warranty  and the software's author,  the holder of the
+# economic rights,  and the successive licensors  have only  limited liability.
+
+# In this respect, the user's attention is drawn to the risks associated with loading,  using,  modifying
+# and/or developing or reproducing the software by the user in light of its specific status of free software,
+# that may mean  that it is complicated to manipulate,  and  that  also therefore means  that it is reserved
+# for developers  and  experienced professionals having in-depth computer knowledge. Users are therefore
+# encouraged to load and test the software's suitability as regards their requirements in conditions enabling
+# the security of their systems and/or data to be ensured and,  more generally, to use and operate it in the
+# same conditions as regards security.
+
+# The fact that you are presently reading this means that you have had knowledge of the CeCILL license and that
+# you accept its terms.
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import configuration.utils.constants as cst
+from configuration.backup.fit_cache import FitCache, get_active_fit_cache, make_fit_key, use_fit_cache
+from configuration.models.measures import AgentMeasures
+from configuration.models.shapes2D import Shapes2D
+
+PEDESTRIAN_MEASURES: dict[str, float | str] = {
+    "sex": "male",
+    "bideltoid_breadth": 50.02,
+    "chest_depth": 25.98,
+    "height": 180.0,
+    "weight": 80.0,
+}
+
+
+def test_keys_quantise_measures() -> None:
+    """Test that measures closer than the resolution of the cache share a key."""
+    assert make_fit_key("pedestrian2D", "male", (25.98, 50.02)) == make_fit_key("pedestrian2D", "male", (26.01, 49.99))
+    assert make_fit_key("pedestrian2D", "male", (25.98, 50.02)) != make_fit_key("pedestrian2D", "male", (25.8, 50.02))
+    assert make_fit_key("pedestrian2D", "male", (26.0, 50.0)) != make_fit_key("pedestrian3D", "male", (26.0, 50.0))
+    assert make_fit_key("bike2D", None, (6.0, 142.0)) == "bike2D::60,1420"
+
+
+def test_fits_are_persisted_and_counted(tmp_path: Path) -> None:
+    """
+    Test that the fits are persisted across connections, and that lookups are counted.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        A pytest fixture providing a temporary directory for file operations.
+    """
+    cache = FitCache(tmp_path / "fits.sqlite")
+    assert cache.get("a") is None
+    cache.put("a", np.array([0.5, 1.5]))
+    np.testing.assert_array_equal(cache.get("a"), [0.5, 1.5])
+    assert (cache.hits, cache.misses) == (1, 1)
+    cache.close()
+
+    reopened_cache = FitCache(tmp_path / "fits.sqlite")
+    np.testing.assert_array_equal(reopened_cache.get("a"), [0.5, 1.5])
+    assert (reopened_cache.hits, reopened_cache.misses, len(reopened_cache)) == (1, 0, 1)
+    reopened_cache.clear()
+    assert (reopened_cache.hits, len(reopened_cache)) == (0, 0)
+    reopened_cache.close()
+
+
+def test_least_recently_used_fits_are_evicted(tmp_path: Path) -> None:
+    """
+    Test that the least recently used fits are evicted above the size cap.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        A pytest fixture providing a temporary directory for file operations.
+    """
+    cache = FitCache(tmp_path / "fits.sqlite", max_entries=2)
+    cache.put("a", np.array([1.0]))
+    cache.put("b", np.array([2.0]))
+    cache.get("a")
+    cache.put("c", np.array([3.0]))
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    cache.close()
+
+
+def test_shapes_on_hit_match_shapes_on_miss(tmp_path: Path) -> None:
+    """
+    Test that the shapes created from cached scale factors match the ones created by the fit.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        A pytest fixture providing a temporary directory for file operations.
+    """
+    measures = AgentMeasures(agent_type=cst.AgentTypes.pedestrian, measures=dict(PEDESTRIAN_MEASURES))
+    with use_fit_cache(tmp_path / "fits.sqlite") as cache:
+        assert get_active_fit_cache() is cache
+        fitted_shapes = Shapes2D(agent_type=cst.AgentTypes.pedestrian)
+        fitted_shapes.create_pedestrian_shapes(measures)
+        cached_shapes = Shapes2D(agent_type=cst.AgentTypes.pedestrian)
+        cached_shapes.create_pedestrian_shapes(measures)
+        assert (cache.hits, cache.misses) == (1, 1)
+    assert get_active_fit_cache() is None
+
+    for name, shape in fitted_shapes.shapes.items():
+        assert shape["object"].equals_exact(cached_shapes.shapes[name]["object"], tolerance=1e-12)
+
+
+def test_invalid_cache_raises_errors(tmp_path: Path) -> None:
+    """
+    Test that invalid paths and sizes raise errors.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        A pytest fixture providing a temporary directory for file operations.
+    """
+    with pytest.raises(TypeError, match="Path object"):
+        FitCache(str(tmp_path / "fits.sqlite"))
+    with pytest.raises(ValueError, match="positive integer"):
+        FitCache(tmp_path / "fits.sqlite", max_entries=0)
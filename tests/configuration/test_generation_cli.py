@@ -0,0 +1,134 @@
+"""
+Unit tests for the command-line interface generating crowds from a job specification.
+
+Tests cover:
+    - Jobs are loaded from JSON and TOML specifications, with defaults and repetitions
+    - The number of agents is computed from the density of the room
+    - The command writes the outputs of each job and a timing report
+    - Invalid specifications raise errors, and failed jobs are reported
+"""
+
+# Copyright  2025  Institute of Light and Matter, CNRS UMR 5306, University Claude Bernard Lyon 1
+# Contributors: Oscar DUFOUR, Maxime STAPELLE, Alexandre NICOLAS
+
+# This software is a computer program designed to generate a realistic crowd from anthropometric data and
+# simulate the mechanical interactions that occur within it and with obstacles.
+
+# This software is governed by the CeCILL  license under French law and abiding by the rules of distribution
+# of free software.  You can  use, modify and/ or redistribute the software under the terms of the CeCILL
+# license as circulated by CEA, CNRS and INRIA at the following URL "http://www.cecill.info".
+
+# As a counterpart to the access to the source code and  rights to copy, modify and redistribute granted by
+# the license, users are provided only with a limited warranty  and the software's author,  the holder of the
+# economic rights,  and the successive licensors  have only  limited liability.
+
+# In this respect, the user's attention is drawn to the risks associated with loading,  using,  modifying
+# and/or developing or reproducing the software by the user in light of its specific status of free software,
+# that may mean  that it is complicated to manipulate,  and  that  also therefore means  that it is reserved
+# for developers  and  experienced professionals having in-depth computer knowledge. Users are therefore
+# encouraged to load and test the software's suitability as regards their requirements in conditions enabling
+# the security of their systems and/or data to be ensured and,  more generally, to use and operate it in the
+# same conditions as regards security.
+
+# The fact that you are presently reading this means that you have had knowledge of the CeCILL license and that
+# you accept its terms.
+
+import json
+from pathlib import Path
+
+import pytest
+
+from configuration.backup.crowd_to_npz_and_reverse import load_crowd_from_npz
+from configuration.cli import GenerationJob, load_generation_jobs, main
+
+ROOM: list[list[float]] = [[0.0, 0.0], [400.0, 0.0], [400.0, 300.0], [0.0, 300.0]]
+
+
+def test_load_jobs_with_defaults_and_repetitions(tmp_path: Path) -> None:
+    """
+    Test that the jobs of JSON and TOML specifications are loaded with their defaults and repetitions.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        A pytest fixture providing a temporary directory for file operations.
+    """
+    spec = {
+        "defaults": {"boundaries": ROOM, "formats": ["npz"]},
+        "jobs": [{"name": "room", "density": 0.5, "seed": 10, "repetitions": 3}, {"number_agents": 2, "packing": "grid"}],
+    }
+    spec_path = tmp_path / "spec.json"
+    spec_path.write_text(json.dumps(spec), encoding="utf-8")
+    jobs = load_generation_jobs(spec_path)
+
+    assert [job.name for job in jobs] == ["room_0", "room_1", "room_2", "job1"]
+    assert [job.seed for job in jobs] == [10, 11, 12, None]
+    assert all(job.output_dir == tmp_path and job.formats == ["npz"] for job in jobs)
+    assert jobs[0].get_number_agents() == 6
+
+    toml_path = tmp_path / "spec.toml"
+    toml_path.write_text('[[jobs]]\nname = "toml"\nnumber_agents = 3\npacking = "none"\n', encoding="utf-8")
+    (toml_job,) = load_generation_jobs(toml_path, output_dir=tmp_path / "out")
+    assert (toml_job.name, toml_job.get_number_agents(), toml_job.output_dir) == ("toml", 3, tmp_path / "out")
+
+
+def test_main_writes_outputs_and_report(tmp_path: Path) -> None:
+    """
+    Test that the command writes the outputs of the jobs and a timing report, and reports failed jobs.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        A pytest fixture providing a temporary directory for file operations.
+    """
+    spec = {
+        "defaults": {"boundaries": ROOM, "packing": "grid", "seed": 0},
+        "jobs": [
+            {"name": "ansur", "number_agents": 2, "formats": ["zip", "npz"], "male_proportion": 1.0},
+            {"name": "broken", "number_agents": 2, "packing_parameters": {"unknown": 1.0}},
+            {"name": "flat_room", "density": 1.0, "boundaries": [[0.0, 0.0], [400.0, 0.0]]},
+        ],
+    }
+    spec_path = tmp_path / "spec.json"
+    spec_path.write_text(json.dumps(spec), encoding="utf-8")
+
+    assert main([str(spec_path), "--max-workers", "1"]) == 1
+    assert (tmp_path / "ansur.zip").exists()
+    crowd = load_crowd_from_npz(tmp_path / "ansur.npz")
+    assert crowd.get_number_agents() == 2
+    assert {agent.measures.measures["sex"] for agent in crowd.agents} == {"male"}
+
+    report = json.loads((tmp_path / "report.json").read_text(encoding="utf-8"))
+    ansur_report, broken_report, flat_room_report = report["jobs"]
+    assert ansur_report["error"] is None and ansur_report["total_time"] >= ansur_report["pack_time"] >= 0.0
+    assert "TypeError" in broken_report["error"]
+    assert flat_room_report["number_agents"] is None and "ValueError" in flat_room_report["error"]
+
+
+def test_invalid_specifications_raise_errors(tmp_path: Path) -> None:
+    """
+    Test that invalid specifications raise errors.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        A pytest fixture providing a temporary directory for file operations.
+    """
+    with pytest.raises(ValueError, match="exactly one"):
+        GenerationJob(name="job", output_dir=tmp_path, number_agents=2, density=1.0, boundaries=ROOM)
+    with pytest.raises(ValueError, match="given with boundaries"):
+        GenerationJob(name="job", output_dir=tmp_path, density=1.0)
+    with pytest.raises(ValueError, match="unknown packing"):
+        GenerationJob(name="job", output_dir=tmp_path, number_agents=2, packing="spiral")
+    with pytest.raises(ValueError, match="formats"):
+        GenerationJob(name="job", output_dir=tmp_path, number_agents=2, formats=["pdf"])
+
+    spec_path = tmp_path / "spec.json"
+    spec_path.write_text(json.dumps({"jobs": [{"name": "job", "number_agents": 2, "agents": 3}]}), encoding="utf-8")
+    with pytest.raises(ValueError, match="Unknown fields"):
+        load_generation_jobs(spec_path)
+    spec_path.write_text(json.dumps({"jobs": [{"name": "job", "number_agents": 2}] * 2}), encoding="utf-8")
+    with pytest.raises(ValueError, match="unique"):
+        load_generation_jobs(spec_path)
+    with pytest.raises(ValueError, match="extension"):
+        load_generation_jobs(tmp_path / "spec.yaml")
@@ -0,0 +1,154 @@
+"""
+Unit tests for the computation of the initial interactions between agents.
+
+Tests cover:
+    - The interactions of overlapping pedestrians (disks only) match a brute force test of all shape pairs
+    - The interactions of a crowd with bikes (disks and rectangles) match a brute force test of all shape pairs
+    - Agents without any interaction are kept in the interactions
+"""
+
+# Copyright  2025  Institute of Light and Matter, CNRS UMR 5306, University Claude Bernard Lyon 1
+# Contributors: Oscar DUFOUR, Maxime STAPELLE, Alexandre NICOLAS
+
+# This software is a computer program designed to generate a realistic crowd from anthropometric data and
+# simulate the mechanical interactions that occur within it and with obstacles.
+
+# This software is governed by the CeCILL  license under French law and abiding by the rules of distribution
+# of free software.  You can  use, modify and/ or redistribute the software under the terms of the CeCILL
+# license as circulated by CEA, CNRS and INRIA at the following URL "http://www.cecill.info".
+
+# As a counterpart to the access to the source code and  rights to copy, modify and redistribute granted by
+# the license, users are provided only with a limited warranty  and the software's author,  the holder of the
+# economic rights,  and the successive licensors  have only  limited liability.
+
+# In this respect, the user's attention is drawn to the risks associated with loading,  using,  modifying
+# and/or developing or reproducing the software by the user in light of its specific status of free software,
+# that may mean  that it is complicated to manipulate,  and  that  also therefore means  that it is reserved
+# for developers  and  experienced professionals having in-depth computer knowledge. Users are therefore
+# encouraged to load and test the software's suitability as regards their requirements in conditions enabling
+# the security of their systems and/or data to be ensured and,  more generally, to use and operate it in the
+# same conditions as regards security.
+
+# The fact that you are presently reading this means that you have had knowledge of the CeCILL license and that
+# you accept its terms.
+
+import numpy as np
+import pytest
+from shapely.geometry import Polygon
+
+import configuration.backup.crowd_to_dict as fun_dict
+import configuration.utils.constants as cst
+from configuration.models.agents import Agent
+from configuration.models.crowd import Crowd
+from configuration.utils.typing_custom import InteractionsDataType
+
+
+def brute_force_interactions(crowd: Crowd) -> InteractionsDataType:
+    """
+    Compute the interactions of a crowd by testing every pair of shapes of every pair of agents.
+
+    Parameters
+    ----------
+    crowd : Crowd
+        The crowd whose interactions are computed.
+
+    Returns
+    -------
+    InteractionsDataType
+        A dictionary containing the parameters for agent interactions.
+    """
+    interactions_dict: InteractionsDataType = {"Interactions": {}}
+    for id_agent1, agent1 in enumerate(crowd.agents):
+        neighbouring_agents = {}
+        for id_agent2, agent2 in enumerate(crowd.agents):
+            interactions = {
+                f"Interaction_{p_id}_{c_id}": {
+                    "ParentShape": p_id,
+                    "ChildShape": c_id,
+                    "TangentialRelativeDisplacement": (
+                        cst.INITIAL_TANGENTIAL_RELATIVE_DISPLACEMENT_X,
+                        cst.INITIAL_TANGENTIAL_RELATIVE_DISPLACEMENT_Y,
+                    ),
+                    "Fn": (cst.INITIAL_NORMAL_FORCE_X, cst.INITIAL_NORMAL_FORCE_Y),
+                    "Ft": (cst.INITIAL_TANGENTIAL_FORCE_X, cst.INITIAL_TANGENTIAL_FORCE_Y),
+                }
+                for p_id, shape1 in enumerate(agent1.shapes2D.get_geometric_shapes())
+                for c_id, shape2 in enumerate(agent2.shapes2D.get_geometric_shapes())
+                if id_agent1 != id_agent2 and p_id <= c_id and shape1.intersects(shape2)
+            }
+            if interactions:
+                neighbouring_agents[f"Agent{id_agent2}"] = {"Id": id_agent2, "Interactions": interactions}
+        interactions_dict["Interactions"][f"Agent{id_agent1}"] = {"Id": id_agent1, "NeighbouringAgents": neighbouring_agents}
+    return interactions_dict
+
+
+def as_ordered_items(interactions_dict: InteractionsDataType) -> list[tuple[str, list[tuple[str, list[str]]]]]:
+    """
+    Flatten the keys of an interactions dictionary, keeping their order.
+
+    Parameters
+    ----------
+    interactions_dict : InteractionsDataType
+        A dictionary containing the parameters for agent interactions.
+
+    Returns
+    -------
+    list[tuple[str, list[tuple[str, list[str]]]]]
+        The agent keys, with the keys of their neighbours and of their interactions.
+    """
+    return [
+        (
+            agent_key,
+            [(neighbour_key, list(neighbour["Interactions"])) for neighbour_key, neighbour in agent["NeighbouringAgents"].items()],
+        )
+        for agent_key, agent in interactions_dict["Interactions"].items()
+    ]
+
+
+@pytest.mark.parametrize("seed", [0, 1])
+def test_pedestrian_interactions_match_brute_force(seed: int) -> None:
+    """
+    Test the interactions of overlapping pedestrians, whose shapes are all disks.
+
+    Parameters
+    ----------
+    seed : int
+        Seed of the random generator used to create and move the pedestrians.
+    """
+    np.random.seed(seed)
+    crowd = Crowd(boundaries=Polygon([(0.0, 0.0), (150.0, 0.0), (150.0, 150.0), (0.0, 150.0)]))
+    crowd.create_agents(15)
+    crowd.pack_agents_on_grid()
+    for agent in crowd.agents:
+        agent.translate(*np.random.uniform(-15.0, 15.0, size=2))
+
+    expected_interactions = brute_force_interactions(crowd)
+    interactions = fun_dict.get_interactions_params(crowd)
+    assert interactions == expected_interactions
+    assert as_ordered_items(interactions) == as_ordered_items(expected_interactions)
+    assert any(agent["NeighbouringAgents"] for agent in interactions["Interactions"].values())
+
+
+def test_bike_interactions_match_brute_force() -> None:
+    """Test the interactions of a crowd mixing pedestrians and bikes, whose shapes include rectangles."""
+    np.random.seed(2)
+    crowd = Crowd()
+    crowd.create_agents(3)
+    bike_measures = {
+        cst.BikeParts.wheel_width.name: 5.0,
+        cst.BikeParts.total_length.name: 150.0,
+        cst.BikeParts.handlebar_length.name: 60.0,
+        cst.BikeParts.top_tube_length.name: 60.0,
+        cst.CommonMeasures.weight.name: 30.0,
+    }
+    agents = crowd.agents + [Agent(agent_type=cst.AgentTypes.bike, measures=bike_measures) for _ in range(2)]
+    for id_agent, agent in enumerate(agents):
+        agent.translate(40.0 * id_agent, 0.0)
+    agents.append(Agent(agent_type=cst.AgentTypes.bike, measures=bike_measures))
+    agents[-1].translate(1000.0, 1000.0)
+    crowd.agents = agents
+
+    interactions = fun_dict.get_interactions_params(crowd)
+    assert interactions == brute_force_interactions(crowd)
+    assert interactions["Interactions"]["Agent3"]["NeighbouringAgents"]
+    assert interactions["Interactions"]["Agent5"] == {"Id": 5, "NeighbouringAgents": {}}
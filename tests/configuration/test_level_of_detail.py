@@ -0,0 +1,199 @@
+"""
+Unit tests for the levels of detail of the 3D bodies.
+
+Tests cover:
+    - The reduction of a body keeps its lowest and highest slices, with fewer slices and vertices at coarser levels
+    - The light body keeps one slice per bin of altitude, without the highest slice if its bin already has one
+    - The selection of a level from a budget of vertices or a crowd size
+    - Agents rebuilt at another level of detail keep their height and their pose
+    - The bodies at another level of detail are built from the templates, without fitting them again
+    - A change of the measures of an agent fits its 3D body again, also when the body is still to be built
+    - Invalid levels and budgets raise errors
+"""
+
+# Copyright  2025  Institute of Light and Matter, CNRS UMR 5306, University Claude Bernard Lyon 1
+# Contributors: Oscar DUFOUR, Maxime STAPELLE, Alexandre NICOLAS
+
+# This software is a computer program designed to generate a realistic crowd from anthropometric data and
+# simulate the mechanical interactions that occur within it and with obstacles.
+
+# This software is governed by the CeCILL  license under French law and abiding by the rules of distribution
+# of free software.  You can  use, modify and/ or redistribute the software under the terms of the CeCILL
+# license as circulated by CEA, CNRS and INRIA at the following URL "http://www.cecill.info".
+
+# As a counterpart to the access to the source code and  rights to copy, modify and redistribute granted by
+# the license, users are provided only with a limited warranty  and the software's author,  the holder of the
+# economic rights,  and the successive licensors  have only  limited liability.
+
+# In this respect, the user's attention is drawn to the risks associated with loading,  using,  modifying
+# and/or developing or reproducing the software by the user in light of its specific status of free software,
+# that may mean  that it is complicated to manipulate,  and  that  also therefore means  that it is reserved
+# for developers  and  experienced professionals having in-depth computer knowledge. Users are therefore
+# encouraged to load and test the software's suitability as regards their requirements in conditions enabling
+# the security of their systems and/or data to be ensured and,  more generally, to use and operate it in the
+# same conditions as regards security.
+
+# The fact that you are presently reading this means that you have had knowledge of the CeCILL license and that
+# you accept its terms.
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+import shapely
+from shapely.geometry import MultiPoint, MultiPolygon, box
+
+import configuration.utils.constants as cst
+import configuration.utils.functions as fun
+from configuration.models.agents import Agent
+from configuration.models.crowd import Crowd
+from configuration.models.shapes3D import Shapes3D
+
+PKL_DIR_PATH = Path(__file__).parent.parent.parent / "data" / "pkl"
+
+
+def count_vertices(shapes3D: dict[float, MultiPolygon]) -> int:
+    """
+    Count the vertices of a 3D body.
+
+    Parameters
+    ----------
+    shapes3D : dict[float, MultiPolygon]
+        The MultiPolygons of the body, indexed by height.
+
+    Returns
+    -------
+    int
+        The number of vertices of the body.
+    """
+    return int(shapely.get_num_coordinates(list(shapes3D.values())).sum())
+
+
+def test_levels_of_detail_are_coarser() -> None:
+    """Test that each level of detail keeps the extreme slices of the body with fewer slices and vertices."""
+    shapes3D: dict[float, MultiPolygon] = fun.load_pickle(str(PKL_DIR_PATH / "male_3dBody_light.pkl"))
+
+    previous_shapes3D = shapes3D
+    for slice_spacing, tolerance in cst.BODY3D_LODS[1:]:
+        lod_shapes3D = fun.compute_3D_body_lod(shapes3D, slice_spacing, tolerance)
+        assert min(lod_shapes3D) == min(shapes3D)
+        assert max(lod_shapes3D) == max(shapes3D)
+        assert list(lod_shapes3D) == sorted(lod_shapes3D)
+        assert len(lod_shapes3D) < len(previous_shapes3D)
+        assert count_vertices(lod_shapes3D) < count_vertices(previous_shapes3D)
+        previous_shapes3D = lod_shapes3D
+
+
+def test_light_body_keeps_one_slice_per_bin() -> None:
+    """Test that the highest slice is only added to its bin when `keep_highest_slice` is True."""
+    shapes3D = {height: MultiPolygon([box(0.0, 0.0, 10.0, 5.0)]) for height in (0.0, 0.2, 0.4, 1.1)}
+
+    assert list(fun.compute_3D_body_lod(shapes3D, 1.0, cst.POLYGON_TOLERANCE, keep_highest_slice=False)) == [0.0, 1.1]
+    assert list(fun.compute_3D_body_lod(dict(list(shapes3D.items())[:3]), 1.0, cst.POLYGON_TOLERANCE, keep_highest_slice=False)) == [
+        0.0
+    ]
+    assert list(fun.compute_3D_body_lod(dict(list(shapes3D.items())[:3]), 1.0, cst.POLYGON_TOLERANCE)) == [0.0, 0.4]
+
+
+def test_select_lod() -> None:
+    """Test that the selected level is the finest fitting in the budget of vertices."""
+    assert Shapes3D.select_lod() == 0
+    assert Shapes3D.select_lod(vertices_per_agent=10**9) == 0
+    assert Shapes3D.select_lod(vertices_per_agent=1) == len(cst.BODY3D_LODS) - 1
+    assert Shapes3D.select_lod(crowd_size=1) == 0
+
+    selected_lods = [Shapes3D.select_lod(crowd_size=crowd_size) for crowd_size in (1, 10, 100, 1_000, 10_000, 100_000)]
+    assert selected_lods == sorted(selected_lods)
+    assert selected_lods[-1] == len(cst.BODY3D_LODS) - 1
+
+    with pytest.raises(ValueError):
+        Shapes3D.select_lod(vertices_per_agent=0)
+    with pytest.raises(ValueError):
+        Shapes3D.select_lod(crowd_size=-3)
+
+
+def test_agents_rebuilt_at_another_lod_keep_their_pose() -> None:
+    """Test that the 3D bodies rebuilt at another level of detail keep the height and the pose of the agents."""
+    np.random.seed(0)
+    crowd = Crowd()
+    crowd.create_agents(2)
+    for agent in crowd.agents:
+        agent.rotate(35.0)
+        agent.translate(20.0, -10.0)
+    heights = [agent.shapes3D.get_height() for agent in crowd.agents]
+    numbers_slices = [len(agent.shapes3D.shapes) for agent in crowd.agents]
+
+    crowd.set_lod(len(cst.BODY3D_LODS) - 1)
+
+    for agent, height, number_slices in zip(crowd.agents, heights, numbers_slices, strict=True):
+        assert agent.lod == len(cst.BODY3D_LODS) - 1
+        assert agent.shapes3D_pending
+        assert agent.shapes3D.lod == len(cst.BODY3D_LODS) - 1
+        assert len(agent.shapes3D.shapes) < number_slices
+        assert agent.shapes3D.get_height() == pytest.approx(height)
+        centroid_body3D = agent.get_centroid_body3D()
+        position = agent.get_position()
+        assert (centroid_body3D.x, centroid_body3D.y) == pytest.approx((position.x, position.y))
+
+    with pytest.raises(ValueError):
+        crowd.agents[0].lod = len(cst.BODY3D_LODS)
+
+
+def test_get_shapes3D_at_lod(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the bodies at another level of detail are built from the templates without fitting them again."""
+    np.random.seed(1)
+    crowd = Crowd()
+    crowd.create_agents(1, lod=1)
+    agent = crowd.agents[0]
+    agent.rotate(20.0)
+    agent.translate(15.0, 5.0)
+    shapes3D = agent.shapes3D
+    assert agent.lod == 1
+    assert shapes3D.scale_factors is not None
+
+    def fail_fit(*args: object, **kwargs: object) -> None:
+        """Fail if a 3D body is fitted again."""
+        raise AssertionError("The 3D body should not be fitted again.")
+
+    monkeypatch.setattr("configuration.models.shapes3D.dual_annealing", fail_fit)
+    coarse_shapes3D = agent.get_shapes3D_at_lod(len(cst.BODY3D_LODS) - 1)
+    assert agent.get_shapes3D_at_lod(1) is shapes3D.shapes
+    assert agent.shapes3D is shapes3D
+    assert len(coarse_shapes3D) < len(shapes3D.shapes)
+    assert max(coarse_shapes3D) == pytest.approx(max(shapes3D.shapes))
+    centroid = MultiPoint([multipolygon.centroid for multipolygon in coarse_shapes3D.values()]).centroid
+    assert (centroid.x, centroid.y) == pytest.approx((agent.get_position().x, agent.get_position().y))
+
+    crowd.set_lod(0)
+    assert len(agent.shapes3D.shapes) > len(shapes3D.shapes)
+    with pytest.raises(ValueError):
+        agent.get_shapes3D_at_lod(-1)
+
+
+def test_measures_change_refits_body3D() -> None:
+    """Test that the 3D body of an agent is fitted again on its new measures, at any level of detail."""
+    np.random.seed(2)
+    crowd = Crowd()
+    crowd.create_agents(1)
+    agent = crowd.agents[0]
+    new_measures = {
+        **agent.measures.measures,
+        cst.PedestrianParts.bideltoid_breadth.name: 55.0,
+        cst.PedestrianParts.chest_depth.name: 35.0,
+    }
+    reference_agent = Agent(agent_type=cst.AgentTypes.pedestrian, measures=dict(new_measures))
+
+    agent.measures = dict(new_measures)
+    assert agent.shapes3D.scale_factors == pytest.approx(reference_agent.shapes3D.scale_factors)
+    assert agent.shapes3D.get_bideltoid_breadth() == pytest.approx(reference_agent.shapes3D.get_bideltoid_breadth())
+
+    # A body rebuilt lazily at another level of detail follows the new measures too
+    agent.lod = 1
+    agent.measures = {**new_measures, cst.PedestrianParts.bideltoid_breadth.name: 45.0}
+    assert agent.shapes3D_pending
+    assert agent.shapes3D.scale_factors != pytest.approx(reference_agent.shapes3D.scale_factors)
+    assert agent.shapes3D.fitted_measures == (
+        new_measures[cst.PedestrianParts.sex.name],
+        new_measures[cst.PedestrianParts.chest_depth.name],
+        45.0,
+    )
@@ -0,0 +1,176 @@
+"""
+Unit tests for the checkpointing of the packing algorithm.
+
+Tests cover:
+    - A packing checkpoint is saved and loaded back without loss
+    - The progress callback receives every iteration and a non-decreasing wall time
+    - An interrupted packing resumed from its checkpoint ends in the same state as an uninterrupted one
+    - Resuming a checkpoint on another crowd raises an error
+"""
+
+# Copyright  2025  Institute of Light and Matter, CNRS UMR 5306, University Claude Bernard Lyon 1
+# Contributors: Oscar DUFOUR, Maxime STAPELLE, Alexandre NICOLAS
+
+# This software is a computer program designed to generate a realistic crowd from anthropometric data and
+# simulate the mechanical interactions that occur within it and with obstacles.
+
+# This software is governed by the CeCILL  license under French law and abiding by the rules of distribution
+# of free software.  You can  use, modify and/ or redistribute the software under the terms of the CeCILL
+# license as circulated by CEA, CNRS and INRIA at the following URL "http://www.cecill.info".
+
+# As a counterpart to the access to the source code and  rights to copy, modify and redistribute granted by
+# the license, users are provided only with a limited warranty  and the software's author,  the holder of the
+# economic rights,  and the successive licensors  have only  limited liability.
+
+# In this respect, the user's attention is drawn to the risks associated with loading,  using,  modifying
+# and/or developing or reproducing the software by the user in light of its specific status of free software,
+# that may mean  that it is complicated to manipulate,  and  that  also therefore means  that it is reserved
+# for developers  and  experienced professionals having in-depth computer knowledge. Users are therefore
+# encouraged to load and test the software's suitability as regards their requirements in conditions enabling
+# the security of their systems and/or data to be ensured and,  more generally, to use and operate it in the
+# same conditions as regards security.
+
+# The fact that you are presently reading this means that you have had knowledge of the CeCILL license and that
+# you accept its terms.
+
+import copy
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import configuration.utils.constants as cst
+from configuration.backup.packing_checkpoint import PackingCheckpoint, load_packing_checkpoint, save_packing_checkpoint
+from configuration.models.crowd import Crowd
+
+
+@pytest.fixture
+def crowd() -> Crowd:
+    """
+    Fixture to create a small crowd of pedestrians for testing.
+
+    Returns
+    -------
+    Crowd
+        A crowd of three unpacked pedestrians.
+    """
+    np.random.seed(0)
+    current_crowd = Crowd()
+    current_crowd.create_agents(3)
+    return current_crowd
+
+
+def test_save_and_load_checkpoint(tmp_path: Path) -> None:
+    """
+    Test that a packing checkpoint is saved and loaded back without loss.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary directory provided by pytest.
+    """
+    np.random.seed(42)
+    checkpoint = PackingCheckpoint(
+        iteration=7,
+        temperature=0.3,
+        elapsed_time=12.5,
+        initial_positions=np.zeros((2, 2)),
+        positions=np.array([[1.0, 2.0], [3.0, 4.0]]),
+        rotations=np.array([10.0, -20.0]),
+        rng_state=np.random.get_state(),
+    )
+    checkpoint_path = tmp_path / "checkpoint.npz"
+    save_packing_checkpoint(checkpoint, checkpoint_path)
+    loaded_checkpoint = load_packing_checkpoint(checkpoint_path)
+
+    assert loaded_checkpoint.iteration == 7
+    assert loaded_checkpoint.temperature == pytest.approx(0.3)
+    assert loaded_checkpoint.elapsed_time == pytest.approx(12.5)
+    np.testing.assert_array_equal(loaded_checkpoint.positions, checkpoint.positions)
+    np.testing.assert_array_equal(loaded_checkpoint.rotations, checkpoint.rotations)
+    np.random.set_state(loaded_checkpoint.rng_state)
+    drawn_after_restore = np.random.rand(5)
+    np.random.set_state(checkpoint.rng_state)
+    np.testing.assert_array_equal(drawn_after_restore, np.random.rand(5))
+
+
+def test_progress_callback(crowd: Crowd, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that the progress callback receives every iteration and a non-decreasing wall time.
+
+    Parameters
+    ----------
+    crowd : Crowd
+        The crowd fixture.
+    monkeypatch : pytest.MonkeyPatch
+        Pytest fixture used to shorten the packing.
+    """
+    monkeypatch.setattr(cst, "MAX_NB_ITERATIONS", 4)
+    calls: list[tuple[int, int, float]] = []
+    crowd.pack_agents_with_forces(progress_callback=lambda iteration, total, elapsed: calls.append((iteration, total, elapsed)))
+
+    assert [call[0] for call in calls] == [1, 2, 3, 4]
+    assert all(call[1] == 4 for call in calls)
+    assert all(later[2] >= earlier[2] for earlier, later in zip(calls, calls[1:], strict=False))
+
+
+def test_resume_interrupted_packing(crowd: Crowd, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that an interrupted packing resumed from its checkpoint ends in the same state as an uninterrupted one.
+
+    Parameters
+    ----------
+    crowd : Crowd
+        The crowd fixture.
+    tmp_path : Path
+        Temporary directory provided by pytest.
+    monkeypatch : pytest.MonkeyPatch
+        Pytest fixture used to shorten the packing.
+    """
+    monkeypatch.setattr(cst, "MAX_NB_ITERATIONS", 6)
+    checkpoint_path = tmp_path / "packing.npz"
+    interrupted_crowd = copy.deepcopy(crowd)
+    resumed_crowd = copy.deepcopy(crowd)
+
+    np.random.seed(1)
+    crowd.pack_agents_with_forces(variable_orientation=True)
+
+    def interrupt(iteration: int, total: int, elapsed: float) -> None:
+        if iteration == 4:
+            raise KeyboardInterrupt
+
+    np.random.seed(1)
+    with pytest.raises(KeyboardInterrupt):
+        interrupted_crowd.pack_agents_with_forces(
+            variable_orientation=True, checkpoint_path=checkpoint_path, checkpoint_interval=3, progress_callback=interrupt
+        )
+    assert load_packing_checkpoint(checkpoint_path).iteration == 3
+
+    resumed_crowd.pack_agents_with_forces(variable_orientation=True, checkpoint_path=checkpoint_path, resume=True)
+
+    np.testing.assert_allclose(resumed_crowd.get_agent_positions(), crowd.get_agent_positions(), atol=1e-6)
+    for resumed_agent, agent in zip(resumed_crowd.agents, crowd.agents, strict=True):
+        assert resumed_agent.get_agent_orientation() == pytest.approx(agent.get_agent_orientation(), abs=1e-6)
+
+
+def test_resume_on_another_crowd(crowd: Crowd, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that resuming a checkpoint on another crowd raises an error.
+
+    Parameters
+    ----------
+    crowd : Crowd
+        The crowd fixture.
+    tmp_path : Path
+        Temporary directory provided by pytest.
+    monkeypatch : pytest.MonkeyPatch
+        Pytest fixture used to shorten the packing.
+    """
+    monkeypatch.setattr(cst, "MAX_NB_ITERATIONS", 2)
+    checkpoint_path = tmp_path / "packing.npz"
+    other_crowd = copy.deepcopy(crowd)
+    other_crowd.translate_crowd(100.0, 0.0)
+    crowd.pack_agents_with_forces(checkpoint_path=checkpoint_path)
+
+    with pytest.raises(ValueError, match="does not match"):
+        other_crowd.pack_agents_with_forces(checkpoint_path=checkpoint_path, resume=True)
@@ -0,0 +1,165 @@
+"""
+Unit tests for the sweep of the packing parameters.
+
+Tests cover:
+    - Grid and random configurations of the packing parameters
+    - The annealing schedule of the packing can be overridden at call time
+    - Sweeps leave the crowd unchanged and give the same table sequentially and in parallel
+    - The fastest run within an overlap tolerance is selected, and the table is saved to CSV
+    - Invalid parameters raise errors
+"""
+
+# Copyright  2025  Institute of Light and Matter, CNRS UMR 5306, University Claude Bernard Lyon 1
+# Contributors: Oscar DUFOUR, Maxime STAPELLE, Alexandre NICOLAS
+
+# This software is a computer program designed to generate a realistic crowd from anthropometric data and
+# simulate the mechanical interactions that occur within it and with obstacles.
+
+# This software is governed by the CeCILL  license under French law and abiding by the rules of distribution
+# of free software.  You can  use, modify and/ or redistribute the software under the terms of the CeCILL
+# license as circulated by CEA, CNRS and INRIA at the following URL "http://www.cecill.info".
+
+# As a counterpart to the access to the source code and  rights to copy, modify and redistribute granted by
+# the license, users are provided only with a limited warranty  and the software's author,  the holder of the
+# economic rights,  and the successive licensors  have only  limited liability.
+
+# In this respect, the user's attention is drawn to the risks associated with loading,  using,  modifying
+# and/or developing or reproducing the software by the user in light of its specific status of free software,
+# that may mean  that it is complicated to manipulate,  and  that  also therefore means  that it is reserved
+# for developers  and  experienced professionals having in-depth computer knowledge. Users are therefore
+# encouraged to load and test the software's suitability as regards their requirements in conditions enabling
+# the security of their systems and/or data to be ensured and,  more generally, to use and operate it in the
+# same conditions as regards security.
+
+# The fact that you are presently reading this means that you have had knowledge of the CeCILL license and that
+# you accept its terms.
+
+import csv
+from pathlib import Path
+
+import numpy as np
+import pytest
+from shapely.geometry import Polygon
+
+from configuration.models.crowd import Crowd
+from configuration.models.packing_sweep import (
+    get_grid_configurations,
+    get_random_configurations,
+    run_packing_sweep,
+    save_sweep_table,
+    select_fastest_configuration,
+)
+
+
+@pytest.fixture
+def crowd() -> Crowd:
+    """
+    Fixture to create a small crowd of overlapping pedestrians in a room centred on them.
+
+    Returns
+    -------
+    Crowd
+        A crowd of 4 pedestrians, not packed.
+    """
+    np.random.seed(0)
+    crowd = Crowd(boundaries=Polygon([(-150.0, -150.0), (150.0, -150.0), (150.0, 150.0), (-150.0, 150.0)]))
+    crowd.create_agents(4)
+    return crowd
+
+
+def test_grid_and_random_configurations() -> None:
+    """Test the grid and random configurations of the packing parameters."""
+    grid = get_grid_configurations({"nb_iterations": [5, 10], "variable_orientation": [False, True]})
+    assert grid == [
+        {"nb_iterations": 5, "variable_orientation": False},
+        {"nb_iterations": 5, "variable_orientation": True},
+        {"nb_iterations": 10, "variable_orientation": False},
+        {"nb_iterations": 10, "variable_orientation": True},
+    ]
+
+    np.random.seed(1)
+    configurations = get_random_configurations(
+        {"nb_iterations": (5, 10), "additive_cooling": (0.05, 0.2), "repulsion_length": [2.0, 5.0]}, 20
+    )
+    assert len(configurations) == 20
+    assert all(
+        isinstance(configuration["nb_iterations"], int) and 5 <= configuration["nb_iterations"] <= 10
+        for configuration in configurations
+    )
+    assert all(0.05 <= configuration["additive_cooling"] <= 0.2 for configuration in configurations)
+    assert {configuration["repulsion_length"] for configuration in configurations} == {2.0, 5.0}
+
+
+def test_packing_schedule_is_overridden_at_call_time(crowd: Crowd) -> None:
+    """
+    Test that the number of iterations of the packing can be overridden without changing the constants.
+
+    Parameters
+    ----------
+    crowd : Crowd
+        The crowd fixture.
+    """
+    progress: list[tuple[int, int]] = []
+    crowd.pack_agents_with_forces(
+        nb_iterations=3,
+        initial_temperature=0.5,
+        additive_cooling=0.25,
+        progress_callback=lambda done, total, _: progress.append((done, total)),
+    )
+    assert progress == [(1, 3), (2, 3), (3, 3)]
+    with pytest.raises(ValueError, match="non-negative"):
+        crowd.pack_agents_with_forces(additive_cooling=-1.0)
+
+
+def test_sweep_leaves_crowd_unchanged(crowd: Crowd, tmp_path: Path) -> None:
+    """
+    Test that a sweep leaves the crowd unchanged, and gives the same table sequentially and in parallel.
+
+    Parameters
+    ----------
+    crowd : Crowd
+        The crowd fixture.
+    tmp_path : Path
+        A pytest fixture providing a temporary directory for file operations.
+    """
+    initial_positions = crowd.get_agent_positions().copy()
+    configurations = get_grid_configurations({"nb_iterations": [1, 30], "repulsion_length": [5.0]})
+    table = run_packing_sweep(crowd, configurations, max_workers=1)
+
+    np.testing.assert_array_equal(crowd.get_agent_positions(), initial_positions)
+    assert [row["nb_iterations"] for row in table] == [1, 30]
+    assert table[1]["interpenetration_between_agents"] < table[0]["interpenetration_between_agents"]
+    assert all(row["runtime"] > 0.0 and row["density"] > 0.0 for row in table)
+
+    parallel_table = run_packing_sweep(crowd, configurations, max_workers=2)
+    for row, parallel_row in zip(table, parallel_table, strict=True):
+        assert row["interpenetration_between_agents"] == pytest.approx(parallel_row["interpenetration_between_agents"])
+        assert row["packing_fraction"] == pytest.approx(parallel_row["packing_fraction"])
+
+    assert select_fastest_configuration(table, overlap_tolerance=float("inf")) == min(table, key=lambda row: row["runtime"])
+    assert select_fastest_configuration(table, overlap_tolerance=-1.0) is None
+
+    save_sweep_table(table, tmp_path / "sweep.csv")
+    with open(tmp_path / "sweep.csv", encoding="utf-8") as csv_file:
+        rows = list(csv.DictReader(csv_file))
+    assert [int(row["nb_iterations"]) for row in rows] == [1, 30]
+    assert float(rows[1]["runtime"]) == pytest.approx(table[1]["runtime"])
+
+
+def test_invalid_sweeps_raise_errors(crowd: Crowd) -> None:
+    """
+    Test that invalid sweeps raise errors.
+
+    Parameters
+    ----------
+    crowd : Crowd
+        The crowd fixture.
+    """
+    with pytest.raises(ValueError, match="Unknown packing parameters"):
+        get_grid_configurations({"temperature": [1.0]})
+    with pytest.raises(ValueError, match="at least one value"):
+        get_grid_configurations({"nb_iterations": []})
+    with pytest.raises(ValueError, match="range of 'additive_cooling'"):
+        get_random_configurations({"additive_cooling": (0.2, 0.1)}, 2)
+    with pytest.raises(ValueError, match="positive integer"):
+        run_packing_sweep(crowd, [{"nb_iterations": 1}], max_workers=0)
@@ -0,0 +1,107 @@
+"""
+Unit tests for the ragged-array layout of the 3D bodies.
+
+Tests cover:
+    - The bodies saved as arrays are loaded back exactly, in the order of the heights
+    - The arrays of the shipped 3D bodies are memory-mapped
+    - Invalid paths raise errors
+"""
+
+# Copyright  2025  Institute of Light and Matter, CNRS UMR 5306, University Claude Bernard Lyon 1
+# Contributors: Oscar DUFOUR, Maxime STAPELLE, Alexandre NICOLAS
+
+# This software is a computer program designed to generate a realistic crowd from anthropometric data and
+# simulate the mechanical interactions that occur within it and with obstacles.
+
+# This software is governed by the CeCILL  license under French law and abiding by the rules of distribution
+# of free software.  You can  use, modify and/ or redistribute the software under the terms of the CeCILL
+# license as circulated by CEA, CNRS and INRIA at the following URL "http://www.cecill.info".
+
+# As a counterpart to the access to the source code and  rights to copy, modify and redistribute granted by
+# the license, users are provided only with a limited warranty  and the software's author,  the holder of the
+# economic rights,  and the successive licensors  have only  limited liability.
+
+# In this respect, the user's attention is drawn to the risks associated with loading,  using,  modifying
+# and/or developing or reproducing the software by the user in light of its specific status of free software,
+# that may mean  that it is complicated to manipulate,  and  that  also therefore means  that it is reserved
+# for developers  and  experienced professionals having in-depth computer knowledge. Users are therefore
+# encouraged to load and test the software's suitability as regards their requirements in conditions enabling
+# the security of their systems and/or data to be ensured and,  more generally, to use and operate it in the
+# same conditions as regards security.
+
+# The fact that you are presently reading this means that you have had knowledge of the CeCILL license and that
+# you accept its terms.
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+from shapely.geometry import MultiPolygon
+
+import configuration.utils.constants as cst
+import configuration.utils.functions as fun
+
+PKL_DIR_PATH = Path(__file__).parent.parent.parent / "data" / "pkl"
+
+
+@pytest.mark.parametrize("sex", ["male", "female"])
+def test_ragged_arrays_round_trip(sex: str, tmp_path: Path) -> None:
+    """
+    Test that a 3D body saved as ragged arrays is loaded back exactly.
+
+    Parameters
+    ----------
+    sex : str
+        The sex of the shipped 3D body.
+    tmp_path : Path
+        A pytest fixture providing a temporary directory for file operations.
+    """
+    shapes3D: dict[float, MultiPolygon] = fun.load_pickle(str(PKL_DIR_PATH / f"{sex}_3dBody_light.pkl"))
+    fun.save_ragged_multipolygons(shapes3D, tmp_path / sex)
+
+    assert sorted(path.name for path in (tmp_path / sex).iterdir()) == sorted(cst.BODY3D_ARRAY_FILE_NAMES)
+    loaded_shapes3D = fun.load_ragged_multipolygons(str(tmp_path / sex))
+    assert list(loaded_shapes3D) == sorted(shapes3D)
+    for height, multipolygon in loaded_shapes3D.items():
+        assert isinstance(multipolygon, MultiPolygon)
+        assert multipolygon.equals_exact(shapes3D[height], tolerance=0.0)
+
+
+def test_ragged_arrays_are_memory_mapped(tmp_path: Path) -> None:
+    """
+    Test that the saved arrays are flat and can be memory-mapped.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        A pytest fixture providing a temporary directory for file operations.
+    """
+    shapes3D: dict[float, MultiPolygon] = fun.load_pickle(str(PKL_DIR_PATH / "male_3dBody_light.pkl"))
+    fun.save_ragged_multipolygons(shapes3D, tmp_path)
+
+    heights, coordinates, ring_offsets, polygon_offsets, multipolygon_offsets = (
+        np.load(tmp_path / file_name, mmap_mode="r") for file_name in cst.BODY3D_ARRAY_FILE_NAMES
+    )
+    assert isinstance(coordinates, np.memmap)
+    assert coordinates.shape == (ring_offsets[-1], 2)
+    assert ring_offsets.shape == (polygon_offsets[-1] + 1,)
+    assert polygon_offsets.shape == (multipolygon_offsets[-1] + 1,)
+    assert multipolygon_offsets.shape == (len(heights) + 1,)
+    np.testing.assert_array_equal(heights, sorted(shapes3D))
+
+
+def test_invalid_paths_raise(tmp_path: Path) -> None:
+    """
+    Test that invalid paths raise errors.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        A pytest fixture providing a temporary directory for file operations.
+    """
+    with pytest.raises(TypeError):
+        fun.save_ragged_multipolygons({}, str(tmp_path))
+    with pytest.raises(TypeError):
+        fun.load_ragged_multipolygons(tmp_path)
+    with pytest.raises(FileNotFoundError):
+        fun.load_ragged_multipolygons(str(tmp_path / "missing"))
@@ -0,0 +1,212 @@
+"""
+Unit tests for the append-only trajectory store.
+
+Tests cover:
+    - Time steps written by chunks are read back through the memory map, by time range and agent subset
+    - Appending to an existing store continues it and drops a partially written record
+    - Invalid time steps and files raise errors
+    - Snapshot files converted to a store export to the same CSV file as the XML exporter
+"""
+
+# Copyright  2025  Institute of Light and Matter, CNRS UMR 5306, University Claude Bernard Lyon 1
+# Contributors: Oscar DUFOUR, Maxime STAPELLE, Alexandre NICOLAS
+
+# This software is a computer program designed to generate a realistic crowd from anthropometric data and
+# simulate the mechanical interactions that occur within it and with obstacles.
+
+# This software is governed by the CeCILL  license under French law and abiding by the rules of distribution
+# of free software.  You can  use, modify and/ or redistribute the software under the terms of the CeCILL
+# license as circulated by CEA, CNRS and INRIA at the following URL "http://www.cecill.info".
+
+# As a counterpart to the access to the source code and  rights to copy, modify and redistribute granted by
+# the license, users are provided only with a limited warranty  and the software's author,  the holder of the
+# economic rights,  and the successive licensors  have only  limited liability.
+
+# In this respect, the user's attention is drawn to the risks associated with loading,  using,  modifying
+# and/or developing or reproducing the software by the user in light of its specific status of free software,
+# that may mean  that it is complicated to manipulate,  and  that  also therefore means  that it is reserved
+# for developers  and  experienced professionals having in-depth computer knowledge. Users are therefore
+# encouraged to load and test the software's suitability as regards their requirements in conditions enabling
+# the security of their systems and/or data to be ensured and,  more generally, to use and operate it in the
+# same conditions as regards security.
+
+# The fact that you are presently reading this means that you have had knowledge of the CeCILL license and that
+# you accept its terms.
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+from numpy.typing import NDArray
+
+import configuration.backup.trajectory_store as fun_store
+import configuration.backup.xml_to_Chaos as fun_chaos
+import configuration.utils.constants as cst
+
+
+def get_step(step: int, number_agents: int = 3) -> dict[str, NDArray[np.float64]]:
+    """
+    Build the kinematics of the agents at a time step.
+
+    Parameters
+    ----------
+    step : int
+        The index of the time step.
+    number_agents : int, optional
+        The number of agents, by default 3.
+
+    Returns
+    -------
+    dict[str, NDArray[np.float64]]
+        The position, velocity, theta and omega of the agents.
+    """
+    values = np.arange(6 * number_agents, dtype=np.float64) + 100.0 * step
+    return {
+        "position": values[: 2 * number_agents].reshape(-1, 2),
+        "velocity": values[2 * number_agents : 4 * number_agents].reshape(-1, 2),
+        "theta": values[4 * number_agents : 5 * number_agents],
+        "omega": values[5 * number_agents :],
+    }
+
+
+def test_write_and_query(tmp_path: Path) -> None:
+    """
+    Test that the time steps written by chunks are read back entirely, by time range and by agent subset.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        A pytest fixture providing a temporary directory for file operations.
+    """
+    store_path = tmp_path / "run" / "trajectories.trj"
+    with fun_store.TrajectoryStoreWriter(store_path, [5, 1, 9], chunk_size=3) as writer:
+        for step in range(7):
+            writer.append(0.5 * step, **get_step(step))
+
+    with fun_store.TrajectoryStoreReader(store_path) as reader:
+        assert len(reader) == 7
+        np.testing.assert_array_equal(reader.agent_ids, [5, 1, 9])
+        np.testing.assert_array_equal(reader.times, 0.5 * np.arange(7))
+
+        trajectories = reader.query()
+        for step in range(7):
+            for key, values in get_step(step).items():
+                np.testing.assert_array_equal(trajectories[key][step], values)
+
+        subset = reader.query(t_min=1.0, t_max=2.0, agent_ids=[9, 5])
+        np.testing.assert_array_equal(subset["time"], [1.0, 1.5, 2.0])
+        np.testing.assert_array_equal(subset["agent_id"], [9, 5])
+        np.testing.assert_array_equal(subset["position"], trajectories["position"][2:5][:, [2, 0]])
+        np.testing.assert_array_equal(subset["omega"], trajectories["omega"][2:5][:, [2, 0]])
+
+        assert len(reader.query(t_min=10.0)["time"]) == 0
+        with pytest.raises(ValueError, match="not in the trajectory store"):
+            reader.query(agent_ids=[2])
+
+
+def test_append_to_existing_store(tmp_path: Path) -> None:
+    """
+    Test that a store is continued when appending to it, and that a partially written record is dropped.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        A pytest fixture providing a temporary directory for file operations.
+    """
+    store_path = tmp_path / "trajectories.trj"
+    with fun_store.TrajectoryStoreWriter(store_path, [1, 2, 3]) as writer:
+        writer.append(0.0, **get_step(0))
+        writer.append(1.0, **get_step(1))
+    with open(store_path, "ab") as store_file:
+        store_file.write(b"\x01" * 10)
+
+    with fun_store.TrajectoryStoreReader(store_path) as reader:
+        assert len(reader) == 2
+
+    with fun_store.TrajectoryStoreWriter(store_path, [1, 2, 3], append=True) as writer:
+        with pytest.raises(ValueError, match="lower than the time of the previous step"):
+            writer.append(0.5, **get_step(2))
+        writer.append(2.0, **get_step(2))
+
+    with fun_store.TrajectoryStoreReader(store_path) as reader:
+        np.testing.assert_array_equal(reader.times, [0.0, 1.0, 2.0])
+        np.testing.assert_array_equal(reader.query(t_min=2.0)["velocity"][0], get_step(2)["velocity"])
+
+    with pytest.raises(ValueError, match="differ from `agent_ids`"):
+        fun_store.TrajectoryStoreWriter(store_path, [1, 2], append=True)
+
+
+def test_invalid_steps_and_files_raise(tmp_path: Path) -> None:
+    """
+    Test that invalid arguments, time steps and files raise errors.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        A pytest fixture providing a temporary directory for file operations.
+    """
+    store_path = tmp_path / "trajectories.trj"
+    with pytest.raises(TypeError):
+        fun_store.TrajectoryStoreWriter("trajectories.trj", [1])
+    with pytest.raises(ValueError, match="unique"):
+        fun_store.TrajectoryStoreWriter(store_path, [1, 1])
+    with fun_store.TrajectoryStoreWriter(store_path, [1, 2, 3]) as writer:
+        with pytest.raises(ValueError, match="`theta` should have shape"):
+            writer.append(0.0, **{**get_step(0), "theta": np.zeros(2)})
+
+    with pytest.raises(FileNotFoundError):
+        fun_store.TrajectoryStoreReader(tmp_path / "missing.trj")
+    not_a_store_path = tmp_path / "not_a_store.trj"
+    not_a_store_path.write_bytes(b"\0" * 128)
+    with pytest.raises(ValueError, match="Not a trajectory store file"):
+        fun_store.TrajectoryStoreReader(not_a_store_path)
+    store_bytes = bytearray(store_path.read_bytes())
+    store_bytes[8:12] = np.array(cst.TRAJECTORY_STORE_VERSION + 1, dtype="<u4").tobytes()
+    store_path.write_bytes(bytes(store_bytes))
+    with pytest.raises(ValueError, match="Unsupported trajectory store version"):
+        fun_store.TrajectoryStoreReader(store_path)
+
+
+def test_snapshots_to_store_and_CSV(tmp_path: Path) -> None:
+    """
+    Test that snapshot files converted to a store export to the same CSV file as the XML exporter.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        A pytest fixture providing a temporary directory for file operations.
+    """
+    xml_folder = tmp_path / "xml"
+    xml_folder.mkdir()
+    for step in range(4):
+        kinematics = get_step(step, number_agents=2)
+        lines = ['<?xml version="1.0" encoding="utf-8"?>', "<Agents>"]
+        for agent_idx in range(2 if step != 2 else 1):
+            position = ",".join(map(str, kinematics["position"][agent_idx]))
+            velocity = ",".join(map(str, kinematics["velocity"][agent_idx]))
+            lines += [
+                f'    <Agent Id="{agent_idx + 1}">',
+                f'        <Kinematics Position="{position}" Velocity="{velocity}" '
+                f'Theta="{kinematics["theta"][agent_idx]}" Omega="{kinematics["omega"][agent_idx]}"/>',
+                "    </Agent>",
+            ]
+        lines.append("</Agents>")
+        (xml_folder / f"AgentDynamics output t={0.1 * step:.1f}.xml").write_text("\n".join(lines), encoding="utf-8")
+
+    store_path = tmp_path / "trajectories.trj"
+    fun_store.snapshots_to_trajectory_store(xml_folder, store_path, chunk_size=2)
+    with fun_store.TrajectoryStoreReader(store_path) as reader:
+        trajectories = reader.query()
+    np.testing.assert_allclose(trajectories["time"], [0.0, 0.1, 0.2, 0.3])
+    np.testing.assert_array_equal(trajectories["agent_id"], [1, 2])
+    np.testing.assert_array_equal(trajectories["theta"][1], get_step(1, number_agents=2)["theta"])
+    assert np.isnan(trajectories["position"][2, 1]).all()
+
+    store_csv_folder = tmp_path / "store_csv"
+    xml_csv_folder = tmp_path / "xml_csv"
+    xml_csv_folder.mkdir()
+    fun_store.export_trajectory_store_to_CHAOS(store_path, store_csv_folder, 0.05, max_workers=1)
+    fun_chaos.export_dict_to_CSV(xml_csv_folder, xml_folder, max_workers=1)
+    store_csv = (store_csv_folder / fun_chaos.trajectories_csv_filename).read_text(encoding="utf-8")
+    assert store_csv == (xml_csv_folder / fun_chaos.trajectories_csv_filename).read_text(encoding="utf-8")
+    assert sorted(path.name for path in (store_csv_folder / "ForCHAOS").iterdir()) == ["traj000.csv", "traj001.csv"]
@@ -0,0 +1,157 @@
+"""
+Unit tests for the trusted constructors and the deferred validation of the models.
+
+Tests cover:
+    - Trusted constructors build the same models as the validating ones
+    - Validation is skipped inside a deferred validation block and run by `validate()`
+    - The crowd statistics are computed lazily and kept up to date by the agents setter
+    - Trusted agents build their 3D body on first access, at the pose of their 2D shapes
+    - Agents loaded from configuration files without refitting give back the same files
+"""
+
+# Copyright  2025  Institute of Light and Matter, CNRS UMR 5306, University Claude Bernard Lyon 1
+# Contributors: Oscar DUFOUR, Maxime STAPELLE, Alexandre NICOLAS
+
+# This software is a computer program designed to generate a realistic crowd from anthropometric data and
+# simulate the mechanical interactions that occur within it and with obstacles.
+
+# This software is governed by the CeCILL  license under French law and abiding by the rules of distribution
+# of free software.  You can  use, modify and/ or redistribute the software under the terms of the CeCILL
+# license as circulated by CEA, CNRS and INRIA at the following URL "http://www.cecill.info".
+
+# As a counterpart to the access to the source code and  rights to copy, modify and redistribute granted by
+# the license, users are provided only with a limited warranty  and the software's author,  the holder of the
+# economic rights,  and the successive licensors  have only  limited liability.
+
+# In this respect, the user's attention is drawn to the risks associated with loading,  using,  modifying
+# and/or developing or reproducing the software by the user in light of its specific status of free software,
+# that may mean  that it is complicated to manipulate,  and  that  also therefore means  that it is reserved
+# for developers  and  experienced professionals having in-depth computer knowledge. Users are therefore
+# encouraged to load and test the software's suitability as regards their requirements in conditions enabling
+# the security of their systems and/or data to be ensured and,  more generally, to use and operate it in the
+# same conditions as regards security.
+
+# The fact that you are presently reading this means that you have had knowledge of the CeCILL license and that
+# you accept its terms.
+
+import numpy as np
+import pytest
+from shapely.geometry import MultiPolygon, Polygon
+
+import configuration.backup.crowd_to_dict as fun_dict
+import configuration.utils.constants as cst
+import configuration.utils.functions as fun
+from configuration.models.agents import Agent
+from configuration.models.crowd import Crowd, create_agents_from_dynamic_static_geometry_parameters
+from configuration.models.measures import AgentMeasures
+from configuration.models.shapes2D import Shapes2D
+from configuration.models.shapes3D import Shapes3D
+
+
+def test_from_trusted_matches_validated_constructors() -> None:
+    """Test that the trusted constructors store the same data as the validating constructors."""
+    np.random.seed(0)
+    crowd = Crowd()
+    crowd.create_agents(2)
+    agent = crowd.agents[0]
+
+    measures = AgentMeasures.from_trusted(agent.agent_type, agent.measures.measures)
+    assert measures == AgentMeasures(agent_type=agent.agent_type, measures=agent.measures.measures)
+    shapes2D = Shapes2D.from_trusted(agent.agent_type, agent.shapes2D.shapes)
+    assert shapes2D == Shapes2D(agent_type=agent.agent_type, shapes=agent.shapes2D.shapes)
+    assert agent.shapes3D is not None
+    shapes3D = Shapes3D.from_trusted(agent.agent_type, agent.shapes3D.shapes)
+    assert shapes3D.shapes is agent.shapes3D.shapes
+
+    trusted_crowd = Crowd.from_trusted(crowd.agents)
+    assert trusted_crowd.agents is crowd.agents
+    assert trusted_crowd.measures.agent_statistics == crowd.get_crowd_statistics()["measures"]
+
+
+def test_deferred_validation_skips_and_validate_raises() -> None:
+    """Test that invalid models are accepted inside a deferred validation block and rejected by `validate()`."""
+    invalid_shapes = {"disk0": MultiPolygon()}
+    with pytest.raises(ValueError):
+        Shapes3D(agent_type=cst.AgentTypes.pedestrian, shapes=invalid_shapes)
+
+    with fun.deferred_validation():
+        assert fun.is_validation_deferred()
+        shapes3D = Shapes3D(agent_type=cst.AgentTypes.pedestrian, shapes=invalid_shapes)
+        measures = AgentMeasures(agent_type=cst.AgentTypes.pedestrian, measures={})
+    assert not fun.is_validation_deferred()
+
+    with pytest.raises(ValueError):
+        shapes3D.validate()
+    with pytest.raises(ValueError):
+        measures.validate()
+
+    crowd = Crowd.from_trusted(["not an agent"])
+    with pytest.raises(ValueError, match="Agent instances"):
+        crowd.validate()
+
+
+def test_crowd_statistics_are_lazy_and_refreshed() -> None:
+    """Test that the crowd statistics are computed on access and refreshed after the agents are replaced."""
+    np.random.seed(1)
+    crowd = Crowd()
+    crowd.create_agents(3)
+    agents: list[Agent] = crowd.agents
+
+    with fun.deferred_validation():
+        trusted_crowd = Crowd(agents=agents[:2], boundaries=Polygon())
+        assert trusted_crowd._measures is None
+        trusted_crowd.agents = agents
+    assert trusted_crowd.measures.agent_statistics == crowd.get_crowd_statistics()["measures"]
+
+    trusted_crowd.agents = agents[:1]
+    assert trusted_crowd.measures.agent_statistics == Crowd(agents=agents[:1]).measures.agent_statistics
+    trusted_crowd.validate()
+
+
+def test_trusted_agent_builds_3D_body_lazily() -> None:
+    """Test that a trusted pedestrian builds its 3D body on first access, at the position and orientation of its disks."""
+    np.random.seed(0)
+    crowd = Crowd()
+    crowd.create_agents(1)
+    agent = crowd.agents[0]
+    agent.translate(50.0, -20.0)
+    agent.rotate(30.0)
+
+    trusted_agent = Agent.from_trusted(agent.agent_type, agent.measures, agent.shapes2D)
+    assert trusted_agent.shapes3D_pending
+    assert trusted_agent.measures is agent.measures
+
+    shapes3D = trusted_agent.shapes3D
+    assert not trusted_agent.shapes3D_pending
+    assert shapes3D is not None and shapes3D.shapes
+    centroid_body = trusted_agent.get_centroid_body3D()
+    position = trusted_agent.get_position()
+    assert centroid_body.distance(position) < 1e-6
+    # The reference slice of the body is as wide as the disks, along the shoulders of the agent
+    reference_multipolygon = shapes3D.get_reference_multipolygon()
+    assert reference_multipolygon.distance(trusted_agent.shapes2D.shapes["disk0"]["object"]) == pytest.approx(0.0, abs=1.0)
+    assert reference_multipolygon.distance(trusted_agent.shapes2D.shapes["disk4"]["object"]) == pytest.approx(0.0, abs=1.0)
+
+
+def test_loading_configuration_files_without_refitting() -> None:
+    """Test that agents rebuilt from configuration files without refitting give back the same files."""
+    np.random.seed(0)
+    crowd = Crowd(boundaries=Polygon([(0.0, 0.0), (400.0, 0.0), (400.0, 400.0), (0.0, 400.0)]))
+    crowd.create_agents(4)
+    crowd.pack_agents_on_grid()
+    for agent_idx, agent in enumerate(crowd.agents):
+        agent.rotate(25.0 * agent_idx)
+    static_dict = fun_dict.get_static_params(crowd)
+    dynamic_dict = fun_dict.get_dynamic_params(crowd)
+    geometry_dict = fun_dict.get_geometry_params(crowd)
+
+    loaded_crowd = create_agents_from_dynamic_static_geometry_parameters(static_dict, dynamic_dict, geometry_dict)
+    assert all(agent.shapes3D_pending for agent in loaded_crowd.agents)
+    assert fun_dict.get_static_params(loaded_crowd) == static_dict
+    assert fun_dict.get_dynamic_params(loaded_crowd) == dynamic_dict
+    loaded_crowd.validate()
+    assert all(agent.shapes3D_pending for agent in loaded_crowd.agents)
+
+    refitted_crowd = create_agents_from_dynamic_static_geometry_parameters(static_dict, dynamic_dict, geometry_dict, refit=True)
+    assert refitted_crowd.get_number_agents() == loaded_crowd.get_number_agents()
+    np.testing.assert_allclose(refitted_crowd.get_agent_positions(), loaded_crowd.get_agent_positions(), atol=0.1)
@@ -0,0 +1,193 @@
+"""
+Unit tests for the ingestion of the trajectories written by the mechanical layer.
+
+Tests cover:
+    - Snapshot files are parsed in a single pass into dense arrays indexed by time and agent ID
+    - The sequential and multiprocess loaders give the same arrays
+    - Agents missing from a snapshot, or with invalid kinematics, are NaN
+    - The nested dictionary of trajectories is built from the same arrays
+    - The CSV file and the interpolated ChAOS files are the same when written sequentially or in parallel
+"""
+
+# Copyright  2025  Institute of Light and Matter, CNRS UMR 5306, University Claude Bernard Lyon 1
+# Contributors: Oscar DUFOUR, Maxime STAPELLE, Alexandre NICOLAS
+
+# This software is a computer program designed to generate a realistic crowd from anthropometric data and
+# simulate the mechanical interactions that occur within it and with obstacles.
+
+# This software is governed by the CeCILL  license under French law and abiding by the rules of distribution
+# of free software.  You can  use, modify and/ or redistribute the software under the terms of the CeCILL
+# license as circulated by CEA, CNRS and INRIA at the following URL "http://www.cecill.info".
+
+# As a counterpart to the access to the source code and  rights to copy, modify and redistribute granted by
+# the license, users are provided only with a limited warranty  and the software's author,  the holder of the
+# economic rights,  and the successive licensors  have only  limited liability.
+
+# In this respect, the user's attention is drawn to the risks associated with loading,  using,  modifying
+# and/or developing or reproducing the software by the user in light of its specific status of free software,
+# that may mean  that it is complicated to manipulate,  and  that  also therefore means  that it is reserved
+# for developers  and  experienced professionals having in-depth computer knowledge. Users are therefore
+# encouraged to load and test the software's suitability as regards their requirements in conditions enabling
+# the security of their systems and/or data to be ensured and,  more generally, to use and operate it in the
+# same conditions as regards security.
+
+# The fact that you are presently reading this means that you have had knowledge of the CeCILL license and that
+# you accept its terms.
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import configuration.backup.xml_to_Chaos as fun_chaos
+
+
+def write_snapshot(folder_path: Path, time: float, kinematics: dict[str, str]) -> None:
+    """
+    Write a snapshot file in the format of the mechanical layer output.
+
+    Parameters
+    ----------
+    folder_path : Path
+        Path to the output folder.
+    time : float
+        Time of the snapshot.
+    kinematics : dict[str, str]
+        Mapping from the agent IDs to the attributes of their <Kinematics> element.
+    """
+    lines = ['<?xml version="1.0" encoding="utf-8"?>', "<Agents>"]
+    for agent_id, attributes in kinematics.items():
+        lines += [f'    <Agent Id="{agent_id}">', f"        <Kinematics {attributes}/>", "    </Agent>"]
+    lines.append("</Agents>")
+    (folder_path / f"AgentDynamics output t={time}.xml").write_text("\n".join(lines), encoding="utf-8")
+
+
+@pytest.fixture
+def snapshot_folder(tmp_path: Path) -> Path:
+    """
+    Fixture to create a folder with three snapshot files and an unrelated file.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        A pytest fixture providing a temporary directory for file operations.
+
+    Returns
+    -------
+    Path
+        The folder containing the snapshot files.
+    """
+    write_snapshot(
+        tmp_path,
+        0.1,
+        {
+            "10": 'Position="1.5,2" Velocity="0.1,-0.2" Theta="0" Omega="0"',
+            "2": 'Position="3,4" Velocity="0,0" Theta="0" Omega="0"',
+        },
+    )
+    write_snapshot(tmp_path, 0.0, {"2": 'Position="2.5,4" Velocity="1e-1,0" Theta="0" Omega="0"'})
+    write_snapshot(
+        tmp_path,
+        0.2,
+        {
+            "2": 'Position="3.5,4.5" Velocity="0.5,0.5" Theta="0" Omega="0"',
+            "7": 'Position="invalid" Velocity="0,0" Theta="0" Omega="0"',
+        },
+    )
+    (tmp_path / "AgentInteractions output t=0.1.xml").write_text("<Interactions/>", encoding="utf-8")
+    return tmp_path
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_load_agent_trajectories(snapshot_folder: Path, max_workers: int) -> None:
+    """
+    Test that the snapshot files are loaded into arrays sorted by time and agent ID, with NaN for missing values.
+
+    Parameters
+    ----------
+    snapshot_folder : Path
+        A fixture providing a folder of snapshot files.
+    max_workers : int
+        The number of processes parsing the files.
+    """
+    times, agent_ids, data = fun_chaos.load_agent_trajectories(snapshot_folder, max_workers=max_workers)
+
+    np.testing.assert_array_equal(times, [0.0, 0.1, 0.2])
+    np.testing.assert_array_equal(agent_ids, ["10", "2", "7"])
+    assert data.shape == (3, 3, 4)
+    np.testing.assert_array_equal(data[:, 1], [[2.5, 4.0, 0.1, 0.0], [3.0, 4.0, 0.0, 0.0], [3.5, 4.5, 0.5, 0.5]])
+    np.testing.assert_array_equal(data[1, 0], [1.5, 2.0, 0.1, -0.2])
+    assert np.isnan(data[[0, 2], 0]).all()
+    assert np.isnan(data[:, 2]).all()
+
+
+def test_create_dict_of_agent_trajectories(snapshot_folder: Path) -> None:
+    """
+    Test that the nested dictionary of trajectories only holds the valid kinematics of each agent.
+
+    Parameters
+    ----------
+    snapshot_folder : Path
+        A fixture providing a folder of snapshot files.
+    """
+    times, agents = fun_chaos.create_dict_of_agent_trajectories(snapshot_folder)
+
+    assert times == [0.0, 0.1, 0.2]
+    assert agents == {
+        "10": {0.1: {"x": 1.5, "y": 2.0, "vx": 0.1, "vy": -0.2}},
+        "2": {
+            0.0: {"x": 2.5, "y": 4.0, "vx": 0.1, "vy": 0.0},
+            0.1: {"x": 3.0, "y": 4.0, "vx": 0.0, "vy": 0.0},
+            0.2: {"x": 3.5, "y": 4.5, "vx": 0.5, "vy": 0.5},
+        },
+        "7": {},
+    }
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_export_to_CSV_and_CHAOS(snapshot_folder: Path, tmp_path_factory: pytest.TempPathFactory, max_workers: int) -> None:
+    """
+    Test the CSV file of all trajectories and the ChAOS files interpolated from it.
+
+    Parameters
+    ----------
+    snapshot_folder : Path
+        A fixture providing a folder of snapshot files.
+    tmp_path_factory : pytest.TempPathFactory
+        A pytest fixture creating temporary directories.
+    max_workers : int
+        The number of processes used by the exports.
+    """
+    csv_folder = tmp_path_factory.mktemp("csv")
+    fun_chaos.export_dict_to_CSV(csv_folder, snapshot_folder, max_workers=max_workers)
+    assert (csv_folder / fun_chaos.trajectories_csv_filename).read_text(encoding="utf-8") == "\n".join(
+        [
+            "t,ID,x,y,vx,vy",
+            "0.0000,2,2.500000,4.000000,0.100000,0.000000",
+            "0.1000,10,1.500000,2.000000,0.100000,-0.200000",
+            "0.1000,2,3.000000,4.000000,0.000000,0.000000",
+            "0.2000,2,3.500000,4.500000,0.500000,0.500000",
+        ]
+    )
+
+    fun_chaos.export_from_CSV_to_CHAOS(csv_folder, 0.05, max_workers=max_workers)
+    chaos_folder = csv_folder / "ForCHAOS"
+    assert sorted(path.name for path in chaos_folder.iterdir()) == ["traj000.csv", "traj001.csv"]
+    assert (chaos_folder / "traj000.csv").read_text(encoding="utf-8") == (
+        "0.000,2.500,4.000,0.0\n0.050,2.750,4.000,0.0\n0.100,3.000,4.000,0.0\n0.150,3.250,4.250,0.0\n"
+    )
+    # A single sample gives no interval to interpolate in
+    assert (chaos_folder / "traj001.csv").read_text(encoding="utf-8") == ""
+
+
+def test_invalid_max_workers_raise(snapshot_folder: Path) -> None:
+    """
+    Test that an invalid number of processes raises a ValueError.
+
+    Parameters
+    ----------
+    snapshot_folder : Path
+        A fixture providing a folder of snapshot files.
+    """
+    with pytest.raises(ValueError, match="max_workers"):
+        fun_chaos.load_agent_trajectories(snapshot_folder, max_workers=0)